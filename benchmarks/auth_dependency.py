@@ -0,0 +1,151 @@
+# benchmarks/auth_dependency.py
+# Copyright (c) Arche.
+# SPDX-License-Identifier: MIT
+"""Per-request cost of the Clerk auth dependency (RS256 JWT).
+
+Purpose:
+    Time ``require_clerk_principal`` in-process against a mocked JWKS
+    endpoint (no network, a fixed simulated JWKS latency). Variants:
+
+        * ``legacy``  — the previous flow: a new JWKS client per request (so a
+          JWKS fetch per request), explicit signature check, then
+          ``jwt.decode`` (a second RS256 verification).
+        * ``unique``  — current dependency with a distinct token per request
+          (token-cache misses, warm shared JWKS): one RS256 verification.
+        * ``cached``  — current dependency replaying the same token
+          (verified-token cache hits).
+
+Usage:
+    python benchmarks/auth_dependency.py [--iterations 2000] [--jwks-latency-ms 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from types import SimpleNamespace
+from typing import Any
+
+import httpx
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwk, jwt
+
+from arche_api.infrastructure.auth.clerk_principal_dependency import require_clerk_principal
+from arche_api.infrastructure.http.transport import (
+    HTTPTransportRegistry,
+    set_http_transport_registry,
+)
+from arche_api.infrastructure.security.clerk_jwks import ClerkJWKSClient
+
+VARIANTS = ("legacy", "unique", "cached")
+
+
+def _keys(kid: str) -> tuple[bytes, dict[str, Any]]:
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_pem = key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+    public_pem = key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    )
+    public_jwk = jwk.construct(public_pem, "RS256").to_dict()
+    public_jwk["kid"] = kid
+    return private_pem, public_jwk
+
+
+def _jwks_transport(public_jwk: dict[str, Any], latency_s: float) -> httpx.MockTransport:
+    async def handler(_request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(latency_s)
+        return httpx.Response(200, json={"keys": [public_jwk]})
+
+    return httpx.MockTransport(handler)
+
+
+async def _legacy(token: str, issuer: str, http: httpx.AsyncClient) -> None:
+    client = ClerkJWKSClient(issuer, http=http)
+    key_data, _ = await client.get_key_for_token(token)
+    ClerkJWKSClient.verify_signature(token, key_data)
+    jwt.decode(token, key=key_data, algorithms=["RS256"], issuer=issuer)
+
+
+async def run_variant(variant: str, *, iterations: int, jwks_latency_ms: float) -> list[float]:
+    """Return per-call latencies (seconds) for ``variant``."""
+    # JWKS clients are process-wide per issuer: give each variant its own.
+    issuer = f"https://{variant}.issuer.bench"
+    kid = f"bench-{variant}"
+    private_pem, public_jwk = _keys(kid)
+    transport = _jwks_transport(public_jwk, jwks_latency_ms / 1000.0)
+    exp = int(time.time()) + 3600
+    tokens = [
+        jwt.encode(
+            {"sub": f"user_{i}", "iss": issuer, "exp": exp},
+            private_pem,
+            algorithm="RS256",
+            headers={"kid": kid},
+        )
+        for i in range(iterations if variant != "cached" else 1)
+    ]
+
+    registry = HTTPTransportRegistry()
+    registry.client("jwks")._transport = transport
+    set_http_transport_registry(registry)
+    settings: Any = SimpleNamespace(
+        clerk_issuer=issuer,
+        clerk_audience=None,
+        clerk_jwks_ttl_seconds=300,
+        auth_token_cache_max_entries=iterations + 1,
+    )
+    http = httpx.AsyncClient(transport=transport)
+    latencies: list[float] = []
+    try:
+        # Warm-up (first JWKS fetch and import-time costs are not measured).
+        await require_clerk_principal(f"Bearer {tokens[0]}", settings)
+        for i in range(iterations):
+            token = tokens[i % len(tokens)]
+            start = time.perf_counter()
+            if variant == "legacy":
+                await _legacy(token, issuer, http)
+            else:
+                await require_clerk_principal(f"Bearer {token}", settings)
+            latencies.append(time.perf_counter() - start)
+    finally:
+        set_http_transport_registry(None)
+        await registry.aclose()
+        await http.aclose()
+    return latencies
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run every variant and print per-request latency."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=2000, help="Calls per variant.")
+    parser.add_argument(
+        "--jwks-latency-ms", type=float, default=20.0, help="Simulated JWKS fetch latency."
+    )
+    args = parser.parse_args(argv)
+
+    print(f"{'variant':<8} {'mean us':>10} {'p50 us':>9} {'p99 us':>9}")
+    for variant in VARIANTS:
+        lat = sorted(
+            asyncio.run(
+                run_variant(
+                    variant,
+                    iterations=args.iterations,
+                    jwks_latency_ms=args.jwks_latency_ms,
+                )
+            )
+        )
+        mean = statistics.fmean(lat) * 1e6
+        p50 = statistics.median(lat) * 1e6
+        p99 = lat[max(0, int(len(lat) * 0.99) - 1)] * 1e6
+        print(f"{variant:<8} {mean:>10.1f} {p50:>9.1f} {p99:>9.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,318 @@
+# benchmarks/corpora.py
+# Copyright (c) Arche.
+# SPDX-License-Identifier: MIT
+"""Deterministic synthetic corpora for the benchmark suite.
+
+Purpose:
+    Generate inputs shaped like production data at sizes the checked-in test
+    fixtures do not reach:
+
+        * ``xbrl_instance``      — an XBRL instance document with quarterly
+          duration/instant contexts, segment-dimensioned contexts and
+          thousands of facts over the concepts the normalizer resolves.
+        * ``statement_history``  — canonical payloads for many CIKs × years ×
+          fiscal periods × statement types, lazily generated.
+        * ``intraday_bars``      — minute bars for a set of symbols.
+
+    Every generator takes an explicit ``seed`` and draws from its own
+    ``random.Random``, so the same arguments always produce byte-identical
+    output and benchmark runs are comparable across machines and commits.
+
+Usage:
+    Imported by ``benchmarks/suite.py``; not a standalone script.
+"""
+
+from __future__ import annotations
+
+import random
+from collections.abc import Iterator
+from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal
+from uuid import UUID
+
+from arche_api.adapters.repositories.market_data_repository import IntradayBarRow
+from arche_api.domain.entities.canonical_statement_payload import CanonicalStatementPayload
+from arche_api.domain.enums.canonical_statement_metric import CanonicalStatementMetric as M
+from arche_api.domain.enums.edgar import AccountingStandard, FiscalPeriod, StatementType
+
+#: Fiscal periods generated per year with their (month, day) period end.
+PERIODS: tuple[tuple[FiscalPeriod, int, int], ...] = (
+    (FiscalPeriod.Q1, 3, 31),
+    (FiscalPeriod.Q2, 6, 30),
+    (FiscalPeriod.Q3, 9, 30),
+    (FiscalPeriod.FY, 12, 31),
+)
+
+#: Concepts emitted into XBRL instances: (qname, unit id, instant?).
+_XBRL_CONCEPTS: tuple[tuple[str, str, bool], ...] = (
+    ("Revenues", "usd", False),
+    ("CostOfRevenue", "usd", False),
+    ("GrossProfit", "usd", False),
+    ("OperatingIncomeLoss", "usd", False),
+    ("NetIncomeLoss", "usd", False),
+    ("EarningsPerShareBasic", "usdPerShare", False),
+    ("EarningsPerShareDiluted", "usdPerShare", False),
+    ("WeightedAverageNumberOfDilutedSharesOutstanding", "shares", False),
+    ("Assets", "usd", True),
+    ("Liabilities", "usd", True),
+    ("StockholdersEquity", "usd", True),
+    ("CashAndCashEquivalentsAtCarryingValue", "usd", True),
+    ("NetCashProvidedByUsedInOperatingActivities", "usd", False),
+    ("NetCashProvidedByUsedInInvestingActivities", "usd", False),
+    ("NetCashProvidedByUsedInFinancingActivities", "usd", False),
+    ("ResearchAndDevelopmentExpense", "usd", False),
+    ("SellingGeneralAndAdministrativeExpense", "usd", False),
+    ("IncomeTaxExpenseBenefit", "usd", False),
+    ("InterestExpense", "usd", False),
+    ("PaymentsToAcquirePropertyPlantAndEquipment", "usd", False),
+)
+
+_INCOME_METRICS = (
+    M.REVENUE,
+    M.COST_OF_REVENUE,
+    M.GROSS_PROFIT,
+    M.OPERATING_INCOME,
+    M.INCOME_BEFORE_TAX,
+    M.INCOME_TAX_EXPENSE,
+    M.INTEREST_EXPENSE,
+    M.INTEREST_INCOME,
+    M.NET_INCOME,
+    M.DEPRECIATION_AND_AMORTIZATION_EXPENSE,
+    M.DILUTED_EPS,
+    # Balance-sheet inputs carried on the income payload for return ratios.
+    M.TOTAL_ASSETS,
+    M.TOTAL_EQUITY,
+    M.TOTAL_CURRENT_ASSETS,
+    M.TOTAL_CURRENT_LIABILITIES,
+    M.CASH_AND_CASH_EQUIVALENTS,
+    M.SHORT_TERM_DEBT,
+    M.CURRENT_PORTION_OF_LONG_TERM_DEBT,
+    M.LONG_TERM_DEBT,
+)
+
+
+def cik_for(index: int) -> str:
+    """Return the synthetic, zero-padded CIK for company ``index``."""
+    return str(1_000_000 + index).zfill(10)
+
+
+# --------------------------------------------------------------------------- #
+# XBRL instances                                                              #
+# --------------------------------------------------------------------------- #
+
+
+def xbrl_instance(*, facts: int, years: int = 3, segments: int = 8, seed: int = 0) -> bytes:
+    """Return an XBRL instance document with ``facts`` numeric facts.
+
+    Args:
+        facts: Number of fact elements to emit.
+        years: Fiscal years of quarterly contexts (ending with the latest).
+        segments: Business-segment members per period (dimensional contexts).
+        seed: Random seed.
+
+    Returns:
+        UTF-8 encoded instance XML.
+    """
+    rng = random.Random(seed)  # noqa: S311
+    cik = cik_for(seed)
+    last_year = 2024
+    parts: list[str] = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        '<xbrli:xbrl xmlns:xbrli="http://www.xbrl.org/2003/instance"'
+        ' xmlns:us-gaap="http://fasb.org/us-gaap/2024"'
+        ' xmlns:xbrldi="http://xbrl.org/2006/xbrldi"'
+        ' xmlns:iso4217="http://www.xbrl.org/2003/iso4217">',
+        '<xbrli:unit id="usd"><xbrli:measure>iso4217:USD</xbrli:measure></xbrli:unit>',
+        '<xbrli:unit id="shares"><xbrli:measure>xbrli:shares</xbrli:measure></xbrli:unit>',
+        '<xbrli:unit id="usdPerShare"><xbrli:measure>iso4217:USD</xbrli:measure></xbrli:unit>',
+    ]
+
+    duration_ctx: list[str] = []
+    instant_ctx: list[str] = []
+    for year in range(last_year - years + 1, last_year + 1):
+        for quarter, (_, month, day) in enumerate(PERIODS):
+            start = date(year, month - 2, 1) if quarter < 3 else date(year, 1, 1)
+            end = date(year, month, day)
+            for segment in range(segments + 1):
+                suffix = f"_seg{segment}" if segment else ""
+                entity = (
+                    f'<xbrli:entity><xbrli:identifier scheme="http://www.sec.gov/CIK">{cik}'
+                    "</xbrli:identifier>"
+                    + (
+                        "<xbrli:segment><xbrldi:explicitMember"
+                        ' dimension="us-gaap:StatementBusinessSegmentsAxis">'
+                        f"arche:Segment{segment}Member</xbrldi:explicitMember></xbrli:segment>"
+                        if segment
+                        else ""
+                    )
+                    + "</xbrli:entity>"
+                )
+                d_id = f"D{year}{quarter}{suffix}"
+                i_id = f"I{year}{quarter}{suffix}"
+                parts.append(
+                    f'<xbrli:context id="{d_id}">{entity}<xbrli:period>'
+                    f"<xbrli:startDate>{start.isoformat()}</xbrli:startDate>"
+                    f"<xbrli:endDate>{end.isoformat()}</xbrli:endDate>"
+                    "</xbrli:period></xbrli:context>"
+                )
+                parts.append(
+                    f'<xbrli:context id="{i_id}">{entity}<xbrli:period>'
+                    f"<xbrli:instant>{end.isoformat()}</xbrli:instant>"
+                    "</xbrli:period></xbrli:context>"
+                )
+                duration_ctx.append(d_id)
+                instant_ctx.append(i_id)
+
+    for i in range(facts):
+        concept, unit, instant = _XBRL_CONCEPTS[i % len(_XBRL_CONCEPTS)]
+        ctx = rng.choice(instant_ctx if instant else duration_ctx)
+        if unit == "usdPerShare":
+            value, decimals = f"{rng.uniform(-5, 15):.2f}", "2"
+        else:
+            value, decimals = str(rng.randrange(-(10**9), 10**11, 1000)), "-3"
+        parts.append(
+            f'<us-gaap:{concept} id="f{i}" contextRef="{ctx}" unitRef="{unit}"'
+            f' decimals="{decimals}">{value}</us-gaap:{concept}>'
+        )
+
+    parts.append("</xbrli:xbrl>")
+    return "\n".join(parts).encode("utf-8")
+
+
+# --------------------------------------------------------------------------- #
+# Statement-version histories                                                 #
+# --------------------------------------------------------------------------- #
+
+
+def _statement_metrics(
+    statement_type: StatementType, rng: random.Random, scale: Decimal
+) -> dict[M, Decimal]:
+    """Return internally consistent core metrics for one statement."""
+
+    def amount(low: float, high: float) -> Decimal:
+        return (Decimal(f"{rng.uniform(low, high):.4f}") * scale).quantize(Decimal(1))
+
+    if statement_type is StatementType.BALANCE_SHEET:
+        liabilities, equity = amount(20, 60), amount(10, 40)
+        return {
+            M.TOTAL_ASSETS: liabilities + equity,
+            M.TOTAL_LIABILITIES: liabilities,
+            M.TOTAL_EQUITY: equity,
+            M.CASH_AND_CASH_EQUIVALENTS: amount(1, 10),
+            M.TOTAL_CURRENT_ASSETS: amount(10, 30),
+            M.TOTAL_CURRENT_LIABILITIES: amount(5, 20),
+            M.LONG_TERM_DEBT: amount(5, 20),
+        }
+    if statement_type is StatementType.CASH_FLOW_STATEMENT:
+        operating, investing, financing = amount(2, 10), amount(-8, 0), amount(-5, 5)
+        return {
+            M.NET_CASH_FROM_OPERATING_ACTIVITIES: operating,
+            M.NET_CASH_FROM_INVESTING_ACTIVITIES: investing,
+            M.NET_CASH_FROM_FINANCING_ACTIVITIES: financing,
+            M.NET_INCREASE_DECREASE_IN_CASH: operating + investing + financing,
+            M.CAPITAL_EXPENDITURES: amount(-4, -1),
+            M.DEPRECIATION_AND_AMORTIZATION_EXPENSE: amount(1, 3),
+        }
+    metrics = {metric: amount(1, 50) for metric in _INCOME_METRICS}
+    metrics[M.DILUTED_EPS] = Decimal(f"{rng.uniform(-2, 12):.2f}")
+    return metrics
+
+
+def statement_history(
+    *,
+    ciks: int,
+    years: int,
+    statement_types: tuple[StatementType, ...] = tuple(StatementType),
+    seed: int = 0,
+) -> Iterator[CanonicalStatementPayload]:
+    """Yield canonical payloads for ``ciks`` companies over ``years`` years.
+
+    Payloads are yielded company by company, oldest period first, with one
+    payload per (fiscal year, fiscal period, statement type). The generator is
+    lazy so thousands of CIKs × decades can be streamed without being held in
+    memory at once.
+
+    Args:
+        ciks: Number of companies.
+        years: Fiscal years per company (ending 2024).
+        statement_types: Statement types emitted for each period.
+        seed: Random seed.
+
+    Yields:
+        CanonicalStatementPayload instances.
+    """
+    first_year = 2024 - years + 1
+    for index in range(ciks):
+        rng = random.Random(seed * 1_000_003 + index)  # noqa: S311
+        cik = cik_for(index)
+        scale = Decimal(10) ** rng.randint(6, 9)
+        for year in range(first_year, 2025):
+            for period, month, day in PERIODS:
+                for statement_type in statement_types:
+                    yield CanonicalStatementPayload(
+                        cik=cik,
+                        statement_type=statement_type,
+                        accounting_standard=AccountingStandard.US_GAAP,
+                        statement_date=date(year, month, day),
+                        fiscal_year=year,
+                        fiscal_period=period,
+                        currency="USD",
+                        unit_multiplier=0,
+                        core_metrics=_statement_metrics(statement_type, rng, scale),
+                        extra_metrics={},
+                        dimensions={"consolidation": "CONSOLIDATED"},
+                        source_accession_id=f"{cik}-{year % 100:02d}-{month:06d}",
+                        source_taxonomy="US_GAAP_2024",
+                        source_version_sequence=1,
+                    )
+
+
+# --------------------------------------------------------------------------- #
+# Intraday bars                                                               #
+# --------------------------------------------------------------------------- #
+
+
+def intraday_bars(*, symbols: int, bars_per_symbol: int, seed: int = 0) -> list[IntradayBarRow]:
+    """Return one-minute bars for ``symbols`` symbols.
+
+    Args:
+        symbols: Number of distinct symbols.
+        bars_per_symbol: Consecutive minute bars per symbol.
+        seed: Random seed.
+
+    Returns:
+        Bars ordered by symbol, then timestamp.
+    """
+    rng = random.Random(seed)  # noqa: S311
+    session_open = datetime(2024, 6, 3, 13, 30, tzinfo=UTC)
+    rows: list[IntradayBarRow] = []
+    for _ in range(symbols):
+        symbol_id = UUID(int=rng.getrandbits(128), version=4)
+        price = rng.uniform(5, 500)
+        for minute in range(bars_per_symbol):
+            open_ = price
+            price = max(0.01, price * (1 + rng.gauss(0, 0.001)))
+            high = max(open_, price) * (1 + abs(rng.gauss(0, 0.0005)))
+            low = min(open_, price) * (1 - abs(rng.gauss(0, 0.0005)))
+            rows.append(
+                IntradayBarRow(
+                    symbol_id=symbol_id,
+                    ts=session_open + timedelta(minutes=minute),
+                    open=f"{open_:.4f}",
+                    high=f"{high:.4f}",
+                    low=f"{low:.4f}",
+                    close=f"{price:.4f}",
+                    volume=str(rng.randrange(100, 1_000_000)),
+                    provider="marketstack",
+                )
+            )
+    return rows
+
+
+__all__ = [
+    "PERIODS",
+    "cik_for",
+    "intraday_bars",
+    "statement_history",
+    "xbrl_instance",
+]
@@ -0,0 +1,142 @@
+# benchmarks/import_time.py
+# Copyright (c) Arche.
+# SPDX-License-Identifier: MIT
+"""Import-time profile of the application module.
+
+Purpose:
+    Run ``python -X importtime -c "import <module>"`` in a fresh interpreter
+    (once per ``ROUTER_GROUPS`` selection) and summarize the trace: total
+    import time, the slowest modules by cumulative and self time, and totals
+    per top-level package / ``arche_api`` sub-package.
+
+Usage:
+    python benchmarks/import_time.py [--groups all quotes] [--module arche_api.main]
+        [--top 15] [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ImportRecord:
+    """One ``-X importtime`` line (times in microseconds)."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(stderr: str) -> list[ImportRecord]:
+    """Parse ``import time: self | cumulative | name`` lines from stderr."""
+    records: list[ImportRecord] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # header row
+        name = parts[2].rstrip()
+        stripped = name.lstrip()
+        records.append(
+            ImportRecord(
+                module=stripped,
+                self_us=int(parts[0]),
+                cumulative_us=int(parts[1]),
+                depth=(len(name) - len(stripped) - 1) // 2,
+            )
+        )
+    return records
+
+
+def total_us(records: Iterable[ImportRecord]) -> int:
+    """Wall import time: the sum of cumulative times of top-level imports."""
+    return sum(r.cumulative_us for r in records if r.depth == 0)
+
+
+def package_totals(records: Iterable[ImportRecord]) -> dict[str, int]:
+    """Sum self time per package (``arche_api`` is split by sub-package)."""
+    totals: dict[str, int] = defaultdict(int)
+    for r in records:
+        parts = r.module.split(".")
+        key = ".".join(parts[:3]) if parts[0] == "arche_api" else parts[0]
+        totals[key] += r.self_us
+    return dict(totals)
+
+
+def profile(module: str, groups: str) -> tuple[list[ImportRecord], set[str]]:
+    """Import ``module`` in a subprocess and return its records and loaded modules."""
+    env = {**os.environ, "ROUTER_GROUPS": groups}
+    proc = subprocess.run(  # noqa: S603 - fixed interpreter and arguments
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {module} failed (ROUTER_GROUPS={groups}):\n{proc.stderr}")
+    records = parse_importtime(proc.stderr)
+    return records, {r.module for r in records}
+
+
+def _report(groups: str, runs: list[list[ImportRecord]], top: int) -> None:
+    best = min(runs, key=total_us)
+    totals = sorted(total_us(r) / 1000 for r in runs)
+    print(f"\n== ROUTER_GROUPS={groups} ==")
+    print(f"total import ms: min {totals[0]:.1f}  median {totals[len(totals) // 2]:.1f}")
+
+    print(f"\n{'cumulative ms':>14}  module")
+    for r in sorted(best, key=lambda r: r.cumulative_us, reverse=True)[:top]:
+        print(f"{r.cumulative_us / 1000:>14.1f}  {r.module}")
+
+    print(f"\n{'self ms':>14}  module")
+    for r in sorted(best, key=lambda r: r.self_us, reverse=True)[:top]:
+        print(f"{r.self_us / 1000:>14.1f}  {r.module}")
+
+    print(f"\n{'self ms':>14}  package")
+    for name, us in sorted(package_totals(best).items(), key=lambda kv: kv[1], reverse=True)[:top]:
+        print(f"{us / 1000:>14.1f}  {name}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Profile each router-group selection and print a report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="arche_api.main", help="Module to import.")
+    parser.add_argument(
+        "--groups", nargs="+", default=["all", "quotes"], help="ROUTER_GROUPS values to profile."
+    )
+    parser.add_argument("--top", type=int, default=15, help="Rows per table.")
+    parser.add_argument("--repeat", type=int, default=3, help="Interpreter runs per selection.")
+    args = parser.parse_args(argv)
+
+    baseline: set[str] | None = None
+    for groups in args.groups:
+        runs = []
+        loaded: set[str] = set()
+        for _ in range(max(1, args.repeat)):
+            records, loaded = profile(args.module, groups)
+            runs.append(records)
+        _report(groups, runs, args.top)
+        if baseline is None:
+            baseline = loaded
+        else:
+            skipped = sorted(m for m in baseline - loaded if m.startswith("arche_api."))
+            print(
+                f"\nnot imported vs ROUTER_GROUPS={args.groups[0]}: {len(skipped)} arche_api modules"
+            )
+            for name in skipped[: args.top]:
+                print(f"  {name}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,176 @@
+# benchmarks/json_serialization.py
+# Copyright (c) Arche.
+# SPDX-License-Identifier: MIT
+"""Serialization cost of the historical-bars and fundamentals envelopes.
+
+Purpose:
+    Time the per-response JSON work on two envelope shapes built from the
+    synthetic corpora (see ``benchmarks/corpora.py``):
+
+        * ``bars``         — ``PaginatedEnvelope[HistoricalBarHTTP]`` (one page
+          of one-minute bars, Decimal prices).
+        * ``fundamentals`` — ``PaginatedEnvelope[FundamentalsTimeSeriesPointHTTP]``
+          built by the fundamentals presenter.
+
+    Operations and variants:
+
+        * ``render/legacy`` — ``model_dump_http()`` then Starlette's
+          ``JSONResponse`` (the path before the JSON codec).
+        * ``render/<codec>`` — ``model_dump_http()`` then the codec.
+        * ``render/direct`` — ``FastJSONResponse`` on the model itself
+          (``model_dump_json`` bytes, no intermediate dict).
+        * ``etag/<codec>``  — strong ETag (sorted canonical JSON + SHA-256).
+        * ``cache/<codec>`` — Redis JSON cache encode + decode round trip.
+
+    ``<codec>`` is ``stdlib`` and, when the ``fastjson`` extra is installed,
+    ``orjson``.
+
+Usage:
+    python benchmarks/json_serialization.py [--iterations 200] [--items 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+from collections.abc import Callable
+from decimal import Decimal
+from functools import partial
+from itertools import islice
+from typing import Any
+
+from corpora import intraday_bars, statement_history
+from fastapi.responses import JSONResponse
+
+from arche_api.adapters.presenters.base_presenter import _compute_quoted_etag
+from arche_api.adapters.presenters.fundamentals_presenter import (
+    present_fundamentals_time_series,
+)
+from arche_api.adapters.schemas.http.base import BaseHTTPSchema
+from arche_api.adapters.schemas.http.envelopes import PaginatedEnvelope
+from arche_api.adapters.schemas.http.quotes import HistoricalBarHTTP
+from arche_api.domain.entities.edgar_fundamentals_timeseries import (
+    build_fundamentals_timeseries,
+)
+from arche_api.infrastructure.http.responses import FastJSONResponse
+from arche_api.infrastructure.serialization.json_codec import (
+    JsonBackend,
+    JsonCodec,
+    OrjsonCodec,
+    configure_json_codec,
+)
+
+#: Bars per symbol in the corpus (one regular session of minute bars).
+_SESSION_BARS = 390
+
+#: Payloads per company in the statement corpus (30 years x 4 periods x 3 types).
+_PAYLOADS_PER_CIK = 30 * 4 * 3
+
+
+def bars_envelope(items: int) -> PaginatedEnvelope[HistoricalBarHTTP]:
+    """Return one page of ``items`` historical bars."""
+    rows = intraday_bars(symbols=items // _SESSION_BARS + 1, bars_per_symbol=_SESSION_BARS)
+    bars = [
+        HistoricalBarHTTP(
+            ticker=f"SYM{index // _SESSION_BARS:03d}",
+            timestamp=row.ts,
+            open=Decimal(row.open),
+            high=Decimal(row.high),
+            low=Decimal(row.low),
+            close=Decimal(row.close),
+            volume=Decimal(row.volume),
+            interval="1m",
+        )
+        for index, row in enumerate(rows[:items])
+    ]
+    return PaginatedEnvelope[HistoricalBarHTTP](page=1, page_size=items, total=items, items=bars)
+
+
+def fundamentals_envelope(items: int) -> BaseHTTPSchema:
+    """Return one page of ``items`` fundamentals time-series points."""
+    payloads = islice(
+        statement_history(ciks=items // _PAYLOADS_PER_CIK + 1, years=30),
+        items,
+    )
+    return present_fundamentals_time_series(
+        points=build_fundamentals_timeseries(payloads), page=1, page_size=items
+    )
+
+
+def _codecs() -> list[JsonBackend]:
+    try:
+        OrjsonCodec()
+    except RuntimeError:
+        return ["stdlib"]
+    return ["stdlib", "orjson"]
+
+
+def _render_with(codec: JsonCodec, envelope: BaseHTTPSchema) -> bytes:
+    return codec.dumps(envelope.model_dump_http())
+
+
+def _round_trip(codec: JsonCodec, payload: dict[str, Any]) -> Any:
+    return codec.loads(codec.dumps(payload))
+
+
+#: (operation, variant, process-wide codec to install or None, timed callable)
+Case = tuple[str, str, JsonBackend | None, Callable[[], Any]]
+
+
+def _cases(envelope: BaseHTTPSchema) -> list[Case]:
+    payload = envelope.model_dump_http()
+    cases: list[Case] = [
+        ("render", "legacy", None, lambda: JSONResponse(content=envelope.model_dump_http())),
+        ("render", "direct", None, lambda: FastJSONResponse(content=envelope)),
+    ]
+    for name in _codecs():
+        codec = configure_json_codec(name)
+        cases += [
+            ("render", name, None, partial(_render_with, codec, envelope)),
+            # ETag hashing uses the process-wide codec.
+            ("etag", name, name, partial(_compute_quoted_etag, payload)),
+            ("cache", name, None, partial(_round_trip, codec, payload)),
+        ]
+    return cases
+
+
+def _time(fn: Callable[[], Any], iterations: int) -> list[float]:
+    fn()  # warm-up
+    latencies: list[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        latencies.append(time.perf_counter() - start)
+    return sorted(latencies)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run every case and print per-call latency."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200, help="Calls per case.")
+    parser.add_argument("--items", type=int, default=200, help="Items per page (API max 200).")
+    args = parser.parse_args(argv)
+
+    envelopes = {
+        "bars": bars_envelope(args.items),
+        "fundamentals": fundamentals_envelope(args.items),
+    }
+
+    print(f"{'envelope':<13} {'case':<15} {'bytes':>8} {'mean us':>10} {'p50 us':>9} {'p99 us':>9}")
+    for label, envelope in envelopes.items():
+        size = len(FastJSONResponse(content=envelope).body)
+        for operation, variant, process_codec, fn in _cases(envelope):
+            if process_codec is not None:
+                configure_json_codec(process_codec)
+            lat = _time(fn, args.iterations)
+            mean = statistics.fmean(lat) * 1e6
+            p50 = statistics.median(lat) * 1e6
+            p99 = lat[max(0, int(len(lat) * 0.99) - 1)] * 1e6
+            case = f"{operation}/{variant}"
+            print(f"{label:<13} {case:<15} {size:>8} {mean:>10.1f} {p50:>9.1f} {p99:>9.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,181 @@
+# benchmarks/middleware_stack.py
+# Copyright (c) Arche.
+# SPDX-License-Identifier: MIT
+"""Requests-per-second benchmark: BaseHTTPMiddleware chain vs fused ASGI middleware.
+
+Purpose:
+    Measure the per-request cost of the observability middleware stack on a
+    trivial route served by uvicorn. Two variants are compared:
+
+        * ``legacy`` — the previous chain of ``BaseHTTPMiddleware`` layers
+          (TraceId, RequestId, AccessLog, RequestLatency, PromMetrics,
+          SecurityHeaders), in the order ``create_app`` used to install them.
+        * ``fused``  — the single pure-ASGI ``ObservabilityMiddleware``.
+
+    Each variant runs in its own uvicorn subprocess (single worker, logs
+    discarded); the load generator is an httpx client with a fixed number of
+    concurrent connections.
+
+Usage:
+    python benchmarks/middleware_stack.py [--duration 10] [--concurrency 32]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+from fastapi import FastAPI
+
+VARIANTS = ("legacy", "fused")
+
+
+def build_app(variant: str) -> FastAPI:
+    """Return a trivial app wrapped in the requested middleware stack."""
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping() -> dict[str, str]:
+        return {"status": "ok"}
+
+    if variant == "legacy":
+        from arche_api.infrastructure.http.middleware.trace import TraceIdMiddleware
+        from arche_api.infrastructure.middleware.access_log import AccessLogMiddleware
+        from arche_api.infrastructure.middleware.metrics import PromMetricsMiddleware
+        from arche_api.infrastructure.middleware.request_id import RequestIdMiddleware
+        from arche_api.infrastructure.middleware.request_metrics import (
+            RequestLatencyMiddleware,
+        )
+        from arche_api.infrastructure.middleware.security_headers import (
+            SecurityHeadersMiddleware,
+        )
+
+        app.add_middleware(TraceIdMiddleware)
+        app.add_middleware(RequestIdMiddleware)
+        app.add_middleware(AccessLogMiddleware)
+        app.add_middleware(RequestLatencyMiddleware)
+        app.add_middleware(PromMetricsMiddleware)
+        app.add_middleware(SecurityHeadersMiddleware)
+    elif variant == "fused":
+        from arche_api.infrastructure.middleware.observability import (
+            ObservabilityMiddleware,
+        )
+
+        app.add_middleware(ObservabilityMiddleware)
+    else:
+        raise ValueError(f"unknown variant: {variant}")
+    return app
+
+
+def _serve(variant: str, port: int) -> None:
+    import uvicorn
+
+    uvicorn.run(build_app(variant), host="127.0.0.1", port=port, log_level="warning")
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+async def _wait_ready(url: str, timeout_s: float = 15.0) -> None:
+    deadline = time.monotonic() + timeout_s
+    async with httpx.AsyncClient() as client:
+        while time.monotonic() < deadline:
+            try:
+                if (await client.get(url)).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.1)
+    raise RuntimeError(f"server at {url} did not become ready")
+
+
+async def _load(url: str, *, duration_s: float, concurrency: int) -> tuple[int, list[float]]:
+    latencies: list[float] = []
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(limits=limits) as client:
+        stop_at = time.perf_counter() + duration_s
+
+        async def worker() -> None:
+            while time.perf_counter() < stop_at:
+                t0 = time.perf_counter()
+                response = await client.get(url)
+                response.raise_for_status()
+                latencies.append(time.perf_counter() - t0)
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return len(latencies), latencies
+
+
+def run_variant(
+    variant: str, *, duration_s: float, warmup_s: float, concurrency: int
+) -> dict[str, float]:
+    """Benchmark one variant in a fresh uvicorn subprocess."""
+    port = _free_port()
+    proc = subprocess.Popen(  # noqa: S603 - fixed argv, local benchmark tool
+        [sys.executable, str(Path(__file__).resolve()), "--serve", variant, "--port", str(port)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    url = f"http://127.0.0.1:{port}/ping"
+    try:
+        asyncio.run(_wait_ready(url))
+        asyncio.run(_load(url, duration_s=warmup_s, concurrency=concurrency))
+        count, latencies = asyncio.run(_load(url, duration_s=duration_s, concurrency=concurrency))
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
+
+    latencies.sort()
+    return {
+        "rps": count / duration_s,
+        "p50_ms": statistics.median(latencies) * 1000.0,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000.0,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark (or serve one variant when ``--serve`` is given)."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--duration", type=float, default=10.0, help="Measured seconds per variant."
+    )
+    parser.add_argument("--warmup", type=float, default=2.0, help="Warm-up seconds per variant.")
+    parser.add_argument("--concurrency", type=int, default=32, help="Concurrent connections.")
+    parser.add_argument("--serve", choices=VARIANTS, help=argparse.SUPPRESS)
+    parser.add_argument("--port", type=int, default=0, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.serve:
+        _serve(args.serve, args.port)
+        return 0
+
+    results = {
+        variant: run_variant(
+            variant,
+            duration_s=args.duration,
+            warmup_s=args.warmup,
+            concurrency=args.concurrency,
+        )
+        for variant in VARIANTS
+    }
+
+    print(f"{'variant':<8} {'req/s':>10} {'p50 ms':>9} {'p99 ms':>9}")
+    for variant, r in results.items():
+        print(f"{variant:<8} {r['rps']:>10.0f} {r['p50_ms']:>9.2f} {r['p99_ms']:>9.2f}")
+    speedup = results["fused"]["rps"] / results["legacy"]["rps"]
+    print(f"fused/legacy throughput: {speedup:.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,475 @@
+# benchmarks/suite.py
+# Copyright (c) Arche.
+# SPDX-License-Identifier: MIT
+"""End-to-end throughput suite for the EDGAR and market-data hot paths.
+
+Purpose:
+    Time the CPU-bound pipeline stages over deterministic synthetic corpora
+    (see ``benchmarks/corpora.py``), write the results as JSON, and compare
+    them against a checked-in baseline so performance work can be verified
+    and regressions fail CI:
+
+        * ``xbrl.parse``              — ``XBRLParser.parse`` on one instance.
+        * ``xbrl.normalize``          — ``XBRLDocumentIndex`` + the canonical
+          normalizer for the three statement types of that instance.
+        * ``derived.compute``         — ``DerivedMetricsEngine.compute`` over
+          every income statement with its trailing history.
+        * ``reconciliation.run``      — ``ReconciliationEngine.run`` with the
+          default E11 rules, one company history per call.
+        * ``fact_dq.evaluate``        — ``FactDQEngine.evaluate`` over facts
+          derived from each statement with prior-year history.
+        * ``payload.serialize`` /
+          ``payload.deserialize``     — the statement repository's JSONB
+          payload round trip.
+        * ``bars.upsert.compile``     — ``MarketDataRepository.upsert_intraday_bars``
+          up to and including PostgreSQL statement compilation.
+        * ``bars.upsert.db``          — the same upsert executed against a
+          migrated database (only with ``--database-url``; repeated upserts
+          take the ON CONFLICT update path and are rolled back at the end).
+
+    Each case reports the median and best wall time per call over several
+    rounds (each round long enough to amortize timer overhead) and the
+    derived items/second.
+
+Baseline:
+    ``benchmarks/baseline.json`` records the corpus parameters alongside the
+    results. A comparison is only meaningful for the same scale on the same
+    class of machine, so regenerate the baseline on the reference runner
+    whenever either changes.
+
+Usage:
+    python benchmarks/suite.py [--scale smoke|default|large] [--only PATTERN ...]
+        [--output results.json] [--compare benchmarks/baseline.json]
+        [--max-regression 0.25] [--database-url URL]
+
+    Exit status is 1 when any compared case is slower than the baseline by
+    more than ``--max-regression`` (a fraction of the baseline median), and 2
+    when the baseline was recorded at a different scale.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import fnmatch
+import json
+import platform
+import statistics
+import sys
+import time
+from collections.abc import Callable, Generator
+from dataclasses import dataclass
+from datetime import date
+from functools import cached_property
+from pathlib import Path
+from typing import Any
+
+from corpora import intraday_bars, statement_history, xbrl_instance
+from sqlalchemy.dialects import postgresql
+
+from arche_api.adapters.mappers.xbrl_parser import XBRLParser
+from arche_api.adapters.repositories.edgar_statements_repository import (
+    EdgarStatementsRepository,
+)
+from arche_api.adapters.repositories.market_data_repository import (
+    IntradayBarRow,
+    MarketDataRepository,
+)
+from arche_api.domain.entities.canonical_statement_payload import CanonicalStatementPayload
+from arche_api.domain.entities.edgar_dq import NormalizedStatementIdentity
+from arche_api.domain.entities.edgar_normalized_fact import EdgarNormalizedFact
+from arche_api.domain.entities.xbrl_document import XBRLDocument
+from arche_api.domain.enums.edgar import AccountingStandard, FiscalPeriod, StatementType
+from arche_api.domain.services.derived_metrics_engine import DerivedMetricsEngine
+from arche_api.domain.services.edgar_normalization import (
+    CanonicalStatementNormalizer,
+    NormalizationContext,
+)
+from arche_api.domain.services.fact_dq_engine import FactDQEngine
+from arche_api.domain.services.fact_store_service import payload_to_facts
+from arche_api.domain.services.reconciliation_engine import ReconciliationEngine
+from arche_api.domain.services.reconciliation_rule_sets import get_default_e11_rules
+from arche_api.domain.services.xbrl_document_index import XBRLDocumentIndex
+
+SCHEMA_VERSION = 1
+
+#: Corpus sizes per scale. ``ciks`` × ``years`` × 4 periods × 3 statement types
+#: payloads are materialized, so ``large`` needs a few GB of memory.
+SCALES: dict[str, dict[str, int]] = {
+    "smoke": {"xbrl_facts": 2_000, "ciks": 5, "years": 10, "bar_symbols": 10, "bars": 390},
+    "default": {"xbrl_facts": 20_000, "ciks": 50, "years": 30, "bar_symbols": 50, "bars": 390},
+    "large": {"xbrl_facts": 100_000, "ciks": 1_000, "years": 30, "bar_symbols": 500, "bars": 390},
+}
+
+#: Trailing payloads passed as history to the derived-metrics engine.
+DERIVED_HISTORY = 8
+
+
+@dataclass(frozen=True, slots=True)
+class Bench:
+    """A timed callable and the number of items one call processes."""
+
+    fn: Callable[[], Any]
+    items: int
+
+
+CaseFactory = Callable[["Corpus", argparse.Namespace], Generator[Bench, None, None]]
+CASES: dict[str, CaseFactory] = {}
+
+
+def case(name: str) -> Callable[[CaseFactory], CaseFactory]:
+    """Register a benchmark case.
+
+    A case is a generator that performs setup, yields one :class:`Bench`
+    (or nothing, to skip), then tears down.
+    """
+
+    def register(factory: CaseFactory) -> CaseFactory:
+        CASES[name] = factory
+        return factory
+
+    return register
+
+
+class Corpus:
+    """Lazily generated inputs shared by the cases of one run."""
+
+    def __init__(self, params: dict[str, int]) -> None:
+        """Initialize the corpus from scale parameters."""
+        self.params = params
+
+    @cached_property
+    def xbrl_bytes(self) -> bytes:
+        """Synthetic XBRL instance."""
+        content: bytes = xbrl_instance(facts=self.params["xbrl_facts"])
+        return content
+
+    @cached_property
+    def xbrl_document(self) -> XBRLDocument:
+        """Parsed :attr:`xbrl_bytes`."""
+        return XBRLParser().parse(accession_id="0001000000-24-000001", content=self.xbrl_bytes)
+
+    @cached_property
+    def payloads(self) -> list[CanonicalStatementPayload]:
+        """Statement history for every company, company by company."""
+        return list(statement_history(ciks=self.params["ciks"], years=self.params["years"]))
+
+    @cached_property
+    def histories(self) -> list[list[CanonicalStatementPayload]]:
+        """:attr:`payloads` split per company."""
+        per_company = len(self.payloads) // self.params["ciks"]
+        return [
+            self.payloads[start : start + per_company]
+            for start in range(0, len(self.payloads), per_company)
+        ]
+
+    @cached_property
+    def bars(self) -> list[IntradayBarRow]:
+        """Intraday bar set."""
+        rows: list[IntradayBarRow] = intraday_bars(
+            symbols=self.params["bar_symbols"], bars_per_symbol=self.params["bars"]
+        )
+        return rows
+
+
+# --------------------------------------------------------------------------- #
+# Cases                                                                       #
+# --------------------------------------------------------------------------- #
+
+
+@case("xbrl.parse")
+def _xbrl_parse(corpus: Corpus, _: argparse.Namespace) -> Generator[Bench, None, None]:
+    parser, content = XBRLParser(), corpus.xbrl_bytes
+    yield Bench(
+        fn=lambda: parser.parse(accession_id="0001000000-24-000001", content=content),
+        items=corpus.params["xbrl_facts"],
+    )
+
+
+@case("xbrl.normalize")
+def _xbrl_normalize(corpus: Corpus, _: argparse.Namespace) -> Generator[Bench, None, None]:
+    document, normalizer = corpus.xbrl_document, CanonicalStatementNormalizer()
+    cik = next(iter(document.contexts.values())).entity_identifier
+
+    def normalize_filing() -> None:
+        index = XBRLDocumentIndex(document)
+        for statement_type in StatementType:
+            normalizer.normalize(
+                NormalizationContext(
+                    cik=cik,
+                    statement_type=statement_type,
+                    accounting_standard=AccountingStandard.US_GAAP,
+                    statement_date=date(2024, 12, 31),
+                    fiscal_year=2024,
+                    fiscal_period=FiscalPeriod.FY,
+                    currency="USD",
+                    accession_id=document.accession_id,
+                    taxonomy="US_GAAP_MIN_E10A",
+                    version_sequence=1,
+                    facts=index.edgar_facts(currency="USD"),
+                    fact_index=index.fact_index(currency="USD"),
+                )
+            )
+
+    yield Bench(fn=normalize_filing, items=len(document.facts))
+
+
+@case("derived.compute")
+def _derived_compute(corpus: Corpus, _: argparse.Namespace) -> Generator[Bench, None, None]:
+    engine = DerivedMetricsEngine()
+    work: list[tuple[CanonicalStatementPayload, list[CanonicalStatementPayload]]] = []
+    for history in corpus.histories:
+        income = [p for p in history if p.statement_type is StatementType.INCOME_STATEMENT]
+        work.extend(
+            (payload, income[max(0, i - DERIVED_HISTORY) : i]) for i, payload in enumerate(income)
+        )
+
+    def compute_all() -> None:
+        for payload, trailing in work:
+            engine.compute(payload=payload, history=trailing)
+
+    yield Bench(fn=compute_all, items=len(work))
+
+
+@case("reconciliation.run")
+def _reconciliation_run(corpus: Corpus, _: argparse.Namespace) -> Generator[Bench, None, None]:
+    engine, rules = ReconciliationEngine(), get_default_e11_rules()
+    history = corpus.histories[0]
+    yield Bench(fn=lambda: engine.run(rules=rules, statements=history), items=len(history))
+
+
+@case("fact_dq.evaluate")
+def _fact_dq_evaluate(corpus: Corpus, _: argparse.Namespace) -> Generator[Bench, None, None]:
+    engine = FactDQEngine()
+    work: list[
+        tuple[NormalizedStatementIdentity, list[EdgarNormalizedFact], list[EdgarNormalizedFact]]
+    ] = []
+    history: list[EdgarNormalizedFact] = []
+    for payload in corpus.histories[0]:
+        if payload.statement_type is not StatementType.INCOME_STATEMENT:
+            continue
+        identity = NormalizedStatementIdentity(
+            cik=payload.cik,
+            statement_type=payload.statement_type,
+            fiscal_year=payload.fiscal_year,
+            fiscal_period=payload.fiscal_period,
+            version_sequence=payload.source_version_sequence,
+        )
+        facts = payload_to_facts(payload, version_sequence=1)
+        work.append((identity, facts, list(history)))
+        history.extend(facts)
+
+    def evaluate_all() -> None:
+        for identity, facts, prior in work:
+            engine.evaluate(statement_identity=identity, facts=facts, history=prior)
+
+    yield Bench(fn=evaluate_all, items=sum(len(facts) for _, facts, _ in work))
+
+
+@case("payload.serialize")
+def _payload_serialize(corpus: Corpus, _: argparse.Namespace) -> Generator[Bench, None, None]:
+    payloads, serialize = corpus.payloads, EdgarStatementsRepository._serialize_normalized_payload
+    yield Bench(fn=lambda: [json.dumps(serialize(p)) for p in payloads], items=len(payloads))
+
+
+@case("payload.deserialize")
+def _payload_deserialize(corpus: Corpus, _: argparse.Namespace) -> Generator[Bench, None, None]:
+    serialize = EdgarStatementsRepository._serialize_normalized_payload
+    documents = [json.dumps(serialize(p)) for p in corpus.payloads]
+    load = EdgarStatementsRepository._map_normalized_payload
+    yield Bench(fn=lambda: [load(json.loads(d)) for d in documents], items=len(documents))
+
+
+class _CompilingSession:
+    """Session stand-in that compiles statements for PostgreSQL instead of sending them."""
+
+    _dialect = postgresql.dialect()  # type: ignore[no-untyped-call]
+
+    async def execute(self, statement: Any) -> None:
+        statement.compile(dialect=self._dialect)
+
+
+@case("bars.upsert.compile")
+def _bars_upsert_compile(corpus: Corpus, _: argparse.Namespace) -> Generator[Bench, None, None]:
+    loop = asyncio.new_event_loop()
+    repo, rows = MarketDataRepository(_CompilingSession()), corpus.bars  # type: ignore[arg-type]
+    try:
+        yield Bench(
+            fn=lambda: loop.run_until_complete(repo.upsert_intraday_bars(rows)), items=len(rows)
+        )
+    finally:
+        loop.close()
+
+
+@case("bars.upsert.db")
+def _bars_upsert_db(corpus: Corpus, args: argparse.Namespace) -> Generator[Bench, None, None]:
+    if not args.database_url:
+        return
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    loop = asyncio.new_event_loop()
+    engine = create_async_engine(args.database_url)
+    rows = corpus.bars
+
+    async def open_session() -> Any:
+        from sqlalchemy.ext.asyncio import AsyncSession
+
+        session = AsyncSession(engine)
+        await session.begin()
+        return session
+
+    session = loop.run_until_complete(open_session())
+    repo = MarketDataRepository(session)
+    try:
+        yield Bench(
+            fn=lambda: loop.run_until_complete(repo.upsert_intraday_bars(rows)), items=len(rows)
+        )
+    finally:
+        loop.run_until_complete(session.rollback())
+        loop.run_until_complete(session.close())
+        loop.run_until_complete(engine.dispose())
+        loop.close()
+
+
+# --------------------------------------------------------------------------- #
+# Runner                                                                      #
+# --------------------------------------------------------------------------- #
+
+
+def measure(bench: Bench, *, rounds: int, min_round_s: float) -> dict[str, float]:
+    """Time ``bench`` and return per-call statistics.
+
+    One warm-up call sizes the round so that each round runs for at least
+    ``min_round_s``; the per-call time of each round is then recorded.
+    """
+    t0 = time.perf_counter()
+    bench.fn()
+    warmup = time.perf_counter() - t0
+    number = max(1, int(min_round_s / warmup) if warmup > 0 else 1)
+
+    per_call: list[float] = []
+    for _ in range(rounds):
+        t0 = time.perf_counter()
+        for _ in range(number):
+            bench.fn()
+        per_call.append((time.perf_counter() - t0) / number)
+
+    median = statistics.median(per_call)
+    return {
+        "items": bench.items,
+        "calls_per_round": number,
+        "median_s": median,
+        "min_s": min(per_call),
+        "items_per_s": bench.items / median if median > 0 else 0.0,
+    }
+
+
+def run(args: argparse.Namespace) -> dict[str, Any]:
+    """Run the selected cases and return the results document."""
+    params = SCALES[args.scale]
+    corpus = Corpus(params)
+    results: dict[str, dict[str, float]] = {}
+    skipped: list[str] = []
+
+    print(f"{'case':<22} {'items':>9} {'median ms':>11} {'min ms':>10} {'items/s':>13}")
+    for name, factory in CASES.items():
+        if args.only and not any(fnmatch.fnmatch(name, pattern) for pattern in args.only):
+            continue
+        cases = factory(corpus, args)
+        bench = next(cases, None)
+        if bench is None:
+            skipped.append(name)
+            print(f"{name:<22} {'skipped':>9}")
+            continue
+        try:
+            stats = measure(bench, rounds=args.rounds, min_round_s=args.min_round_time)
+        finally:
+            cases.close()
+        results[name] = stats
+        print(
+            f"{name:<22} {stats['items']:>9} {stats['median_s'] * 1e3:>11.2f}"
+            f" {stats['min_s'] * 1e3:>10.2f} {stats['items_per_s']:>13,.0f}"
+        )
+
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "scale": args.scale,
+        "params": params,
+        "environment": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "system": platform.system(),
+        },
+        "results": results,
+        "skipped": skipped,
+    }
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any], *, max_regression: float) -> int:
+    """Print current vs. baseline medians; return the process exit status."""
+    if baseline.get("params") != current["params"]:
+        print(
+            f"baseline was recorded at scale {baseline.get('scale')!r} "
+            f"{baseline.get('params')}, current run is {current['scale']!r} {current['params']}"
+        )
+        return 2
+
+    failed: list[str] = []
+    print(f"\n{'case':<22} {'baseline ms':>12} {'current ms':>11} {'change':>8}")
+    for name, stats in current["results"].items():
+        reference = baseline["results"].get(name)
+        if reference is None:
+            print(f"{name:<22} {'—':>12} {stats['median_s'] * 1e3:>11.2f} {'new':>8}")
+            continue
+        change = stats["median_s"] / reference["median_s"] - 1
+        flag = ""
+        if change > max_regression:
+            failed.append(name)
+            flag = "  REGRESSION"
+        print(
+            f"{name:<22} {reference['median_s'] * 1e3:>12.2f} "
+            f"{stats['median_s'] * 1e3:>11.2f} {change:>+8.1%}{flag}"
+        )
+
+    if failed:
+        print(f"\n{len(failed)} case(s) regressed by more than {max_regression:.0%}: {failed}")
+        return 1
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the suite."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", choices=sorted(SCALES), default="default")
+    parser.add_argument(
+        "--only", nargs="+", metavar="PATTERN", help="Run cases matching these glob patterns."
+    )
+    parser.add_argument("--rounds", type=int, default=5, help="Timed rounds per case.")
+    parser.add_argument(
+        "--min-round-time", type=float, default=0.2, help="Minimum seconds per round."
+    )
+    parser.add_argument("--output", type=Path, help="Write the results JSON here.")
+    parser.add_argument("--compare", type=Path, help="Baseline JSON to gate against.")
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=0.25,
+        help="Allowed slowdown of a case median vs. baseline (0.25 = 25%%).",
+    )
+    parser.add_argument(
+        "--database-url", help="asyncpg URL of a migrated database for bars.upsert.db."
+    )
+    args = parser.parse_args(argv)
+
+    current = run(args)
+    if args.output is not None:
+        args.output.write_text(json.dumps(current, indent=2, sort_keys=True) + "\n")
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text())
+        return compare(current, baseline, max_regression=args.max_regression)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
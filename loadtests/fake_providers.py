@@ -0,0 +1,487 @@
+# loadtests/fake_providers.py
+# Copyright (c) Arche.
+# SPDX-License-Identifier: MIT
+"""Local stand-ins for the Marketstack V2 and SEC EDGAR HTTP APIs.
+
+Purpose:
+    Serve deterministic, provider-shaped responses over real HTTP so load
+    tests exercise the production clients end to end — connection pooling,
+    retries, ``Retry-After`` handling, circuit breakers, conditional GETs and
+    the API's caches — without network access or live provider quotas.
+
+    Marketstack (``/eod``, ``/intraday``):
+        * ``symbols``/``date_from``/``date_to``/``limit``/``offset`` paging
+          with a ``pagination`` block; rows are generated lazily per page, so
+          multi-year, many-symbol windows produce large totals cheaply.
+        * 401 with a provider error body when ``access_key`` is missing.
+
+    EDGAR (``/submissions/CIK##########.json``,
+    ``/Archives/edgar/data/{cik}/{accession}/{accession}.xml``):
+        * Submissions JSON with a ``filings.recent`` column block of 10-K/10-Q
+          filings; XBRL instances with a configurable number of facts.
+        * 403 when the request carries no ``User-Agent`` (as SEC does).
+
+    Both servers:
+        * Strong ``ETag`` and ``Last-Modified`` on every 200; a matching
+          ``If-None-Match`` yields 304.
+        * Fault injection: fixed latency plus jitter, a 5xx error rate and a
+          429 rate (with ``Retry-After``), drawn from a seeded RNG.
+        * ``GET /__stats`` returns request counts by path and status;
+          ``POST /__faults`` replaces the fault settings at runtime (JSON body
+          with any :class:`Faults` field), e.g. to trip breakers mid-run.
+
+Usage:
+    python loadtests/fake_providers.py [--marketstack-port 9101] [--edgar-port 9102]
+        [--latency-ms 20] [--jitter-ms 10] [--error-rate 0.01]
+        [--throttle-rate 0.02] [--retry-after 1] [--xbrl-facts 2000]
+
+    Then point the API at the stand-ins:
+        MARKETSTACK_BASE_URL=http://127.0.0.1:9101 MARKETSTACK_ACCESS_KEY=loadtest
+        EDGAR_BASE_URL=http://127.0.0.1:9102
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import json
+import random
+import re
+import zlib
+from collections import Counter
+from dataclasses import asdict, dataclass, fields
+from datetime import UTC, date, datetime, timedelta
+from email.utils import format_datetime
+from functools import lru_cache
+from typing import Any
+
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+#: Provider data "last changed" instant, shared by every Last-Modified header.
+_LAST_MODIFIED = format_datetime(datetime(2024, 12, 31, 22, 0, tzinfo=UTC), usegmt=True)
+_INTERVAL_MINUTES = {"1min": 1, "5min": 5, "10min": 10, "15min": 15, "30min": 30, "1hour": 60}
+_SESSION_OPEN = (13, 30)  # 09:30 America/New_York in UTC (ignoring DST)
+_SESSION_MINUTES = 390
+
+
+@dataclass(slots=True)
+class Faults:
+    """Fault-injection settings applied before every provider response."""
+
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    throttle_rate: float = 0.0
+    retry_after_s: int = 1
+    seed: int = 0
+
+
+class _Injector:
+    """Applies :class:`Faults` and keeps per-path/status counters."""
+
+    def __init__(self, faults: Faults) -> None:
+        self.faults = faults
+        self.stats: Counter[str] = Counter()
+        self._rng = random.Random(faults.seed)  # noqa: S311
+
+    def update(self, overrides: dict[str, Any]) -> None:
+        known = {f.name for f in fields(Faults)}
+        self.faults = Faults(
+            **{**asdict(self.faults), **{k: v for k, v in overrides.items() if k in known}}
+        )
+        self._rng = random.Random(self.faults.seed)  # noqa: S311
+
+    async def before(self) -> Response | None:
+        """Sleep for the configured latency; return an injected error response, if any."""
+        faults = self.faults
+        delay = faults.latency_ms + self._rng.uniform(0, faults.jitter_ms)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+        roll = self._rng.random()
+        if roll < faults.throttle_rate:
+            return JSONResponse(
+                {"error": {"code": "rate_limit_reached", "message": "Too many requests."}},
+                status_code=429,
+                headers={"Retry-After": str(faults.retry_after_s)},
+            )
+        if roll < faults.throttle_rate + faults.error_rate:
+            return JSONResponse(
+                {"error": {"code": "internal_error", "message": "Injected failure."}},
+                status_code=503,
+            )
+        return None
+
+    def record(self, request: Request, response: Response) -> Response:
+        path = re.sub(r"\d{4,}", "{n}", request.url.path)
+        self.stats[f"{path} {response.status_code}"] += 1
+        return response
+
+
+def _conditional(request: Request, body: bytes, media_type: str) -> Response:
+    """Return 304 when ``If-None-Match`` matches the body's ETag, else 200."""
+    etag = f'"{hashlib.sha1(body, usedforsecurity=False).hexdigest()}"'
+    headers = {"ETag": etag, "Last-Modified": _LAST_MODIFIED}
+    if etag in {tag.strip() for tag in request.headers.get("if-none-match", "").split(",")}:
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type=media_type, headers=headers)
+
+
+def _stats_routes(injector: _Injector) -> list[Route]:
+    async def stats(_: Request) -> JSONResponse:
+        return JSONResponse({"faults": asdict(injector.faults), "requests": dict(injector.stats)})
+
+    async def set_faults(request: Request) -> JSONResponse:
+        injector.update(await request.json())
+        return JSONResponse(asdict(injector.faults))
+
+    return [Route("/__stats", stats), Route("/__faults", set_faults, methods=["POST"])]
+
+
+# --------------------------------------------------------------------------- #
+# Marketstack                                                                 #
+# --------------------------------------------------------------------------- #
+
+
+def _price(symbol: str, ordinal: int) -> tuple[float, float, float, float, int]:
+    """Deterministic OHLCV for ``symbol`` at an ordinal (day or minute index)."""
+    rng = random.Random(zlib.crc32(f"{symbol}:{ordinal}".encode()))  # noqa: S311
+    base = 20 + zlib.crc32(symbol.encode()) % 480
+    close = base * (1 + 0.2 * rng.uniform(-1, 1))
+    open_ = close * (1 + rng.gauss(0, 0.01))
+    high = max(open_, close) * (1 + abs(rng.gauss(0, 0.005)))
+    low = min(open_, close) * (1 - abs(rng.gauss(0, 0.005)))
+    return open_, high, low, close, rng.randrange(10_000, 5_000_000)
+
+
+def _parse_day(raw: str | None, default: date) -> date:
+    if not raw:
+        return default
+    return date.fromisoformat(raw[:10])
+
+
+def _trading_days(start: date, end: date) -> list[date]:
+    days = (start + timedelta(days=n) for n in range((end - start).days + 1))
+    return [d for d in days if d.weekday() < 5]
+
+
+def _page_params(request: Request, *, max_limit: int) -> tuple[list[str], int, int] | Response:
+    if not request.query_params.get("access_key"):
+        return JSONResponse(
+            {
+                "error": {
+                    "code": "missing_access_key",
+                    "message": "You have not supplied an API Access Key.",
+                }
+            },
+            status_code=401,
+        )
+    symbols = [s for s in request.query_params.get("symbols", "").upper().split(",") if s]
+    if not symbols:
+        return JSONResponse(
+            {"error": {"code": "validation_error", "message": "symbols is required."}},
+            status_code=422,
+        )
+    limit = max(1, min(max_limit, int(request.query_params.get("limit", 100))))
+    offset = max(0, int(request.query_params.get("offset", 0)))
+    return symbols, limit, offset
+
+
+def _paged_body(rows: list[dict[str, Any]], *, limit: int, offset: int, total: int) -> bytes:
+    return json.dumps(
+        {
+            "pagination": {"limit": limit, "offset": offset, "count": len(rows), "total": total},
+            "data": rows,
+        }
+    ).encode()
+
+
+def build_marketstack_app(faults: Faults) -> Starlette:
+    """Return the Marketstack V2 stand-in."""
+    injector = _Injector(faults)
+
+    async def eod(request: Request) -> Response:
+        injected = await injector.before()
+        if injected is not None:
+            return injector.record(request, injected)
+        parsed = _page_params(request, max_limit=1000)
+        if isinstance(parsed, Response):
+            return injector.record(request, parsed)
+        symbols, limit, offset = parsed
+
+        today = datetime.now(UTC).date()
+        start = _parse_day(request.query_params.get("date_from"), today - timedelta(days=30))
+        end = _parse_day(request.query_params.get("date_to"), today)
+        days = _trading_days(start, end)[::-1]  # newest first, as Marketstack returns
+        total = len(days) * len(symbols)
+
+        rows = []
+        for index in range(offset, min(total, offset + limit)):
+            day, symbol = days[index // len(symbols)], symbols[index % len(symbols)]
+            o, h, lo, c, v = _price(symbol, day.toordinal())
+            rows.append(
+                {
+                    "open": round(o, 4),
+                    "high": round(h, 4),
+                    "low": round(lo, 4),
+                    "close": round(c, 4),
+                    "volume": v,
+                    "adj_close": round(c, 4),
+                    "symbol": symbol,
+                    "exchange": "XNAS",
+                    "currency": "USD",
+                    "date": f"{day.isoformat()}T00:00:00+0000",
+                }
+            )
+        body = _paged_body(rows, limit=limit, offset=offset, total=total)
+        return injector.record(request, _conditional(request, body, "application/json"))
+
+    async def intraday(request: Request) -> Response:
+        injected = await injector.before()
+        if injected is not None:
+            return injector.record(request, injected)
+        parsed = _page_params(request, max_limit=1000)
+        if isinstance(parsed, Response):
+            return injector.record(request, parsed)
+        symbols, limit, offset = parsed
+
+        step = _INTERVAL_MINUTES.get(request.query_params.get("interval", "1hour"), 60)
+        today = datetime.now(UTC).date()
+        start = _parse_day(request.query_params.get("date_from"), today - timedelta(days=7))
+        end = _parse_day(request.query_params.get("date_to"), today)
+        bars_per_day = _SESSION_MINUTES // step
+        days = _trading_days(start, end)[::-1]
+        per_symbol = len(days) * bars_per_day
+        total = per_symbol * len(symbols)
+
+        rows = []
+        for index in range(offset, min(total, offset + limit)):
+            slot, position = divmod(index, len(symbols))
+            symbol = symbols[position]
+            day_index, bar = divmod(slot, bars_per_day)
+            opened = datetime(*days[day_index].timetuple()[:3], *_SESSION_OPEN, tzinfo=UTC)
+            ts = opened + timedelta(minutes=(bars_per_day - 1 - bar) * step)
+            o, h, lo, c, v = _price(symbol, int(ts.timestamp()) // 60)
+            rows.append(
+                {
+                    "open": round(o, 4),
+                    "high": round(h, 4),
+                    "low": round(lo, 4),
+                    "close": round(c, 4),
+                    "last": round(c, 4),
+                    "volume": v,
+                    "symbol": symbol,
+                    "exchange": "IEXG",
+                    "date": ts.strftime("%Y-%m-%dT%H:%M:%S+0000"),
+                }
+            )
+        body = _paged_body(rows, limit=limit, offset=offset, total=total)
+        return injector.record(request, _conditional(request, body, "application/json"))
+
+    return Starlette(
+        routes=[Route("/eod", eod), Route("/intraday", intraday), *_stats_routes(injector)]
+    )
+
+
+# --------------------------------------------------------------------------- #
+# EDGAR                                                                       #
+# --------------------------------------------------------------------------- #
+
+
+def _accession(cik: int, index: int) -> str:
+    return f"{cik:010d}-{(24 - index // 4) % 100:02d}-{index + 1:06d}"
+
+
+def _filing_periods(count: int) -> list[tuple[str, date, date]]:
+    """Return ``(form, report_date, filing_date)`` newest first."""
+    out = []
+    for index in range(count):
+        year, quarter = 2024 - index // 4, 4 - index % 4
+        report = date(year, quarter * 3, 30 if quarter in (2, 3) else 31)
+        form = "10-K" if quarter == 4 else "10-Q"
+        out.append((form, report, report + timedelta(days=60 if form == "10-K" else 40)))
+    return out
+
+
+@lru_cache(maxsize=256)
+def _xbrl_document(cik: int, accession: str, facts: int) -> bytes:
+    """Return an XBRL instance for one filing (cached: generation is not the SUT)."""
+    rng = random.Random(zlib.crc32(accession.encode()))  # noqa: S311
+    concepts = (
+        ("Revenues", "usd"),
+        ("NetIncomeLoss", "usd"),
+        ("OperatingIncomeLoss", "usd"),
+        ("EarningsPerShareDiluted", "usdPerShare"),
+        ("Assets", "usd"),
+        ("Liabilities", "usd"),
+        ("StockholdersEquity", "usd"),
+        ("NetCashProvidedByUsedInOperatingActivities", "usd"),
+    )
+    parts = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        '<xbrli:xbrl xmlns:xbrli="http://www.xbrl.org/2003/instance"'
+        ' xmlns:us-gaap="http://fasb.org/us-gaap/2024">',
+        '<xbrli:unit id="usd"><xbrli:measure>iso4217:USD</xbrli:measure></xbrli:unit>',
+        '<xbrli:unit id="usdPerShare"><xbrli:measure>iso4217:USD</xbrli:measure></xbrli:unit>',
+    ]
+    for ctx in range(8):
+        parts.append(
+            f'<xbrli:context id="c{ctx}"><xbrli:entity><xbrli:identifier'
+            f' scheme="http://www.sec.gov/CIK">{cik:010d}</xbrli:identifier></xbrli:entity>'
+            f"<xbrli:period><xbrli:startDate>{2024 - ctx}-01-01</xbrli:startDate>"
+            f"<xbrli:endDate>{2024 - ctx}-12-31</xbrli:endDate></xbrli:period></xbrli:context>"
+        )
+    for i in range(facts):
+        concept, unit = concepts[i % len(concepts)]
+        value = (
+            f"{rng.uniform(-5, 15):.2f}"
+            if unit == "usdPerShare"
+            else str(rng.randrange(10**6, 10**11))
+        )
+        parts.append(
+            f'<us-gaap:{concept} id="f{i}" contextRef="c{i % 8}" unitRef="{unit}"'
+            f' decimals="0">{value}</us-gaap:{concept}>'
+        )
+    parts.append("</xbrli:xbrl>")
+    return "\n".join(parts).encode()
+
+
+def build_edgar_app(
+    faults: Faults, *, filings_per_company: int = 40, xbrl_facts: int = 2000
+) -> Starlette:
+    """Return the SEC EDGAR stand-in."""
+    injector = _Injector(faults)
+
+    def _forbidden(request: Request) -> Response | None:
+        if request.headers.get("user-agent"):
+            return None
+        return Response("Undeclared automated tool.", status_code=403, media_type="text/plain")
+
+    async def submissions(request: Request) -> Response:
+        injected = _forbidden(request) or await injector.before()
+        if injected is not None:
+            return injector.record(request, injected)
+        cik = int(request.path_params["cik"])
+        periods = _filing_periods(filings_per_company)
+        accessions = [_accession(cik, i) for i in range(len(periods))]
+        body = json.dumps(
+            {
+                "cik": str(cik),
+                "entityType": "operating",
+                "name": f"Loadtest Company {cik}",
+                "tickers": [f"LT{cik % 100_000}"],
+                "exchanges": ["Nasdaq"],
+                "filings": {
+                    "recent": {
+                        "accessionNumber": accessions,
+                        "filingDate": [filed.isoformat() for _, _, filed in periods],
+                        "reportDate": [report.isoformat() for _, report, _ in periods],
+                        "acceptanceDateTime": [
+                            f"{filed.isoformat()}T16:05:00.000Z" for _, _, filed in periods
+                        ],
+                        "form": [form for form, _, _ in periods],
+                        "primaryDocument": [f"{a.replace('-', '')}.htm" for a in accessions],
+                    },
+                    "files": [],
+                },
+            }
+        ).encode()
+        return injector.record(request, _conditional(request, body, "application/json"))
+
+    async def archive(request: Request) -> Response:
+        injected = _forbidden(request) or await injector.before()
+        if injected is not None:
+            return injector.record(request, injected)
+        cik, folder, name = (request.path_params[k] for k in ("cik", "folder", "name"))
+        if name != f"{folder}.xml":
+            return injector.record(request, Response(status_code=404))
+        accession = f"{folder[:10]}-{folder[10:12]}-{folder[12:]}"
+        body = _xbrl_document(int(cik), accession, xbrl_facts)
+        return injector.record(request, _conditional(request, body, "application/xml"))
+
+    return Starlette(
+        routes=[
+            Route("/submissions/CIK{cik:int}.json", submissions),
+            Route("/Archives/edgar/data/{cik:int}/{folder}/{name}", archive),
+            *_stats_routes(injector),
+        ]
+    )
+
+
+# --------------------------------------------------------------------------- #
+# Entrypoint                                                                  #
+# --------------------------------------------------------------------------- #
+
+
+async def serve(
+    *,
+    host: str,
+    marketstack_port: int,
+    edgar_port: int,
+    faults: Faults,
+    xbrl_facts: int = 2000,
+) -> None:
+    """Serve both stand-ins until cancelled."""
+    servers = [
+        uvicorn.Server(
+            uvicorn.Config(app, host=host, port=port, log_level="warning", access_log=False)
+        )
+        for app, port in (
+            (build_marketstack_app(faults), marketstack_port),
+            (build_edgar_app(faults, xbrl_facts=xbrl_facts), edgar_port),
+        )
+    ]
+    await asyncio.gather(*(server.serve() for server in servers))
+
+
+def add_fault_arguments(parser: argparse.ArgumentParser) -> None:
+    """Register the fault-injection options on ``parser``."""
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Base latency per response.")
+    parser.add_argument("--jitter-ms", type=float, default=10.0, help="Uniform extra latency.")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction answered with 503.")
+    parser.add_argument(
+        "--throttle-rate", type=float, default=0.0, help="Fraction answered with 429."
+    )
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds on 429.")
+    parser.add_argument("--seed", type=int, default=0, help="Fault RNG seed.")
+
+
+def faults_from_args(args: argparse.Namespace) -> Faults:
+    """Build :class:`Faults` from options registered by :func:`add_fault_arguments`."""
+    return Faults(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        retry_after_s=args.retry_after,
+        seed=args.seed,
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the stand-ins."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--marketstack-port", type=int, default=9101)
+    parser.add_argument("--edgar-port", type=int, default=9102)
+    parser.add_argument("--xbrl-facts", type=int, default=2000, help="Facts per XBRL instance.")
+    add_fault_arguments(parser)
+    args = parser.parse_args(argv)
+    asyncio.run(
+        serve(
+            host=args.host,
+            marketstack_port=args.marketstack_port,
+            edgar_port=args.edgar_port,
+            faults=faults_from_args(args),
+            xbrl_facts=args.xbrl_facts,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,458 @@
+# loadtests/harness.py
+# Copyright (c) Arche.
+# SPDX-License-Identifier: MIT
+r"""HTTP load harness for the Arche API with mixed, weighted traffic.
+
+Purpose:
+    Drive a running API (or one spawned here against the local provider
+    stand-ins in ``loadtests/fake_providers.py``) with a realistic request mix
+    and report per-route throughput, status mix, error rate and latency
+    percentiles, so capacity and tail-latency regressions show up before
+    production does.
+
+Scenarios (``--mix name=weight,...``):
+    quotes               ``GET /v2/quotes`` for 1-5 tickers; every other
+                         request replays the last ETag as ``If-None-Match``.
+    historical_daily     ``GET /v2/quotes/historical?interval=1d`` over
+                         1-3 year windows, random page (large provider pages).
+    historical_intraday  ``GET /v2/quotes/historical?interval=1m`` for one
+                         recent trading week.
+    health               ``GET /health/z``.
+    edgar_ingest         EDGAR ingestion is not exposed over HTTP, so this runs
+                         the production ingestion gateway in-process against
+                         ``--edgar-url``: identity -> filings -> one XBRL
+                         instance, over the pooled ``edgar`` transport.
+
+Load model:
+    ``--concurrency`` workers loop for ``--duration`` seconds (closed loop). With
+    ``--rps`` the workers instead share a fixed-rate schedule (open loop), and
+    latency is measured from the *scheduled* start so queueing delay is not
+    hidden (no coordinated omission).
+
+Errors:
+    A request counts as an error on a 5xx status, a transport exception or a
+    timeout. 4xx responses (including 429) are reported separately; 304 is a
+    success.
+
+Usage:
+    # Everything local: stand-ins + API subprocess (needs DATABASE_URL/REDIS_URL
+    # in the environment, as for ``make run``).
+    python loadtests/harness.py --spawn --duration 60 --concurrency 32
+
+    # Against an already running API (pointed at the stand-ins or not).
+    python loadtests/harness.py --base-url http://127.0.0.1:8000 --rps 200 \
+        --mix quotes=6,historical_daily=2,health=1 --output load.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from fake_providers import add_fault_arguments  # noqa: E402
+
+_TICKERS = ("AAPL", "MSFT", "NVDA", "AMZN", "GOOGL", "META", "TSLA", "BRK.B", "JPM", "V", "XOM")
+_CIKS = (320193, 789019, 1045810, 1018724, 1652044, 1326801, 1318605, 1067983, 19617, 1403161)
+DEFAULT_MIX = "quotes=6,historical_daily=2,historical_intraday=1,health=1,edgar_ingest=1"
+
+
+@dataclass(slots=True)
+class RouteStats:
+    """Samples for one route label."""
+
+    latencies_ms: list[float] = field(default_factory=list)
+    statuses: dict[str, int] = field(default_factory=dict)
+    errors: int = 0
+
+    def add(self, latency_ms: float, status: str, *, error: bool) -> None:
+        """Record one request outcome."""
+        self.latencies_ms.append(latency_ms)
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        self.errors += int(error)
+
+    def summary(self, elapsed_s: float) -> dict[str, Any]:
+        """Return throughput, error rates and latency percentiles."""
+        ordered = sorted(self.latencies_ms)
+        count = len(ordered)
+        client_errors = sum(n for s, n in self.statuses.items() if s.startswith("4"))
+        return {
+            "count": count,
+            "rps": round(count / elapsed_s, 2) if elapsed_s else 0.0,
+            "error_rate": round(self.errors / count, 4) if count else 0.0,
+            "client_error_rate": round(client_errors / count, 4) if count else 0.0,
+            "statuses": dict(sorted(self.statuses.items())),
+            "p50_ms": _percentile(ordered, 0.50),
+            "p95_ms": _percentile(ordered, 0.95),
+            "p99_ms": _percentile(ordered, 0.99),
+            "max_ms": round(ordered[-1], 2) if ordered else None,
+        }
+
+
+def _percentile(ordered: list[float], q: float) -> float | None:
+    """Nearest-rank percentile of an ascending sample."""
+    if not ordered:
+        return None
+    rank = max(1, min(len(ordered), round(q * len(ordered) + 0.5)))
+    return round(ordered[rank - 1], 2)
+
+
+@dataclass(slots=True)
+class Context:
+    """Shared state handed to every scenario call."""
+
+    client: httpx.AsyncClient
+    rng: random.Random
+    edgar: Any = None
+    etags: dict[str, str] = field(default_factory=dict)
+
+
+Scenario = Callable[[Context], Awaitable[int]]
+
+
+# --------------------------------------------------------------------------- #
+# Scenarios                                                                   #
+# --------------------------------------------------------------------------- #
+
+
+async def _quotes(ctx: Context) -> int:
+    symbols = ",".join(sorted(ctx.rng.sample(_TICKERS, ctx.rng.randint(1, 5))))
+    headers = {}
+    if symbols in ctx.etags and ctx.rng.random() < 0.5:
+        headers["If-None-Match"] = ctx.etags[symbols]
+    resp = await ctx.client.get("/v2/quotes", params={"tickers": symbols}, headers=headers)
+    if "etag" in resp.headers:
+        ctx.etags[symbols] = resp.headers["etag"]
+    return resp.status_code
+
+
+async def _historical(ctx: Context, *, interval: str) -> int:
+    today = datetime.now(UTC).date()
+    if interval == "1d":
+        start = today - timedelta(days=365 * ctx.rng.randint(1, 3))
+        page, page_size = ctx.rng.randint(1, 4), 500
+    else:
+        start = today - timedelta(days=7)
+        page, page_size = ctx.rng.randint(1, 2), 200
+    params: dict[str, str | int | list[str]] = {
+        "tickers": ctx.rng.sample(_TICKERS, ctx.rng.randint(1, 3)),
+        "from_": start.isoformat(),
+        "to": today.isoformat(),
+        "interval": interval,
+        "page": page,
+        "page_size": page_size,
+    }
+    resp = await ctx.client.get("/v2/quotes/historical", params=params)
+    return resp.status_code
+
+
+async def _historical_daily(ctx: Context) -> int:
+    return await _historical(ctx, interval="1d")
+
+
+async def _historical_intraday(ctx: Context) -> int:
+    return await _historical(ctx, interval="1m")
+
+
+async def _health(ctx: Context) -> int:
+    resp = await ctx.client.get("/health/z")
+    return resp.status_code
+
+
+async def _edgar_ingest(ctx: Context) -> int:
+    from arche_api.domain.enums.edgar import FilingType
+
+    gateway = ctx.edgar
+    company = await gateway.fetch_company_identity(str(ctx.rng.choice(_CIKS)))
+    filings = await gateway.fetch_filings_for_company(
+        company,
+        [FilingType.FORM_10K, FilingType.FORM_10Q],
+        date(2020, 1, 1),
+        datetime.now(UTC).date(),
+    )
+    if filings:
+        await gateway.fetch_xbrl_for_filing(
+            cik=company.cik, accession_id=ctx.rng.choice(filings).accession_id
+        )
+    return 200
+
+
+#: Scenario name -> (report label, callable).
+SCENARIOS: dict[str, tuple[str, Scenario]] = {
+    "quotes": ("GET /v2/quotes", _quotes),
+    "historical_daily": ("GET /v2/quotes/historical [1d]", _historical_daily),
+    "historical_intraday": ("GET /v2/quotes/historical [1m]", _historical_intraday),
+    "health": ("GET /health/z", _health),
+    "edgar_ingest": ("edgar ingest (in-process)", _edgar_ingest),
+}
+
+
+def parse_mix(raw: str) -> dict[str, int]:
+    """Parse ``name=weight,...`` into a validated weight table."""
+    mix: dict[str, int] = {}
+    for part in filter(None, (p.strip() for p in raw.split(","))):
+        name, _, weight = part.partition("=")
+        if name not in SCENARIOS:
+            raise SystemExit(f"unknown scenario {name!r}; choose from {sorted(SCENARIOS)}")
+        mix[name] = int(weight or 1)
+    if not any(mix.values()):
+        raise SystemExit("--mix must give at least one scenario a positive weight")
+    return mix
+
+
+def _build_edgar_gateway(edgar_url: str) -> Any:
+    from arche_api.adapters.gateways.edgar_gateway import HttpEdgarIngestionGateway
+    from arche_api.infrastructure.external_apis.edgar.client import EdgarClient
+    from arche_api.infrastructure.external_apis.edgar.settings import EdgarSettings
+    from arche_api.infrastructure.http.transport import get_http_transport_registry
+
+    settings = EdgarSettings(base_url=edgar_url, user_agent="arche-loadtest loadtest@example.com")
+    client = EdgarClient(settings, http=get_http_transport_registry().client("edgar"))
+    return HttpEdgarIngestionGateway(client)
+
+
+# --------------------------------------------------------------------------- #
+# Runner                                                                      #
+# --------------------------------------------------------------------------- #
+
+
+async def run(
+    *,
+    base_url: str,
+    mix: dict[str, int],
+    duration_s: float,
+    concurrency: int,
+    rps: float | None,
+    timeout_s: float,
+    seed: int,
+    edgar_url: str | None,
+) -> dict[str, Any]:
+    """Run the load and return the JSON report."""
+    names = [n for n, w in mix.items() if w > 0]
+    weights = [mix[n] for n in names]
+    if "edgar_ingest" in names and edgar_url is None:
+        raise SystemExit("edgar_ingest needs --edgar-url (or --spawn)")
+
+    stats: dict[str, RouteStats] = {}
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    started = time.perf_counter()
+    deadline = started + duration_s
+    issued = 0
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=timeout_s, limits=limits) as client:
+        edgar = _build_edgar_gateway(edgar_url) if edgar_url else None
+
+        async def worker(index: int) -> None:
+            nonlocal issued
+            rng = random.Random(seed * 7919 + index)  # noqa: S311
+            ctx = Context(client=client, rng=rng, edgar=edgar)
+            while True:
+                if rps is None:
+                    scheduled = time.perf_counter()
+                else:
+                    scheduled = started + issued / rps
+                    issued += 1
+                    await asyncio.sleep(max(0.0, scheduled - time.perf_counter()))
+                if scheduled >= deadline:
+                    return
+                label, scenario = SCENARIOS[ctx.rng.choices(names, weights)[0]]
+                try:
+                    status = await scenario(ctx)
+                    code, error = str(status), status >= 500
+                except Exception as exc:  # noqa: BLE001 - every failure is a sample
+                    code, error = type(exc).__name__, True
+                elapsed_ms = (time.perf_counter() - scheduled) * 1000
+                stats.setdefault(label, RouteStats()).add(elapsed_ms, code, error=error)
+
+        await asyncio.gather(*(worker(i) for i in range(concurrency)))
+
+    elapsed = time.perf_counter() - started
+    total = RouteStats()
+    for route in stats.values():
+        total.latencies_ms += route.latencies_ms
+        total.errors += route.errors
+        for status, n in route.statuses.items():
+            total.statuses[status] = total.statuses.get(status, 0) + n
+    return {
+        "schema_version": 1,
+        "params": {
+            "base_url": base_url,
+            "mix": mix,
+            "duration_s": duration_s,
+            "concurrency": concurrency,
+            "rps": rps,
+            "seed": seed,
+        },
+        "elapsed_s": round(elapsed, 3),
+        "total": total.summary(elapsed),
+        "routes": {label: stats[label].summary(elapsed) for label in sorted(stats)},
+    }
+
+
+def print_report(report: dict[str, Any]) -> None:
+    """Print a fixed-width per-route table."""
+    header = (
+        f"{'route':<40} {'count':>7} {'rps':>8} {'err%':>6} {'4xx%':>6}"
+        f" {'p50':>8} {'p95':>8} {'p99':>8}"
+    )
+    print(header)
+    print("-" * len(header))
+    rows = [*report["routes"].items(), ("TOTAL", report["total"])]
+    for label, s in rows:
+        print(
+            f"{label:<40} {s['count']:>7} {s['rps']:>8.1f} {s['error_rate'] * 100:>6.2f}"
+            f" {s['client_error_rate'] * 100:>6.2f} {s['p50_ms'] or 0:>8.1f}"
+            f" {s['p95_ms'] or 0:>8.1f} {s['p99_ms'] or 0:>8.1f}"
+        )
+
+
+# --------------------------------------------------------------------------- #
+# Spawned stack                                                               #
+# --------------------------------------------------------------------------- #
+
+
+def _wait_ready(url: str, *, timeout_s: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout_s
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(url, timeout=1.0).status_code < 500:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.25)
+    raise SystemExit(f"timed out waiting for {url}")
+
+
+@contextmanager
+def spawned_stack(args: argparse.Namespace) -> Iterator[tuple[str, str]]:
+    """Start the stand-ins and an API subprocess wired to them."""
+    here = Path(__file__).resolve().parent
+    marketstack_url = f"http://127.0.0.1:{args.marketstack_port}"
+    edgar_url = f"http://127.0.0.1:{args.edgar_port}"
+    fakes_cmd = [
+        sys.executable,
+        str(here / "fake_providers.py"),
+        f"--marketstack-port={args.marketstack_port}",
+        f"--edgar-port={args.edgar_port}",
+        f"--latency-ms={args.latency_ms}",
+        f"--jitter-ms={args.jitter_ms}",
+        f"--error-rate={args.error_rate}",
+        f"--throttle-rate={args.throttle_rate}",
+        f"--retry-after={args.retry_after}",
+        f"--seed={args.seed}",
+    ]
+    env = {
+        **os.environ,
+        "MARKETSTACK_BASE_URL": marketstack_url,
+        "MARKETSTACK_ACCESS_KEY": "loadtest",
+        "EDGAR_BASE_URL": edgar_url,
+        "STACKLION_TEST_MODE": "0",
+        "RATE_LIMIT_ENABLED": "false",
+    }
+    if env.get("ENVIRONMENT", "").lower() == "test":
+        env["ENVIRONMENT"] = "development"  # test mode swaps in the in-memory gateway
+    api_cmd = [
+        sys.executable,
+        "-m",
+        "uvicorn",
+        "arche_api.main:create_app",
+        "--factory",
+        "--host=127.0.0.1",
+        f"--port={args.api_port}",
+        f"--workers={args.api_workers}",
+        "--log-level=warning",
+        "--no-access-log",
+    ]
+    procs = [subprocess.Popen(fakes_cmd)]  # noqa: S603 - fixed argv
+    try:
+        _wait_ready(f"{marketstack_url}/__stats")
+        procs.append(subprocess.Popen(api_cmd, env=env))  # noqa: S603 - fixed argv
+        api_url = f"http://127.0.0.1:{args.api_port}"
+        _wait_ready(f"{api_url}/health/z")
+        yield api_url, edgar_url
+    finally:
+        for proc in reversed(procs):
+            proc.terminate()
+            try:
+                proc.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the load harness."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000", help="API under test.")
+    parser.add_argument("--edgar-url", default=None, help="EDGAR base URL for edgar_ingest.")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="Scenario weights, name=weight,...")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds of load.")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent workers.")
+    parser.add_argument("--rps", type=float, default=None, help="Open-loop target rate.")
+    parser.add_argument("--timeout", type=float, default=10.0, help="Per-request timeout.")
+    parser.add_argument("--output", type=Path, default=None, help="Write the JSON report here.")
+    parser.add_argument(
+        "--max-error-rate",
+        type=float,
+        default=None,
+        help="Exit 1 when the overall error rate exceeds this fraction.",
+    )
+    spawn = parser.add_argument_group("spawned stack")
+    spawn.add_argument("--spawn", action="store_true", help="Start stand-ins and the API here.")
+    spawn.add_argument("--api-port", type=int, default=8765)
+    spawn.add_argument("--api-workers", type=int, default=1)
+    spawn.add_argument("--marketstack-port", type=int, default=9101)
+    spawn.add_argument("--edgar-port", type=int, default=9102)
+    add_fault_arguments(spawn)
+    args = parser.parse_args(argv)
+
+    mix = parse_mix(args.mix)
+
+    def _run(base_url: str, edgar_url: str | None) -> dict[str, Any]:
+        return asyncio.run(
+            run(
+                base_url=base_url,
+                mix=mix,
+                duration_s=args.duration,
+                concurrency=args.concurrency,
+                rps=args.rps,
+                timeout_s=args.timeout,
+                seed=args.seed,
+                edgar_url=edgar_url,
+            )
+        )
+
+    if args.spawn:
+        with spawned_stack(args) as (api_url, edgar_url):
+            report = _run(api_url, args.edgar_url or edgar_url)
+    else:
+        report = _run(args.base_url, args.edgar_url)
+
+    print_report(report)
+    if args.output is not None:
+        args.output.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+    if args.max_error_rate is not None and report["total"]["error_rate"] > args.max_error_rate:
+        print(
+            f"error rate {report['total']['error_rate']:.2%} exceeds {args.max_error_rate:.2%}",
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,119 @@
+"""Create sec.edgar_restatement_ledger table.
+
+Revision ID: 20251214_0007_edgar_restatement_ledger
+Revises: 20251212_0006_edgar_reconciliation_checks
+Create Date: 2025-12-14
+
+Precomputed per-metric restatement deltas between adjacent normalized
+statement versions, indexed for universe-wide restatement screens.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "20251214_0007_edgar_restatement_ledger"
+down_revision: str | None = "20251212_0006_edgar_reconciliation_checks"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "edgar_restatement_ledger",
+        sa.Column("entry_id", postgresql.UUID(as_uuid=True), primary_key=True, nullable=False),
+        sa.Column("company_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("cik", sa.String(length=10), nullable=False),
+        sa.Column("statement_type", sa.String(length=32), nullable=False),
+        sa.Column("accounting_standard", sa.String(length=32), nullable=False),
+        sa.Column("fiscal_year", sa.Integer, nullable=False),
+        sa.Column("fiscal_period", sa.String(length=8), nullable=False),
+        sa.Column("statement_date", sa.Date, nullable=False),
+        sa.Column("currency", sa.String(length=16), nullable=False),
+        sa.Column("from_version_sequence", sa.Integer, nullable=False),
+        sa.Column("to_version_sequence", sa.Integer, nullable=False),
+        sa.Column("restated_on", sa.Date, nullable=True),
+        sa.Column("metric_code", sa.String(length=64), nullable=False),
+        sa.Column("old_value", sa.Numeric(38, 6), nullable=False),
+        sa.Column("new_value", sa.Numeric(38, 6), nullable=False),
+        sa.Column("diff_value", sa.Numeric(38, 6), nullable=False),
+        sa.Column("abs_diff_value", sa.Numeric(38, 6), nullable=False),
+        sa.Column("pct_change", sa.Numeric(38, 12), nullable=True),
+        sa.Column("abs_pct_change", sa.Numeric(38, 12), nullable=True),
+        sa.Column("materiality", sa.String(length=16), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+        ),
+        schema="sec",
+    )
+
+    op.create_unique_constraint(
+        "uq_edgar_restatement_ledger_hop_metric",
+        "edgar_restatement_ledger",
+        [
+            "company_id",
+            "statement_type",
+            "fiscal_year",
+            "fiscal_period",
+            "to_version_sequence",
+            "metric_code",
+        ],
+        schema="sec",
+    )
+
+    op.create_index(
+        "ix_edgar_restatement_ledger_screen",
+        "edgar_restatement_ledger",
+        ["statement_type", "metric_code", "fiscal_year", "fiscal_period", "abs_pct_change"],
+        schema="sec",
+    )
+
+    op.create_index(
+        "ix_edgar_restatement_ledger_materiality",
+        "edgar_restatement_ledger",
+        ["statement_type", "materiality", "restated_on"],
+        schema="sec",
+    )
+
+    op.create_foreign_key(
+        "fk_edgar_restatement_ledger_company",
+        "edgar_restatement_ledger",
+        "companies",
+        ["company_id"],
+        ["company_id"],
+        source_schema="sec",
+        referent_schema="ref",
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        "fk_edgar_restatement_ledger_company",
+        "edgar_restatement_ledger",
+        schema="sec",
+        type_="foreignkey",
+    )
+    op.drop_index(
+        "ix_edgar_restatement_ledger_materiality",
+        table_name="edgar_restatement_ledger",
+        schema="sec",
+    )
+    op.drop_index(
+        "ix_edgar_restatement_ledger_screen",
+        table_name="edgar_restatement_ledger",
+        schema="sec",
+    )
+    op.drop_constraint(
+        "uq_edgar_restatement_ledger_hop_metric",
+        "edgar_restatement_ledger",
+        schema="sec",
+        type_="unique",
+    )
+    op.drop_table("edgar_restatement_ledger", schema="sec")
@@ -53,6 +53,9 @@ from arche_api.application.use_cases.statements.get_restatement_timeline import
 from arche_api.application.use_cases.statements.get_statement_override_trace import (
     GetStatementOverrideTraceRequest,
 )
+from arche_api.application.use_cases.statements.get_statement_versions_validator import (
+    GetStatementVersionsValidatorRequest,
+)
 from arche_api.domain.entities.edgar_derived_timeseries import (
     DerivedMetricsTimeSeriesPoint,
 )
@@ -257,6 +260,14 @@ class GetStatementOverrideTraceUseCase(Protocol):
         ...
 
 
+class GetStatementVersionsValidatorUseCase(Protocol):
+    """Protocol for the statement-versions validator use case."""
+
+    async def execute(self, req: GetStatementVersionsValidatorRequest) -> str:
+        """Return an opaque validator for a statement-derived representation."""
+        ...
+
+
 class EdgarController(BaseController):
     """Controller orchestrating EDGAR filings, statements, and derived metrics."""
 
@@ -271,6 +282,7 @@ class EdgarController(BaseController):
         get_restatement_ledger_uc: GetRestatementLedgerUseCase | None = None,
         get_restatement_timeline_uc: GetRestatementTimelineUseCase | None = None,
         get_statement_override_trace_uc: GetStatementOverrideTraceUseCase | None = None,
+        get_statement_versions_validator_uc: GetStatementVersionsValidatorUseCase | None = None,
     ) -> None:
         """Initialize the controller with its use-cases.
 
@@ -295,6 +307,9 @@ class EdgarController(BaseController):
             get_statement_override_trace_uc:
                 Optional use-case providing override observability traces for
                 normalized statement identities.
+            get_statement_versions_validator_uc:
+                Optional use-case computing cheap validators for conditional
+                GETs on statement listings. When None, no ETag is emitted.
         """
         self._list_filings_uc = list_filings_uc
         self._get_filing_uc = get_filing_uc
@@ -305,6 +320,7 @@ class EdgarController(BaseController):
         self._get_restatement_ledger_uc = get_restatement_ledger_uc
         self._get_restatement_timeline_uc = get_restatement_timeline_uc
         self._get_statement_override_trace_uc = get_statement_override_trace_uc
+        self._get_statement_versions_validator_uc = get_statement_versions_validator_uc
 
     # ------------------------------------------------------------------
     # Filings
@@ -408,6 +424,40 @@ class EdgarController(BaseController):
             page_size=page_size,
         )
 
+    async def statement_versions_validator(
+        self,
+        *,
+        cik: str,
+        statement_type: StatementType,
+        from_date: date | None,
+        to_date: date | None,
+        representation: dict[str, Any],
+    ) -> str | None:
+        """Return a validator for a statement listing, or None when not wired.
+
+        Args:
+            cik: Company CIK.
+            statement_type: Statement type filter.
+            from_date: Optional lower bound on statement_date (inclusive).
+            to_date: Optional upper bound on statement_date (inclusive).
+            representation: Remaining parameters shaping the response.
+
+        Returns:
+            Opaque validator string, or None if no validator use-case is
+            configured.
+        """
+        if self._get_statement_versions_validator_uc is None:
+            return None
+        return await self._get_statement_versions_validator_uc.execute(
+            GetStatementVersionsValidatorRequest(
+                ciks=[cik.strip()],
+                statement_type=statement_type,
+                from_date=from_date,
+                to_date=to_date,
+                representation=representation,
+            ),
+        )
+
     async def get_statement_versions_for_filing(
         self,
         *,
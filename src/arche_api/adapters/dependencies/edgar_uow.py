@@ -9,33 +9,68 @@ Purpose:
 
 Layer:
     adapters/dependencies
+
+Notes:
+    Read endpoints depend on :func:`get_edgar_read_uow`, which routes to a
+    read replica when one is configured and fresh (see
+    ``infrastructure.database.session.open_read_session``). It is layered on
+    :func:`get_edgar_uow`, so overriding that dependency still replaces both.
 """
 
 from __future__ import annotations
 
+from typing import Annotated
+
+from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from arche_api.adapters.uow import SqlAlchemyUnitOfWork
+from arche_api.application.uow import UnitOfWork
 from arche_api.config.settings import get_settings
 from arche_api.infrastructure.database.session import (
     get_sessionmaker,
     init_engine_and_sessionmaker,
+    open_read_session,
 )
 
 
-def get_edgar_uow() -> SqlAlchemyUnitOfWork:
-    """Construct a UnitOfWork instance for EDGAR use cases.
+def build_edgar_uow(*, read_only: bool = False) -> SqlAlchemyUnitOfWork:
+    """Construct a UnitOfWork for EDGAR use cases.
 
     Behavior:
         - Ensures the global engine/sessionmaker are initialized
           (idempotent, safe to call multiple times).
-        - Obtains the async_sessionmaker via `get_sessionmaker()`.
-        - Returns a fresh SqlAlchemyUnitOfWork bound to that factory.
-        - Each call returns a new UoW instance (one per use-case invocation).
+        - Returns a fresh SqlAlchemyUnitOfWork bound to the primary; with
+          ``read_only=True`` its session comes from the replica router.
     """
     # Lazy-init to support test transports that skip lifespan.
     settings = get_settings()
     init_engine_and_sessionmaker(settings)
 
     session_factory: async_sessionmaker[AsyncSession] = get_sessionmaker()
-    return SqlAlchemyUnitOfWork(session_factory=session_factory)
+    return SqlAlchemyUnitOfWork(
+        session_factory=session_factory,
+        read_session_factory=open_read_session,
+        read_only=read_only,
+    )
+
+
+def get_edgar_uow() -> SqlAlchemyUnitOfWork:
+    """FastAPI dependency: a read-write UnitOfWork on the primary.
+
+    Each call returns a new UoW instance (one per use-case invocation).
+    """
+    return build_edgar_uow()
+
+
+def get_edgar_read_uow(
+    uow: Annotated[UnitOfWork, Depends(get_edgar_uow)],
+) -> UnitOfWork:
+    """FastAPI dependency: a read-only UnitOfWork for query endpoints.
+
+    Overrides of :func:`get_edgar_uow` (tests, alternative stores) are passed
+    through unchanged.
+    """
+    if isinstance(uow, SqlAlchemyUnitOfWork):
+        return uow.as_read_only()
+    return uow
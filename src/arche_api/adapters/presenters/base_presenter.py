@@ -9,7 +9,12 @@ Purpose:
 Responsibilities:
     * Build SuccessEnvelope, PaginatedEnvelope, and ErrorEnvelope instances.
     * Compute strong, quoted ETags from canonical JSON material.
+    * Format weak ETags from precomputed validators and evaluate
+      ``If-None-Match`` for conditional GETs.
     * Apply standard headers such as X-Request-ID and optional Cache-Control.
+    * Pre-render static representations (catalogs) once into JSON and gzip
+      bytes with a fixed ETag, served with long-lived caching and 304s, and
+      negotiate gzip from ``Accept-Encoding`` q-values.
 
 Layer:
     adapters/presenters
@@ -17,15 +22,15 @@ Layer:
 
 from __future__ import annotations
 
+import gzip
 import hashlib
-import json
 from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import date, datetime
 from decimal import Decimal
 from typing import Any
 
-from fastapi import Response
+from fastapi import Request, Response
 
 from arche_api.adapters.schemas.http.envelopes import (
     ErrorEnvelope,
@@ -34,9 +39,14 @@ from arche_api.adapters.schemas.http.envelopes import (
     SuccessEnvelope,
 )
 from arche_api.infrastructure.logging.logger import get_json_logger
+from arche_api.infrastructure.serialization.json_codec import get_json_codec
 
 _LOGGER = get_json_logger(__name__)
 
+#: Cache policy for representations that only change with a deploy. Clients
+#: revalidate with the ETag after a day; a new code version changes the ETag.
+STATIC_CACHE_CONTROL = "public, max-age=86400"
+
 
 def _json_default(value: Any) -> str:
     """Serialize non-JSON-native types deterministically for hashing.
@@ -66,16 +76,77 @@ def _json_default(value: Any) -> str:
 
 def _compute_quoted_etag(payload: Mapping[str, Any]) -> str:
     """Return a quoted strong ETag (SHA-256 of canonical JSON for ``payload``)."""
-    material = json.dumps(
-        payload,
-        sort_keys=True,
-        separators=(",", ":"),
-        default=_json_default,
-    ).encode("utf-8")
+    material = get_json_codec().dumps(payload, sort_keys=True, default=_json_default)
     digest = hashlib.sha256(material).hexdigest()
     return f'"{digest}"'
 
 
+def weak_etag(validator: str) -> str:
+    """Return a weak ETag (``W/"<validator>"``) for a precomputed validator.
+
+    Validators derived from stored data versions identify a representation
+    semantically rather than byte-for-byte, hence the weak form.
+    """
+    return f'W/"{validator}"'
+
+
+def if_none_match_satisfied(if_none_match: str | None, etag: str) -> bool:
+    """Return True when ``If-None-Match`` matches ``etag`` (weak comparison).
+
+    Handles ``*``, comma-separated lists, and ``W/`` prefixes on either side,
+    per RFC 9110 section 13.1.2.
+    """
+    if not if_none_match:
+        return False
+
+    def _opaque(tag: str) -> str:
+        tag = tag.strip()
+        return tag[2:] if tag.startswith("W/") else tag
+
+    target = _opaque(etag)
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or (candidate and _opaque(candidate) == target):
+            return True
+    return False
+
+
+def _qvalue(params: str) -> float:
+    """Return the ``q`` weight from ``;``-separated parameters (default 1)."""
+    for param in params.split(";"):
+        name, _, value = param.partition("=")
+        if name.strip().lower() == "q":
+            try:
+                return float(value)
+            except ValueError:
+                return 0.0
+    return 1.0
+
+
+def accepts_gzip(accept_encoding: str | None) -> bool:
+    """Return True when ``Accept-Encoding`` allows a gzip-coded response.
+
+    Honors q-values (``gzip;q=0`` refuses gzip), the ``x-gzip`` alias and the
+    ``*`` wildcard; an explicit gzip entry takes precedence over ``*``, per
+    RFC 9110 section 12.5.3. Malformed weights count as ``q=0``.
+    """
+    if not accept_encoding:
+        return False
+
+    gzip_q: float | None = None
+    wildcard_q: float | None = None
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if coding in ("gzip", "x-gzip"):
+            gzip_q = max(gzip_q or 0.0, _qvalue(params))
+        elif coding == "*":
+            wildcard_q = _qvalue(params)
+
+    weight = gzip_q if gzip_q is not None else wildcard_q
+    return weight is not None and weight > 0
+
+
 @dataclass(slots=True)
 class PresentResult[T]:
     """Presentation result envelope.
@@ -184,3 +255,62 @@ class BasePresenter[T]:
 
         if result.status_code is not None:
             response.status_code = result.status_code
+
+
+@dataclass(frozen=True, slots=True)
+class PrerenderedResponse:
+    """A static representation rendered once and served from memory.
+
+    Built from a presenter result whose body is a pure function of the code
+    version (registries, catalogs). Rendering, ETag hashing and compression
+    happen once; each request only compares ``If-None-Match`` and picks the
+    identity or gzip bytes.
+
+    Attributes:
+        body: Rendered JSON bytes (identical to FastAPI's rendering).
+        gzip_body: ``body`` compressed once at the highest level.
+        etag: Quoted strong ETag computed at render time.
+        cache_control: ``Cache-Control`` header value.
+    """
+
+    body: bytes
+    gzip_body: bytes
+    etag: str
+    cache_control: str
+
+    @classmethod
+    def from_result(
+        cls,
+        result: PresentResult[Any],
+        *,
+        cache_control: str = STATIC_CACHE_CONTROL,
+    ) -> PrerenderedResponse:
+        """Render ``result`` (a success envelope with an ETag) to bytes."""
+        if result.body is None:
+            raise ValueError("cannot pre-render a result without a body")
+        body = result.body.model_dump_json().encode("utf-8")
+        etag = result.headers.get("ETag") or _compute_quoted_etag(
+            result.body.model_dump(mode="python")
+        )
+        return cls(
+            body=body,
+            gzip_body=gzip.compress(body, compresslevel=9, mtime=0),
+            etag=etag,
+            cache_control=cache_control,
+        )
+
+    def respond(self, request: Request, *, trace_id: str | None = None) -> Response:
+        """Return a 304 or the (optionally gzip-encoded) representation."""
+        headers = {
+            "ETag": self.etag,
+            "Cache-Control": self.cache_control,
+            "Vary": "Accept-Encoding",
+        }
+        if trace_id:
+            headers["X-Request-ID"] = trace_id
+        if if_none_match_satisfied(request.headers.get("If-None-Match"), self.etag):
+            return Response(status_code=304, headers=headers)
+        if accepts_gzip(request.headers.get("Accept-Encoding")):
+            headers["Content-Encoding"] = "gzip"
+            return Response(self.gzip_body, media_type="application/json", headers=headers)
+        return Response(self.body, media_type="application/json", headers=headers)
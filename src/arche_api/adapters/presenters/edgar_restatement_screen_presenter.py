@@ -0,0 +1,87 @@
+# src/arche_api/adapters/presenters/edgar_restatement_screen_presenter.py
+# Copyright (c)
+# SPDX-License-Identifier: MIT
+"""Presenter: restatement screener results → HTTP envelopes.
+
+Purpose:
+    Map the application-layer restatement screen result into canonical HTTP
+    schemas and a SuccessEnvelope.
+
+Layer:
+    adapters/presenters
+"""
+
+from __future__ import annotations
+
+from arche_api.adapters.schemas.http.edgar_schemas import (
+    RestatementScreenHitHTTP,
+    RestatementScreenHTTP,
+)
+from arche_api.adapters.schemas.http.envelopes import SuccessEnvelope
+from arche_api.application.use_cases.statements.screen_restatements import (
+    ScreenRestatementsResult,
+)
+from arche_api.domain.entities.edgar_restatement_ledger import RestatementLedgerRecord
+from arche_api.infrastructure.logging.logger import get_json_logger
+
+_LOGGER = get_json_logger(__name__)
+
+
+def _map_record_to_http(record: RestatementLedgerRecord) -> RestatementScreenHitHTTP:
+    """Map a ledger record to its HTTP schema (decimals stringified)."""
+    return RestatementScreenHitHTTP(
+        cik=record.cik,
+        statement_type=record.statement_type,
+        accounting_standard=record.accounting_standard,
+        statement_date=record.statement_date,
+        fiscal_year=record.fiscal_year,
+        fiscal_period=record.fiscal_period,
+        currency=record.currency,
+        from_version_sequence=record.from_version_sequence,
+        to_version_sequence=record.to_version_sequence,
+        restated_on=record.restated_on,
+        metric=record.metric.value,
+        old_value=str(record.old_value),
+        new_value=str(record.new_value),
+        diff=str(record.diff),
+        pct_change=str(record.pct_change) if record.pct_change is not None else None,
+        materiality=record.materiality,
+    )
+
+
+def present_restatement_screen(
+    result: ScreenRestatementsResult,
+) -> SuccessEnvelope[RestatementScreenHTTP]:
+    """Present a restatement screen as a SuccessEnvelope.
+
+    Hits keep the repository ordering (|pct_change| DESC with undefined
+    relative changes first, then cik), which is already deterministic.
+    """
+    query = result.query
+    hits = [_map_record_to_http(record) for record in result.records]
+
+    payload = RestatementScreenHTTP(
+        statement_type=query.statement_type,
+        metric=query.metric.value if query.metric is not None else None,
+        fiscal_year=query.fiscal_year,
+        fiscal_period=query.fiscal_period,
+        min_abs_pct_change=(
+            str(query.min_abs_pct_change) if query.min_abs_pct_change is not None else None
+        ),
+        min_materiality=query.min_materiality,
+        total=len(hits),
+        hits=hits,
+    )
+
+    _LOGGER.info(
+        "edgar_presenter_restatement_screen",
+        extra={
+            "statement_type": query.statement_type.value,
+            "metric": payload.metric,
+            "fiscal_year": query.fiscal_year,
+            "fiscal_period": query.fiscal_period.value if query.fiscal_period else None,
+            "hits": len(hits),
+        },
+    )
+
+    return SuccessEnvelope(data=payload)
@@ -0,0 +1,191 @@
+# src/arche_api/adapters/presenters/fundamentals_export_presenter.py
+# Copyright (c)
+# SPDX-License-Identifier: MIT
+"""Fundamentals bulk-export encoders (NDJSON / Arrow IPC).
+
+Purpose:
+    Encode a lazily produced fundamentals time series into byte chunks for
+    streaming HTTP responses, without materializing the panel or building
+    Pydantic envelopes per request.
+
+Layer:
+    adapters/presenters
+
+Notes:
+    - NDJSON rows carry exactly the fields of ``FundamentalsTimeSeriesPointHTTP``
+      (metrics as decimal strings), one JSON object per line.
+    - Arrow output is an IPC *stream* (schema message, record batches, end of
+      stream marker). Metrics become one ``decimal128`` column each; the
+      column set is the metric projection, or every canonical metric when no
+      projection is requested.
+    - Arrow support requires the optional ``pyarrow`` dependency (``arrow``
+      extra). Callers check :func:`arrow_export_available` first.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+from collections.abc import AsyncIterator, Sequence
+from decimal import Decimal, localcontext
+from typing import Any, Final
+
+from arche_api.domain.entities.edgar_fundamentals_timeseries import (
+    FundamentalsTimeSeriesPoint,
+)
+from arche_api.domain.enums.canonical_statement_metric import CanonicalStatementMetric
+
+NDJSON_MEDIA_TYPE: Final[str] = "application/x-ndjson"
+ARROW_STREAM_MEDIA_TYPE: Final[str] = "application/vnd.apache.arrow.stream"
+
+EXPORT_MEDIA_TYPES: Final[dict[str, str]] = {
+    "ndjson": NDJSON_MEDIA_TYPE,
+    "arrow": ARROW_STREAM_MEDIA_TYPE,
+}
+
+# Arrow decimal layout for metric columns: 28 integer digits, 10 fractional.
+ARROW_DECIMAL_PRECISION: Final[int] = 38
+ARROW_DECIMAL_SCALE: Final[int] = 10
+_ARROW_QUANTUM: Final[Decimal] = Decimal(1).scaleb(-ARROW_DECIMAL_SCALE)
+
+# IPC stream end-of-stream marker: continuation token + zero metadata length.
+_ARROW_EOS: Final[bytes] = b"\xff\xff\xff\xff\x00\x00\x00\x00"
+
+try:  # pragma: no cover - exercised indirectly via arrow_export_available
+    _pa: Any = importlib.import_module("pyarrow")
+except ModuleNotFoundError:  # pragma: no cover - only hit when pyarrow is absent
+    _pa = None
+
+
+def arrow_export_available() -> bool:
+    """Return True when the optional ``pyarrow`` dependency is importable."""
+    return _pa is not None
+
+
+def _point_row(point: FundamentalsTimeSeriesPoint) -> dict[str, Any]:
+    """Return the NDJSON row for ``point`` (HTTP schema field layout)."""
+    return {
+        "cik": point.cik,
+        "statement_type": point.statement_type.value,
+        "accounting_standard": point.accounting_standard.value,
+        "statement_date": point.statement_date.isoformat(),
+        "fiscal_year": point.fiscal_year,
+        "fiscal_period": point.fiscal_period.value,
+        "currency": point.currency,
+        "metrics": {metric.value: format(amount, "f") for metric, amount in point.metrics.items()},
+        "normalized_payload_version_sequence": point.normalized_payload_version_sequence,
+    }
+
+
+async def iter_fundamentals_ndjson(
+    points: AsyncIterator[FundamentalsTimeSeriesPoint],
+    *,
+    chunk_bytes: int = 64 * 1024,
+) -> AsyncIterator[bytes]:
+    """Encode points as NDJSON, yielding chunks of roughly ``chunk_bytes``.
+
+    Args:
+        points: Lazily produced time-series points.
+        chunk_bytes: Buffered size after which a chunk is flushed.
+
+    Yields:
+        UTF-8 encoded NDJSON chunks; every chunk ends on a line boundary.
+    """
+    buffer: list[bytes] = []
+    buffered = 0
+    async for point in points:
+        line = json.dumps(_point_row(point), separators=(",", ":")).encode("utf-8") + b"\n"
+        buffer.append(line)
+        buffered += len(line)
+        if buffered >= chunk_bytes:
+            yield b"".join(buffer)
+            buffer = []
+            buffered = 0
+    if buffer:
+        yield b"".join(buffer)
+
+
+def fundamentals_arrow_schema(metrics: Sequence[CanonicalStatementMetric]) -> Any:
+    """Return the Arrow schema for an export with the given metric columns."""
+    if _pa is None:
+        raise RuntimeError("pyarrow is required for Arrow export")
+    decimal_type = _pa.decimal128(ARROW_DECIMAL_PRECISION, ARROW_DECIMAL_SCALE)
+    fields = [
+        _pa.field("cik", _pa.string(), nullable=False),
+        _pa.field("statement_type", _pa.string(), nullable=False),
+        _pa.field("accounting_standard", _pa.string(), nullable=False),
+        _pa.field("statement_date", _pa.date32(), nullable=False),
+        _pa.field("fiscal_year", _pa.int32(), nullable=False),
+        _pa.field("fiscal_period", _pa.string(), nullable=False),
+        _pa.field("currency", _pa.string(), nullable=False),
+        _pa.field("normalized_payload_version_sequence", _pa.int64(), nullable=False),
+    ]
+    fields.extend(_pa.field(metric.value, decimal_type) for metric in metrics)
+    return _pa.schema(fields)
+
+
+def _arrow_batch(
+    schema: Any,
+    rows: list[FundamentalsTimeSeriesPoint],
+    metrics: Sequence[CanonicalStatementMetric],
+) -> Any:
+    """Build one Arrow record batch from a list of points."""
+    columns: list[list[Any]] = [
+        [p.cik for p in rows],
+        [p.statement_type.value for p in rows],
+        [p.accounting_standard.value for p in rows],
+        [p.statement_date for p in rows],
+        [p.fiscal_year for p in rows],
+        [p.fiscal_period.value for p in rows],
+        [p.currency for p in rows],
+        [p.normalized_payload_version_sequence for p in rows],
+    ]
+    with localcontext() as ctx:
+        ctx.prec = ARROW_DECIMAL_PRECISION
+        for metric in metrics:
+            values: list[Decimal | None] = []
+            for p in rows:
+                amount = p.metrics.get(metric)
+                values.append(None if amount is None else amount.quantize(_ARROW_QUANTUM))
+            columns.append(values)
+    return _pa.RecordBatch.from_arrays(
+        [_pa.array(col, type=field.type) for col, field in zip(columns, schema, strict=True)],
+        schema=schema,
+    )
+
+
+async def iter_fundamentals_arrow(
+    points: AsyncIterator[FundamentalsTimeSeriesPoint],
+    *,
+    metrics: Sequence[CanonicalStatementMetric] | None,
+    batch_size: int = 1000,
+) -> AsyncIterator[bytes]:
+    """Encode points as an Arrow IPC stream, one record batch per chunk.
+
+    Args:
+        points: Lazily produced time-series points.
+        metrics: Metric columns to emit; None emits every canonical metric.
+        batch_size: Number of rows per record batch.
+
+    Yields:
+        The schema message, then one IPC message per record batch, then the
+        end-of-stream marker. Concatenated, the chunks form a valid stream
+        readable with ``pyarrow.ipc.open_stream``.
+
+    Raises:
+        RuntimeError: If ``pyarrow`` is not installed.
+    """
+    columns = tuple(metrics) if metrics is not None else tuple(CanonicalStatementMetric)
+    schema = fundamentals_arrow_schema(columns)
+    yield schema.serialize().to_pybytes()
+
+    rows: list[FundamentalsTimeSeriesPoint] = []
+    async for point in points:
+        rows.append(point)
+        if len(rows) >= batch_size:
+            yield _arrow_batch(schema, rows, columns).serialize().to_pybytes()
+            rows = []
+    if rows:
+        yield _arrow_batch(schema, rows, columns).serialize().to_pybytes()
+
+    yield _ARROW_EOS
@@ -16,11 +16,19 @@ Notes:
     - Envelopes follow API_STANDARDS.md:
         * SuccessEnvelope[T]: { "data": T }
         * PaginatedEnvelope[T]: { "page", "page_size", "total", "items": [T] }
+    - Keyset pagination keeps the envelope shape unchanged; the opaque cursor
+      for the next page travels in the ``X-Next-Cursor`` response header.
 """
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+import base64
+import binascii
+import json
+from bisect import bisect_right
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from datetime import date
 from decimal import Decimal
 from math import ceil
 from typing import cast
@@ -53,6 +61,114 @@ from arche_api.domain.entities.edgar_derived_timeseries import (
 from arche_api.domain.entities.edgar_fundamentals_timeseries import (
     FundamentalsTimeSeriesPoint,
 )
+from arche_api.domain.enums.edgar import FiscalPeriod
+from arche_api.domain.value_objects import StatementKeyset
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+@dataclass(frozen=True)
+class TimeSeriesCursor:
+    """Decoded keyset pagination cursor for time-series endpoints.
+
+    Attributes:
+        keyset: Last row of the previous page; the next page starts after it.
+        page: 1-based index of the page the cursor points to.
+        total: Total item count reported by the page that issued the cursor,
+            echoed so keyset pages never need a count query.
+    """
+
+    keyset: StatementKeyset
+    page: int
+    total: int
+
+
+def encode_time_series_cursor(cursor: TimeSeriesCursor) -> str:
+    """Encode a cursor as an opaque, URL-safe token."""
+    material = json.dumps(
+        {
+            "k": [
+                cursor.keyset.cik,
+                cursor.keyset.statement_date.isoformat(),
+                cursor.keyset.fiscal_period.value,
+            ],
+            "p": cursor.page,
+            "t": cursor.total,
+        },
+        separators=(",", ":"),
+    ).encode("utf-8")
+    return base64.urlsafe_b64encode(material).decode("ascii").rstrip("=")
+
+
+def decode_time_series_cursor(token: str) -> TimeSeriesCursor:
+    """Decode a token produced by :func:`encode_time_series_cursor`.
+
+    Raises:
+        ValueError: If the token is malformed or was not issued by this API.
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        raw = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        cik, statement_date, fiscal_period = raw["k"]
+        cursor = TimeSeriesCursor(
+            keyset=StatementKeyset(
+                cik=str(cik),
+                statement_date=date.fromisoformat(statement_date),
+                fiscal_period=FiscalPeriod(fiscal_period),
+            ),
+            page=int(raw["p"]),
+            total=int(raw["t"]),
+        )
+    except (binascii.Error, UnicodeError, KeyError, TypeError, ValueError) as exc:
+        raise ValueError("invalid time-series cursor") from exc
+
+    if cursor.page < 1 or cursor.total < 0:
+        raise ValueError("invalid time-series cursor")
+    return cursor
+
+
+def keyset_of(
+    point: FundamentalsTimeSeriesPoint | DerivedMetricsTimeSeriesPoint,
+) -> StatementKeyset:
+    """Return the keyset identifying ``point`` in time-series order."""
+    return StatementKeyset(
+        cik=point.cik,
+        statement_date=point.statement_date,
+        fiscal_period=point.fiscal_period,
+    )
+
+
+def index_after_keyset(
+    points: Sequence[FundamentalsTimeSeriesPoint] | Sequence[DerivedMetricsTimeSeriesPoint],
+    keyset: StatementKeyset,
+) -> int:
+    """Return the index of the first point strictly after ``keyset``.
+
+    ``points`` must be in canonical ``(cik, statement_date, fiscal_period)``
+    order; the keyset need not be present in ``points``.
+    """
+    return bisect_right(
+        points,
+        (keyset.cik, keyset.statement_date, keyset.fiscal_period.value),
+        key=lambda p: (p.cik, p.statement_date, p.fiscal_period.value),
+    )
+
+
+def next_keyset_after_page(
+    points: Sequence[FundamentalsTimeSeriesPoint] | Sequence[DerivedMetricsTimeSeriesPoint],
+    *,
+    page: int,
+    page_size: int,
+) -> StatementKeyset | None:
+    """Return the keyset of the last item of an offset page when more items follow.
+
+    This lets clients switch from ``page`` to cursor pagination after the
+    first request.
+    """
+    end = max(page, 1) * max(page_size, 1)
+    if len(points) <= end:
+        return None
+    return keyset_of(points[end - 1])
 
 
 def _decimal_to_str(value: Decimal | None) -> str | None:
@@ -197,6 +313,46 @@ def present_derived_time_series(
     )
 
 
+def present_fundamentals_time_series_page(
+    *,
+    points: Iterable[FundamentalsTimeSeriesPoint],
+    page: int,
+    page_size: int,
+    total: int,
+) -> PaginatedEnvelope[FundamentalsTimeSeriesPointHTTP]:
+    """Present one keyset page of a fundamentals time series.
+
+    Unlike :func:`present_fundamentals_time_series`, ``points`` is already the
+    page; no slicing is applied.
+    """
+    return PaginatedEnvelope[FundamentalsTimeSeriesPointHTTP](
+        page=page,
+        page_size=page_size,
+        total=total,
+        items=[_map_fundamentals_point(point) for point in points],
+    )
+
+
+def present_derived_time_series_page(
+    *,
+    points: Iterable[DerivedMetricsTimeSeriesPoint],
+    page: int,
+    page_size: int,
+    total: int,
+) -> PaginatedEnvelope[DerivedMetricsTimeSeriesPointHTTP]:
+    """Present one keyset page of a derived metrics time series.
+
+    Unlike :func:`present_derived_time_series`, ``points`` is already the
+    page; no slicing is applied.
+    """
+    return PaginatedEnvelope[DerivedMetricsTimeSeriesPointHTTP](
+        page=page,
+        page_size=page_size,
+        total=total,
+        items=[_map_derived_point(point) for point in points],
+    )
+
+
 def present_restatement_delta(
     *,
     result: ComputeRestatementDeltaResult,
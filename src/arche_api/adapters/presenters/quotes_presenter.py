@@ -14,7 +14,6 @@ Layer:
 from __future__ import annotations
 
 import hashlib
-import json
 from collections.abc import Mapping
 from typing import Any
 
@@ -22,6 +21,7 @@ from arche_api.adapters.presenters.base_presenter import PresentResult
 from arche_api.adapters.schemas.http.envelopes import SuccessEnvelope
 from arche_api.adapters.schemas.http.quotes import QuoteItem, QuotesBatch
 from arche_api.application.schemas.dto.quotes import QuotesBatchDTO
+from arche_api.infrastructure.serialization.json_codec import get_json_codec
 
 
 class QuotesPresenter:
@@ -29,11 +29,7 @@ class QuotesPresenter:
 
     def _compute_etag(self, body: Mapping[str, Any]) -> str:
         """Strong ETag from canonical JSON (sorted, compact, safe)."""
-        material = json.dumps(
-            body,
-            sort_keys=True,
-            separators=(",", ":"),
-        ).encode("utf-8")
+        material = get_json_codec().dumps(body, sort_keys=True)
         return f'"{hashlib.sha256(material).hexdigest()}"'
 
     def present_success(
@@ -82,11 +78,7 @@ class QuotesPresenter:
             if etag_seed is not None:
                 material = etag_seed.encode()
             else:
-                material = json.dumps(
-                    envelope.model_dump_http(),
-                    sort_keys=True,
-                    separators=(",", ":"),
-                ).encode()
+                material = get_json_codec().dumps(envelope.model_dump_http(), sort_keys=True)
 
             headers["ETag"] = f'"{hashlib.sha256(material).hexdigest()}"'
 
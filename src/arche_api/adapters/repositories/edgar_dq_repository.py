@@ -25,6 +25,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import aliased
 
 from arche_api.adapters.repositories.base_repository import BaseRepository
+from arche_api.adapters.repositories.edgar_identity_map import (
+    CompanyKey,
+    get_company_by_cik,
+)
 from arche_api.domain.entities.edgar_dq import (
     EdgarDQAnomaly,
     EdgarDQRun,
@@ -33,7 +37,6 @@ from arche_api.domain.entities.edgar_dq import (
 )
 from arche_api.domain.enums.edgar import MaterialityClass
 from arche_api.domain.exceptions.edgar import EdgarIngestionError
-from arche_api.infrastructure.database.models.ref import Company
 from arche_api.infrastructure.database.models.sec import (
     EdgarDQAnomaly as EdgarDQAnomalyModel,
 )
@@ -409,11 +412,9 @@ class EdgarDQRepository(BaseRepository[EdgarDQRunModel]):
             sv_row.version_sequence,
         )
 
-    async def _get_company_by_cik(self, cik: str) -> Company | None:
-        """Return the Company row for a given CIK, or None if missing."""
-        stmt = select(Company).where(Company.cik == cik).limit(1)
-        res = await self._session.execute(stmt)
-        return res.scalar_one_or_none()
+    async def _get_company_by_cik(self, cik: str) -> CompanyKey | None:
+        """Return the company for a given CIK, or None if missing."""
+        return await get_company_by_cik(self._session, cik)
 
     @staticmethod
     def _map_run_to_domain(row: EdgarDQRunModel) -> EdgarDQRun:
@@ -25,7 +25,12 @@ from sqlalchemy import Select, delete, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import aliased
 
+from arche_api.adapters.repositories import edgar_fast_reads as fast_reads
 from arche_api.adapters.repositories.base_repository import BaseRepository
+from arche_api.adapters.repositories.edgar_identity_map import (
+    CompanyKey,
+    get_company_by_cik,
+)
 from arche_api.domain.entities.edgar_dq import NormalizedStatementIdentity
 from arche_api.domain.entities.edgar_normalized_fact import EdgarNormalizedFact
 from arche_api.domain.enums.edgar import (
@@ -34,7 +39,6 @@ from arche_api.domain.enums.edgar import (
     StatementType,
 )
 from arche_api.domain.exceptions.edgar import EdgarIngestionError
-from arche_api.infrastructure.database.models.ref import Company
 from arche_api.infrastructure.database.models.sec import (
     EdgarNormalizedFact as EdgarNormalizedFactModel,
 )
@@ -145,6 +149,23 @@ class EdgarFactsRepository(BaseRepository[EdgarNormalizedFactModel]):
 
         try:
             sv_row, company_row = await self._resolve_statement_version(identity)
+            cik = company_row.cik or identity.cik
+
+            if metric_filter:
+                records = await fast_reads.fetch(
+                    self._session,
+                    fast_reads.FACTS_BY_STATEMENT_VERSION_AND_METRICS,
+                    sv_row.statement_version_id,
+                    list(metric_filter),
+                )
+            else:
+                records = await fast_reads.fetch(
+                    self._session,
+                    fast_reads.FACTS_BY_STATEMENT_VERSION,
+                    sv_row.statement_version_id,
+                )
+            if records is not None:
+                return [self._map_record_to_domain(record=r, cik=cik) for r in records]
 
             ef = aliased(EdgarNormalizedFactModel)
 
@@ -165,8 +186,6 @@ class EdgarFactsRepository(BaseRepository[EdgarNormalizedFactModel]):
             res = await self._session.execute(stmt)
             rows: list[EdgarNormalizedFactModel] = list(res.scalars().all())
 
-            cik = company_row.cik or identity.cik
-
             return [
                 self._map_to_domain(
                     row=row,
@@ -268,8 +287,8 @@ class EdgarFactsRepository(BaseRepository[EdgarNormalizedFactModel]):
     async def _resolve_statement_version(
         self,
         identity: NormalizedStatementIdentity,
-    ) -> tuple[StatementVersion, Company]:
-        """Resolve the StatementVersion + Company rows for a statement identity."""
+    ) -> tuple[StatementVersion, CompanyKey]:
+        """Resolve the StatementVersion row + company for a statement identity."""
         company_row = await self._get_company_by_cik(identity.cik)
         if company_row is None or company_row.cik is None:
             raise EdgarIngestionError(
@@ -308,11 +327,9 @@ class EdgarFactsRepository(BaseRepository[EdgarNormalizedFactModel]):
 
         return sv_row, company_row
 
-    async def _get_company_by_cik(self, cik: str) -> Company | None:
-        """Return the Company row for a given CIK, or None if missing."""
-        stmt = select(Company).where(Company.cik == cik).limit(1)
-        res = await self._session.execute(stmt)
-        return res.scalar_one_or_none()
+    async def _get_company_by_cik(self, cik: str) -> CompanyKey | None:
+        """Return the company for a given CIK, or None if missing."""
+        return await get_company_by_cik(self._session, cik)
 
     @staticmethod
     def _to_row_dict(
@@ -383,3 +400,30 @@ class EdgarFactsRepository(BaseRepository[EdgarNormalizedFactModel]):
             dimension_key=row.dimension_key,
             source_line_item=row.source_line_item,
         )
+
+    @staticmethod
+    def _map_record_to_domain(*, record: Any, cik: str) -> EdgarNormalizedFact:
+        """Map a fast-path fact record to the domain (mirrors :meth:`_map_to_domain`)."""
+        dimensions_raw = fast_reads.json_value(record["dimension"])
+        dimensions: Mapping[str, str] = (
+            {str(k): str(v) for k, v in dimensions_raw.items()} if dimensions_raw else {}
+        )
+
+        return EdgarNormalizedFact(
+            cik=cik,
+            statement_type=StatementType(record["statement_type"]),
+            accounting_standard=AccountingStandard(record["accounting_standard"]),
+            fiscal_year=record["fiscal_year"],
+            fiscal_period=FiscalPeriod(record["fiscal_period"]),
+            statement_date=record["statement_date"],
+            version_sequence=record["version_sequence"],
+            metric_code=record["metric_code"],
+            metric_label=record["metric_label"],
+            unit=record["unit"],
+            period_start=record["period_start"],
+            period_end=record["period_end"],
+            value=Decimal(str(record["value"])),
+            dimensions=dimensions,
+            dimension_key=record["dimension_key"],
+            source_line_item=record["source_line_item"],
+        )
@@ -0,0 +1,201 @@
+# src/arche_api/adapters/repositories/edgar_fast_reads.py
+# Copyright (c) Arche.
+# SPDX-License-Identifier: MIT
+"""Native asyncpg fast path for hot EDGAR read queries.
+
+Purpose:
+    The hottest EDGAR reads (statement versions by company/year/window,
+    latest normalized payloads, facts by statement) spend most of their time
+    building ORM instances that are immediately mapped to domain entities and
+    discarded. This module runs the same queries directly on the session's
+    asyncpg connection and returns plain records, which the repositories map
+    straight into domain entities.
+
+Layer:
+    adapters/repositories
+
+Design:
+    * Opt-in (``EDGAR_ASYNCPG_FAST_PATH``); when disabled, or when the session
+      is not bound to asyncpg, :func:`fetch` returns None and callers use the
+      ORM path unchanged.
+    * Queries run on the session's own connection, so they share its
+      transaction (and its replica routing) with the ORM statements of the
+      same unit of work.
+    * SQL is fixed text with positional parameters, prepared through
+      asyncpg's per-connection statement cache; every optional filter has its
+      own statement so each one gets a stable plan.
+    * JSON columns come back already decoded (SQLAlchemy installs json/jsonb
+      codecs on every asyncpg connection); string values are decoded here as
+      a fallback.
+
+Notes:
+    - Column lists and ordering must match the ORM queries in
+      ``edgar_statements_repository`` / ``edgar_facts_repository``; the parity
+      suite in ``tests/integration/adapters/repositories`` compares both paths.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+__all__ = [
+    "FACTS_BY_STATEMENT_VERSION",
+    "FACTS_BY_STATEMENT_VERSION_AND_METRICS",
+    "LATEST_PAYLOADS",
+    "LATEST_PAYLOADS_AFTER",
+    "LATEST_PAYLOADS_BEFORE",
+    "LATEST_STATEMENT_VERSION_BY_DATE",
+    "LATEST_STATEMENT_VERSION_BY_PERIOD",
+    "STATEMENT_VERSIONS_BY_DATE_WINDOW",
+    "STATEMENT_VERSIONS_BY_YEAR",
+    "STATEMENT_VERSIONS_BY_YEAR_AND_PERIOD",
+    "fast_reads_enabled",
+    "fetch",
+    "json_value",
+    "set_fast_reads_enabled",
+]
+
+_STATEMENT_VERSIONS_TEMPLATE = """
+SELECT sv.statement_type, sv.accounting_standard, sv.statement_date, sv.fiscal_year,
+       sv.fiscal_period, sv.currency, sv.is_restated, sv.restatement_reason,
+       sv.version_source, sv.version_sequence, sv.accession_id, sv.filing_date,
+       sv.normalized_payload, sv.normalized_payload_version,
+       f.accession AS filing_accession, f.form_type, f.period_of_report, f.accepted_at,
+       f.is_amendment, f.amendment_sequence, f.primary_document, f.data_source
+FROM sec.statement_versions AS sv
+JOIN sec.filings AS f ON f.filing_id = sv.filing_id
+WHERE sv.company_id = $1 AND sv.statement_type = $2 AND {where}
+ORDER BY {order_by}"""
+
+_LATEST_FIRST = "sv.version_sequence DESC, sv.statement_version_id ASC\nLIMIT 1"
+_OLDEST_FIRST = "sv.version_sequence ASC, sv.statement_version_id ASC"
+
+# $1 company_id, $2 statement_type, $3 statement_date
+LATEST_STATEMENT_VERSION_BY_DATE = _STATEMENT_VERSIONS_TEMPLATE.format(
+    where="sv.statement_date = $3",
+    order_by=_LATEST_FIRST,
+)
+
+# $1 company_id, $2 statement_type, $3 from_date, $4 to_date
+STATEMENT_VERSIONS_BY_DATE_WINDOW = _STATEMENT_VERSIONS_TEMPLATE.format(
+    where="sv.statement_date >= $3 AND sv.statement_date <= $4",
+    order_by="sv.statement_date ASC, " + _OLDEST_FIRST,
+)
+
+# $1 company_id, $2 statement_type, $3 fiscal_year, $4 fiscal_period
+LATEST_STATEMENT_VERSION_BY_PERIOD = _STATEMENT_VERSIONS_TEMPLATE.format(
+    where="sv.fiscal_year = $3 AND sv.fiscal_period = $4",
+    order_by=_LATEST_FIRST,
+)
+
+# $1 company_id, $2 statement_type, $3 fiscal_year
+STATEMENT_VERSIONS_BY_YEAR = _STATEMENT_VERSIONS_TEMPLATE.format(
+    where="sv.fiscal_year = $3",
+    order_by=_OLDEST_FIRST,
+)
+
+# $1 company_id, $2 statement_type, $3 fiscal_year, $4 fiscal_period
+STATEMENT_VERSIONS_BY_YEAR_AND_PERIOD = _STATEMENT_VERSIONS_TEMPLATE.format(
+    where="sv.fiscal_year = $3 AND sv.fiscal_period = $4",
+    order_by=_OLDEST_FIRST,
+)
+
+_LATEST_PAYLOADS_TEMPLATE = """
+SELECT DISTINCT ON (c.cik, sv.statement_date, sv.fiscal_period) sv.normalized_payload
+FROM sec.statement_versions AS sv
+JOIN ref.companies AS c ON c.company_id = sv.company_id
+WHERE c.cik = ANY($1::text[]) AND sv.statement_type = $2
+  AND sv.fiscal_period = ANY($3::text[])
+  AND sv.statement_date >= $4 AND sv.statement_date <= $5
+  AND jsonb_typeof(sv.normalized_payload) = 'object'{keyset}
+ORDER BY c.cik {direction}, sv.statement_date {direction}, sv.fiscal_period {direction},
+         sv.version_sequence DESC
+LIMIT ${limit}"""
+
+# $1 ciks, $2 statement_type, $3 fiscal_periods, $4 from_date, $5 to_date, $6 limit
+# (NULL for no limit).
+LATEST_PAYLOADS = _LATEST_PAYLOADS_TEMPLATE.format(keyset="", direction="ASC", limit=6)
+
+# ... plus $6/$7/$8 keyset (cik, statement_date, fiscal_period), $9 limit.
+LATEST_PAYLOADS_AFTER = _LATEST_PAYLOADS_TEMPLATE.format(
+    keyset="\n  AND (c.cik, sv.statement_date, sv.fiscal_period) > ($6::text, $7::date, $8::text)",
+    direction="ASC",
+    limit=9,
+)
+LATEST_PAYLOADS_BEFORE = _LATEST_PAYLOADS_TEMPLATE.format(
+    keyset="\n  AND (c.cik, sv.statement_date, sv.fiscal_period) < ($6::text, $7::date, $8::text)",
+    direction="DESC",
+    limit=9,
+)
+
+_FACTS_TEMPLATE = """
+SELECT statement_type, accounting_standard, fiscal_year, fiscal_period, statement_date,
+       version_sequence, metric_code, metric_label, unit, period_start, period_end, value,
+       dimension, dimension_key, source_line_item
+FROM sec.edgar_normalized_facts
+WHERE statement_version_id = $1{where}
+ORDER BY metric_code ASC, dimension_key ASC, fact_id ASC"""
+
+# $1 statement_version_id
+FACTS_BY_STATEMENT_VERSION = _FACTS_TEMPLATE.format(where="")
+
+# $1 statement_version_id, $2 metric codes
+FACTS_BY_STATEMENT_VERSION_AND_METRICS = _FACTS_TEMPLATE.format(
+    where=" AND metric_code = ANY($2::text[])"
+)
+
+_enabled = False
+
+
+def fast_reads_enabled() -> bool:
+    """Return whether hot reads bypass the ORM."""
+    return _enabled
+
+
+def set_fast_reads_enabled(enabled: bool) -> None:
+    """Enable or disable the asyncpg fast path process-wide."""
+    global _enabled
+    _enabled = enabled
+
+
+async def _driver_connection(session: AsyncSession) -> Any | None:
+    connection = await session.connection()
+    if connection.dialect.driver != "asyncpg":
+        return None
+    raw = await connection.get_raw_connection()
+    return raw.driver_connection
+
+
+async def fetch(session: AsyncSession, sql: str, *args: Any) -> Sequence[Any] | None:
+    """Run ``sql`` on the session's asyncpg connection.
+
+    Args:
+        session: Session whose connection (and transaction) is used.
+        sql: One of this module's statements.
+        *args: Positional parameters.
+
+    Returns:
+        The asyncpg records, or None when the fast path is disabled or the
+        session is not bound to asyncpg (callers then use the ORM).
+    """
+    if not _enabled:
+        return None
+    pg = await _driver_connection(session)
+    if pg is None:
+        return None
+    # Connection.fetch goes through the per-connection statement cache;
+    # Connection.prepare would re-prepare (one extra round trip) every call.
+    records: Sequence[Any] = await pg.fetch(sql, *args)
+    return records
+
+
+def json_value(value: Any) -> Mapping[str, Any] | None:
+    """Return a JSON column value as a mapping (decoding text if needed)."""
+    if isinstance(value, (str, bytes)):
+        decoded: Mapping[str, Any] | None = json.loads(value)
+        return decoded
+    return value
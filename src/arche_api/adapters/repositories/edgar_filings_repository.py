@@ -17,9 +17,9 @@ Design:
       constraint in the database.
     - Upsert is implemented via PostgreSQL ``ON CONFLICT`` on ``accession``,
       with last-write-wins semantics for non-key fields.
-    - Company foreign keys are resolved via ``ref.companies.cik``; if a
-      mapping is missing, the filing is still stored with a NULL company_id
-      but a non-null CIK.
+    - Company foreign keys are resolved via ``ref.companies.cik`` (through the
+      shared EDGAR identity map); if a mapping is missing, the filing is still
+      stored with a NULL company_id but a non-null CIK.
 
 Layer:
     adapters / repositories
@@ -44,6 +44,10 @@ from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from arche_api.adapters.repositories.base_repository import BaseRepository
+from arche_api.adapters.repositories.edgar_identity_map import (
+    fetch_companies_by_cik,
+    forget_filings,
+)
 from arche_api.domain.entities.edgar_company import EdgarCompanyIdentity
 from arche_api.domain.entities.edgar_filing import EdgarFiling
 from arche_api.domain.enums.edgar import FilingType
@@ -134,6 +138,7 @@ class EdgarFilingsRepository(BaseRepository[Filing]):
                     raise EdgarMappingError("accession_id must not be empty.")
                 dedup[acc] = filing
 
+            forget_filings(dedup)
             cik_to_company_id = await self._resolve_company_ids(
                 cik_list={f.company.cik for f in dedup.values()},
                 overrides=company_overrides or {},
@@ -336,10 +341,9 @@ class EdgarFilingsRepository(BaseRepository[Filing]):
         if not remaining:
             return resolved
 
-        stmt = select(Company.cik, Company.company_id).where(Company.cik.in_(remaining))
-        res = await self._session.execute(stmt)
-        for cik, company_id in res.all():
-            resolved[str(cik)] = company_id
+        companies = await fetch_companies_by_cik(self._session, remaining, recheck_missing=True)
+        for cik, company in companies.items():
+            resolved[cik] = company.company_id
 
         return resolved
 
@@ -0,0 +1,434 @@
+# src/arche_api/adapters/repositories/edgar_identity_map.py
+# Copyright (c) Arche.
+# SPDX-License-Identifier: MIT
+"""EDGAR identity map (CIK → company, accession → filing).
+
+Purpose:
+    Most EDGAR repository calls start by resolving a CIK to its
+    ``ref.companies`` row and, on writes, an accession to its ``sec.filings``
+    row. Both mappings are immutable once the row exists, so this module keeps
+    a bounded in-process map shared by every EDGAR repository and only queries
+    the database on a miss.
+
+Layer:
+    adapters/repositories
+
+Design:
+    * Two bounded LRU tables (companies by CIK, filings by accession) holding
+      small frozen identity records, never ORM instances, so entries are safe
+      to share across sessions.
+    * Negative entries: a CIK/accession that does not exist is remembered as
+      missing for ``negative_ttl_s`` so repeated lookups for unknown issuers do
+      not hit the database. Write paths pass ``recheck_missing=True`` and
+      :func:`forget_filings` drops entries for accessions being upserted.
+    * The map is opt-in: without an installed map (unit tests, scripts) the
+      helpers issue exactly the queries the repositories used to issue and
+      return the ORM rows unchanged.
+    * :func:`warm_identity_map` preloads the active universe at startup.
+    * Filing rows are resolved on write paths, possibly from rows the same
+      transaction just upserted. They are staged on the session and only
+      published to the shared map after it commits; a rollback (or a close
+      without commit) drops them.
+
+Notes:
+    - Company rows are reference data that the service never rewrites, so
+      company lookups are cached immediately.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import Any, Final, Generic, Protocol, TypeVar
+from uuid import UUID
+
+from sqlalchemy import event, exists, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
+
+from arche_api.infrastructure.database.models.ref import Company
+from arche_api.infrastructure.database.models.sec import Filing, StatementVersion
+from arche_api.infrastructure.observability.metrics import get_edgar_identity_cache_total
+
+__all__ = [
+    "CompanyKey",
+    "CompanyRef",
+    "EdgarIdentityMap",
+    "FilingKey",
+    "FilingRef",
+    "fetch_companies_by_cik",
+    "fetch_filings_by_accession",
+    "forget_filings",
+    "get_company_by_cik",
+    "get_edgar_identity_map",
+    "set_edgar_identity_map",
+    "warm_identity_map",
+]
+
+V = TypeVar("V")
+
+
+class CompanyKey(Protocol):
+    """Company identity fields used by the repositories (ORM row or ``CompanyRef``)."""
+
+    @property
+    def company_id(self) -> UUID:
+        """Primary key in ``ref.companies``."""
+        ...
+
+    @property
+    def cik(self) -> str | None:
+        """SEC Central Index Key."""
+        ...
+
+    @property
+    def name(self) -> str:
+        """Legal name."""
+        ...
+
+
+class FilingKey(Protocol):
+    """Filing identity fields used by the repositories (ORM row or ``FilingRef``)."""
+
+    @property
+    def filing_id(self) -> UUID:
+        """Primary key in ``sec.filings``."""
+        ...
+
+    @property
+    def accession(self) -> str:
+        """SEC accession number."""
+        ...
+
+
+@dataclass(frozen=True, slots=True)
+class CompanyRef:
+    """Cached ``ref.companies`` identity."""
+
+    company_id: UUID
+    cik: str | None
+    name: str
+
+
+@dataclass(frozen=True, slots=True)
+class FilingRef:
+    """Cached ``sec.filings`` identity."""
+
+    filing_id: UUID
+    accession: str
+
+
+class _IdentityTable(Generic[V]):  # noqa: UP046
+    """Bounded LRU of key → value, with expiring negative (missing) entries."""
+
+    def __init__(
+        self,
+        kind: str,
+        *,
+        max_entries: int,
+        negative_ttl_s: float,
+        clock: Callable[[], float],
+    ) -> None:
+        self._kind = kind
+        self._max_entries = max(1, int(max_entries))
+        self._negative_ttl_s = negative_ttl_s
+        self._clock = clock
+        # value None marks a negative entry; the float is its expiry.
+        self._entries: OrderedDict[str, tuple[V | None, float]] = OrderedDict()
+        self._lookups = get_edgar_identity_cache_total()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _count(self, outcome: str, n: int = 1) -> None:
+        if n:
+            with suppress(Exception):
+                self._lookups.labels(kind=self._kind, outcome=outcome).inc(n)
+
+    def lookup(
+        self,
+        keys: Iterable[str],
+        *,
+        recheck_missing: bool = False,
+    ) -> tuple[dict[str, V], list[str]]:
+        """Split ``keys`` into cached values and keys that need a query.
+
+        Keys with a live negative entry are in neither result unless
+        ``recheck_missing`` is set.
+        """
+        found: dict[str, V] = {}
+        pending: list[str] = []
+        negatives = 0
+        now = self._clock()
+        for key in keys:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is None and entry[1] <= now:
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                pending.append(key)
+            elif entry[0] is None:
+                negatives += 1
+                if recheck_missing:
+                    pending.append(key)
+            else:
+                self._entries.move_to_end(key)
+                found[key] = entry[0]
+        self._count("hit", len(found))
+        self._count("negative_hit", negatives)
+        self._count("miss", len(pending) - (negatives if recheck_missing else 0))
+        return found, pending
+
+    def _store(self, key: str, entry: tuple[V | None, float]) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def put(self, key: str, value: V) -> None:
+        """Cache a resolved identity."""
+        self._store(key, (value, float("inf")))
+
+    def put_missing(self, key: str) -> None:
+        """Remember ``key`` as missing for ``negative_ttl_s``."""
+        if self._negative_ttl_s > 0:
+            self._store(key, (None, self._clock() + self._negative_ttl_s))
+
+    def discard(self, key: str) -> None:
+        """Drop ``key`` (positive or negative)."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+
+class EdgarIdentityMap:
+    """Process-wide CIK and accession identity tables.
+
+    Args:
+        max_entries: Capacity of each table (companies, filings).
+        negative_ttl_s: Lifetime of "does not exist" entries; 0 disables them.
+        clock: Monotonic clock (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 50_000,
+        *,
+        negative_ttl_s: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize empty tables."""
+        self.max_entries = max(1, int(max_entries))
+        self.companies: _IdentityTable[CompanyRef] = _IdentityTable(
+            "company", max_entries=max_entries, negative_ttl_s=negative_ttl_s, clock=clock
+        )
+        self.filings: _IdentityTable[FilingRef] = _IdentityTable(
+            "filing", max_entries=max_entries, negative_ttl_s=negative_ttl_s, clock=clock
+        )
+
+    def clear(self) -> None:
+        """Drop every cached identity."""
+        self.companies.clear()
+        self.filings.clear()
+
+
+_identity_map: EdgarIdentityMap | None = None
+
+
+def get_edgar_identity_map() -> EdgarIdentityMap | None:
+    """Return the process-wide identity map, or None when lookups go to the DB."""
+    return _identity_map
+
+
+def set_edgar_identity_map(identity_map: EdgarIdentityMap | None) -> None:
+    """Install (or clear) the process-wide identity map."""
+    global _identity_map
+    _identity_map = identity_map
+
+
+def _company_ref(row: CompanyKey) -> CompanyRef:
+    return CompanyRef(company_id=row.company_id, cik=row.cik, name=row.name)
+
+
+# ``Session.info`` key holding the filing refs resolved by the session's open
+# transaction, published to the shared map when it commits.
+_STAGED_FILINGS: Final[str] = "edgar_identity_map.staged_filings"
+
+
+def _staged_filings(session: AsyncSession) -> dict[str, FilingRef]:
+    """Return the session's staged filing refs, hooking its transaction end once."""
+    sync_session = session.sync_session
+    staged: dict[str, FilingRef] | None = sync_session.info.get(_STAGED_FILINGS)
+    if staged is None:
+        staged = {}
+        sync_session.info[_STAGED_FILINGS] = staged
+        event.listen(sync_session, "after_commit", _publish_staged_filings)
+        event.listen(sync_session, "after_transaction_end", _drop_staged_filings)
+    return staged
+
+
+def _publish_staged_filings(sync_session: Session) -> None:
+    staged: dict[str, FilingRef] = sync_session.info.get(_STAGED_FILINGS, {})
+    identity_map = _identity_map
+    if identity_map is not None:
+        for accession, ref in staged.items():
+            identity_map.filings.put(accession, ref)
+    staged.clear()
+
+
+def _drop_staged_filings(sync_session: Session, transaction: SessionTransaction) -> None:
+    # Runs after ``after_commit`` on commit; on rollback or close it discards.
+    if transaction.parent is None:
+        staged: dict[str, Any] = sync_session.info.get(_STAGED_FILINGS, {})
+        staged.clear()
+
+
+# ---------------------------------------------------------------------------
+# Lookups used by the EDGAR repositories
+# ---------------------------------------------------------------------------
+
+
+async def fetch_companies_by_cik(
+    session: AsyncSession,
+    ciks: Iterable[str],
+    *,
+    recheck_missing: bool = False,
+) -> dict[str, CompanyKey]:
+    """Resolve CIKs to companies; unknown CIKs are omitted from the result.
+
+    Args:
+        session: Session used for cache misses.
+        ciks: CIKs to resolve.
+        recheck_missing: Query CIKs cached as missing instead of trusting the
+            negative entry (write paths).
+    """
+    wanted = set(ciks)
+    if not wanted:
+        return {}
+    identity_map = _identity_map
+    if identity_map is None:
+        res = await session.execute(select(Company).where(Company.cik.in_(list(wanted))))
+        rows: list[Company] = list(res.scalars().all())
+        return {row.cik: row for row in rows if row.cik is not None}
+
+    found, pending = identity_map.companies.lookup(wanted, recheck_missing=recheck_missing)
+    result: dict[str, CompanyKey] = dict(found)
+    if pending:
+        res = await session.execute(select(Company).where(Company.cik.in_(pending)))
+        for row in res.scalars().all():
+            if row.cik is not None:
+                ref = _company_ref(row)
+                identity_map.companies.put(row.cik, ref)
+                result[row.cik] = ref
+        for cik in pending:
+            if cik not in result:
+                identity_map.companies.put_missing(cik)
+    return result
+
+
+async def get_company_by_cik(session: AsyncSession, cik: str) -> CompanyKey | None:
+    """Return the company for ``cik``, or None if it does not exist."""
+    identity_map = _identity_map
+    if identity_map is None:
+        res = await session.execute(select(Company).where(Company.cik == cik).limit(1))
+        row: Company | None = res.scalar_one_or_none()
+        return row
+
+    found, pending = identity_map.companies.lookup((cik,))
+    if not pending:
+        return found.get(cik)
+    res = await session.execute(select(Company).where(Company.cik == cik).limit(1))
+    company: Company | None = res.scalar_one_or_none()
+    if company is None:
+        identity_map.companies.put_missing(cik)
+        return None
+    ref = _company_ref(company)
+    identity_map.companies.put(cik, ref)
+    return ref
+
+
+async def fetch_filings_by_accession(
+    session: AsyncSession,
+    accessions: Iterable[str],
+    *,
+    recheck_missing: bool = False,
+) -> dict[str, FilingKey]:
+    """Resolve accessions to filings; unknown accessions are omitted.
+
+    Filings read from the database are cached only once the session's
+    transaction commits, since they may be rows it has just upserted.
+
+    Args:
+        session: Session used for cache misses.
+        accessions: Accession numbers to resolve.
+        recheck_missing: Query accessions cached as missing instead of
+            trusting the negative entry (write paths).
+    """
+    wanted = set(accessions)
+    if not wanted:
+        return {}
+    identity_map = _identity_map
+    if identity_map is None:
+        res = await session.execute(select(Filing).where(Filing.accession.in_(list(wanted))))
+        rows: list[Filing] = list(res.scalars().all())
+        return {row.accession: row for row in rows}
+
+    found, pending = identity_map.filings.lookup(wanted, recheck_missing=recheck_missing)
+    result: dict[str, FilingKey] = dict(found)
+    staged = _staged_filings(session)
+    result.update((acc, staged[acc]) for acc in pending if acc in staged)
+    pending = [acc for acc in pending if acc not in staged]
+    if pending:
+        stmt = select(Filing.filing_id, Filing.accession).where(Filing.accession.in_(pending))
+        res = await session.execute(stmt)
+        for filing_id, accession in res.all():
+            ref = FilingRef(filing_id=filing_id, accession=accession)
+            staged[accession] = ref
+            result[accession] = ref
+        for accession in pending:
+            if accession not in result:
+                identity_map.filings.put_missing(accession)
+    return result
+
+
+def forget_filings(accessions: Iterable[str]) -> None:
+    """Drop cached entries for ``accessions`` (called before they are upserted)."""
+    identity_map = _identity_map
+    if identity_map is not None:
+        for accession in accessions:
+            identity_map.filings.discard(accession)
+
+
+async def warm_identity_map(
+    session: AsyncSession,
+    identity_map: EdgarIdentityMap,
+    *,
+    ciks: Iterable[str] | None = None,
+) -> int:
+    """Preload company identities and return how many were cached.
+
+    Args:
+        session: Session to read ``ref.companies`` with.
+        identity_map: Map to fill.
+        ciks: Explicit universe; when None, every company that has statement
+            versions (up to the map's capacity).
+    """
+    stmt = select(Company.company_id, Company.cik, Company.name).where(Company.cik.is_not(None))
+    wanted = sorted(set(ciks)) if ciks is not None else None
+    if wanted is not None:
+        if not wanted:
+            return 0
+        stmt = stmt.where(Company.cik.in_(wanted))
+    else:
+        stmt = stmt.where(exists().where(StatementVersion.company_id == Company.company_id))
+    res = await session.execute(stmt.limit(identity_map.max_entries))
+    count = 0
+    for company_id, cik, name in res.all():
+        identity_map.companies.put(str(cik), CompanyRef(company_id=company_id, cik=cik, name=name))
+        count += 1
+    return count
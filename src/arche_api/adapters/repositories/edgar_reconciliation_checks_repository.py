@@ -33,6 +33,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import aliased
 
 from arche_api.adapters.repositories.base_repository import BaseRepository
+from arche_api.adapters.repositories.edgar_identity_map import (
+    CompanyKey,
+    fetch_companies_by_cik,
+    get_company_by_cik,
+)
 from arche_api.domain.entities.edgar_dq import NormalizedStatementIdentity
 from arche_api.domain.entities.edgar_reconciliation import ReconciliationResult
 from arche_api.domain.enums.edgar import FiscalPeriod, MaterialityClass, StatementType
@@ -44,7 +49,6 @@ from arche_api.domain.exceptions.edgar import EdgarIngestionError
 from arche_api.domain.interfaces.repositories.edgar_reconciliation_checks_repository import (
     EdgarReconciliationChecksRepository as EdgarReconciliationChecksRepositoryPort,
 )
-from arche_api.infrastructure.database.models.ref import Company
 from arche_api.infrastructure.database.models.sec import (
     EdgarReconciliationCheck,
     StatementVersion,
@@ -109,7 +113,7 @@ class SqlAlchemyEdgarReconciliationChecksRepository(
             run_uuid = UUID(reconciliation_run_id)
 
             ciks = {r.statement_identity.cik for r in results}
-            cik_to_company = await self._fetch_companies_by_cik(ciks)
+            cik_to_company = await self._fetch_companies_by_cik(ciks, recheck_missing=True)
 
             stmt_versions = await self._fetch_statement_versions(
                 identities=[r.statement_identity for r in results],
@@ -347,20 +351,20 @@ class SqlAlchemyEdgarReconciliationChecksRepository(
     # Internal helpers
     # ------------------------------------------------------------------
 
-    async def _fetch_companies_by_cik(self, ciks: set[str]) -> dict[str, Company]:
-        """Fetch reference companies by CIK into a lookup map."""
-        if not ciks:
-            return {}
-
-        res = await self._session.execute(select(Company).where(Company.cik.in_(list(ciks))))
-        rows: list[Company] = list(res.scalars().all())
-        return {row.cik: row for row in rows if row.cik is not None}
+    async def _fetch_companies_by_cik(
+        self,
+        ciks: set[str],
+        *,
+        recheck_missing: bool = False,
+    ) -> dict[str, CompanyKey]:
+        """Resolve reference companies by CIK via the shared identity map."""
+        return await fetch_companies_by_cik(self._session, ciks, recheck_missing=recheck_missing)
 
     async def _fetch_statement_versions(
         self,
         *,
         identities: Sequence[NormalizedStatementIdentity],
-        cik_to_company: Mapping[str, Company],
+        cik_to_company: Mapping[str, CompanyKey],
     ) -> dict[tuple[Any, ...], StatementVersion]:
         """Fetch statement_versions needed for a batch into a lookup map."""
         if not identities:
@@ -408,10 +412,9 @@ class SqlAlchemyEdgarReconciliationChecksRepository(
             for row in rows
         }
 
-    async def _get_company_by_cik(self, cik: str) -> Company | None:
-        """Return the `Company` row for a given CIK, or None if missing."""
-        res = await self._session.execute(select(Company).where(Company.cik == cik).limit(1))
-        return res.scalar_one_or_none()
+    async def _get_company_by_cik(self, cik: str) -> CompanyKey | None:
+        """Return the company for a given CIK, or None if missing."""
+        return await get_company_by_cik(self._session, cik)
 
     @staticmethod
     def _to_row_dict(
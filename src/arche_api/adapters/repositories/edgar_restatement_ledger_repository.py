@@ -0,0 +1,305 @@
+# src/arche_api/adapters/repositories/edgar_restatement_ledger_repository.py
+# Copyright (c)
+# SPDX-License-Identifier: MIT
+"""EDGAR restatement ledger repository (SQLAlchemy).
+
+Purpose:
+    Persist precomputed per-metric restatement deltas in
+    `sec.edgar_restatement_ledger` and answer universe-wide restatement
+    screens with a single indexed query.
+
+Layer:
+    adapters/repositories
+
+Design:
+    * Uses SQLAlchemy Core/ORM with AsyncSession.
+    * Emits Prometheus-style metrics for latency and failures.
+    * Hop writes are delete-then-insert on the "to" version so each version
+      has exactly one incoming hop.
+    * Screens filter on the denormalized identity, metric, magnitude and
+      materiality columns covered by `ix_edgar_restatement_ledger_screen`
+      and `ix_edgar_restatement_ledger_materiality`.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Sequence
+from contextlib import suppress
+from decimal import Decimal
+from typing import Any
+from uuid import UUID, uuid4
+
+from sqlalchemy import Select, delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from arche_api.adapters.repositories.base_repository import BaseRepository
+from arche_api.adapters.repositories.edgar_identity_map import get_company_by_cik
+from arche_api.domain.entities.edgar_dq import NormalizedStatementIdentity
+from arche_api.domain.entities.edgar_restatement_ledger import (
+    RestatementLedgerRecord,
+    RestatementScreenQuery,
+)
+from arche_api.domain.enums.canonical_statement_metric import CanonicalStatementMetric
+from arche_api.domain.enums.edgar import (
+    AccountingStandard,
+    FiscalPeriod,
+    MaterialityClass,
+    StatementType,
+)
+from arche_api.domain.exceptions.edgar import EdgarIngestionError
+from arche_api.domain.interfaces.repositories.edgar_restatement_ledger_repository import (
+    EdgarRestatementLedgerRepository as EdgarRestatementLedgerRepositoryPort,
+)
+from arche_api.infrastructure.database.models.sec import EdgarRestatementLedgerEntry
+from arche_api.infrastructure.observability.metrics import (
+    get_db_errors_total,
+    get_db_operation_duration_seconds,
+)
+
+
+class SqlAlchemyEdgarRestatementLedgerRepository(
+    BaseRepository[EdgarRestatementLedgerEntry],
+    EdgarRestatementLedgerRepositoryPort,
+):
+    """SQLAlchemy-backed persisted restatement ledger repository."""
+
+    _MODEL_NAME = "sec_edgar_restatement_ledger"
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize the repository.
+
+        Args:
+            session: Async SQLAlchemy session bound to the database.
+        """
+        super().__init__(session=session)
+        self._metrics_hist = get_db_operation_duration_seconds()
+        self._metrics_err = get_db_errors_total()
+
+    # ------------------------------------------------------------------
+    # WRITE
+    # ------------------------------------------------------------------
+
+    async def replace_hop(
+        self,
+        *,
+        identity: NormalizedStatementIdentity,
+        from_version_sequence: int,
+        records: Sequence[RestatementLedgerRecord],
+    ) -> None:
+        """Replace the ledger records whose "to" side is ``identity``.
+
+        Args:
+            identity: Statement identity of the "to" version.
+            from_version_sequence: Version sequence of the "from" side.
+            records: Ledger records for the hop (may be empty).
+
+        Raises:
+            EdgarIngestionError: If the reference company cannot be resolved
+                or a record does not belong to the hop.
+        """
+        start = time.perf_counter()
+        outcome = "success"
+
+        try:
+            company = await get_company_by_cik(self._session, identity.cik)
+            if company is None:
+                raise EdgarIngestionError(
+                    "No ref.company found for EDGAR restatement ledger persistence.",
+                    details={"cik": identity.cik},
+                )
+
+            rows: list[dict[str, Any]] = []
+            for record in records:
+                if (
+                    record.cik != identity.cik
+                    or record.statement_type is not identity.statement_type
+                    or record.fiscal_year != identity.fiscal_year
+                    or record.fiscal_period is not identity.fiscal_period
+                    or record.to_version_sequence != identity.version_sequence
+                    or record.from_version_sequence != from_version_sequence
+                ):
+                    raise EdgarIngestionError(
+                        "Restatement ledger record does not belong to the hop being replaced.",
+                        details={
+                            "cik": identity.cik,
+                            "statement_type": identity.statement_type.value,
+                            "fiscal_year": identity.fiscal_year,
+                            "fiscal_period": identity.fiscal_period.value,
+                            "from_version_sequence": from_version_sequence,
+                            "to_version_sequence": identity.version_sequence,
+                            "metric": record.metric.value,
+                        },
+                    )
+                rows.append(self._to_row_dict(record=record, company_id=company.company_id))
+
+            entry = EdgarRestatementLedgerEntry
+            await self._session.execute(
+                delete(entry).where(
+                    entry.company_id == company.company_id,
+                    entry.statement_type == identity.statement_type.value,
+                    entry.fiscal_year == identity.fiscal_year,
+                    entry.fiscal_period == identity.fiscal_period.value,
+                    entry.to_version_sequence == identity.version_sequence,
+                )
+            )
+            if rows:
+                await self._session.execute(insert(entry).values(rows))
+
+        except Exception as exc:  # noqa: BLE001
+            outcome = "error"
+            with suppress(Exception):
+                self._metrics_err.labels(
+                    operation="replace_hop",
+                    model=self._MODEL_NAME,
+                    reason=type(exc).__name__,
+                ).inc()
+            raise
+        finally:
+            with suppress(Exception):
+                self._metrics_hist.labels(
+                    operation="replace_hop",
+                    model=self._MODEL_NAME,
+                    outcome=outcome,
+                ).observe(time.perf_counter() - start)
+
+    # ------------------------------------------------------------------
+    # QUERIES
+    # ------------------------------------------------------------------
+
+    async def screen(
+        self,
+        *,
+        query: RestatementScreenQuery,
+    ) -> Sequence[RestatementLedgerRecord]:
+        """Screen the ledger across all filers in one indexed query.
+
+        Ordering:
+            abs_pct_change DESC NULLS FIRST,
+            cik ASC,
+            fiscal_year DESC,
+            fiscal_period ASC,
+            to_version_sequence ASC,
+            metric_code ASC
+
+        Args:
+            query: Screen filters and limit.
+
+        Returns:
+            Deterministically ordered ledger records.
+        """
+        start = time.perf_counter()
+        outcome = "success"
+
+        try:
+            res = await self._session.execute(self._screen_stmt(query))
+            return [self._map_to_domain(row) for row in res.scalars().all()]
+
+        except Exception as exc:  # noqa: BLE001
+            outcome = "error"
+            with suppress(Exception):
+                self._metrics_err.labels(
+                    operation="screen",
+                    model=self._MODEL_NAME,
+                    reason=type(exc).__name__,
+                ).inc()
+            raise
+        finally:
+            with suppress(Exception):
+                self._metrics_hist.labels(
+                    operation="screen",
+                    model=self._MODEL_NAME,
+                    outcome=outcome,
+                ).observe(time.perf_counter() - start)
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _screen_stmt(query: RestatementScreenQuery) -> Select[Any]:
+        """Build the screen statement for ``query``."""
+        entry = EdgarRestatementLedgerEntry
+        conditions: list[Any] = [entry.statement_type == query.statement_type.value]
+        if query.metric is not None:
+            conditions.append(entry.metric_code == query.metric.value)
+        if query.fiscal_year is not None:
+            conditions.append(entry.fiscal_year == query.fiscal_year)
+        if query.fiscal_period is not None:
+            conditions.append(entry.fiscal_period == query.fiscal_period.value)
+        if query.min_abs_pct_change is not None:
+            conditions.append(entry.abs_pct_change >= query.min_abs_pct_change)
+        classes = query.materiality_classes
+        if classes is not None:
+            conditions.append(entry.materiality.in_([c.value for c in classes]))
+        if query.restated_from is not None:
+            conditions.append(entry.restated_on >= query.restated_from)
+        if query.restated_to is not None:
+            conditions.append(entry.restated_on <= query.restated_to)
+
+        return (
+            select(entry)
+            .where(*conditions)
+            .order_by(
+                entry.abs_pct_change.desc().nulls_first(),
+                entry.cik.asc(),
+                entry.fiscal_year.desc(),
+                entry.fiscal_period.asc(),
+                entry.to_version_sequence.asc(),
+                entry.metric_code.asc(),
+            )
+            .limit(query.limit)
+        )
+
+    @staticmethod
+    def _to_row_dict(*, record: RestatementLedgerRecord, company_id: UUID) -> dict[str, Any]:
+        """Convert a domain ledger record into a row dict for insertion."""
+        return {
+            "entry_id": uuid4(),
+            "company_id": company_id,
+            "cik": record.cik,
+            "statement_type": record.statement_type.value,
+            "accounting_standard": record.accounting_standard.value,
+            "fiscal_year": record.fiscal_year,
+            "fiscal_period": record.fiscal_period.value,
+            "statement_date": record.statement_date,
+            "currency": record.currency,
+            "from_version_sequence": record.from_version_sequence,
+            "to_version_sequence": record.to_version_sequence,
+            "restated_on": record.restated_on,
+            "metric_code": record.metric.value,
+            "old_value": record.old_value,
+            "new_value": record.new_value,
+            "diff_value": record.diff,
+            "abs_diff_value": record.abs_diff,
+            "pct_change": record.pct_change,
+            "abs_pct_change": record.abs_pct_change,
+            "materiality": record.materiality.value,
+        }
+
+    @staticmethod
+    def _map_to_domain(row: EdgarRestatementLedgerEntry) -> RestatementLedgerRecord:
+        """Map an ORM ledger row to a domain RestatementLedgerRecord."""
+        old_value = Decimal(str(row.old_value))
+        new_value = Decimal(str(row.new_value))
+        return RestatementLedgerRecord(
+            cik=row.cik,
+            statement_type=StatementType(row.statement_type),
+            accounting_standard=AccountingStandard(row.accounting_standard),
+            statement_date=row.statement_date,
+            fiscal_year=row.fiscal_year,
+            fiscal_period=FiscalPeriod(row.fiscal_period),
+            currency=row.currency,
+            from_version_sequence=row.from_version_sequence,
+            to_version_sequence=row.to_version_sequence,
+            metric=CanonicalStatementMetric(row.metric_code),
+            old_value=old_value,
+            new_value=new_value,
+            diff=new_value - old_value,
+            pct_change=Decimal(str(row.pct_change)) if row.pct_change is not None else None,
+            materiality=MaterialityClass(row.materiality),
+            restated_on=row.restated_on,
+        )
+
+
+__all__ = ["SqlAlchemyEdgarRestatementLedgerRepository"]
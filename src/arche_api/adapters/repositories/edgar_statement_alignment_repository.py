@@ -30,6 +30,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import aliased
 
 from arche_api.adapters.repositories.base_repository import BaseRepository
+from arche_api.adapters.repositories.edgar_identity_map import (
+    CompanyKey,
+    fetch_companies_by_cik,
+    get_company_by_cik,
+)
 from arche_api.domain.entities.edgar_dq import NormalizedStatementIdentity
 from arche_api.domain.enums.edgar import StatementType
 from arche_api.domain.exceptions.edgar import EdgarIngestionError
@@ -39,7 +44,6 @@ from arche_api.domain.interfaces.repositories.edgar_statement_alignment_reposito
 from arche_api.domain.interfaces.repositories.edgar_statement_alignment_repository import (
     StatementAlignmentRecord,
 )
-from arche_api.infrastructure.database.models.ref import Company
 from arche_api.infrastructure.database.models.sec import (
     EdgarStatementAlignment,
     StatementVersion,
@@ -92,7 +96,7 @@ class SqlAlchemyEdgarStatementAlignmentRepository(
         try:
             # Resolve company + statement_version FKs from the identity fields.
             cik_set = {a.cik for a in alignments}
-            cik_to_company = await self._fetch_companies_by_cik(cik_set)
+            cik_to_company = await self._fetch_companies_by_cik(cik_set, recheck_missing=True)
 
             stmt_versions = await self._fetch_statement_versions(alignments)
 
@@ -314,15 +318,11 @@ class SqlAlchemyEdgarStatementAlignmentRepository(
     async def _fetch_companies_by_cik(
         self,
         ciks: set[str],
-    ) -> dict[str, Company]:
-        """Fetch reference companies by CIK into a lookup map."""
-        if not ciks:
-            return {}
-
-        stmt = select(Company).where(Company.cik.in_(list(ciks)))
-        res = await self._session.execute(stmt)
-        rows: list[Company] = list(res.scalars().all())
-        return {row.cik: row for row in rows if row.cik is not None}
+        *,
+        recheck_missing: bool = False,
+    ) -> dict[str, CompanyKey]:
+        """Resolve reference companies by CIK via the shared identity map."""
+        return await fetch_companies_by_cik(self._session, ciks, recheck_missing=recheck_missing)
 
     async def _fetch_statement_versions(
         self,
@@ -377,8 +377,6 @@ class SqlAlchemyEdgarStatementAlignmentRepository(
             for row in rows
         }
 
-    async def _get_company_by_cik(self, cik: str) -> Company | None:
-        """Return the `Company` row for a given CIK, or None if missing."""
-        stmt = select(Company).where(Company.cik == cik).limit(1)
-        res = await self._session.execute(stmt)
-        return res.scalar_one_or_none()
+    async def _get_company_by_cik(self, cik: str) -> CompanyKey | None:
+        """Return the company for a given CIK, or None if missing."""
+        return await get_company_by_cik(self._session, cik)
@@ -20,18 +20,26 @@ Design:
 from __future__ import annotations
 
 import time
-from collections.abc import Mapping, Sequence
+from collections.abc import AsyncIterator, Mapping, Sequence
 from contextlib import suppress
 from datetime import date
 from decimal import Decimal, InvalidOperation
 from typing import Any, cast
 from uuid import uuid4
 
-from sqlalchemy import Select, insert, select, update
+from sqlalchemy import Select, func, insert, literal, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import aliased
 
+from arche_api.adapters.repositories import edgar_fast_reads as fast_reads
 from arche_api.adapters.repositories.base_repository import BaseRepository
+from arche_api.adapters.repositories.edgar_identity_map import (
+    CompanyKey,
+    FilingKey,
+    fetch_companies_by_cik,
+    fetch_filings_by_accession,
+    get_company_by_cik,
+)
 from arche_api.domain.entities.canonical_statement_payload import (
     CanonicalStatementPayload,
 )
@@ -48,6 +56,7 @@ from arche_api.domain.enums.edgar import (
     StatementType,
 )
 from arche_api.domain.exceptions.edgar import EdgarIngestionError
+from arche_api.domain.value_objects import StatementKeyset, StatementVersionsFingerprint
 from arche_api.infrastructure.database.models.ref import Company
 from arche_api.infrastructure.database.models.sec import Filing, StatementVersion
 from arche_api.infrastructure.observability.metrics import (
@@ -115,10 +124,12 @@ class EdgarStatementsRepository(BaseRepository[StatementVersion]):
 
         try:
             cik_set = {v.company.cik for v in versions}
-            cik_to_company = await self._fetch_companies_by_cik(cik_set)
+            cik_to_company = await self._fetch_companies_by_cik(cik_set, recheck_missing=True)
 
             accession_set = {v.accession_id for v in versions}
-            accession_to_filing = await self._fetch_filings_by_accession(accession_set)
+            accession_to_filing = await self._fetch_filings_by_accession(
+                accession_set, recheck_missing=True
+            )
 
             payload: list[dict[str, Any]] = []
             for v in versions:
@@ -242,6 +253,8 @@ class EdgarStatementsRepository(BaseRepository[StatementVersion]):
                 .values(
                     normalized_payload=normalized_payload_dict,
                     normalized_payload_version=payload_version,
+                    # Keep updated_at meaningful for validators built on it.
+                    updated_at=func.now(),
                 )
             )
 
@@ -309,23 +322,33 @@ class EdgarStatementsRepository(BaseRepository[StatementVersion]):
                     details={"cik": company.cik},
                 )
 
-            sv = aliased(StatementVersion)
-            f = aliased(Filing)
-
-            stmt: Select[Any] = (
-                select(sv, f)
-                .join(f, sv.filing_id == f.filing_id)
-                .where(
-                    sv.company_id == company_row.company_id,
-                    sv.statement_type == statement_type.value,
-                    sv.statement_date == statement_date,
-                )
-                .order_by(sv.version_sequence.desc(), sv.statement_version_id.asc())
-                .limit(1)
+            records = await fast_reads.fetch(
+                self._session,
+                fast_reads.LATEST_STATEMENT_VERSION_BY_DATE,
+                company_row.company_id,
+                statement_type.value,
+                statement_date,
             )
+            if records is not None:
+                row = records[0] if records else None
+            else:
+                sv = aliased(StatementVersion)
+                f = aliased(Filing)
+
+                stmt: Select[Any] = (
+                    select(sv, f)
+                    .join(f, sv.filing_id == f.filing_id)
+                    .where(
+                        sv.company_id == company_row.company_id,
+                        sv.statement_type == statement_type.value,
+                        sv.statement_date == statement_date,
+                    )
+                    .order_by(sv.version_sequence.desc(), sv.statement_version_id.asc())
+                    .limit(1)
+                )
 
-            res = await self._session.execute(stmt)
-            row = res.first()
+                res = await self._session.execute(stmt)
+                row = res.first()
             if row is None:
                 raise EdgarIngestionError(
                     "No statement version found for company/date.",
@@ -336,6 +359,8 @@ class EdgarStatementsRepository(BaseRepository[StatementVersion]):
                     },
                 )
 
+            if records is not None:
+                return self._map_record_to_domain(company_row, row)
             sv_row, filing_row = cast(tuple[StatementVersion, Filing], row)
             return self._map_to_domain(company_row, filing_row, sv_row)
 
@@ -378,31 +403,43 @@ class EdgarStatementsRepository(BaseRepository[StatementVersion]):
             if company_row is None:
                 return []
 
-            sv = aliased(StatementVersion)
-            f = aliased(Filing)
-
-            stmt: Select[Any] = (
-                select(sv, f)
-                .join(f, sv.filing_id == f.filing_id)
-                .where(
-                    sv.company_id == company_row.company_id,
-                    sv.statement_type == statement_type.value,
-                    sv.statement_date >= from_date,
-                    sv.statement_date <= to_date,
-                )
-                .order_by(
-                    sv.statement_date.asc(),
-                    sv.version_sequence.asc(),
-                    sv.statement_version_id.asc(),
-                )
+            records = await fast_reads.fetch(
+                self._session,
+                fast_reads.STATEMENT_VERSIONS_BY_DATE_WINDOW,
+                company_row.company_id,
+                statement_type.value,
+                from_date,
+                to_date,
             )
+            if records is not None:
+                versions = [self._map_record_to_domain(company_row, r) for r in records]
+            else:
+                sv = aliased(StatementVersion)
+                f = aliased(Filing)
+
+                stmt: Select[Any] = (
+                    select(sv, f)
+                    .join(f, sv.filing_id == f.filing_id)
+                    .where(
+                        sv.company_id == company_row.company_id,
+                        sv.statement_type == statement_type.value,
+                        sv.statement_date >= from_date,
+                        sv.statement_date <= to_date,
+                    )
+                    .order_by(
+                        sv.statement_date.asc(),
+                        sv.version_sequence.asc(),
+                        sv.statement_version_id.asc(),
+                    )
+                )
 
-            res = await self._session.execute(stmt)
-            rows = cast(list[tuple[StatementVersion, Filing]], res.all())
+                res = await self._session.execute(stmt)
+                rows = cast(list[tuple[StatementVersion, Filing]], res.all())
 
-            versions = [
-                self._map_to_domain(company_row, filing_row, sv_row) for sv_row, filing_row in rows
-            ]
+                versions = [
+                    self._map_to_domain(company_row, filing_row, sv_row)
+                    for sv_row, filing_row in rows
+                ]
 
             if include_restated:
                 return versions
@@ -474,6 +511,17 @@ class EdgarStatementsRepository(BaseRepository[StatementVersion]):
             if company is None:
                 return None
 
+            records = await fast_reads.fetch(
+                self._session,
+                fast_reads.LATEST_STATEMENT_VERSION_BY_PERIOD,
+                company.company_id,
+                statement_type.value,
+                fiscal_year,
+                fiscal_period.value,
+            )
+            if records is not None:
+                return self._map_record_to_domain(company, records[0]) if records else None
+
             sv = aliased(StatementVersion)
             f = aliased(Filing)
 
@@ -546,6 +594,26 @@ class EdgarStatementsRepository(BaseRepository[StatementVersion]):
             if company is None:
                 return []
 
+            if fiscal_period is None:
+                records = await fast_reads.fetch(
+                    self._session,
+                    fast_reads.STATEMENT_VERSIONS_BY_YEAR,
+                    company.company_id,
+                    statement_type.value,
+                    fiscal_year,
+                )
+            else:
+                records = await fast_reads.fetch(
+                    self._session,
+                    fast_reads.STATEMENT_VERSIONS_BY_YEAR_AND_PERIOD,
+                    company.company_id,
+                    statement_type.value,
+                    fiscal_year,
+                    fiscal_period.value,
+                )
+            if records is not None:
+                return [self._map_record_to_domain(company, r) for r in records]
+
             sv = aliased(StatementVersion)
             f = aliased(Filing)
 
@@ -587,6 +655,426 @@ class EdgarStatementsRepository(BaseRepository[StatementVersion]):
                     outcome=outcome,
                 ).observe(duration)
 
+    # ------------------------------------------------------------------
+    # Keyset-paginated payload reads
+    # ------------------------------------------------------------------
+
+    async def list_latest_statement_payloads(
+        self,
+        *,
+        ciks: Sequence[str],
+        statement_type: StatementType,
+        fiscal_periods: Sequence[FiscalPeriod],
+        from_date: date,
+        to_date: date,
+        after: StatementKeyset | None = None,
+        before: StatementKeyset | None = None,
+        limit: int | None = None,
+    ) -> list[CanonicalStatementPayload]:
+        """List latest normalized payloads per (cik, statement_date, fiscal_period).
+
+        The latest-version selection, keyset predicate and LIMIT are all pushed
+        into a single ``DISTINCT ON`` query, so the cost of a page depends on
+        ``limit`` rather than on how deep into the panel the page is. Only the
+        key columns and the payload document are selected; filings are not
+        joined.
+
+        Args:
+            ciks: Universe of company CIKs.
+            statement_type: Statement type to filter by.
+            fiscal_periods: Fiscal periods to include.
+            from_date: Inclusive lower bound on statement_date.
+            to_date: Inclusive upper bound on statement_date.
+            after: When provided, only rows strictly after this keyset.
+            before: When provided, only rows strictly before this keyset. The
+                query then scans backwards so that ``limit`` selects the rows
+                immediately preceding the keyset.
+            limit: Optional maximum number of rows to return.
+
+        Returns:
+            Canonical payloads ordered by (cik, statement_date, fiscal_period)
+            ascending.
+        """
+        start = time.perf_counter()
+        outcome = "success"
+
+        try:
+            if not ciks or not fiscal_periods:
+                return []
+
+            records = await self._fetch_latest_payload_records(
+                ciks=ciks,
+                statement_type=statement_type,
+                fiscal_periods=fiscal_periods,
+                from_date=from_date,
+                to_date=to_date,
+                after=after,
+                before=before,
+                limit=limit,
+            )
+            raw_payloads: list[Mapping[str, Any] | None]
+            if records is not None:
+                raw_payloads = [fast_reads.json_value(r[0]) for r in records]
+            else:
+                stmt = self._latest_payloads_stmt(
+                    ciks=ciks,
+                    statement_type=statement_type,
+                    fiscal_periods=fiscal_periods,
+                    from_date=from_date,
+                    to_date=to_date,
+                    after=after,
+                    before=before,
+                )
+                if limit is not None:
+                    stmt = stmt.limit(limit)
+
+                res = await self._session.execute(stmt)
+                raw_payloads = [row.normalized_payload for row in res.all()]
+
+            payloads: list[CanonicalStatementPayload] = []
+            for raw in raw_payloads:
+                payload = self._map_normalized_payload(raw)
+                if payload is not None:
+                    payloads.append(payload)
+
+            if before is not None:
+                payloads.reverse()
+            return payloads
+
+        except Exception as exc:  # noqa: BLE001
+            outcome = "error"
+            with suppress(Exception):
+                self._metrics_err.labels(
+                    operation="list_latest_statement_payloads",
+                    model=self._MODEL_NAME,
+                    reason=type(exc).__name__,
+                ).inc()
+            raise
+
+        finally:
+            with suppress(Exception):
+                duration = time.perf_counter() - start
+                self._metrics_hist.labels(
+                    operation="list_latest_statement_payloads",
+                    model=self._MODEL_NAME,
+                    outcome=outcome,
+                ).observe(duration)
+
+    async def stream_latest_statement_payloads(
+        self,
+        *,
+        ciks: Sequence[str],
+        statement_type: StatementType,
+        fiscal_periods: Sequence[FiscalPeriod],
+        from_date: date,
+        to_date: date,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[CanonicalStatementPayload]:
+        """Stream latest normalized payloads per (cik, statement_date, fiscal_period).
+
+        Runs the same ``DISTINCT ON`` query as
+        :meth:`list_latest_statement_payloads` over a server-side cursor and
+        maps rows ``batch_size`` at a time, so at most one batch of payload
+        documents is held in memory.
+
+        Args:
+            ciks: Universe of company CIKs.
+            statement_type: Statement type to filter by.
+            fiscal_periods: Fiscal periods to include.
+            from_date: Inclusive lower bound on statement_date.
+            to_date: Inclusive upper bound on statement_date.
+            batch_size: Number of rows fetched from the cursor per round trip.
+
+        Yields:
+            Canonical payloads ordered by (cik, statement_date, fiscal_period)
+            ascending.
+        """
+        start = time.perf_counter()
+        outcome = "success"
+
+        try:
+            if not ciks or not fiscal_periods:
+                return
+
+            stmt = self._latest_payloads_stmt(
+                ciks=ciks,
+                statement_type=statement_type,
+                fiscal_periods=fiscal_periods,
+                from_date=from_date,
+                to_date=to_date,
+            ).execution_options(yield_per=max(1, batch_size))
+
+            res = await self._session.stream(stmt)
+            try:
+                async for partition in res.partitions():
+                    for row in partition:
+                        payload = self._map_normalized_payload(row.normalized_payload)
+                        if payload is not None:
+                            yield payload
+            finally:
+                await res.close()
+
+        except Exception as exc:  # noqa: BLE001
+            outcome = "error"
+            with suppress(Exception):
+                self._metrics_err.labels(
+                    operation="stream_latest_statement_payloads",
+                    model=self._MODEL_NAME,
+                    reason=type(exc).__name__,
+                ).inc()
+            raise
+
+        finally:
+            with suppress(Exception):
+                duration = time.perf_counter() - start
+                self._metrics_hist.labels(
+                    operation="stream_latest_statement_payloads",
+                    model=self._MODEL_NAME,
+                    outcome=outcome,
+                ).observe(duration)
+
+    async def count_latest_statement_payloads(
+        self,
+        *,
+        ciks: Sequence[str],
+        statement_type: StatementType,
+        fiscal_periods: Sequence[FiscalPeriod],
+        from_date: date,
+        to_date: date,
+    ) -> int:
+        """Count identities returned by :meth:`list_latest_statement_payloads`.
+
+        Counts distinct (cik, statement_date, fiscal_period) keys carrying a
+        normalized payload; only key columns are read, never payload
+        documents.
+
+        Args:
+            ciks: Universe of company CIKs.
+            statement_type: Statement type to filter by.
+            fiscal_periods: Fiscal periods to include.
+            from_date: Inclusive lower bound on statement_date.
+            to_date: Inclusive upper bound on statement_date.
+
+        Returns:
+            Number of rows in the unpaginated result.
+        """
+        start = time.perf_counter()
+        outcome = "success"
+
+        try:
+            if not ciks or not fiscal_periods:
+                return 0
+
+            sv = aliased(StatementVersion)
+            c = aliased(Company)
+
+            keys = (
+                select(c.cik, sv.statement_date, sv.fiscal_period)
+                .join(c, sv.company_id == c.company_id)
+                .where(
+                    c.cik.in_(list(ciks)),
+                    sv.statement_type == statement_type.value,
+                    sv.fiscal_period.in_([p.value for p in fiscal_periods]),
+                    sv.statement_date >= from_date,
+                    sv.statement_date <= to_date,
+                    func.jsonb_typeof(sv.normalized_payload) == "object",
+                )
+                .distinct()
+                .subquery()
+            )
+
+            res = await self._session.execute(select(func.count()).select_from(keys))
+            return int(res.scalar_one() or 0)
+
+        except Exception as exc:  # noqa: BLE001
+            outcome = "error"
+            with suppress(Exception):
+                self._metrics_err.labels(
+                    operation="count_latest_statement_payloads",
+                    model=self._MODEL_NAME,
+                    reason=type(exc).__name__,
+                ).inc()
+            raise
+
+        finally:
+            with suppress(Exception):
+                duration = time.perf_counter() - start
+                self._metrics_hist.labels(
+                    operation="count_latest_statement_payloads",
+                    model=self._MODEL_NAME,
+                    outcome=outcome,
+                ).observe(duration)
+
+    async def get_statement_versions_fingerprint(
+        self,
+        *,
+        ciks: Sequence[str],
+        statement_type: StatementType,
+        from_date: date | None = None,
+        to_date: date | None = None,
+    ) -> StatementVersionsFingerprint:
+        """Return an aggregate change marker for statement versions in scope.
+
+        Runs a single ``count``/``max`` aggregate over the statement-version
+        rows of the universe; payload documents are never read.
+
+        Args:
+            ciks: Universe of company CIKs.
+            statement_type: Statement type to filter by.
+            from_date: Optional inclusive lower bound on statement_date.
+            to_date: Optional inclusive upper bound on statement_date.
+
+        Returns:
+            StatementVersionsFingerprint for the scope.
+        """
+        start = time.perf_counter()
+        outcome = "success"
+
+        try:
+            if not ciks:
+                return StatementVersionsFingerprint(
+                    row_count=0,
+                    max_version_sequence=None,
+                    max_updated_at=None,
+                )
+
+            sv = aliased(StatementVersion)
+            c = aliased(Company)
+
+            conditions: list[Any] = [
+                c.cik.in_(list(ciks)),
+                sv.statement_type == statement_type.value,
+            ]
+            if from_date is not None:
+                conditions.append(sv.statement_date >= from_date)
+            if to_date is not None:
+                conditions.append(sv.statement_date <= to_date)
+
+            stmt = (
+                select(
+                    func.count(),
+                    func.max(sv.version_sequence),
+                    func.max(sv.updated_at),
+                )
+                .select_from(sv)
+                .join(c, sv.company_id == c.company_id)
+                .where(*conditions)
+            )
+
+            res = await self._session.execute(stmt)
+            row_count, max_version_sequence, max_updated_at = res.one()
+            return StatementVersionsFingerprint(
+                row_count=int(row_count or 0),
+                max_version_sequence=max_version_sequence,
+                max_updated_at=max_updated_at,
+            )
+
+        except Exception as exc:  # noqa: BLE001
+            outcome = "error"
+            with suppress(Exception):
+                self._metrics_err.labels(
+                    operation="get_statement_versions_fingerprint",
+                    model=self._MODEL_NAME,
+                    reason=type(exc).__name__,
+                ).inc()
+            raise
+
+        finally:
+            with suppress(Exception):
+                duration = time.perf_counter() - start
+                self._metrics_hist.labels(
+                    operation="get_statement_versions_fingerprint",
+                    model=self._MODEL_NAME,
+                    outcome=outcome,
+                ).observe(duration)
+
+    async def _fetch_latest_payload_records(
+        self,
+        *,
+        ciks: Sequence[str],
+        statement_type: StatementType,
+        fiscal_periods: Sequence[FiscalPeriod],
+        from_date: date,
+        to_date: date,
+        after: StatementKeyset | None,
+        before: StatementKeyset | None,
+        limit: int | None,
+    ) -> Sequence[Any] | None:
+        """Run the latest-payload query on the asyncpg fast path, if enabled."""
+        args: list[Any] = [
+            list(ciks),
+            statement_type.value,
+            [p.value for p in fiscal_periods],
+            from_date,
+            to_date,
+        ]
+        if after is not None and before is not None:
+            return None  # two-sided windows are rare; the ORM query handles them
+        if after is not None:
+            sql = fast_reads.LATEST_PAYLOADS_AFTER
+            args += [after.cik, after.statement_date, after.fiscal_period.value]
+        elif before is not None:
+            sql = fast_reads.LATEST_PAYLOADS_BEFORE
+            args += [before.cik, before.statement_date, before.fiscal_period.value]
+        else:
+            sql = fast_reads.LATEST_PAYLOADS
+        return await fast_reads.fetch(self._session, sql, *args, limit)
+
+    @staticmethod
+    def _keyset_tuple(keyset: StatementKeyset) -> Any:
+        """Return a SQL row-value literal for a keyset comparison."""
+        return tuple_(
+            literal(keyset.cik),
+            literal(keyset.statement_date),
+            literal(keyset.fiscal_period.value),
+        )
+
+    @classmethod
+    def _latest_payloads_stmt(
+        cls,
+        *,
+        ciks: Sequence[str],
+        statement_type: StatementType,
+        fiscal_periods: Sequence[FiscalPeriod],
+        from_date: date,
+        to_date: date,
+        after: StatementKeyset | None = None,
+        before: StatementKeyset | None = None,
+    ) -> Select[Any]:
+        """Build the latest-payload-per-identity ``DISTINCT ON`` query."""
+        sv = aliased(StatementVersion)
+        c = aliased(Company)
+
+        key_columns = (c.cik, sv.statement_date, sv.fiscal_period)
+        conditions: list[Any] = [
+            c.cik.in_(list(ciks)),
+            sv.statement_type == statement_type.value,
+            sv.fiscal_period.in_([p.value for p in fiscal_periods]),
+            sv.statement_date >= from_date,
+            sv.statement_date <= to_date,
+            # The column is JSONB; explicit JSON ``null`` must be skipped
+            # just like SQL NULL so older versions with a payload win.
+            func.jsonb_typeof(sv.normalized_payload) == "object",
+        ]
+        if after is not None:
+            conditions.append(tuple_(*key_columns) > cls._keyset_tuple(after))
+        if before is not None:
+            conditions.append(tuple_(*key_columns) < cls._keyset_tuple(before))
+
+        if before is not None:
+            ordering = [col.desc() for col in key_columns]
+        else:
+            ordering = [col.asc() for col in key_columns]
+
+        stmt: Select[Any] = (
+            select(c.cik, sv.statement_date, sv.fiscal_period, sv.normalized_payload)
+            .join(c, sv.company_id == c.company_id)
+            .where(*conditions)
+            .distinct(*key_columns)
+            .order_by(*ordering, sv.version_sequence.desc())
+        )
+        return stmt
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
@@ -594,38 +1082,30 @@ class EdgarStatementsRepository(BaseRepository[StatementVersion]):
     async def _fetch_companies_by_cik(
         self,
         ciks: set[str],
-    ) -> dict[str, Company]:
-        """Fetch reference companies by CIK into a lookup map."""
-        if not ciks:
-            return {}
-
-        stmt = select(Company).where(Company.cik.in_(list(ciks)))
-        res = await self._session.execute(stmt)
-        rows: list[Company] = list(res.scalars().all())
-        return {row.cik: row for row in rows if row.cik is not None}
+        *,
+        recheck_missing: bool = False,
+    ) -> dict[str, CompanyKey]:
+        """Resolve reference companies by CIK via the shared identity map."""
+        return await fetch_companies_by_cik(self._session, ciks, recheck_missing=recheck_missing)
 
     async def _fetch_filings_by_accession(
         self,
         accessions: set[str],
-    ) -> dict[str, Filing]:
-        """Fetch SEC filings by accession into a lookup map."""
-        if not accessions:
-            return {}
-
-        stmt = select(Filing).where(Filing.accession.in_(list(accessions)))
-        res = await self._session.execute(stmt)
-        rows: list[Filing] = list(res.scalars().all())
-        return {row.accession: row for row in rows}
-
-    async def _get_company_by_cik(self, cik: str) -> Company | None:
-        """Return the `Company` row for a given CIK, or None if missing."""
-        stmt = select(Company).where(Company.cik == cik).limit(1)
-        res = await self._session.execute(stmt)
-        return res.scalar_one_or_none()
+        *,
+        recheck_missing: bool = False,
+    ) -> dict[str, FilingKey]:
+        """Resolve SEC filings by accession via the shared identity map."""
+        return await fetch_filings_by_accession(
+            self._session, accessions, recheck_missing=recheck_missing
+        )
+
+    async def _get_company_by_cik(self, cik: str) -> CompanyKey | None:
+        """Return the company for a given CIK, or None if missing."""
+        return await get_company_by_cik(self._session, cik)
 
     @staticmethod
     def _map_to_domain(
-        company_row: Company,
+        company_row: CompanyKey,
         filing_row: Filing,
         sv_row: StatementVersion,
     ) -> EdgarStatementVersion:
@@ -698,6 +1178,59 @@ class EdgarStatementsRepository(BaseRepository[StatementVersion]):
             normalized_payload_version=sv_row.normalized_payload_version,
         )
 
+    @staticmethod
+    def _map_record_to_domain(company: CompanyKey, record: Any) -> EdgarStatementVersion:
+        """Map a fast-path record (statement version + filing columns) to the domain.
+
+        Mirrors :meth:`_map_to_domain` column for column; see
+        ``edgar_fast_reads`` for the selected columns.
+        """
+        if company.cik is None:
+            raise EdgarIngestionError(
+                "ref.company has null CIK; cannot map to EdgarCompanyIdentity.",
+                details={"company_id": str(company.company_id)},
+            )
+
+        company_identity = EdgarCompanyIdentity(
+            cik=company.cik,
+            ticker=None,
+            legal_name=company.name,
+            exchange=None,
+            country=None,
+        )
+        filing = EdgarFiling(
+            accession_id=record["filing_accession"],
+            company=company_identity,
+            filing_type=FilingType(record["form_type"]),
+            filing_date=record["filing_date"],
+            period_end_date=record["period_of_report"],
+            accepted_at=record["accepted_at"],
+            is_amendment=record["is_amendment"],
+            amendment_sequence=record["amendment_sequence"],
+            primary_document=record["primary_document"],
+            data_source=record["data_source"],
+        )
+        return EdgarStatementVersion(
+            company=company_identity,
+            filing=filing,
+            statement_type=StatementType(record["statement_type"]),
+            accounting_standard=AccountingStandard(record["accounting_standard"]),
+            statement_date=record["statement_date"],
+            fiscal_year=record["fiscal_year"],
+            fiscal_period=FiscalPeriod(record["fiscal_period"]),
+            currency=record["currency"],
+            is_restated=record["is_restated"],
+            restatement_reason=record["restatement_reason"],
+            version_source=record["version_source"],
+            version_sequence=record["version_sequence"],
+            accession_id=record["accession_id"],
+            filing_date=record["filing_date"],
+            normalized_payload=EdgarStatementsRepository._map_normalized_payload(
+                fast_reads.json_value(record["normalized_payload"]),
+            ),
+            normalized_payload_version=record["normalized_payload_version"],
+        )
+
     # ------------------------------------------------------------------
     # Normalized payload mapping helpers
     # ------------------------------------------------------------------
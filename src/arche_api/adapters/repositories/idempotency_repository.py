@@ -25,7 +25,8 @@ from collections.abc import Mapping
 from datetime import datetime, timedelta
 from typing import Any, cast
 
-from sqlalchemy import select
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from arche_api.adapters.repositories.base_repository import BaseRepository
@@ -185,3 +186,82 @@ class IdempotencyRepository(BaseRepository[IdempotencyKey]):
         self._session.add(cast(IdempotencyKey, record))
         await self._session.flush()
         await self._session.commit()
+
+    async def upsert_completed(
+        self,
+        *,
+        key: str,
+        request_hash: str,
+        method: str,
+        path: str,
+        status_code: int,
+        response_body: Mapping[str, Any] | None,
+        ttl_seconds: int,
+        now: datetime | None = None,
+    ) -> None:
+        """Write a COMPLETED record in a single statement (audit path).
+
+        Used when the Redis tier owns locking and replay: the durable row is
+        written once, after the fact, with ``INSERT .. ON CONFLICT DO UPDATE``
+        instead of the STARTED/COMPLETED round-trips.
+
+        Args:
+            key: Idempotency-Key header value.
+            request_hash: Deterministic hash of method/path/query/body.
+            method: HTTP method (e.g. POST).
+            path: Request path (no scheme/host).
+            status_code: HTTP status code for the completed response.
+            response_body: JSON response payload, if the body was JSON.
+            ttl_seconds: TTL duration in seconds.
+            now: Optional reference time (naive UTC).
+        """
+        if now is None:
+            now = _utcnow_naive()
+
+        values: dict[str, Any] = {
+            "key": key,
+            "request_hash": request_hash,
+            "method": method,
+            "path": path,
+            "status_code": status_code,
+            "response_body": dict(response_body) if response_body is not None else None,
+            "state": "COMPLETED",
+            "created_at": now,
+            "updated_at": now,
+            "expires_at": now + timedelta(seconds=ttl_seconds),
+        }
+        stmt = pg_insert(IdempotencyKey).values(**values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[IdempotencyKey.key],
+            set_={name: stmt.excluded[name] for name in values if name != "key"},
+        )
+        await self._session.execute(stmt)
+        await self._session.commit()
+
+    async def delete_expired(self, *, now: datetime | None = None, batch_size: int = 1000) -> int:
+        """Delete up to ``batch_size`` expired records in one statement.
+
+        Args:
+            now: Optional reference time (naive UTC); rows with
+                ``expires_at < now`` are removed.
+            batch_size: Maximum rows deleted per call (bounds lock time).
+
+        Returns:
+            Number of rows deleted.
+        """
+        if now is None:
+            now = _utcnow_naive()
+
+        expired = (
+            select(IdempotencyKey.key)
+            .where(IdempotencyKey.expires_at < now)
+            .limit(batch_size)
+            .scalar_subquery()
+        )
+        result = await self._session.execute(
+            delete(IdempotencyKey)
+            .where(IdempotencyKey.key.in_(expired))
+            .execution_options(synchronize_session=False)
+        )
+        await self._session.commit()
+        return int(getattr(result, "rowcount", 0) or 0)
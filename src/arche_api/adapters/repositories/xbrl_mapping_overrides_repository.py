@@ -20,7 +20,7 @@ Design:
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Collection, Mapping, Sequence
 from typing import Any, Protocol, TypeVar, cast
 
 from sqlalchemy import Select, select
@@ -109,6 +109,53 @@ class SqlAlchemyXBRLMappingOverridesRepository(
         rows = result.scalars().all()
         return [self._to_domain(row) for row in rows]
 
+    async def list_rules_for_concepts(
+        self,
+        *,
+        concepts: Collection[str],
+        taxonomy: str | None = None,
+    ) -> Mapping[str, Sequence[MappingOverrideRule]]:
+        """Return override rules for a set of concepts with one query.
+
+        Args:
+            concepts:
+                XBRL concept QNames for which rules should be retrieved.
+            taxonomy:
+                Optional taxonomy identifier. When provided, both
+                taxonomy-specific and taxonomy-agnostic rules are returned.
+
+        Returns:
+            Rules grouped by concept (sorted keys, every requested concept
+            present), ordered by rule id within each concept.
+        """
+        wanted = sorted(set(concepts))
+        if not wanted:
+            return {}
+
+        stmt = select(EdgarXBRLMappingOverride).where(
+            EdgarXBRLMappingOverride.source_concept.in_(wanted),
+        )
+
+        if taxonomy is not None:
+            stmt = stmt.where(
+                (EdgarXBRLMappingOverride.source_taxonomy == taxonomy)
+                | EdgarXBRLMappingOverride.source_taxonomy.is_(None)
+            )
+
+        stmt = stmt.order_by(
+            EdgarXBRLMappingOverride.source_concept,
+            EdgarXBRLMappingOverride.id,
+        )
+
+        result = await self._session.execute(stmt)
+        grouped: dict[str, list[MappingOverrideRule]] = {concept: [] for concept in wanted}
+        for row in result.scalars().all():
+            rule = self._to_domain(row)
+            bucket = grouped.get(rule.source_concept)
+            if bucket is not None:
+                bucket.append(rule)
+        return grouped
+
     @staticmethod
     def _to_domain(row: Any) -> MappingOverrideRule:
         """Map a persistence model or domain object to a MappingOverrideRule.
@@ -1,12 +1,12 @@
 """Routers Package Export (Adapters Layer).
 
 Purpose:
-    Provide stable, explicit exports for the application router aggregator (`api_router`)
-    and the health router (`health_router`). The FastAPI application expects to import
-    these names from this package during startup.
+    Provide stable, explicit exports for the router aggregator (`api_router`, built
+    from ``router_groups.ROUTER_SPECS``) and the health router (`health_router`).
 
 Design:
-    - Avoids implicit imports by re-exporting concrete router instances.
+    - Exports are resolved lazily (PEP 562): importing any single router module
+      does not pull in the aggregator and, through it, every feature router.
     - Keeps application bootstrap (`main.py`) decoupled from router file layout.
 
 Layer:
@@ -15,7 +15,21 @@ Layer:
 
 from __future__ import annotations
 
-from .api_router import router as api_router  # noqa: F401
-from .health_router import router as health  # noqa: F401
+import importlib
+from typing import Any
 
 __all__ = ["api_router", "health"]
+
+_EXPORTS: dict[str, str] = {
+    "api_router": ".api_router",
+    "health": ".health_router",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = importlib.import_module(module, __name__).router
+    globals()[name] = value
+    return value
@@ -4,15 +4,16 @@
 """API Router Aggregator (Adapters Layer).
 
 Purpose:
-    Compose and expose the top-level `router` that includes all feature routers.
-    This is the canonical place to register resource-specific routers into the app.
+    Expose a single top-level `router` with every feature router mounted, for
+    callers that want the whole API surface on one ``APIRouter`` (tests,
+    embedding into another application).
 
-Responsibilities:
-    • Mount health endpoints under `/health`.
-    • Mount latest and historical quotes under `/v2/quotes/...`.
-    • Mount EDGAR filings / statement-version endpoints under `/v1/edgar/...`.
-    • Mount fundamentals modeling endpoints under `/v1/fundamentals/...`.
-    • Mount protected endpoints (auth-gated ping) under `/v1/protected/...`.
+Design:
+    - Built from :data:`~arche_api.adapters.routers.router_groups.ROUTER_SPECS`
+      with every group enabled, so it always matches what ``create_app`` mounts
+      with ``ROUTER_GROUPS=all``. Register new routers there, not here.
+    - Importing this module imports every router; ``create_app`` does not use
+      it so that disabled groups are never imported.
 
 Layer:
     adapters/routers
@@ -22,34 +23,7 @@ from __future__ import annotations
 
 from fastapi import APIRouter
 
-from arche_api.adapters.routers.edgar_router import router as edgar_router
-from arche_api.adapters.routers.fundamentals_router import (
-    router as fundamentals_router,
-)
-from arche_api.adapters.routers.health_router import router as health_router
-from arche_api.adapters.routers.historical_quotes_router import (
-    router as historical_quotes_router,
-)
-from arche_api.adapters.routers.protected_router import get_router as get_protected_router
-from arche_api.adapters.routers.quotes_router import router as quotes_router
+from arche_api.adapters.routers.router_groups import ROUTER_GROUPS, include_router_groups
 
 router = APIRouter()
-
-# Health endpoints (liveness/readiness) under /health.
-router.include_router(health_router, prefix="/health", tags=["Health"])
-
-# Latest quotes (v2) – BaseRouter already includes /v2/quotes prefix.
-router.include_router(quotes_router, tags=["Market Data"])
-
-# Historical quotes (v2) – BaseRouter already includes /v2/quotes prefix.
-router.include_router(historical_quotes_router, tags=["Market Data"])
-
-# EDGAR endpoints – filings, statement versions, etc. (all under /v1/edgar/...).
-router.include_router(edgar_router, tags=["EDGAR Filings"])
-
-# Fundamentals modeling endpoints – time series, restatement deltas,
-# normalized statements (all under /v1/fundamentals/...).
-router.include_router(fundamentals_router, tags=["Fundamentals"])
-
-# Protected ping /v1/protected/ping (feature-flagged auth).
-router.include_router(get_protected_router(), tags=["Auth"])
+include_router_groups(router, ROUTER_GROUPS)
@@ -23,6 +23,8 @@ Endpoints (all under /v1/edgar):
         → SuccessEnvelope with restatement delta between two versions.
     - GET /v1/edgar/statements/restatements/ledger
         → SuccessEnvelope with restatement ledger over version history.
+    - GET /v1/edgar/statements/restatements/screen
+        → SuccessEnvelope with universe-wide restatement screen hits.
     - GET /v1/edgar/companies/{cik}/statements/overrides/trace
         → SuccessEnvelope with override observability trace for a statement.
 
@@ -37,14 +39,21 @@ Design:
 from __future__ import annotations
 
 from datetime import date
+from decimal import Decimal
+from functools import cache
 from typing import Annotated, Any, cast
 
 from fastapi import Depends, HTTPException, Path, Query, Request, Response, status
 from fastapi.responses import JSONResponse
 
 from arche_api.adapters.controllers.edgar_controller import EdgarController
-from arche_api.adapters.dependencies.edgar_uow import get_edgar_uow
-from arche_api.adapters.presenters.base_presenter import PresentResult
+from arche_api.adapters.dependencies.edgar_uow import get_edgar_read_uow, get_edgar_uow
+from arche_api.adapters.presenters.base_presenter import (
+    PrerenderedResponse,
+    PresentResult,
+    if_none_match_satisfied,
+    weak_etag,
+)
 from arche_api.adapters.presenters.edgar_dq_presenter import (
     present_run_statement_dq,
     present_statement_dq_overlay,
@@ -53,6 +62,9 @@ from arche_api.adapters.presenters.edgar_overrides_presenter import (
     present_statement_override_trace,
 )
 from arche_api.adapters.presenters.edgar_presenter import EdgarPresenter
+from arche_api.adapters.presenters.edgar_restatement_screen_presenter import (
+    present_restatement_screen,
+)
 from arche_api.adapters.routers.base_router import BaseRouter, PageParams
 from arche_api.adapters.schemas.http.edgar_dq_schemas import (
     RunStatementDQResultHTTP,
@@ -68,6 +80,7 @@ from arche_api.adapters.schemas.http.edgar_schemas import (
     EdgarStatementVersionListHTTP,
     RestatementLedgerHTTP,
     RestatementMetricTimelineHTTP,
+    RestatementScreenHTTP,
 )
 from arche_api.adapters.schemas.http.envelopes import (
     ErrorEnvelope,
@@ -90,9 +103,20 @@ from arche_api.application.use_cases.statements.run_statement_dq import (
     RunStatementDQRequest,
     RunStatementDQUseCase,
 )
+from arche_api.application.use_cases.statements.screen_restatements import (
+    MAX_SCREEN_LIMIT,
+    ScreenRestatementsRequest,
+    ScreenRestatementsUseCase,
+)
 from arche_api.dependencies.edgar import get_edgar_controller
+from arche_api.domain.enums.canonical_statement_metric import CanonicalStatementMetric
 from arche_api.domain.enums.derived_metric import DerivedMetric
-from arche_api.domain.enums.edgar import FilingType, FiscalPeriod, StatementType
+from arche_api.domain.enums.edgar import (
+    FilingType,
+    FiscalPeriod,
+    MaterialityClass,
+    StatementType,
+)
 from arche_api.domain.exceptions.edgar import (
     EdgarIngestionError,
     EdgarMappingError,
@@ -510,9 +534,13 @@ async def list_statement_versions(
             description="Whether to include restated versions (default: false).",
         ),
     ] = False,
-) -> PaginatedEnvelope[Any] | JSONResponse:
-    """List statement versions for a company."""
-    del request
+) -> PaginatedEnvelope[Any] | JSONResponse | Response:
+    """List statement versions for a company.
+
+    Conditional GET: when the controller is wired with a validator use-case,
+    a weak ETag derived from the statement versions in scope is emitted and a
+    matching ``If-None-Match`` returns 304 without listing the versions.
+    """
     trace_id = response.headers.get("X-Request-ID")
     normalized_cik = _normalize_cik(cik)
 
@@ -543,6 +571,31 @@ async def list_statement_versions(
         },
     )
 
+    etag: str | None = None
+    try:
+        validator = await controller.statement_versions_validator(
+            cik=normalized_cik,
+            statement_type=typed_statement_type,
+            from_date=from_date,
+            to_date=to_date,
+            representation={
+                "route": "edgar.list_statement_versions",
+                "include_restated": include_restated,
+                "page": page_params.page,
+                "page_size": page_params.page_size,
+            },
+        )
+        etag = weak_etag(validator) if validator is not None else None
+    except Exception:  # noqa: BLE001
+        logger.warning(
+            "edgar.api.list_statement_versions.validator_unavailable",
+            extra={"cik": normalized_cik, "trace_id": trace_id},
+            exc_info=True,
+        )
+
+    if etag is not None and if_none_match_satisfied(request.headers.get("If-None-Match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
     try:
         dto_list, total = await controller.list_statements(
             cik=normalized_cik,
@@ -562,6 +615,8 @@ async def list_statement_versions(
             trace_id=trace_id,
         )
         body = _apply_present_result(response, result)
+        if etag is not None:
+            response.headers["ETag"] = etag
 
         logger.info(
             "edgar.api.list_statement_versions.success",
@@ -781,6 +836,23 @@ async def get_statement_versions_for_filing(
 # ---------------------------------------------------------------------------
 
 
+@cache
+def _derived_metrics_catalog() -> PrerenderedResponse:
+    """Render the derived-metrics catalog once with the module presenter."""
+    # Deterministic ordering by metric code.
+    specs = sorted(DERIVED_METRIC_SPECS.values(), key=lambda s: s.metric.value)
+    result = presenter.present_derived_metrics_catalog(specs=specs)
+    logger.info(
+        "edgar.api.derived_metrics_catalog.rendered",
+        extra={"metrics_count": len(specs), "etag": result.headers.get("ETag")},
+    )
+    return PrerenderedResponse.from_result(result)
+
+
+# Render at startup rather than on the first request.
+_derived_metrics_catalog()
+
+
 @router.get(
     "/derived-metrics/catalog",
     response_model=SuccessEnvelope[EdgarDerivedMetricsCatalogHTTP] | ErrorEnvelope,
@@ -796,36 +868,17 @@ async def get_statement_versions_for_filing(
 async def get_derived_metrics_catalog(
     request: Request,
     response: Response,
-) -> SuccessEnvelope[EdgarDerivedMetricsCatalogHTTP] | ErrorEnvelope | JSONResponse:
-    """Return the catalog of registered derived metrics."""
-    del request
-    trace_id = response.headers.get("X-Request-ID")
+) -> Response:
+    """Return the catalog of registered derived metrics.
 
-    logger.info(
-        "edgar.api.get_derived_metrics_catalog.start",
-        extra={"trace_id": trace_id},
-    )
+    The catalog is a pure function of the code version: it is rendered once
+    (see :func:`_derived_metrics_catalog`) and served with a long-lived
+    ``Cache-Control``, its build-time ETag and 304 support.
+    """
+    trace_id = response.headers.get("X-Request-ID")
 
     try:
-        specs = list(DERIVED_METRIC_SPECS.values())
-        # Deterministic ordering by metric code.
-        sorted_specs = sorted(specs, key=lambda s: s.metric.value)
-
-        result = presenter.present_derived_metrics_catalog(
-            specs=sorted_specs,
-            trace_id=trace_id,
-        )
-        body = _apply_present_result(response, result)
-
-        logger.info(
-            "edgar.api.get_derived_metrics_catalog.success",
-            extra={
-                "trace_id": trace_id,
-                "metrics_count": len(sorted_specs),
-            },
-        )
-
-        return cast(SuccessEnvelope[EdgarDerivedMetricsCatalogHTTP], body)
+        return _derived_metrics_catalog().respond(request, trace_id=trace_id)
 
     except Exception as exc:  # pragma: no cover - defensive
         logger.exception(
@@ -1613,6 +1666,162 @@ async def get_restatement_timeline(
         return JSONResponse(status_code=503, content=envelope.model_dump(mode="json"))
 
 
+@router.get(
+    "/statements/restatements/screen",
+    response_model=SuccessEnvelope[RestatementScreenHTTP] | ErrorEnvelope,
+    status_code=status.HTTP_200_OK,
+    responses=cast("dict[int | str, dict[str, Any]]", BaseRouter.std_error_responses()),
+    summary="Screen restatements across all companies",
+    description=(
+        "Screen the persisted restatement ledger across all filers, e.g. every "
+        "company that restated REVENUE by at least 5% for a fiscal period. Hits are "
+        "per-metric changes between adjacent normalized versions, ordered by "
+        "absolute relative change (undefined changes from zero first), then CIK."
+    ),
+)
+async def screen_restatements(
+    request: Request,
+    response: Response,
+    uow: Annotated[UnitOfWork, Depends(get_edgar_read_uow)],
+    statement_type: Annotated[
+        str,
+        Query(
+            description=(
+                "Statement type " "(INCOME_STATEMENT, BALANCE_SHEET, CASH_FLOW_STATEMENT)."
+            ),
+            examples=["INCOME_STATEMENT"],
+        ),
+    ],
+    metric: Annotated[
+        str | None,
+        Query(description="Optional canonical metric code (e.g. REVENUE)."),
+    ] = None,
+    fiscal_year: Annotated[
+        int | None,
+        Query(ge=1, description="Optional fiscal year of the restated statements."),
+    ] = None,
+    fiscal_period: Annotated[
+        str | None,
+        Query(description="Optional fiscal period code (e.g., FY, Q1, Q2, Q3, Q4)."),
+    ] = None,
+    min_abs_pct_change: Annotated[
+        Decimal | None,
+        Query(
+            ge=0,
+            description="Optional minimum |relative change| as a fraction (0.05 = 5%).",
+        ),
+    ] = None,
+    min_materiality: Annotated[
+        str | None,
+        Query(description="Optional minimum materiality class (LOW, MEDIUM, HIGH)."),
+    ] = None,
+    restated_from: Annotated[
+        date | None,
+        Query(description="Optional inclusive lower bound on the restating filing date."),
+    ] = None,
+    restated_to: Annotated[
+        date | None,
+        Query(description="Optional inclusive upper bound on the restating filing date."),
+    ] = None,
+    limit: Annotated[
+        int,
+        Query(ge=1, le=MAX_SCREEN_LIMIT, description="Maximum number of hits."),
+    ] = 500,
+) -> SuccessEnvelope[RestatementScreenHTTP] | ErrorEnvelope | JSONResponse:
+    """Screen the persisted restatement ledger across all companies."""
+    del request
+    trace_id = response.headers.get("X-Request-ID")
+
+    # Parse enums manually to produce 400 envelopes on invalid values.
+    try:
+        typed_statement_type = StatementType(statement_type)
+        typed_metric = CanonicalStatementMetric(metric) if metric is not None else None
+        typed_fiscal_period = FiscalPeriod(fiscal_period) if fiscal_period is not None else None
+        typed_materiality = (
+            MaterialityClass(min_materiality) if min_materiality is not None else None
+        )
+    except ValueError:
+        envelope = _error_envelope(
+            http_status=400,
+            code="VALIDATION_ERROR",
+            message="Invalid statement_type, metric, fiscal_period or min_materiality.",
+            trace_id=trace_id,
+            details={
+                "statement_type": statement_type,
+                "metric": metric,
+                "fiscal_period": fiscal_period,
+                "min_materiality": min_materiality,
+            },
+        )
+        return JSONResponse(status_code=400, content=envelope.model_dump(mode="json"))
+
+    logger.info(
+        "edgar.api.screen_restatements.start",
+        extra={
+            "statement_type": typed_statement_type.value,
+            "metric": metric,
+            "fiscal_year": fiscal_year,
+            "fiscal_period": fiscal_period,
+            "min_abs_pct_change": str(min_abs_pct_change) if min_abs_pct_change else None,
+            "min_materiality": min_materiality,
+            "trace_id": trace_id,
+        },
+    )
+
+    use_case = ScreenRestatementsUseCase(uow=uow)
+
+    try:
+        result = await use_case.execute(
+            ScreenRestatementsRequest(
+                statement_type=typed_statement_type,
+                metric=typed_metric,
+                fiscal_year=fiscal_year,
+                fiscal_period=typed_fiscal_period,
+                min_abs_pct_change=min_abs_pct_change,
+                min_materiality=typed_materiality,
+                restated_from=restated_from,
+                restated_to=restated_to,
+                limit=limit,
+            )
+        )
+        envelope_ok = present_restatement_screen(result)
+
+        logger.info(
+            "edgar.api.screen_restatements.success",
+            extra={
+                "statement_type": typed_statement_type.value,
+                "hits": len(result.records),
+                "trace_id": trace_id,
+            },
+        )
+
+        return envelope_ok
+
+    except EdgarMappingError as exc:
+        envelope = _error_envelope(
+            http_status=400,
+            code="VALIDATION_ERROR",
+            message=str(exc),
+            trace_id=trace_id,
+            details=getattr(exc, "details", None),
+        )
+        return JSONResponse(status_code=400, content=envelope.model_dump(mode="json"))
+
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.exception(
+            "edgar.api.screen_restatements.unhandled",
+            extra={"statement_type": typed_statement_type.value, "trace_id": trace_id},
+        )
+        envelope = _error_envelope(
+            http_status=503,
+            code="EDGAR_UNAVAILABLE",
+            message="Restatement screener is temporarily unavailable.",
+            trace_id=trace_id,
+            details={"reason": type(exc).__name__},
+        )
+        return JSONResponse(status_code=503, content=envelope.model_dump(mode="json"))
+
+
 # ---------------------------------------------------------------------------
 # Routes: Data Quality (DQ) – statement scope
 # ---------------------------------------------------------------------------
@@ -1846,7 +2055,7 @@ async def run_statement_dq(
 async def get_statement_dq_overlay(
     request: Request,
     response: Response,
-    uow: Annotated[UnitOfWork, Depends(get_edgar_uow)],
+    uow: Annotated[UnitOfWork, Depends(get_edgar_read_uow)],
     cik: Annotated[
         str,
         Path(
@@ -2034,7 +2243,7 @@ async def get_statement_dq_overlay(
 async def get_statement_override_trace(
     request: Request,
     response: Response,
-    uow: Annotated[UnitOfWork, Depends(get_edgar_uow)],
+    uow: Annotated[UnitOfWork, Depends(get_edgar_read_uow)],
     cik: Annotated[
         str,
         Path(
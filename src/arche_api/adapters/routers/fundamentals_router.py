@@ -8,6 +8,7 @@ Purpose:
     statement payloads:
 
         * GET /v1/fundamentals/time-series
+        * GET /v1/fundamentals/time-series:export
         * GET /v1/fundamentals/derived/time-series
         * GET /v1/fundamentals/restatement-delta
         * GET /v1/fundamentals/normalized-statements
@@ -28,6 +29,11 @@ Notes:
     - UnitOfWork is obtained via a dedicated dependency function. For now
       this uses a no-op UnitOfWork suitable for validation / error-path
       tests; EDGAR wiring can later replace this with a real SQLAlchemy UoW.
+    - Time-series routes emit a weak ETag built from an aggregate fingerprint
+      of the statement versions in scope and answer matching
+      ``If-None-Match`` requests with 304 before running the use case.
+    - ``time-series:export`` streams the full panel as NDJSON or Arrow IPC
+      from a server-side cursor instead of a paginated envelope.
 """
 
 from __future__ import annotations
@@ -36,17 +42,33 @@ from datetime import date
 from typing import Annotated, Any, cast
 
 from fastapi import Depends, HTTPException, Query, Request, Response, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 
-from arche_api.adapters.dependencies.edgar_uow import get_edgar_uow
+from arche_api.adapters.dependencies.edgar_uow import build_edgar_uow
+from arche_api.adapters.presenters.base_presenter import if_none_match_satisfied, weak_etag
 from arche_api.adapters.presenters.edgar_dq_presenter import present_statement_dq_overlay
+from arche_api.adapters.presenters.fundamentals_export_presenter import (
+    EXPORT_MEDIA_TYPES,
+    arrow_export_available,
+    iter_fundamentals_arrow,
+    iter_fundamentals_ndjson,
+)
 from arche_api.adapters.presenters.fundamentals_presenter import (
-    present_derived_time_series,
+    NEXT_CURSOR_HEADER,
+    TimeSeriesCursor,
+    decode_time_series_cursor,
+    encode_time_series_cursor,
+    index_after_keyset,
+    keyset_of,
+    next_keyset_after_page,
+    present_derived_time_series_page,
     present_fundamentals_time_series,
+    present_fundamentals_time_series_page,
     present_normalized_statement,
     present_restatement_delta,
 )
 from arche_api.adapters.routers.base_router import BaseRouter
+from arche_api.adapters.schemas.http.base import BaseHTTPSchema
 from arche_api.adapters.schemas.http.edgar_dq_schemas import StatementDQOverlayHTTP
 from arche_api.adapters.schemas.http.envelopes import (
     ErrorEnvelope,
@@ -60,6 +82,7 @@ from arche_api.adapters.schemas.http.fundamentals import (
     FundamentalsTimeSeriesPointHTTP,
     NormalizedStatementViewHTTP,
 )
+from arche_api.application.interfaces.stage_timing import timed_stage
 from arche_api.application.uow import UnitOfWork
 from arche_api.application.use_cases.statements.compute_restatement_delta import (
     ComputeRestatementDeltaRequest,
@@ -77,6 +100,10 @@ from arche_api.application.use_cases.statements.get_normalized_statement import
     GetNormalizedStatementRequest,
     GetNormalizedStatementUseCase,
 )
+from arche_api.application.use_cases.statements.get_statement_versions_validator import (
+    GetStatementVersionsValidatorRequest,
+    GetStatementVersionsValidatorUseCase,
+)
 from arche_api.application.use_cases.statements.get_statement_with_dq_overlay import (
     GetStatementWithDQOverlayRequest,
     GetStatementWithDQOverlayUseCase,
@@ -89,6 +116,9 @@ from arche_api.domain.exceptions.edgar import (
     EdgarMappingError,
     EdgarNotFound,
 )
+from arche_api.domain.services.derived_metrics_engine import DERIVED_METRICS_ENGINE_VERSION
+from arche_api.domain.value_objects import StatementKeyset
+from arche_api.infrastructure.http.responses import FastJSONResponse
 from arche_api.infrastructure.logging.logger import get_json_logger
 
 logger = get_json_logger(__name__)
@@ -96,6 +126,11 @@ logger = get_json_logger(__name__)
 # v1 Fundamentals router: /v1/fundamentals/...
 router = BaseRouter(version="v1", resource="fundamentals", tags=["Fundamentals"])
 
+# Rows fetched from the database cursor and encoded per export chunk.
+_EXPORT_BATCH_SIZE = 1000
+
+_EXPORT_FILE_EXTENSIONS = {"ndjson": "ndjson", "arrow": "arrows"}
+
 # --------------------------------------------------------------------------- #
 # UoW dependency – EDGAR SQLAlchemy-backed UnitOfWork                         #
 # --------------------------------------------------------------------------- #
@@ -106,9 +141,10 @@ def get_uow() -> UnitOfWork:
 
     This delegates to the shared EDGAR dependency wiring so that fundamentals
     endpoints operate on the same fact store and statement repositories as the
-    EDGAR router.
+    EDGAR router. Every fundamentals endpoint is a read, so the UnitOfWork is
+    read-only and served by a read replica when one is fresh.
     """
-    return get_edgar_uow()
+    return build_edgar_uow(read_only=True)
 
 
 # --------------------------------------------------------------------------- #
@@ -157,6 +193,174 @@ def _error_envelope(
     )
 
 
+def _invalid_cursor_response(trace_id: str | None) -> JSONResponse:
+    """Return the 400 response for a malformed pagination cursor."""
+    error = _error_envelope(
+        http_status=400,
+        code="VALIDATION_ERROR",
+        message="Invalid pagination cursor.",
+        trace_id=trace_id,
+        details={"param": "cursor"},
+    )
+    return JSONResponse(status_code=400, content=error.model_dump(mode="json"))
+
+
+def _set_next_cursor(
+    response: Response,
+    *,
+    next_keyset: StatementKeyset | None,
+    page: int,
+    total: int,
+) -> None:
+    """Attach the opaque next-page cursor header when another page exists."""
+    if next_keyset is None:
+        return
+    response.headers[NEXT_CURSOR_HEADER] = encode_time_series_cursor(
+        TimeSeriesCursor(keyset=next_keyset, page=page + 1, total=total),
+    )
+
+
+async def _statement_versions_etag(
+    uow: UnitOfWork,
+    *,
+    ciks: list[str],
+    statement_type: StatementType,
+    from_date: date | None,
+    to_date: date | None,
+    representation: dict[str, Any],
+    trace_id: str | None,
+) -> str | None:
+    """Return a weak ETag for a statement-derived representation, if available.
+
+    Conditional GET is an optimization: when the validator cannot be computed
+    the request proceeds without an ETag instead of failing.
+    """
+    use_case = GetStatementVersionsValidatorUseCase(uow=uow)
+    try:
+        validator = await use_case.execute(
+            GetStatementVersionsValidatorRequest(
+                ciks=ciks,
+                statement_type=statement_type,
+                from_date=from_date,
+                to_date=to_date,
+                representation=representation,
+            ),
+        )
+    except Exception:  # noqa: BLE001
+        logger.warning(
+            "fundamentals.api.validator_unavailable",
+            extra={"trace_id": trace_id},
+            exc_info=True,
+        )
+        return None
+    return weak_etag(validator)
+
+
+def _set_etag(response: Response, etag: str | None) -> None:
+    """Attach the validator to a full response when one was computed."""
+    if etag is not None:
+        response.headers["ETag"] = etag
+
+
+def _serialized(envelope: BaseHTTPSchema, response: Response, *, stage: str) -> FastJSONResponse:
+    """Serialize ``envelope`` inside stage ``stage``, keeping headers set on ``response``.
+
+    FastAPI would otherwise validate and serialize the returned model after the
+    handler, outside any stage; rendering here renders the model straight to
+    bytes and makes serialization cost visible.
+    """
+    with timed_stage(stage):
+        return FastJSONResponse(
+            content=envelope,
+            headers={k: v for k, v in response.headers.items() if k != "content-length"},
+        )
+
+
+def _not_modified(request: Request, etag: str | None) -> Response | None:
+    """Return an empty 304 response when ``If-None-Match`` matches ``etag``."""
+    if etag is None or not if_none_match_satisfied(request.headers.get("If-None-Match"), etag):
+        return None
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+
+async def _fundamentals_page(
+    use_case: GetFundamentalsTimeSeriesUseCase,
+    req: GetFundamentalsTimeSeriesRequest,
+    *,
+    position: TimeSeriesCursor | None,
+    page: int,
+    page_size: int,
+) -> tuple[PaginatedEnvelope[FundamentalsTimeSeriesPointHTTP], StatementKeyset | None]:
+    """Read and present one page of a fundamentals time series.
+
+    Cursor requests and the first page are served by keyset reads; the first
+    page adds a key-only count for ``total``. Only deep offset pages (``page``
+    > 1 without a cursor) still slice the full panel.
+    """
+    if position is not None:
+        series_page = await use_case.execute_page(req, after=position.keyset, limit=page_size)
+        envelope = present_fundamentals_time_series_page(
+            points=series_page.points,
+            page=position.page,
+            page_size=page_size,
+            total=position.total,
+        )
+        return envelope, series_page.next_keyset
+
+    if page == 1:
+        series_page = await use_case.execute_page(
+            req,
+            after=None,
+            limit=page_size,
+            with_total=True,
+        )
+        envelope = present_fundamentals_time_series_page(
+            points=series_page.points,
+            page=1,
+            page_size=page_size,
+            total=series_page.total or 0,
+        )
+        return envelope, series_page.next_keyset
+
+    series = await use_case.execute(req)
+    envelope = present_fundamentals_time_series(points=series, page=page, page_size=page_size)
+    return envelope, next_keyset_after_page(series, page=page, page_size=page_size)
+
+
+async def _derived_page(
+    use_case: GetDerivedMetricsTimeSeriesUseCase,
+    req: GetDerivedMetricsTimeSeriesRequest,
+    *,
+    position: TimeSeriesCursor | None,
+    page: int,
+    page_size: int,
+) -> tuple[PaginatedEnvelope[DerivedMetricsTimeSeriesPointHTTP], StatementKeyset | None]:
+    """Read and present one page of a derived metrics time series.
+
+    Points exist only for rows where a metric is computable, so a keyset read
+    of N statement rows does not yield N points. Every page (offset or cursor)
+    therefore slices the same full-panel series and ``total`` always counts
+    derived points; a cursor resumes strictly after its keyset.
+    """
+    series = await use_case.execute(req)
+    if position is not None:
+        page = position.page
+        start = index_after_keyset(series, position.keyset)
+    else:
+        start = (page - 1) * page_size
+    end = start + page_size
+
+    with timed_stage("timeseries.present"):
+        envelope = present_derived_time_series_page(
+            points=series[start:end],
+            page=page,
+            page_size=page_size,
+            total=len(series),
+        )
+    next_keyset = keyset_of(series[end - 1]) if end < len(series) else None
+    return envelope, next_keyset
+
+
 # --------------------------------------------------------------------------- #
 # Routes: Fundamentals time series                                            #
 # --------------------------------------------------------------------------- #
@@ -260,9 +464,19 @@ async def get_fundamentals_time_series(
             description="Maximum number of items to return per page (1–200).",
         ),
     ] = 50,
-) -> PaginatedEnvelope[FundamentalsTimeSeriesPointHTTP] | JSONResponse:
+    cursor: Annotated[
+        str | None,
+        Query(
+            description=(
+                "Opaque keyset cursor taken from the `X-Next-Cursor` header of a "
+                "previous response. When present, `page` is ignored and only the "
+                "rows of the next page are read, so deep pages cost the same as "
+                "the first."
+            ),
+        ),
+    ] = None,
+) -> PaginatedEnvelope[FundamentalsTimeSeriesPointHTTP] | Response:
     """HTTP handler for /v1/fundamentals/time-series."""
-    del request  # reserved for future auth/feature flags
     trace_id = response.headers.get("X-Request-ID")
 
     normalized_ciks = [_normalize_cik(cik) for cik in ciks]
@@ -281,6 +495,13 @@ async def get_fundamentals_time_series(
         )
         return JSONResponse(status_code=400, content=error.model_dump(mode="json"))
 
+    position: TimeSeriesCursor | None = None
+    if cursor is not None:
+        try:
+            position = decode_time_series_cursor(cursor)
+        except ValueError:
+            return _invalid_cursor_response(trace_id)
+
     logger.info(
         "fundamentals.api.time_series.start",
         extra={
@@ -293,10 +514,36 @@ async def get_fundamentals_time_series(
             "use_tier1_only": use_tier1_only,
             "page": page,
             "page_size": page_size,
+            "cursor": position is not None,
             "trace_id": trace_id,
         },
     )
 
+    etag = await _statement_versions_etag(
+        uow,
+        ciks=normalized_ciks,
+        statement_type=statement_type,
+        from_date=from_date,
+        to_date=to_date,
+        representation={
+            "route": "fundamentals.time_series",
+            "metrics": sorted(m.value for m in metrics) if metrics is not None else None,
+            "frequency": frequency.lower(),
+            "use_tier1_only": use_tier1_only,
+            "page": page,
+            "page_size": page_size,
+            "cursor": cursor,
+        },
+        trace_id=trace_id,
+    )
+    not_modified = _not_modified(request, etag)
+    if not_modified is not None:
+        logger.info(
+            "fundamentals.api.time_series.not_modified",
+            extra={"ciks": normalized_ciks, "trace_id": trace_id},
+        )
+        return not_modified
+
     use_case = GetFundamentalsTimeSeriesUseCase(uow=uow)
 
     try:
@@ -310,14 +557,22 @@ async def get_fundamentals_time_series(
             use_tier1_only=use_tier1_only,
         )
 
-        series = await use_case.execute(req)
-
-        envelope = present_fundamentals_time_series(
-            points=series,
+        envelope, next_keyset = await _fundamentals_page(
+            use_case,
+            req,
+            position=position,
             page=page,
             page_size=page_size,
         )
 
+        _set_next_cursor(
+            response,
+            next_keyset=next_keyset,
+            page=envelope.page,
+            total=envelope.total,
+        )
+        _set_etag(response, etag)
+
         logger.info(
             "fundamentals.api.time_series.success",
             extra={
@@ -378,6 +633,174 @@ async def get_fundamentals_time_series(
         return JSONResponse(status_code=500, content=error.model_dump(mode="json"))
 
 
+@router.get(
+    "/time-series:export",
+    summary="Fundamentals time series bulk export",
+    description=(
+        "Stream a full fundamentals panel as NDJSON (one point per line) or as "
+        "an Arrow IPC stream of record batches. Rows are read from a "
+        "server-side cursor and encoded incrementally, so memory use does not "
+        "depend on the size of the panel. Use `metrics` to project the export "
+        "onto selected metric columns."
+    ),
+    response_class=StreamingResponse,
+    responses=cast("dict[int | str, dict[str, Any]]", BaseRouter.std_error_responses()),
+)
+async def export_fundamentals_time_series(
+    response: Response,
+    uow: Annotated[UnitOfWork, Depends(get_uow)],
+    ciks: Annotated[
+        list[str],
+        Query(
+            ...,
+            description=(
+                "Universe of companies expressed as CIKs. Multiple CIKs can be "
+                "provided via repeated query parameters."
+            ),
+        ),
+    ],
+    statement_type: Annotated[
+        StatementType,
+        Query(
+            ...,
+            description="Statement type to use as the source of fundamentals.",
+        ),
+    ],
+    metrics: Annotated[
+        list[CanonicalStatementMetric] | None,
+        Query(
+            description=(
+                "Optional metric projection. NDJSON rows only carry these metrics; "
+                "Arrow output has exactly one column per listed metric. When "
+                "omitted, NDJSON carries every metric present and Arrow carries a "
+                "column for every canonical metric."
+            ),
+        ),
+    ] = None,
+    frequency: Annotated[
+        str,
+        Query(
+            description="Requested frequency: 'annual' (FY) or 'quarterly' (Q1–Q4).",
+        ),
+    ] = "annual",
+    from_date: Annotated[
+        date | None,
+        Query(
+            alias="from",
+            description="Inclusive lower bound for statement_date (YYYY-MM-DD).",
+        ),
+    ] = None,
+    to_date: Annotated[
+        date | None,
+        Query(
+            alias="to",
+            description="Inclusive upper bound for statement_date (YYYY-MM-DD).",
+        ),
+    ] = None,
+    use_tier1_only: Annotated[
+        bool,
+        Query(
+            description=(
+                "When true and `metrics` is omitted, restrict the export to the "
+                "Tier-1 canonical metrics for the requested statement_type."
+            ),
+        ),
+    ] = False,
+    export_format: Annotated[
+        str,
+        Query(
+            alias="format",
+            description="Output format: 'ndjson' (default) or 'arrow' (Arrow IPC stream).",
+        ),
+    ] = "ndjson",
+) -> Response:
+    """HTTP handler for /v1/fundamentals/time-series:export."""
+    trace_id = response.headers.get("X-Request-ID")
+    normalized_ciks = [_normalize_cik(cik) for cik in ciks]
+    fmt = export_format.strip().lower()
+
+    if fmt not in EXPORT_MEDIA_TYPES:
+        error = _error_envelope(
+            http_status=400,
+            code="VALIDATION_ERROR",
+            message="Unsupported export format; expected 'ndjson' or 'arrow'.",
+            trace_id=trace_id,
+            details={"format": export_format},
+        )
+        return JSONResponse(status_code=400, content=error.model_dump(mode="json"))
+
+    if fmt == "arrow" and not arrow_export_available():
+        error = _error_envelope(
+            http_status=501,
+            code="EXPORT_FORMAT_UNAVAILABLE",
+            message="Arrow export requires the optional 'pyarrow' dependency.",
+            trace_id=trace_id,
+            details={"format": fmt},
+        )
+        return JSONResponse(status_code=501, content=error.model_dump(mode="json"))
+
+    logger.info(
+        "fundamentals.api.time_series_export.start",
+        extra={
+            "ciks": normalized_ciks,
+            "statement_type": statement_type.value,
+            "metrics": [m.value for m in metrics] if metrics is not None else None,
+            "frequency": frequency,
+            "from_date": from_date.isoformat() if from_date else None,
+            "to_date": to_date.isoformat() if to_date else None,
+            "use_tier1_only": use_tier1_only,
+            "format": fmt,
+            "trace_id": trace_id,
+        },
+    )
+
+    use_case = GetFundamentalsTimeSeriesUseCase(uow=uow)
+
+    try:
+        # Validation happens here, before the first byte is sent; failures
+        # past this point can only abort the stream.
+        stream = use_case.stream(
+            GetFundamentalsTimeSeriesRequest(
+                ciks=normalized_ciks,
+                statement_type=statement_type,
+                metrics=tuple(metrics) if metrics is not None else None,
+                frequency=frequency,
+                from_date=from_date,
+                to_date=to_date,
+                use_tier1_only=use_tier1_only,
+            ),
+            batch_size=_EXPORT_BATCH_SIZE,
+        )
+    except EdgarMappingError as exc:
+        error = _error_envelope(
+            http_status=400,
+            code="EDGAR_MAPPING_ERROR",
+            message=str(exc),
+            trace_id=trace_id,
+            details=getattr(exc, "details", None),
+        )
+        return JSONResponse(status_code=400, content=error.model_dump(mode="json"))
+
+    if fmt == "arrow":
+        body = iter_fundamentals_arrow(
+            stream.points,
+            metrics=stream.metrics,
+            batch_size=_EXPORT_BATCH_SIZE,
+        )
+    else:
+        body = iter_fundamentals_ndjson(stream.points)
+
+    headers = {
+        "Content-Disposition": (
+            f'attachment; filename="fundamentals_time_series.{_EXPORT_FILE_EXTENSIONS[fmt]}"'
+        ),
+    }
+    if trace_id:
+        headers["X-Request-ID"] = trace_id
+
+    return StreamingResponse(body, media_type=EXPORT_MEDIA_TYPES[fmt], headers=headers)
+
+
 # --------------------------------------------------------------------------- #
 # Routes: Derived metrics time series                                         #
 # --------------------------------------------------------------------------- #
@@ -472,9 +895,19 @@ async def get_derived_metrics_time_series(
             description="Maximum number of items to return per page (1–200).",
         ),
     ] = 50,
-) -> PaginatedEnvelope[DerivedMetricsTimeSeriesPointHTTP] | JSONResponse:
+    cursor: Annotated[
+        str | None,
+        Query(
+            description=(
+                "Opaque keyset cursor taken from the `X-Next-Cursor` header of a "
+                "previous response. When present, `page` is ignored and the page "
+                "resumes strictly after the last point of the previous one. Pages "
+                "and `total` always count derived points."
+            ),
+        ),
+    ] = None,
+) -> PaginatedEnvelope[DerivedMetricsTimeSeriesPointHTTP] | Response:
     """HTTP handler for /v1/fundamentals/derived/time-series."""
-    del request  # reserved for future auth/feature flags
     trace_id = response.headers.get("X-Request-ID")
 
     normalized_ciks = [_normalize_cik(cik) for cik in ciks]
@@ -492,6 +925,13 @@ async def get_derived_metrics_time_series(
         )
         return JSONResponse(status_code=400, content=error.model_dump(mode="json"))
 
+    position: TimeSeriesCursor | None = None
+    if cursor is not None:
+        try:
+            position = decode_time_series_cursor(cursor)
+        except ValueError:
+            return _invalid_cursor_response(trace_id)
+
     logger.info(
         "fundamentals.api.derived_time_series.start",
         extra={
@@ -503,10 +943,36 @@ async def get_derived_metrics_time_series(
             "to_date": to_date.isoformat() if to_date else None,
             "page": page,
             "page_size": page_size,
+            "cursor": position is not None,
             "trace_id": trace_id,
         },
     )
 
+    etag = await _statement_versions_etag(
+        uow,
+        ciks=normalized_ciks,
+        statement_type=statement_type,
+        from_date=from_date,
+        to_date=to_date,
+        representation={
+            "route": "fundamentals.derived_time_series",
+            "engine_version": DERIVED_METRICS_ENGINE_VERSION,
+            "metrics": sorted(m.value for m in metrics) if metrics is not None else None,
+            "frequency": frequency.lower(),
+            "page": page,
+            "page_size": page_size,
+            "cursor": cursor,
+        },
+        trace_id=trace_id,
+    )
+    not_modified = _not_modified(request, etag)
+    if not_modified is not None:
+        logger.info(
+            "fundamentals.api.derived_time_series.not_modified",
+            extra={"ciks": normalized_ciks, "trace_id": trace_id},
+        )
+        return not_modified
+
     use_case = GetDerivedMetricsTimeSeriesUseCase(uow=uow)
 
     try:
@@ -519,14 +985,22 @@ async def get_derived_metrics_time_series(
             to_date=to_date,
         )
 
-        series = await use_case.execute(req)
-
-        envelope = present_derived_time_series(
-            points=series,
+        envelope, next_keyset = await _derived_page(
+            use_case,
+            req,
+            position=position,
             page=page,
             page_size=page_size,
         )
 
+        _set_next_cursor(
+            response,
+            next_keyset=next_keyset,
+            page=envelope.page,
+            total=envelope.total,
+        )
+        _set_etag(response, etag)
+
         logger.info(
             "fundamentals.api.derived_time_series.success",
             extra={
@@ -540,7 +1014,7 @@ async def get_derived_metrics_time_series(
                 "trace_id": trace_id,
             },
         )
-        return envelope
+        return _serialized(envelope, response, stage="timeseries.serialize")
 
     except EdgarNotFound as exc:
         error = _error_envelope(
@@ -10,8 +10,14 @@ Design:
     * Adapters boundary respected: no direct DB/Redis imports. Probes are injected.
     * Deterministic OpenAPI: stable operation_id/summary; typed response models.
     * Non-blocking: probes run concurrently; latencies recorded to Prometheus.
+    * Cached: when a background `HealthSampler` is installed (app lifespan),
+      readiness serves its latest snapshot in O(1) instead of probing per
+      request, and reports the sample age, staleness and DB pool occupancy.
+      A snapshot older than the sampler's `max_age_s` is reported as degraded.
     * Testability: a provider instance (`probe_provider`) is the DI token so overrides
       match by identity reliably; `use_cache=False` honors late overrides.
+      `sampler_provider` is the token for the cached path; override it to
+      return None to force live probing.
     * Back-compat: `/health/readiness` is canonical; `/health/ready` is an alias
       (`include_in_schema=False`) for existing tooling.
 """
@@ -28,6 +34,11 @@ from fastapi import APIRouter, Depends, Response, status
 from pydantic import Field
 
 from arche_api.adapters.schemas.http.base import BaseHTTPSchema
+from arche_api.infrastructure.health.sampler import (
+    HealthSampler,
+    HealthSnapshot,
+    get_health_sampler,
+)
 from arche_api.infrastructure.logging.logger import get_json_logger
 from arche_api.infrastructure.observability.metrics import (
     get_readyz_db_latency_seconds,
@@ -72,16 +83,44 @@ class CheckResult(BaseHTTPSchema):
     duration_ms: float
 
 
+class PoolStatus(BaseHTTPSchema):
+    """Database connection-pool occupancy at sample time.
+
+    Attributes:
+        size: Configured pool size.
+        max_overflow: Connections allowed beyond ``size``.
+        checked_out: Connections currently in use.
+        idle: Connections checked in and ready.
+        overflow: Overflow connections currently open.
+        waiting: Tasks waiting for a connection.
+        saturation: ``checked_out / (size + max_overflow)``.
+    """
+
+    size: int
+    max_overflow: int
+    checked_out: int
+    idle: int
+    overflow: int
+    waiting: int
+    saturation: float
+
+
 class ReadinessResponse(BaseHTTPSchema):
     """Aggregated readiness response.
 
     Attributes:
         status: Overall service classification derived from all checks.
         checks: Individual dependency results in deterministic order (DB, Redis).
+        age_ms: Age of the cached sample; null when probed for this request.
+        stale: True when the cached sample is older than the sampler allows.
+        pool: Database pool occupancy, when a sampler reports it.
     """
 
     status: HealthState
     checks: list[CheckResult] = Field(default_factory=list)
+    age_ms: float | None = None
+    stale: bool = False
+    pool: PoolStatus | None = None
 
 
 class LivenessResponse(BaseHTTPSchema):
@@ -162,6 +201,17 @@ class ProbeProvider:
 probe_provider = ProbeProvider()
 
 
+class SamplerProvider:
+    """Dependency token for the background readiness sampler (None when absent)."""
+
+    def __call__(self) -> HealthSampler | None:
+        """Return the process-wide sampler, if the app installed one."""
+        return get_health_sampler()
+
+
+sampler_provider = SamplerProvider()
+
+
 # -----------------------------------------------------------------------------
 # Routes
 # -----------------------------------------------------------------------------
@@ -242,6 +292,55 @@ async def _readiness_impl(response: Response, probe: HealthProbe) -> ReadinessRe
     return payload
 
 
+def _pool_status(stats: t.Mapping[str, int] | None) -> PoolStatus | None:
+    if not stats:
+        return None
+    capacity = stats.get("size", 0) + stats.get("max_overflow", 0)
+    checked_out = stats.get("checked_out", 0)
+    return PoolStatus(
+        size=stats.get("size", 0),
+        max_overflow=stats.get("max_overflow", 0),
+        checked_out=checked_out,
+        idle=stats.get("idle", 0),
+        overflow=stats.get("overflow", 0),
+        waiting=stats.get("waiting", 0),
+        saturation=round(checked_out / capacity, 4) if capacity else 0.0,
+    )
+
+
+def _snapshot_response(
+    response: Response, sampler: HealthSampler, snapshot: HealthSnapshot
+) -> ReadinessResponse:
+    """Build the readiness payload from a cached sampler snapshot (no I/O)."""
+    stale = sampler.is_stale(snapshot)
+    ok = snapshot.ok and not stale
+    if not ok:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return ReadinessResponse(
+        status=HealthState.OK if ok else HealthState.DEGRADED,
+        checks=[
+            CheckResult(
+                name=s.name,
+                status="ok" if s.ok else "down",
+                detail=s.detail,
+                duration_ms=s.duration_ms,
+            )
+            for s in snapshot.samples
+        ],
+        age_ms=round(sampler.age_s(snapshot) * 1000.0, 3),
+        stale=stale,
+        pool=_pool_status(snapshot.pool),
+    )
+
+
+async def _serve_readiness(
+    response: Response, probe: HealthProbe, sampler: HealthSampler | None
+) -> ReadinessResponse:
+    if sampler is None:
+        return await _readiness_impl(response, probe)
+    return _snapshot_response(response, sampler, await sampler.current())
+
+
 @router.get(
     "/readiness",
     summary="Readiness",
@@ -252,15 +351,17 @@ async def _readiness_impl(response: Response, probe: HealthProbe) -> ReadinessRe
 async def readiness(
     response: Response,
     probe: Annotated[HealthProbe, Depends(probe_provider, use_cache=False)],
+    sampler: Annotated[HealthSampler | None, Depends(sampler_provider, use_cache=False)],
 ) -> ReadinessResponse:
     """Canonical readiness endpoint (published in OpenAPI)."""
-    return await _readiness_impl(response, probe)
+    return await _serve_readiness(response, probe, sampler)
 
 
 @router.get("/ready", include_in_schema=False)
 async def readiness_alias(
     response: Response,
     probe: Annotated[HealthProbe, Depends(probe_provider, use_cache=False)],
+    sampler: Annotated[HealthSampler | None, Depends(sampler_provider, use_cache=False)],
 ) -> ReadinessResponse:
     """Back-compat alias for environments still calling `/health/ready`."""
-    return await _readiness_impl(response, probe)
+    return await _serve_readiness(response, probe, sampler)
@@ -0,0 +1,137 @@
+# src/arche_api/adapters/routers/profiling_router.py
+# Copyright (c) Arche.
+# SPDX-License-Identifier: MIT
+r"""Admin sampling profiler (``/v1/admin/profile``).
+
+Purpose:
+    Profile a live worker without a redeploy. A request samples every thread
+    of the worker that serves it, for a bounded duration, and returns
+    flamegraph-compatible collapsed stacks::
+
+        curl -H "X-Admin-Key: $ADMIN_API_KEY" \
+            "https://api/v1/admin/profile?seconds=15" > worker.folded
+        flamegraph.pl worker.folded > worker.svg
+
+Safeguards:
+    • Disabled (404) unless ``PROFILING_ENABLED=true``.
+    • Admin only. Callers send ``X-Admin-Key`` matching ``ADMIN_API_KEY``, or,
+      with ``AUTH_ENABLED=true``, a bearer token with the ``admin:profile``
+      scope. With auth disabled the admin key is mandatory.
+    • ``seconds`` is capped by ``PROFILING_MAX_SECONDS``.
+    • One profile per worker at a time. A concurrent request gets 409.
+    • No cost while idle. Sampling runs on a worker thread only for the
+      duration of a request, and the event loop keeps serving traffic.
+
+Notes:
+    Each uvicorn/gunicorn worker is a separate process; the profile covers the
+    worker that handled the request (see ``X-Profile-Pid``).
+
+Layer:
+    adapters/routers
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hmac
+import os
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import PlainTextResponse
+
+from arche_api.config.features.auth import get_auth_settings
+from arche_api.config.settings import get_settings
+from arche_api.infrastructure.auth.jwt_dependency import auth_required
+from arche_api.infrastructure.logging.logger import get_json_logger
+from arche_api.infrastructure.observability.profiler import ProfilerBusy, sample_stacks
+
+logger = get_json_logger(__name__)
+
+ADMIN_KEY_HEADER = "X-Admin-Key"
+PROFILE_SCOPE = "admin:profile"
+
+_SCOPED_AUTH = auth_required(PROFILE_SCOPE)
+
+router = APIRouter(prefix="/v1/admin", tags=["Admin"])
+
+
+async def require_profiling_admin(request: Request) -> None:
+    """Allow the request only if profiling is enabled and the caller is an admin.
+
+    Raises:
+        HTTPException: 404 when profiling is disabled, 401/403 when the caller
+            is not an admin.
+    """
+    settings = get_settings()
+    if not settings.profiling_enabled:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+
+    expected = settings.admin_api_key
+    supplied = request.headers.get(ADMIN_KEY_HEADER)
+    if expected and supplied and hmac.compare_digest(supplied, expected):
+        return
+
+    if get_auth_settings().enabled:
+        # Raises 401 (missing/invalid token) or 403 (scope missing).
+        await _SCOPED_AUTH(request)
+        return
+
+    raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
+
+
+@router.get(
+    "/profile",
+    include_in_schema=False,
+    dependencies=[Depends(require_profiling_admin)],
+    response_class=PlainTextResponse,
+)
+async def profile_worker(
+    seconds: Annotated[float, Query(gt=0, description="Profile duration in seconds.")] = 10.0,
+    interval_ms: Annotated[
+        int, Query(ge=1, le=1000, description="Sampling interval in milliseconds.")
+    ] = 10,
+    idle: Annotated[
+        bool, Query(description="Keep samples of threads parked in idle waits.")
+    ] = False,
+) -> PlainTextResponse:
+    """Sample this worker's stacks and return them in collapsed-stack format."""
+    max_seconds = get_settings().profiling_max_seconds
+    if seconds > max_seconds:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"seconds must be <= {max_seconds:g}",
+        )
+
+    logger.info(
+        "profiling.start",
+        extra={"extra": {"seconds": seconds, "interval_ms": interval_ms, "idle": idle}},
+    )
+    try:
+        profile = await asyncio.to_thread(
+            sample_stacks,
+            seconds,
+            interval_s=interval_ms / 1000,
+            include_idle=idle,
+        )
+    except ProfilerBusy as exc:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc)) from exc
+
+    logger.info(
+        "profiling.done",
+        extra={
+            "extra": {
+                "samples": profile.samples,
+                "stacks": len(profile.stacks),
+                "duration_s": round(profile.duration_s, 3),
+            }
+        },
+    )
+    return PlainTextResponse(
+        profile.collapsed(),
+        headers={
+            "X-Profile-Samples": str(profile.samples),
+            "X-Profile-Duration-Seconds": f"{profile.duration_s:.3f}",
+            "X-Profile-Pid": str(os.getpid()),
+        },
+    )
@@ -19,7 +19,7 @@ from typing import Any, cast
 from fastapi import Body, Depends, Query, Request, Response
 from fastapi.responses import JSONResponse
 
-from arche_api.adapters.dependencies.edgar_uow import get_edgar_uow
+from arche_api.adapters.dependencies.edgar_uow import get_edgar_read_uow, get_edgar_uow
 from arche_api.adapters.presenters.reconciliation_presenter import (
     present_reconciliation_ledger,
     present_reconciliation_summary,
@@ -78,6 +78,17 @@ def get_uow() -> UnitOfWork:
 
 _UOW_DEP = Depends(get_uow)
 
+
+def get_read_uow(uow: UnitOfWork = _UOW_DEP) -> UnitOfWork:
+    """FastAPI dependency: read-only EDGAR UnitOfWork (replica-routed).
+
+    Layered on :func:`get_uow` so overriding it replaces both.
+    """
+    return get_edgar_read_uow(uow)
+
+
+_READ_UOW_DEP = Depends(get_read_uow)
+
 _RUN_BODY: Any = Body(...)
 
 _Q_CIK: Any = Query(..., description="Company CIK.")
@@ -214,7 +225,7 @@ async def run_reconciliation(
 async def get_reconciliation_ledger(
     request: Request,
     response: Response,
-    uow: UnitOfWork = _UOW_DEP,
+    uow: UnitOfWork = _READ_UOW_DEP,
     cik: str = _Q_CIK,
     statement_type: StatementType = _Q_STATEMENT_TYPE,
     fiscal_year: int = _Q_FISCAL_YEAR,
@@ -281,7 +292,7 @@ async def get_reconciliation_ledger(
 async def get_reconciliation_summary(
     request: Request,
     response: Response,
-    uow: UnitOfWork = _UOW_DEP,
+    uow: UnitOfWork = _READ_UOW_DEP,
     cik: str = _Q_CIK,
     statement_type: StatementType = _Q_STATEMENT_TYPE,
     fiscal_year_from: int = _Q_FISCAL_YEAR_FROM,
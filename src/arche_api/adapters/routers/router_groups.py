@@ -0,0 +1,140 @@
+# src/arche_api/adapters/routers/router_groups.py
+# Copyright (c) Arche.
+# SPDX-License-Identifier: MIT
+"""Router Groups (Adapters Layer).
+
+Purpose:
+    Describe every router mounted by the application as an import path grouped
+    by feature, so ``create_app`` only imports the routers (and their schema,
+    controller and repository modules) of the groups a deployment enables.
+
+Groups:
+    core    Health, protected ping, ``/metrics`` and the admin profiler.
+            Always mounted.
+    quotes  Latest and historical quotes (``/v2/quotes/...``).
+    edgar   EDGAR filings, fundamentals and reconciliation (``/v1/edgar``,
+            ``/v1/fundamentals``).
+    mcp     MCP JSON-RPC surface.
+
+Layer:
+    adapters/routers
+
+Notes:
+    ``ROUTER_SPECS`` is in mount order and is the single registry of routers;
+    the eager aggregator in :mod:`arche_api.adapters.routers.api_router` is
+    built from it with every group enabled.
+"""
+
+from __future__ import annotations
+
+import importlib
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Final
+
+from fastapi import APIRouter, FastAPI
+
+__all__ = [
+    "ROUTER_GROUPS",
+    "ROUTER_SPECS",
+    "RouterSpec",
+    "include_router_groups",
+    "parse_router_groups",
+]
+
+ROUTER_GROUPS: Final[tuple[str, ...]] = ("core", "quotes", "edgar", "mcp")
+_ALWAYS_ON: Final[frozenset[str]] = frozenset({"core"})
+
+
+@dataclass(frozen=True)
+class RouterSpec:
+    """A router to mount, referenced by import path.
+
+    Attributes:
+        group: Feature group the router belongs to.
+        module: Dotted module path.
+        attr: Module attribute holding the router (or a zero-arg factory).
+        prefix: Prefix passed to ``include_router``.
+        tags: Tags passed to ``include_router``.
+        factory: Whether ``attr`` is a factory returning the router.
+    """
+
+    group: str
+    module: str
+    attr: str = "router"
+    prefix: str = ""
+    tags: tuple[str, ...] = ()
+    factory: bool = False
+
+    def load(self) -> APIRouter:
+        """Import the module and return the router (built once per process)."""
+        router = _LOADED.get(self)
+        if router is None:
+            obj = getattr(importlib.import_module(self.module), self.attr)
+            router = obj() if self.factory else obj
+            _LOADED[self] = router
+        return router
+
+
+# Routers are process-wide singletons, as they were with eager imports: later
+# create_app() calls reuse them instead of re-resolving the modules.
+_LOADED: dict[RouterSpec, APIRouter] = {}
+
+
+_ROUTERS = "arche_api.adapters.routers"
+
+ROUTER_SPECS: Final[tuple[RouterSpec, ...]] = (
+    RouterSpec("core", f"{_ROUTERS}.health_router", prefix="/health", tags=("Health",)),
+    RouterSpec("quotes", f"{_ROUTERS}.quotes_router", tags=("Market Data",)),
+    RouterSpec("quotes", f"{_ROUTERS}.historical_quotes_router", tags=("Market Data",)),
+    # edgar_router already tags itself "EDGAR Filings".
+    RouterSpec("edgar", f"{_ROUTERS}.edgar_router"),
+    RouterSpec("edgar", f"{_ROUTERS}.fundamentals_router", tags=("Fundamentals",)),
+    RouterSpec(
+        "core", f"{_ROUTERS}.protected_router", attr="get_router", tags=("Auth",), factory=True
+    ),
+    RouterSpec("edgar", f"{_ROUTERS}.reconciliation_router"),
+    RouterSpec("mcp", f"{_ROUTERS}.mcp_router"),
+    RouterSpec("core", f"{_ROUTERS}.metrics_router"),
+    RouterSpec("core", f"{_ROUTERS}.profiling_router"),
+)
+
+
+def parse_router_groups(raw: str | Iterable[str] | None) -> frozenset[str]:
+    """Parse a group selection (``"all"``, ``"quotes,mcp"`` or an iterable).
+
+    ``core`` is always included.
+
+    Raises:
+        ValueError: If an unknown group is named.
+    """
+    if raw is None:
+        return frozenset(ROUTER_GROUPS)
+    names = raw.split(",") if isinstance(raw, str) else list(raw)
+    selected = {name.strip().lower() for name in names if name.strip()}
+    if not selected or "all" in selected:
+        return frozenset(ROUTER_GROUPS)
+    unknown = selected - set(ROUTER_GROUPS)
+    if unknown:
+        raise ValueError(
+            f"unknown router groups: {sorted(unknown)} (expected any of {list(ROUTER_GROUPS)})"
+        )
+    return frozenset(selected | _ALWAYS_ON)
+
+
+def include_router_groups(app: FastAPI | APIRouter, groups: Iterable[str]) -> list[str]:
+    """Import and mount the routers of ``groups`` in canonical order.
+
+    ``app`` may be the application or an ``APIRouter`` aggregating the routers.
+
+    Returns:
+        The module paths that were mounted.
+    """
+    enabled = set(groups)
+    mounted: list[str] = []
+    for spec in ROUTER_SPECS:
+        if spec.group not in enabled:
+            continue
+        app.include_router(spec.load(), prefix=spec.prefix, tags=list(spec.tags) or None)
+        mounted.append(spec.module)
+    return mounted
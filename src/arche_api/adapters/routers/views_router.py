@@ -25,13 +25,14 @@ Design:
 from __future__ import annotations
 
 from datetime import date
+from functools import cache
 from typing import Annotated, Any, cast
 
 from fastapi import Depends, HTTPException, Path, Query, Request, Response, status
 from fastapi.responses import JSONResponse
 
 from arche_api.adapters.controllers.edgar_controller import EdgarController
-from arche_api.adapters.presenters.base_presenter import PresentResult
+from arche_api.adapters.presenters.base_presenter import PrerenderedResponse, PresentResult
 from arche_api.adapters.presenters.edgar_presenter import EdgarPresenter
 from arche_api.adapters.routers.base_router import BaseRouter
 from arche_api.adapters.schemas.http.edgar_schemas import (
@@ -115,6 +116,22 @@ def _apply_present_result(response: Response, result: PresentResult[Any]) -> Any
 # --------------------------------------------------------------------------- #
 
 
+@cache
+def _metric_views_catalog() -> PrerenderedResponse:
+    """Render the metric views catalog once with the module presenter."""
+    views = list_metric_views()
+    result = presenter.present_metric_views_catalog(views=views)
+    logger.info(
+        "views.api.metric_views_catalog.rendered",
+        extra={"views_count": len(views), "view_codes": [v.code for v in views]},
+    )
+    return PrerenderedResponse.from_result(result)
+
+
+# Render at startup rather than on the first request.
+_metric_views_catalog()
+
+
 @router.get(
     "/metrics",
     response_model=SuccessEnvelope[MetricViewsCatalogHTTP],
@@ -134,32 +151,14 @@ def _apply_present_result(response: Response, result: PresentResult[Any]) -> Any
 async def list_metric_views_endpoint(
     request: Request,
     response: Response,
-) -> SuccessEnvelope[MetricViewsCatalogHTTP]:
-    """List all registered metric views."""
-    del request
-    trace_id = response.headers.get("X-Request-ID")
-
-    logger.info(
-        "views.api.list_metric_views.start",
-        extra={
-            "trace_id": trace_id,
-        },
-    )
-
-    views = list_metric_views()
-    result = presenter.present_metric_views_catalog(views=views, trace_id=trace_id)
-    body = _apply_present_result(response, result)
-
-    logger.info(
-        "views.api.list_metric_views.success",
-        extra={
-            "trace_id": trace_id,
-            "views_count": len(views),
-            "view_codes": [v.code for v in views],
-        },
-    )
+) -> Response:
+    """List all registered metric views.
 
-    return cast(SuccessEnvelope[MetricViewsCatalogHTTP], body)
+    The registry is static, so the catalog is served from bytes rendered once
+    at import, with its build-time ETag and 304 support.
+    """
+    trace_id = response.headers.get("X-Request-ID")
+    return _metric_views_catalog().respond(request, trace_id=trace_id)
 
 
 # --------------------------------------------------------------------------- #
@@ -948,6 +948,82 @@ class RestatementMetricTimelineHTTP(BaseHTTPSchema):
     timeline_severity: str
 
 
+class RestatementScreenHitHTTP(BaseHTTPSchema):
+    """HTTP schema for one changed metric returned by the restatement screener."""
+
+    model_config = ConfigDict(
+        title="RestatementScreenHitHTTP",
+        extra="forbid",
+    )
+
+    cik: str = Field(..., description="Company CIK for the restated statement.")
+    statement_type: StatementType = Field(..., description="Statement type of the identity.")
+    accounting_standard: AccountingStandard = Field(
+        ...,
+        description="Accounting standard of the identity.",
+    )
+    statement_date: date = Field(..., description="Reporting period end date.")
+    fiscal_year: int = Field(..., ge=1, description="Fiscal year of the identity.")
+    fiscal_period: FiscalPeriod = Field(..., description="Fiscal period of the identity.")
+    currency: str = Field(..., description="ISO 4217 currency code of the values.")
+    from_version_sequence: int = Field(
+        ...,
+        ge=1,
+        description="Version sequence of the 'from' side of the hop.",
+    )
+    to_version_sequence: int = Field(
+        ...,
+        ge=1,
+        description="Version sequence of the restating ('to') version.",
+    )
+    restated_on: date | None = Field(
+        default=None,
+        description="Filing date of the restating version, when known.",
+    )
+    metric: str = Field(..., description="Canonical metric code (e.g., REVENUE).")
+    old_value: str = Field(..., description="Stringified value in the 'from' version.")
+    new_value: str = Field(..., description="Stringified value in the 'to' version.")
+    diff: str = Field(..., description="Stringified difference (new - old).")
+    pct_change: str | None = Field(
+        default=None,
+        description=(
+            "Stringified relative change diff / |old| as a fraction, or null when "
+            "the old value is zero."
+        ),
+    )
+    materiality: MaterialityClass = Field(..., description="Materiality class of the change.")
+
+
+class RestatementScreenHTTP(BaseHTTPSchema):
+    """HTTP schema for a universe-wide restatement screen."""
+
+    model_config = ConfigDict(
+        title="RestatementScreenHTTP",
+        extra="forbid",
+    )
+
+    statement_type: StatementType = Field(..., description="Screened statement type.")
+    metric: str | None = Field(default=None, description="Metric filter, if any.")
+    fiscal_year: int | None = Field(default=None, description="Fiscal year filter, if any.")
+    fiscal_period: FiscalPeriod | None = Field(
+        default=None,
+        description="Fiscal period filter, if any.",
+    )
+    min_abs_pct_change: str | None = Field(
+        default=None,
+        description="Minimum absolute relative change applied, as a fraction.",
+    )
+    min_materiality: MaterialityClass | None = Field(
+        default=None,
+        description="Minimum materiality class applied, if any.",
+    )
+    total: int = Field(..., ge=0, description="Number of hits returned.")
+    hits: list[RestatementScreenHitHTTP] = Field(
+        default_factory=list,
+        description="Hits ordered by |pct_change| DESC (undefined first), then cik.",
+    )
+
+
 # --------------------------------------------------------------------------- #
 # Data-quality overlays and results                                          #
 # --------------------------------------------------------------------------- #
@@ -1300,6 +1376,8 @@ __all__ = [
     "RestatementLedgerEntryHTTP",
     "RestatementLedgerHTTP",
     "RestatementMetricTimelineHTTP",
+    "RestatementScreenHitHTTP",
+    "RestatementScreenHTTP",
     "FactQualityHTTP",
     "DQAnomalyHTTP",
     "StatementDQOverlayHTTP",
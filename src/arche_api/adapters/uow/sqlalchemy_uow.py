@@ -10,6 +10,12 @@ Purpose:
 
 Layer:
     adapters/uow
+
+Notes:
+    A read-only UnitOfWork (``read_only=True``) opens its session from
+    ``read_session_factory`` — typically a replica router that falls back to
+    the primary — and never commits: ``commit()`` ends the transaction with a
+    rollback so nothing can be flushed through it.
 """
 
 from __future__ import annotations
@@ -28,6 +34,9 @@ from arche_api.adapters.repositories.edgar_filings_repository import (
 from arche_api.adapters.repositories.edgar_reconciliation_checks_repository import (
     SqlAlchemyEdgarReconciliationChecksRepository,
 )
+from arche_api.adapters.repositories.edgar_restatement_ledger_repository import (
+    SqlAlchemyEdgarRestatementLedgerRepository,
+)
 from arche_api.adapters.repositories.edgar_statement_alignment_repository import (
     SqlAlchemyEdgarStatementAlignmentRepository,
 )
@@ -47,6 +56,9 @@ from arche_api.domain.interfaces.repositories.edgar_facts_repository import (
 from arche_api.domain.interfaces.repositories.edgar_reconciliation_checks_repository import (
     EdgarReconciliationChecksRepository as EdgarReconciliationChecksRepositoryPort,
 )
+from arche_api.domain.interfaces.repositories.edgar_restatement_ledger_repository import (
+    EdgarRestatementLedgerRepository as EdgarRestatementLedgerRepositoryPort,
+)
 from arche_api.domain.interfaces.repositories.edgar_statement_alignment_repository import (
     EdgarStatementAlignmentRepository as EdgarStatementAlignmentRepositoryPort,
 )
@@ -75,6 +87,8 @@ class SqlAlchemyUnitOfWork(UnitOfWork):
         *,
         session_factory: async_sessionmaker[AsyncSession],
         repo_factories: Mapping[type[Any], Callable[[AsyncSession], Any]] | None = None,
+        read_session_factory: Callable[[], AsyncSession] | None = None,
+        read_only: bool = False,
     ) -> None:
         """Initialize the UnitOfWork.
 
@@ -85,9 +99,17 @@ class SqlAlchemyUnitOfWork(UnitOfWork):
                 Optional mapping from repository type to a factory function
                 taking an AsyncSession and returning a repository instance.
                 Defaults are provided for EDGAR repositories.
+            read_session_factory:
+                Factory used instead of ``session_factory`` when ``read_only``
+                is set (e.g. a replica router). Defaults to ``session_factory``.
+            read_only:
+                Open the session from ``read_session_factory`` and never commit.
         """
         self._session_factory = session_factory
+        self._read_session_factory = read_session_factory
+        self._read_only = read_only
         self._session: AsyncSession | None = None
+        self._repo_overrides = repo_factories
 
         # Default wiring: interface → implementation, plus direct concrete keys
         # for backwards compatibility in call sites.
@@ -123,6 +145,13 @@ class SqlAlchemyUnitOfWork(UnitOfWork):
             SqlAlchemyEdgarReconciliationChecksRepository: lambda s: SqlAlchemyEdgarReconciliationChecksRepository(
                 session=s
             ),
+            # Restatement ledger
+            EdgarRestatementLedgerRepositoryPort: lambda s: SqlAlchemyEdgarRestatementLedgerRepository(
+                session=s
+            ),
+            SqlAlchemyEdgarRestatementLedgerRepository: lambda s: SqlAlchemyEdgarRestatementLedgerRepository(
+                session=s
+            ),
         }
 
         self._repo_factories: dict[type[Any], Callable[[AsyncSession], Any]] = {
@@ -134,6 +163,20 @@ class SqlAlchemyUnitOfWork(UnitOfWork):
         self._committed = False
         self._rolled_back = False
 
+    @property
+    def read_only(self) -> bool:
+        """Whether this UnitOfWork routes to the read session factory."""
+        return self._read_only
+
+    def as_read_only(self) -> SqlAlchemyUnitOfWork:
+        """Return a read-only UnitOfWork with the same factories."""
+        return SqlAlchemyUnitOfWork(
+            session_factory=self._session_factory,
+            repo_factories=self._repo_overrides,
+            read_session_factory=self._read_session_factory,
+            read_only=True,
+        )
+
     # ------------------------------------------------------------------ #
     # Async context manager                                              #
     # ------------------------------------------------------------------ #
@@ -147,7 +190,10 @@ class SqlAlchemyUnitOfWork(UnitOfWork):
         if self._session is not None:
             raise RuntimeError("UnitOfWork is already active; nested usage is not supported.")
 
-        self._session = self._session_factory()
+        if self._read_only and self._read_session_factory is not None:
+            self._session = self._read_session_factory()
+        else:
+            self._session = self._session_factory()
         self._committed = False
         self._rolled_back = False
         self._repos.clear()
@@ -191,7 +237,8 @@ class SqlAlchemyUnitOfWork(UnitOfWork):
     async def commit(self) -> None:
         """Commit the current transaction if active.
 
-        No-op if the UnitOfWork was already committed or rolled back.
+        No-op if the UnitOfWork was already committed or rolled back. A
+        read-only UnitOfWork ends its transaction with a rollback instead.
 
         Raises:
             RuntimeError: If called without an active session.
@@ -202,7 +249,10 @@ class SqlAlchemyUnitOfWork(UnitOfWork):
         if self._committed or self._rolled_back:
             return
 
-        await self._session.commit()
+        if self._read_only:
+            await self._session.rollback()
+        else:
+            await self._session.commit()
         self._committed = True
 
     async def rollback(self) -> None:
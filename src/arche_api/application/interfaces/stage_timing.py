@@ -0,0 +1,119 @@
+# src/arche_api/application/interfaces/stage_timing.py
+# Copyright (c) Arche.
+# SPDX-License-Identifier: MIT
+"""Application Interface: Stage Timing Port.
+
+Synopsis:
+    Lets use cases mark pipeline stage boundaries (hydrate, compute, persist,
+    ...) without depending on a tracing or metrics backend. Infrastructure
+    installs a :class:`StageObserver` at startup; until then, and whenever
+    stage timing is disabled, :func:`timed_stage` returns a shared no-op
+    context manager, so an unobserved stage costs one global read.
+
+Usage:
+    .. code-block:: python
+
+        with timed_stage("dq.evaluate"):
+            ...
+
+        @staged("xbrl.parse")
+        async def parse(...): ...
+
+Naming:
+    Stage names are static ``<pipeline>.<stage>`` tokens. They become metric
+    label values and ``Server-Timing`` metric names, so never interpolate
+    request data (CIKs, accession ids) into them.
+
+Layer:
+    application/interfaces
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+from collections.abc import Callable
+from contextlib import AbstractContextManager, nullcontext
+from typing import Any, Protocol, TypeVar, cast
+
+__all__ = [
+    "StageObserver",
+    "get_stage_observer",
+    "set_stage_observer",
+    "staged",
+    "timed_stage",
+]
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class StageObserver(Protocol):
+    """Backend that measures a named stage."""
+
+    def stage(self, name: str) -> AbstractContextManager[None]:
+        """Return a context manager timing the enclosed block as ``name``.
+
+        Implementations must let exceptions propagate unchanged.
+        """
+        ...
+
+
+_NULL_STAGE: AbstractContextManager[None] = nullcontext()
+_observer: StageObserver | None = None
+
+
+def set_stage_observer(observer: StageObserver | None) -> None:
+    """Install (or with ``None``, remove) the process-wide stage observer."""
+    global _observer
+    _observer = observer
+
+
+def get_stage_observer() -> StageObserver | None:
+    """Return the installed stage observer, if any."""
+    return _observer
+
+
+def timed_stage(name: str) -> AbstractContextManager[None]:
+    """Return a context manager that times the enclosed block as stage ``name``.
+
+    Args:
+        name: Static stage name (``<pipeline>.<stage>``).
+
+    Returns:
+        The observer's stage context, or a shared no-op context when no
+        observer is installed.
+    """
+    observer = _observer
+    if observer is None:
+        return _NULL_STAGE
+    return observer.stage(name)
+
+
+def staged(name: str) -> Callable[[F], F]:
+    """Decorate a sync or async callable so each call is timed as stage ``name``.
+
+    Args:
+        name: Static stage name (``<pipeline>.<stage>``).
+
+    Returns:
+        Decorator preserving the wrapped callable's signature.
+    """
+
+    def decorator(fn: F) -> F:
+        if inspect.iscoroutinefunction(fn):
+
+            @functools.wraps(fn)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                with timed_stage(name):
+                    return await fn(*args, **kwargs)
+
+            return cast(F, async_wrapper)
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with timed_stage(name):
+                return fn(*args, **kwargs)
+
+        return cast(F, wrapper)
+
+    return decorator
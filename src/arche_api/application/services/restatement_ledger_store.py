@@ -0,0 +1,205 @@
+# src/arche_api/application/services/restatement_ledger_store.py
+# Copyright (c) Arche.
+# SPDX-License-Identifier: MIT
+"""Restatement ledger store service (application layer).
+
+Purpose:
+    Keep the persisted restatement ledger in step with normalized statement
+    versions. When a normalized version is stored, the hops touching it
+    (previous normalized version → new version, and new version → next
+    normalized version when versions are normalized out of order) are
+    recomputed and written as per-metric ledger records. ``record_history``
+    rebuilds every hop of already-stored versions (ledger backfill).
+
+Layer:
+    application/services
+
+Notes:
+    - Orchestration only: no SQLAlchemy imports, no HTTP concerns.
+    - No commit/rollback; callers write the ledger inside the same
+      transaction that stores the normalized versions.
+    - Hops whose payloads disagree on identity (e.g. a changed statement
+      date) are skipped with a warning, mirroring the on-demand ledger which
+      rejects such pairs.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Sequence
+from dataclasses import replace
+
+from arche_api.application.uow import UnitOfWork
+from arche_api.domain.entities.canonical_statement_payload import CanonicalStatementPayload
+from arche_api.domain.entities.edgar_dq import NormalizedStatementIdentity
+from arche_api.domain.entities.edgar_restatement_delta import compute_restatement_delta
+from arche_api.domain.entities.edgar_statement_version import EdgarStatementVersion
+from arche_api.domain.exceptions.edgar import EdgarMappingError
+from arche_api.domain.interfaces.repositories.edgar_restatement_ledger_repository import (
+    EdgarRestatementLedgerRepository,
+)
+from arche_api.domain.interfaces.repositories.edgar_statements_repository import (
+    EdgarStatementsRepository,
+)
+from arche_api.domain.services.statement_ledger_delta_engine import (
+    build_restatement_ledger_records,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class RestatementLedgerStoreService:
+    """Application service writing restatement ledger hops for new versions."""
+
+    async def record_versions(
+        self,
+        *,
+        uow: UnitOfWork,
+        statements_repo: EdgarStatementsRepository,
+        versions: Sequence[EdgarStatementVersion],
+    ) -> int:
+        """Write the ledger hops touching each newly normalized version.
+
+        Args:
+            uow:
+                Active UnitOfWork used to resolve the ledger repository.
+            statements_repo:
+                Statements repository used to load the sibling versions of
+                each identity.
+            versions:
+                Statement versions that were just stored. Versions without a
+                normalized payload are ignored.
+
+        Returns:
+            Number of ledger records written.
+        """
+        ledger_repo = uow.get_repository(EdgarRestatementLedgerRepository)
+        written = 0
+
+        for version in versions:
+            if version.normalized_payload is None:
+                continue
+
+            siblings = await statements_repo.list_statement_versions_for_company(
+                cik=version.company.cik,
+                statement_type=version.statement_type,
+                fiscal_year=version.fiscal_year,
+                fiscal_period=version.fiscal_period,
+            )
+            by_sequence = {
+                v.version_sequence: v for v in siblings if v.normalized_payload is not None
+            }
+            # The stored version wins over any stale row at the same sequence.
+            by_sequence[version.version_sequence] = version
+            ordered = [by_sequence[seq] for seq in sorted(by_sequence)]
+            idx = ordered.index(version)
+
+            hops: list[tuple[EdgarStatementVersion, EdgarStatementVersion]] = []
+            if idx > 0:
+                hops.append((ordered[idx - 1], version))
+            if idx < len(ordered) - 1:
+                hops.append((version, ordered[idx + 1]))
+
+            for from_version, to_version in hops:
+                written += await self._record_hop(
+                    ledger_repo=ledger_repo,
+                    from_version=from_version,
+                    to_version=to_version,
+                )
+
+        return written
+
+    async def record_history(
+        self,
+        *,
+        uow: UnitOfWork,
+        versions: Sequence[EdgarStatementVersion],
+    ) -> int:
+        """Write every hop between adjacent normalized versions.
+
+        Args:
+            uow:
+                Active UnitOfWork used to resolve the ledger repository.
+            versions:
+                Stored statement versions, possibly spanning several statement
+                identities (e.g. all periods of a fiscal year). Versions
+                without a normalized payload are ignored.
+
+        Returns:
+            Number of ledger records written.
+        """
+        ledger_repo = uow.get_repository(EdgarRestatementLedgerRepository)
+
+        by_identity: dict[tuple[object, ...], dict[int, EdgarStatementVersion]] = {}
+        for version in versions:
+            if version.normalized_payload is None:
+                continue
+            key = (
+                version.company.cik,
+                version.statement_type,
+                version.fiscal_year,
+                version.fiscal_period,
+            )
+            by_identity.setdefault(key, {})[version.version_sequence] = version
+
+        written = 0
+        for by_sequence in by_identity.values():
+            ordered = [by_sequence[seq] for seq in sorted(by_sequence)]
+            for from_version, to_version in zip(ordered, ordered[1:], strict=False):
+                written += await self._record_hop(
+                    ledger_repo=ledger_repo,
+                    from_version=from_version,
+                    to_version=to_version,
+                )
+        return written
+
+    @staticmethod
+    async def _record_hop(
+        *,
+        ledger_repo: EdgarRestatementLedgerRepository,
+        from_version: EdgarStatementVersion,
+        to_version: EdgarStatementVersion,
+    ) -> int:
+        """Compute and replace one hop; return the number of records written."""
+        from_payload: CanonicalStatementPayload = from_version.normalized_payload  # type: ignore[assignment]
+        to_payload: CanonicalStatementPayload = to_version.normalized_payload  # type: ignore[assignment]
+
+        try:
+            delta = compute_restatement_delta(from_payload=from_payload, to_payload=to_payload)
+        except EdgarMappingError as exc:
+            logger.warning(
+                "edgar.restatement_ledger.hop_skipped",
+                extra={
+                    "cik": to_version.company.cik,
+                    "statement_type": to_version.statement_type.value,
+                    "fiscal_year": to_version.fiscal_year,
+                    "fiscal_period": to_version.fiscal_period.value,
+                    "from_version_sequence": from_version.version_sequence,
+                    "to_version_sequence": to_version.version_sequence,
+                    "details": exc.details,
+                },
+            )
+            return 0
+
+        # Key the hop on the stored version sequences, not the payload lineage.
+        delta = replace(
+            delta,
+            from_version_sequence=from_version.version_sequence,
+            to_version_sequence=to_version.version_sequence,
+        )
+        records = build_restatement_ledger_records(delta, restated_on=to_version.filing_date)
+        await ledger_repo.replace_hop(
+            identity=NormalizedStatementIdentity(
+                cik=to_version.company.cik,
+                statement_type=to_version.statement_type,
+                fiscal_year=to_version.fiscal_year,
+                fiscal_period=to_version.fiscal_period,
+                version_sequence=to_version.version_sequence,
+            ),
+            from_version_sequence=from_version.version_sequence,
+            records=records,
+        )
+        return len(records)
+
+
+__all__ = ["RestatementLedgerStoreService"]
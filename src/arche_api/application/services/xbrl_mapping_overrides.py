@@ -26,7 +26,7 @@ Notes:
 
 from __future__ import annotations
 
-from collections.abc import Mapping, Sequence
+from collections.abc import Collection, Mapping, Sequence
 from typing import Any
 
 from arche_api.domain.enums.canonical_statement_metric import (
@@ -109,6 +109,30 @@ class XBRLMappingOverridesService:
             taxonomy=taxonomy,
         )
 
+    async def list_rules_for_concepts(
+        self,
+        *,
+        concepts: Collection[str],
+        taxonomy: str | None = None,
+    ) -> Mapping[str, Sequence[MappingOverrideRule]]:
+        """Retrieve candidate override rules for many concepts at once.
+
+        Args:
+            concepts:
+                XBRL concept QNames present in the statement being normalized.
+            taxonomy:
+                Optional taxonomy identifier, as in
+                :meth:`list_rules_for_concept`.
+
+        Returns:
+            Mapping[str, Sequence[MappingOverrideRule]]: Rules grouped by
+            concept, loaded with a single repository call.
+        """
+        return await self._repository.list_rules_for_concepts(
+            concepts=concepts,
+            taxonomy=taxonomy,
+        )
+
     async def apply_overrides(
         self,
         *,
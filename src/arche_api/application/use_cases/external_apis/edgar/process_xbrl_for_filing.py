@@ -19,6 +19,8 @@ Notes:
       pipeline, using Model A semantics (update in-place).
     - XBRL fetching is performed via the EDGAR ingestion gateway.
     - XML parsing is performed via the XBRLParserGateway adapter.
+    - Stage timing: ``xbrl.fetch``, ``xbrl.parse``, ``xbrl.hydrate``,
+      ``xbrl.normalize`` and ``xbrl.persist``.
 """
 
 from __future__ import annotations
@@ -28,6 +30,10 @@ from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any
 
+from arche_api.application.interfaces.stage_timing import timed_stage
+from arche_api.application.services.restatement_ledger_store import (
+    RestatementLedgerStoreService,
+)
 from arche_api.application.uow import UnitOfWork
 from arche_api.application.use_cases.statements.persist_normalized_facts_for_statement import (
     PersistNormalizedFactsForStatementUseCase,
@@ -35,7 +41,7 @@ from arche_api.application.use_cases.statements.persist_normalized_facts_for_sta
 from arche_api.domain.entities.edgar_dq import NormalizedStatementIdentity
 from arche_api.domain.entities.edgar_normalized_fact import EdgarNormalizedFact
 from arche_api.domain.entities.edgar_statement_version import EdgarStatementVersion
-from arche_api.domain.entities.xbrl_document import XBRLContext, XBRLDocument
+from arche_api.domain.entities.xbrl_document import XBRLDocument
 from arche_api.domain.enums.edgar import StatementType
 from arche_api.domain.exceptions.edgar import EdgarIngestionError, EdgarMappingError
 from arche_api.domain.interfaces.gateways.edgar_ingestion_gateway import (
@@ -52,9 +58,9 @@ from arche_api.domain.interfaces.repositories.edgar_statements_repository import
 )
 from arche_api.domain.services.edgar_normalization import (
     CanonicalStatementNormalizer,
-    EdgarFact,
     NormalizationContext,
 )
+from arche_api.domain.services.xbrl_document_index import XBRLDocumentIndex
 
 logger = logging.getLogger(__name__)
 
@@ -115,6 +121,10 @@ class ProcessXBRLForFilingUseCase:
             Repository key/interface for resolving the statements repository.
         facts_repo_type:
             Repository key/interface for resolving the facts repository.
+        restatement_ledger:
+            Restatement ledger store. The ledger hops touching each newly
+            normalized version are written in the same transaction as the
+            versions. Defaults to :class:`RestatementLedgerStoreService`.
 
     Returns:
         Instances of :class:`ProcessXBRLForFilingResult` from
@@ -131,6 +141,7 @@ class ProcessXBRLForFilingUseCase:
             EdgarStatementsRepositoryProtocol
         ),
         facts_repo_type: type[EdgarFactsRepositoryProtocol] = EdgarFactsRepositoryProtocol,
+        restatement_ledger: RestatementLedgerStoreService | None = None,
     ) -> None:
         """Initialize the use case with collaborators and repository types."""
         self._uow = uow
@@ -138,6 +149,11 @@ class ProcessXBRLForFilingUseCase:
         self._xbrl_parser_gateway = xbrl_parser_gateway
         self._statements_repo_type = statements_repo_type
         self._facts_repo_type = facts_repo_type
+        self._restatement_ledger = (
+            restatement_ledger
+            if restatement_ledger is not None
+            else RestatementLedgerStoreService()
+        )
         self._normalizer = CanonicalStatementNormalizer()
 
     async def execute(self, req: ProcessXBRLForFilingRequest) -> ProcessXBRLForFilingResult:
@@ -200,14 +216,16 @@ class ProcessXBRLForFilingUseCase:
 
     async def _fetch_and_parse_xbrl(self, *, cik: str, accession_id: str) -> XBRLDocument:
         """Fetch raw XBRL bytes and parse into an XBRLDocument."""
-        xbrl_bytes = await self._ingestion_gateway.fetch_xbrl_for_filing(
-            cik=cik,
-            accession_id=accession_id,
-        )
-        document = await self._xbrl_parser_gateway.parse_xbrl(
-            accession_id=accession_id,
-            content=xbrl_bytes,
-        )
+        with timed_stage("xbrl.fetch"):
+            xbrl_bytes = await self._ingestion_gateway.fetch_xbrl_for_filing(
+                cik=cik,
+                accession_id=accession_id,
+            )
+        with timed_stage("xbrl.parse"):
+            document = await self._xbrl_parser_gateway.parse_xbrl(
+                accession_id=accession_id,
+                content=xbrl_bytes,
+            )
         return document
 
     async def _normalize_and_persist(
@@ -226,38 +244,41 @@ class ProcessXBRLForFilingUseCase:
             facts_repo: EdgarFactsRepositoryProtocol = tx.get_repository(self._facts_repo_type)
 
             target_types = self._resolve_target_statement_types(requested_types=requested_types)
-            versions = await self._load_statement_versions(
-                statements_repo=statements_repo,
-                cik=cik,
-                target_types=target_types,
-                accession_id=accession_id,
-            )
+            with timed_stage("xbrl.hydrate"):
+                versions = await self._load_statement_versions(
+                    statements_repo=statements_repo,
+                    cik=cik,
+                    target_types=target_types,
+                    accession_id=accession_id,
+                )
             versions_by_type = self._group_versions_by_accession(
                 versions=versions,
                 accession_id=accession_id,
                 requested_types=requested_types,
                 cik=cik,
             )
-            (
-                updated_versions,
-                all_facts,
-                processed_types,
-                total_facts,
-            ) = self._normalize_versions_for_document(
-                cik=cik,
-                accession_id=accession_id,
-                requested_types=requested_types,
-                versions_by_type=versions_by_type,
-                document=document,
-            )
+            with timed_stage("xbrl.normalize"):
+                (
+                    updated_versions,
+                    all_facts,
+                    processed_types,
+                    total_facts,
+                ) = self._normalize_versions_for_document(
+                    cik=cik,
+                    accession_id=accession_id,
+                    requested_types=requested_types,
+                    versions_by_type=versions_by_type,
+                    document=document,
+                )
 
-            await self._persist_normalization_results(
-                tx=tx,
-                statements_repo=statements_repo,
-                facts_repo=facts_repo,
-                updated_versions=updated_versions,
-                all_facts=all_facts,
-            )
+            with timed_stage("xbrl.persist"):
+                await self._persist_normalization_results(
+                    tx=tx,
+                    statements_repo=statements_repo,
+                    facts_repo=facts_repo,
+                    updated_versions=updated_versions,
+                    all_facts=all_facts,
+                )
 
         return ProcessXBRLForFilingResult(
             cik=cik,
@@ -352,7 +373,12 @@ class ProcessXBRLForFilingUseCase:
         list[StatementType],
         int,
     ]:
-        """Normalize each statement type and build the facts payloads."""
+        """Normalize each statement type and build the facts payloads.
+
+        The document is indexed once and the index is shared by every
+        statement type, so each pass only resolves its registry concepts.
+        """
+        document_index = XBRLDocumentIndex(document)
         updated_versions: list[EdgarStatementVersion] = []
         all_facts: list[tuple[NormalizedStatementIdentity, list[EdgarNormalizedFact]]] = []
         processed_types: list[StatementType] = []
@@ -364,7 +390,7 @@ class ProcessXBRLForFilingUseCase:
                 accession_id=accession_id,
                 statement_type=statement_type,
                 statement_versions=st_versions,
-                document=document,
+                document_index=document_index,
             )
             if result is None:
                 continue
@@ -392,10 +418,15 @@ class ProcessXBRLForFilingUseCase:
         updated_versions: Sequence[EdgarStatementVersion],
         all_facts: Sequence[tuple[NormalizedStatementIdentity, list[EdgarNormalizedFact]]],
     ) -> None:
-        """Persist normalized statement versions and their facts, then commit."""
+        """Persist normalized versions, their facts and ledger hops, then commit."""
         await statements_repo.upsert_statement_versions(list(updated_versions))
         for identity, facts in all_facts:
             await facts_repo.replace_facts_for_statement(identity=identity, facts=facts)
+        await self._restatement_ledger.record_versions(
+            uow=tx,
+            statements_repo=statements_repo,
+            versions=updated_versions,
+        )
         await tx.commit()
 
     def _normalize_for_statement_type(
@@ -405,7 +436,7 @@ class ProcessXBRLForFilingUseCase:
         accession_id: str,
         statement_type: StatementType,
         statement_versions: Sequence[EdgarStatementVersion],
-        document: XBRLDocument,
+        document_index: XBRLDocumentIndex,
     ) -> (
         tuple[EdgarStatementVersion, NormalizedStatementIdentity, list[EdgarNormalizedFact]] | None
     ):
@@ -423,10 +454,7 @@ class ProcessXBRLForFilingUseCase:
             # Already normalized; preserve idempotency.
             return None
 
-        edgar_facts = self._map_xbrl_to_edgar_facts(
-            document=document,
-            statement_version=latest,
-        )
+        edgar_facts = document_index.edgar_facts(currency=latest.currency)
 
         if not edgar_facts:
             logger.info(
@@ -450,7 +478,8 @@ class ProcessXBRLForFilingUseCase:
             accession_id=latest.accession_id,
             taxonomy="US_GAAP_MIN_E10A",
             version_sequence=latest.version_sequence,
-            facts=tuple(edgar_facts),
+            facts=edgar_facts,
+            fact_index=document_index.fact_index(currency=latest.currency),
         )
 
         normalization_result = self._normalizer.normalize(context)
@@ -485,67 +514,3 @@ class ProcessXBRLForFilingUseCase:
         facts = PersistNormalizedFactsForStatementUseCase._flatten_payload_to_facts(updated)
 
         return updated, identity, facts
-
-    @staticmethod
-    def _map_xbrl_to_edgar_facts(
-        *,
-        document: XBRLDocument,
-        statement_version: EdgarStatementVersion,
-    ) -> list[EdgarFact]:
-        """Map XBRL facts into EdgarFact instances for normalization.
-
-        This mapping is intentionally minimal in E10-A and focuses on:
-
-            * Concept qname (e.g., "us-gaap:Revenues").
-            * Statement currency / XBRL unit measure.
-            * Period start/end/instant derived from contexts.
-            * Decimals hint.
-            * Empty dimensions (primary consolidated statements).
-
-        Args:
-            document:
-                Parsed XBRLDocument.
-            statement_version:
-                Target statement version for which facts are being prepared.
-
-        Returns:
-            List of EdgarFact instances to feed into the normalization engine.
-        """
-        edgar_facts: list[EdgarFact] = []
-
-        for fact in document.facts:
-            ctx: XBRLContext | None = document.contexts.get(fact.context_ref)
-            if ctx is None:
-                continue
-
-            # Unit mapping: prefer XBRL unit measure, fall back to statement currency.
-            unit_str = statement_version.currency
-            if fact.unit_ref:
-                unit = document.units.get(fact.unit_ref)
-                if unit is not None and unit.measure:
-                    measure = unit.measure.strip().upper()
-                    unit_str = measure.split(":", 1)[1] if ":" in measure else measure
-
-            period_start = ctx.period.start_date if not ctx.period.is_instant else None
-            period_end = ctx.period.end_date if not ctx.period.is_instant else None
-            instant_date = ctx.period.instant_date if ctx.period.is_instant else None
-
-            if fact.is_nil:
-                # Skip nil facts for E10-A normalization.
-                continue
-
-            edgar_facts.append(
-                EdgarFact(
-                    fact_id=fact.id or f"{fact.concept_qname}:{fact.context_ref}",
-                    concept=fact.concept_qname,
-                    value=fact.raw_value,
-                    unit=unit_str,
-                    decimals=fact.decimals,
-                    period_start=period_start,
-                    period_end=period_end,
-                    instant_date=instant_date,
-                    dimensions={},
-                )
-            )
-
-        return edgar_facts
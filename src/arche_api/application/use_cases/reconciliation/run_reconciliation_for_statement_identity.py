@@ -21,6 +21,7 @@ from datetime import UTC, datetime
 from typing import Any, cast
 from uuid import uuid4
 
+from arche_api.application.interfaces.stage_timing import timed_stage
 from arche_api.application.schemas.dto.reconciliation import (
     ReconciliationResultDTO,
     RunReconciliationOptionsDTO,
@@ -155,30 +156,33 @@ class RunReconciliationForStatementIdentityUseCase:
             facts_repo = _get_facts_repo(tx)
             ledger_repo = _get_ledger_repo(tx)
 
-            resolved = await _resolve_payloads_and_facts(
-                statements_repo=statements_repo,
-                facts_repo=facts_repo,
-                cik=cik,
-                statement_type=statement_type,
-                fiscal_year=req.fiscal_year,
-                fiscal_period=fiscal_period,
-                options=options,
-            )
+            with timed_stage("reconciliation.hydrate"):
+                resolved = await _resolve_payloads_and_facts(
+                    statements_repo=statements_repo,
+                    facts_repo=facts_repo,
+                    cik=cik,
+                    statement_type=statement_type,
+                    fiscal_year=req.fiscal_year,
+                    fiscal_period=fiscal_period,
+                    options=options,
+                )
 
             rules = _build_default_rules(options.rule_categories)
 
-            domain_results = self._engine.run(
-                rules=rules,
-                statements=resolved.payloads,
-                facts_by_identity=resolved.facts_by_identity if options.deep else None,
-            )
+            with timed_stage("reconciliation.evaluate"):
+                domain_results = self._engine.run(
+                    rules=rules,
+                    statements=resolved.payloads,
+                    facts_by_identity=resolved.facts_by_identity if options.deep else None,
+                )
 
-            await ledger_repo.append_results(
-                reconciliation_run_id=reconciliation_run_id,
-                executed_at=executed_at,
-                results=domain_results,
-            )
-            await tx.commit()
+            with timed_stage("reconciliation.persist"):
+                await ledger_repo.append_results(
+                    reconciliation_run_id=reconciliation_run_id,
+                    executed_at=executed_at,
+                    results=domain_results,
+                )
+                await tx.commit()
 
         app_results = tuple(_map_result_to_dto(r) for r in domain_results)
         return RunReconciliationResponseDTO(
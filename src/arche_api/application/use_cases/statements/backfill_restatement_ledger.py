@@ -0,0 +1,159 @@
+# src/arche_api/application/use_cases/statements/backfill_restatement_ledger.py
+# Copyright (c)
+# SPDX-License-Identifier: MIT
+"""Restatement ledger backfill use case.
+
+Purpose:
+    Populate the persisted restatement ledger for statement versions that were
+    normalized before the ledger existed. Normalization keeps the ledger in
+    step going forward; this rebuilds every hop between adjacent normalized
+    versions for the requested companies, statement types and fiscal years.
+
+Design:
+    * Pure application-layer orchestration:
+        - Validation of request parameters.
+        - One transaction per company, so a large backfill commits in
+          bounded chunks and can be resumed per CIK.
+    * Idempotent: each hop is replaced, never appended.
+
+Layer:
+    application/use_cases
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import cast
+
+from arche_api.application.services.restatement_ledger_store import (
+    RestatementLedgerStoreService,
+)
+from arche_api.application.uow import UnitOfWork
+from arche_api.domain.enums.edgar import StatementType
+from arche_api.domain.exceptions.edgar import EdgarMappingError
+from arche_api.domain.interfaces.repositories.edgar_statements_repository import (
+    EdgarStatementsRepository,
+)
+
+
+@dataclass(slots=True)
+class BackfillRestatementLedgerRequest:
+    """Parameter object describing a ledger backfill.
+
+    Attributes:
+        ciks: Companies to backfill.
+        fiscal_year_from: Inclusive first fiscal year.
+        fiscal_year_to: Inclusive last fiscal year.
+        statement_types: Statement types to backfill (all by default).
+    """
+
+    ciks: Sequence[str]
+    fiscal_year_from: int
+    fiscal_year_to: int
+    statement_types: Sequence[StatementType] = field(default_factory=lambda: tuple(StatementType))
+
+
+@dataclass(slots=True)
+class BackfillRestatementLedgerResult:
+    """Summary of a ledger backfill."""
+
+    companies: int
+    records_written: int
+
+
+class BackfillRestatementLedgerUseCase:
+    """Use case rebuilding the restatement ledger from stored versions.
+
+    Args:
+        uow:
+            Unit-of-work instance providing access to the statements and
+            restatement ledger repositories.
+        restatement_ledger:
+            Restatement ledger store. Defaults to
+            :class:`RestatementLedgerStoreService`.
+    """
+
+    def __init__(
+        self,
+        uow: UnitOfWork,
+        restatement_ledger: RestatementLedgerStoreService | None = None,
+    ) -> None:
+        """Initialize the ledger backfill use case.
+
+        Args:
+            uow:
+                Unit-of-work instance providing access to the statements and
+                restatement ledger repositories.
+            restatement_ledger:
+                Restatement ledger store. When ``None``, a default
+                :class:`RestatementLedgerStoreService` is used.
+        """
+        self._uow = uow
+        self._restatement_ledger = (
+            restatement_ledger
+            if restatement_ledger is not None
+            else RestatementLedgerStoreService()
+        )
+
+    async def execute(
+        self, req: BackfillRestatementLedgerRequest
+    ) -> BackfillRestatementLedgerResult:
+        """Execute the backfill.
+
+        Args:
+            req:
+                Companies, statement types and fiscal-year window to backfill.
+
+        Returns:
+            A :class:`BackfillRestatementLedgerResult` summary.
+
+        Raises:
+            EdgarMappingError:
+                If no CIK is given or the fiscal-year window is invalid.
+        """
+        ciks = [cik.strip() for cik in req.ciks if cik.strip()]
+        if not ciks:
+            raise EdgarMappingError(
+                "At least one CIK is required for backfill_restatement_ledger().",
+                details={"ciks": list(req.ciks)},
+            )
+        if req.fiscal_year_from <= 0 or req.fiscal_year_to < req.fiscal_year_from:
+            raise EdgarMappingError(
+                "fiscal_year_from must be positive and not after fiscal_year_to "
+                "for backfill_restatement_ledger().",
+                details={
+                    "fiscal_year_from": req.fiscal_year_from,
+                    "fiscal_year_to": req.fiscal_year_to,
+                },
+            )
+
+        written = 0
+        for cik in ciks:
+            async with self._uow as tx:
+                statements_repo = cast(
+                    EdgarStatementsRepository,
+                    tx.get_repository(EdgarStatementsRepository),
+                )
+                for statement_type in req.statement_types:
+                    for fiscal_year in range(req.fiscal_year_from, req.fiscal_year_to + 1):
+                        versions = await statements_repo.list_statement_versions_for_company(
+                            cik=cik,
+                            statement_type=statement_type,
+                            fiscal_year=fiscal_year,
+                            fiscal_period=None,
+                        )
+                        written += await self._restatement_ledger.record_history(
+                            uow=tx,
+                            versions=versions,
+                        )
+                await tx.commit()
+
+        return BackfillRestatementLedgerResult(companies=len(ciks), records_written=written)
+
+
+__all__ = [
+    "BackfillRestatementLedgerRequest",
+    "BackfillRestatementLedgerResult",
+    "BackfillRestatementLedgerUseCase",
+]
@@ -17,6 +17,12 @@ Notes:
     - It currently supports a universe expressed as CIKs.
     - Currency normalization is deferred to a later phase; metrics are
       computed in native statement currency.
+    - Points exist only for rows where at least one metric is computable,
+      so the series is built in full and paginated by the caller; a keyset
+      read of N statement rows would not yield N points.
+    - Stage timing: ``timeseries.hydrate`` (repository reads),
+      ``timeseries.compute`` (engine) and ``timeseries.assemble`` (panel
+      ordering).
 """
 
 from __future__ import annotations
@@ -27,6 +33,7 @@ from dataclasses import dataclass
 from datetime import date
 from typing import Any, cast
 
+from arche_api.application.interfaces.stage_timing import staged, timed_stage
 from arche_api.application.uow import UnitOfWork
 from arche_api.domain.entities.canonical_statement_payload import (
     CanonicalStatementPayload,
@@ -126,30 +133,7 @@ class GetDerivedMetricsTimeSeriesUseCase:
                 If the request parameters are invalid (empty universe, invalid
                 frequency, or an inverted date window).
         """
-        cleaned_ciks = sorted({c.strip() for c in req.ciks if c.strip()})
-        if not cleaned_ciks:
-            raise EdgarMappingError(
-                "At least one non-empty CIK must be provided for derived metrics time series.",
-            )
-
-        from_date, to_date = self._normalize_window(req.from_date, req.to_date)
-
-        frequency = req.frequency.lower()
-        if frequency not in {"annual", "quarterly"}:
-            raise EdgarMappingError(
-                "Unsupported frequency for derived metrics time series; expected 'annual' or 'quarterly'.",
-                details={"frequency": req.frequency},
-            )
-
-        if frequency == "annual":
-            allowed_periods: set[FiscalPeriod] = {FiscalPeriod.FY}
-        else:
-            allowed_periods = {
-                FiscalPeriod.Q1,
-                FiscalPeriod.Q2,
-                FiscalPeriod.Q3,
-                FiscalPeriod.Q4,
-            }
+        cleaned_ciks, frequency, allowed_periods, from_date, to_date = self._validate(req)
 
         logger.info(
             "edgar.get_derived_metrics_timeseries.start",
@@ -180,7 +164,8 @@ class GetDerivedMetricsTimeSeriesUseCase:
                 )
                 all_points.extend(company_points)
 
-        series = build_derived_metrics_timeseries(all_points)
+        with timed_stage("timeseries.assemble"):
+            series = build_derived_metrics_timeseries(all_points)
 
         logger.info(
             "edgar.get_derived_metrics_timeseries.success",
@@ -200,6 +185,43 @@ class GetDerivedMetricsTimeSeriesUseCase:
     # Internal helpers                                                   #
     # ------------------------------------------------------------------ #
 
+    def _validate(
+        self,
+        req: GetDerivedMetricsTimeSeriesRequest,
+    ) -> tuple[list[str], str, set[FiscalPeriod], date, date]:
+        """Validate a request and derive universe, frequency, periods and window.
+
+        Raises:
+            EdgarMappingError: If the universe is empty, the frequency is not
+                supported, or the date window is inverted.
+        """
+        cleaned_ciks = sorted({c.strip() for c in req.ciks if c.strip()})
+        if not cleaned_ciks:
+            raise EdgarMappingError(
+                "At least one non-empty CIK must be provided for derived metrics time series.",
+            )
+
+        from_date, to_date = self._normalize_window(req.from_date, req.to_date)
+
+        frequency = req.frequency.lower()
+        if frequency not in {"annual", "quarterly"}:
+            raise EdgarMappingError(
+                "Unsupported frequency for derived metrics time series; expected 'annual' or 'quarterly'.",
+                details={"frequency": req.frequency},
+            )
+
+        if frequency == "annual":
+            allowed_periods: set[FiscalPeriod] = {FiscalPeriod.FY}
+        else:
+            allowed_periods = {
+                FiscalPeriod.Q1,
+                FiscalPeriod.Q2,
+                FiscalPeriod.Q3,
+                FiscalPeriod.Q4,
+            }
+
+        return cleaned_ciks, frequency, allowed_periods, from_date, to_date
+
     @staticmethod
     def _normalize_window(
         from_date: date | None,
@@ -260,12 +282,13 @@ class GetDerivedMetricsTimeSeriesUseCase:
         payloads: list[CanonicalStatementPayload] = []
 
         for fiscal_year in range(lower_year, upper_year + 1):
-            versions = await statements_repo.list_statement_versions_for_company(
-                cik=cik,
-                statement_type=statement_type,
-                fiscal_year=fiscal_year,
-                fiscal_period=None,
-            )
+            with timed_stage("timeseries.hydrate"):
+                versions = await statements_repo.list_statement_versions_for_company(
+                    cik=cik,
+                    statement_type=statement_type,
+                    fiscal_year=fiscal_year,
+                    fiscal_period=None,
+                )
 
             candidates = [
                 v
@@ -297,6 +320,24 @@ class GetDerivedMetricsTimeSeriesUseCase:
         # Sort payloads deterministically by statement_date / fiscal_period.
         payloads.sort(key=lambda p: (p.statement_date, p.fiscal_period.value))
 
+        return self._compute_points(payloads=payloads, metrics=metrics)
+
+    @staged("timeseries.compute")
+    def _compute_points(
+        self,
+        *,
+        payloads: Sequence[CanonicalStatementPayload],
+        metrics: Sequence[DerivedMetric] | None,
+    ) -> list[DerivedMetricsTimeSeriesPoint]:
+        """Run the derived-metrics engine over one company's ordered payloads.
+
+        Args:
+            payloads: Company payloads ordered by statement_date / fiscal_period.
+            metrics: Optional subset of derived metrics to compute.
+
+        Returns:
+            Points for payloads where at least one metric was computed.
+        """
         derived_points: list[DerivedMetricsTimeSeriesPoint] = []
         history: list[CanonicalStatementPayload] = []
 
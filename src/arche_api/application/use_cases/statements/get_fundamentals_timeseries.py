@@ -17,12 +17,17 @@ Notes:
     - It currently supports a universe expressed as CIKs.
       A later phase can extend this to tickers or mixed identifiers
       by resolving through reference data.
+    - ``execute_page`` serves keyset-paginated reads: only the rows of the
+      requested page are loaded from the repository, so the cost of a page
+      does not grow with its depth into the panel.
+    - ``stream`` serves bulk exports: points are produced incrementally from
+      a server-side cursor, so memory does not grow with the panel size.
 """
 
 from __future__ import annotations
 
 import logging
-from collections.abc import Iterable, Sequence
+from collections.abc import AsyncIterator, Iterable, Sequence
 from dataclasses import dataclass
 from datetime import date
 from typing import Any, cast
@@ -44,6 +49,7 @@ from arche_api.domain.interfaces.repositories.edgar_statements_repository import
 from arche_api.domain.services.canonical_metric_registry import (
     get_tier1_metrics_for_statement_type,
 )
+from arche_api.domain.value_objects import StatementKeyset
 
 logger = logging.getLogger(__name__)
 
@@ -90,6 +96,44 @@ class GetFundamentalsTimeSeriesRequest:
     use_tier1_only: bool = False
 
 
+@dataclass(frozen=True)
+class FundamentalsTimeSeriesPage:
+    """One keyset page of a fundamentals time series.
+
+    Attributes:
+        points:
+            Points on this page, in canonical time-series order.
+        next_keyset:
+            Keyset of the last row on this page when more rows follow, or
+            None when this is the final page.
+        total:
+            Number of points in the whole series when requested with
+            ``with_total``, otherwise None.
+    """
+
+    points: list[FundamentalsTimeSeriesPoint]
+    next_keyset: StatementKeyset | None
+    total: int | None = None
+
+
+@dataclass(frozen=True)
+class FundamentalsTimeSeriesStream:
+    """Lazily produced fundamentals time series for bulk export.
+
+    Attributes:
+        points:
+            Async iterator over points in (cik, statement_date, fiscal_period)
+            order. Iterating it holds a unit-of-work open until exhausted or
+            closed.
+        metrics:
+            Metric projection in effect, or None when every metric present in
+            each payload is emitted.
+    """
+
+    points: AsyncIterator[FundamentalsTimeSeriesPoint]
+    metrics: tuple[CanonicalStatementMetric, ...] | None
+
+
 class GetFundamentalsTimeSeriesUseCase:
     """Build a fundamentals time series from normalized EDGAR statements.
 
@@ -131,30 +175,7 @@ class GetFundamentalsTimeSeriesUseCase:
                 If the request parameters are invalid (empty universe, invalid
                 frequency, or an inverted date window).
         """
-        cleaned_ciks = sorted({c.strip() for c in req.ciks if c.strip()})
-        if not cleaned_ciks:
-            raise EdgarMappingError(
-                "At least one non-empty CIK must be provided for fundamentals time series.",
-            )
-
-        from_date, to_date = self._normalize_window(req.from_date, req.to_date)
-
-        frequency = req.frequency.lower()
-        if frequency not in {"annual", "quarterly"}:
-            raise EdgarMappingError(
-                "Unsupported frequency for fundamentals time series; expected 'annual' or 'quarterly'.",
-                details={"frequency": req.frequency},
-            )
-
-        if frequency == "annual":
-            allowed_periods: set[FiscalPeriod] = {FiscalPeriod.FY}
-        else:
-            allowed_periods = {
-                FiscalPeriod.Q1,
-                FiscalPeriod.Q2,
-                FiscalPeriod.Q3,
-                FiscalPeriod.Q4,
-            }
+        cleaned_ciks, frequency, allowed_periods, from_date, to_date = self._validate(req)
 
         logger.info(
             "edgar.get_fundamentals_timeseries.start",
@@ -184,16 +205,9 @@ class GetFundamentalsTimeSeriesUseCase:
                 )
                 all_payloads.extend(company_payloads)
 
-        if req.metrics is not None:
-            metric_filter: Iterable[CanonicalStatementMetric] | None = tuple(req.metrics)
-        elif req.use_tier1_only:
-            metric_filter = get_tier1_metrics_for_statement_type(req.statement_type)
-        else:
-            metric_filter = None
-
         series = build_fundamentals_timeseries(
             payloads=all_payloads,
-            metrics=metric_filter,
+            metrics=self._metric_filter(req),
         )
 
         logger.info(
@@ -210,10 +224,227 @@ class GetFundamentalsTimeSeriesUseCase:
 
         return series
 
+    async def execute_page(
+        self,
+        req: GetFundamentalsTimeSeriesRequest,
+        *,
+        after: StatementKeyset | None,
+        limit: int,
+        with_total: bool = False,
+    ) -> FundamentalsTimeSeriesPage:
+        """Execute one keyset page of fundamentals time-series retrieval.
+
+        The repository returns the latest payload per identity already in
+        (cik, statement_date, fiscal_period) order, starting strictly after
+        ``after``. One extra row is requested to detect whether another page
+        follows, so a count query only runs when ``with_total`` asks for it.
+
+        Args:
+            req: Parameters describing the universe and time window.
+            after: Keyset of the last row of the previous page, or None for
+                the first page.
+            limit: Maximum number of points on the page.
+            with_total: When True, also count the whole series (key columns
+                only) so the first page can report a total.
+
+        Returns:
+            FundamentalsTimeSeriesPage with the points and the keyset to
+            resume from.
+
+        Raises:
+            EdgarMappingError:
+                If the request parameters are invalid (empty universe, invalid
+                frequency, or an inverted date window).
+        """
+        cleaned_ciks, frequency, allowed_periods, from_date, to_date = self._validate(req)
+
+        logger.info(
+            "edgar.get_fundamentals_timeseries_page.start",
+            extra={
+                "ciks": cleaned_ciks,
+                "statement_type": req.statement_type.value,
+                "frequency": frequency,
+                "from_date": from_date.isoformat(),
+                "to_date": to_date.isoformat(),
+                "after": _keyset_log_value(after),
+                "limit": limit,
+            },
+        )
+
+        async with self._uow as tx:
+            statements_repo = _get_edgar_statements_repository(tx)
+            payloads = list(
+                await statements_repo.list_latest_statement_payloads(
+                    ciks=cleaned_ciks,
+                    statement_type=req.statement_type,
+                    fiscal_periods=sorted(allowed_periods, key=lambda p: p.value),
+                    from_date=from_date,
+                    to_date=to_date,
+                    after=after,
+                    limit=limit + 1,
+                ),
+            )
+            total: int | None = None
+            if with_total:
+                total = await statements_repo.count_latest_statement_payloads(
+                    ciks=cleaned_ciks,
+                    statement_type=req.statement_type,
+                    fiscal_periods=sorted(allowed_periods, key=lambda p: p.value),
+                    from_date=from_date,
+                    to_date=to_date,
+                )
+
+        has_more = len(payloads) > limit
+        payloads = payloads[:limit]
+        next_keyset = _keyset_for(payloads[-1]) if has_more and payloads else None
+
+        series = build_fundamentals_timeseries(
+            payloads=payloads,
+            metrics=self._metric_filter(req),
+        )
+
+        logger.info(
+            "edgar.get_fundamentals_timeseries_page.success",
+            extra={
+                "ciks": cleaned_ciks,
+                "statement_type": req.statement_type.value,
+                "frequency": frequency,
+                "points": len(series),
+                "has_more": has_more,
+                "total": total,
+            },
+        )
+
+        return FundamentalsTimeSeriesPage(points=series, next_keyset=next_keyset, total=total)
+
+    def stream(
+        self,
+        req: GetFundamentalsTimeSeriesRequest,
+        *,
+        batch_size: int = 1000,
+    ) -> FundamentalsTimeSeriesStream:
+        """Stream a fundamentals time series for bulk export.
+
+        The request is validated eagerly, so invalid parameters surface before
+        any output is produced; rows are then read lazily from the
+        repository's server-side cursor ``batch_size`` at a time.
+
+        Args:
+            req: Parameters describing the universe and time window.
+            batch_size: Number of payloads fetched and converted per batch.
+
+        Returns:
+            FundamentalsTimeSeriesStream wrapping the lazy point iterator and
+            the resolved metric projection.
+
+        Raises:
+            EdgarMappingError:
+                If the request parameters are invalid (empty universe, invalid
+                frequency, or an inverted date window).
+        """
+        cleaned_ciks, frequency, allowed_periods, from_date, to_date = self._validate(req)
+        metric_filter = self._metric_filter(req)
+        metrics = tuple(metric_filter) if metric_filter is not None else None
+
+        async def _points() -> AsyncIterator[FundamentalsTimeSeriesPoint]:
+            emitted = 0
+            logger.info(
+                "edgar.get_fundamentals_timeseries_stream.start",
+                extra={
+                    "ciks": cleaned_ciks,
+                    "statement_type": req.statement_type.value,
+                    "frequency": frequency,
+                    "from_date": from_date.isoformat(),
+                    "to_date": to_date.isoformat(),
+                    "batch_size": batch_size,
+                },
+            )
+
+            async with self._uow as tx:
+                statements_repo = _get_edgar_statements_repository(tx)
+                batch: list[CanonicalStatementPayload] = []
+                async for payload in statements_repo.stream_latest_statement_payloads(
+                    ciks=cleaned_ciks,
+                    statement_type=req.statement_type,
+                    fiscal_periods=sorted(allowed_periods, key=lambda p: p.value),
+                    from_date=from_date,
+                    to_date=to_date,
+                    batch_size=batch_size,
+                ):
+                    batch.append(payload)
+                    if len(batch) >= batch_size:
+                        for point in build_fundamentals_timeseries(payloads=batch, metrics=metrics):
+                            yield point
+                        emitted += len(batch)
+                        batch = []
+
+                for point in build_fundamentals_timeseries(payloads=batch, metrics=metrics):
+                    yield point
+                emitted += len(batch)
+
+            logger.info(
+                "edgar.get_fundamentals_timeseries_stream.success",
+                extra={
+                    "ciks": cleaned_ciks,
+                    "statement_type": req.statement_type.value,
+                    "points": emitted,
+                },
+            )
+
+        return FundamentalsTimeSeriesStream(points=_points(), metrics=metrics)
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
+    def _validate(
+        self,
+        req: GetFundamentalsTimeSeriesRequest,
+    ) -> tuple[list[str], str, set[FiscalPeriod], date, date]:
+        """Validate a request and derive universe, frequency, periods and window.
+
+        Raises:
+            EdgarMappingError: If the universe is empty, the frequency is not
+                supported, or the date window is inverted.
+        """
+        cleaned_ciks = sorted({c.strip() for c in req.ciks if c.strip()})
+        if not cleaned_ciks:
+            raise EdgarMappingError(
+                "At least one non-empty CIK must be provided for fundamentals time series.",
+            )
+
+        from_date, to_date = self._normalize_window(req.from_date, req.to_date)
+
+        frequency = req.frequency.lower()
+        if frequency not in {"annual", "quarterly"}:
+            raise EdgarMappingError(
+                "Unsupported frequency for fundamentals time series; expected 'annual' or 'quarterly'.",
+                details={"frequency": req.frequency},
+            )
+
+        if frequency == "annual":
+            allowed_periods: set[FiscalPeriod] = {FiscalPeriod.FY}
+        else:
+            allowed_periods = {
+                FiscalPeriod.Q1,
+                FiscalPeriod.Q2,
+                FiscalPeriod.Q3,
+                FiscalPeriod.Q4,
+            }
+
+        return cleaned_ciks, frequency, allowed_periods, from_date, to_date
+
+    @staticmethod
+    def _metric_filter(
+        req: GetFundamentalsTimeSeriesRequest,
+    ) -> Iterable[CanonicalStatementMetric] | None:
+        """Resolve the metric filter implied by ``metrics`` / ``use_tier1_only``."""
+        if req.metrics is not None:
+            return tuple(req.metrics)
+        if req.use_tier1_only:
+            return get_tier1_metrics_for_statement_type(req.statement_type)
+        return None
+
     @staticmethod
     def _normalize_window(
         from_date: date | None,
@@ -329,6 +560,22 @@ class GetFundamentalsTimeSeriesUseCase:
         return payloads
 
 
+def _keyset_for(payload: CanonicalStatementPayload) -> StatementKeyset:
+    """Return the keyset identifying ``payload`` in time-series order."""
+    return StatementKeyset(
+        cik=payload.cik,
+        statement_date=payload.statement_date,
+        fiscal_period=payload.fiscal_period,
+    )
+
+
+def _keyset_log_value(keyset: StatementKeyset | None) -> list[str] | None:
+    """Render a keyset for structured logs."""
+    if keyset is None:
+        return None
+    return [keyset.cik, keyset.statement_date.isoformat(), keyset.fiscal_period.value]
+
+
 def _get_edgar_statements_repository(tx: Any) -> EdgarStatementsRepositoryProtocol:
     """Resolve the EDGAR statements repository via the UnitOfWork.
 
@@ -0,0 +1,147 @@
+# src/arche_api/application/use_cases/statements/get_statement_versions_validator.py
+# Copyright (c)
+# SPDX-License-Identifier: MIT
+"""Use case: Cheap validator for statement-derived HTTP representations.
+
+Purpose:
+    Produce an opaque, deterministic validator for any representation built
+    from EDGAR statement versions (fundamentals panels, derived metrics,
+    statement listings). The validator is derived from an aggregate
+    fingerprint of the rows in scope plus a caller-supplied description of
+    the representation, so routers can answer conditional GETs with 304
+    before running the (expensive) read use case.
+
+Layer:
+    application
+
+Notes:
+    - The validator changes whenever a row in scope is inserted, deleted,
+      restated, or has its normalized payload rewritten, or whenever the
+      caller's representation (query parameters, engine versions) changes.
+    - When ``to_date`` is omitted, read use cases default the upper bound to
+      today; today's date is therefore part of the validator in that case.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, cast
+
+from arche_api.application.uow import UnitOfWork
+from arche_api.domain.enums.edgar import StatementType
+from arche_api.domain.interfaces.repositories.edgar_statements_repository import (
+    EdgarStatementsRepository as EdgarStatementsRepositoryProtocol,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class GetStatementVersionsValidatorRequest:
+    """Scope and representation for which a validator is requested.
+
+    Attributes:
+        ciks:
+            Universe of companies expressed as CIKs.
+        statement_type:
+            Statement type in scope.
+        from_date:
+            Optional inclusive lower bound for statement_date.
+        to_date:
+            Optional inclusive upper bound for statement_date.
+        representation:
+            JSON-serializable description of everything else that shapes the
+            response (route, metrics, pagination, engine versions, ...).
+    """
+
+    ciks: Sequence[str]
+    statement_type: StatementType
+    from_date: date | None = None
+    to_date: date | None = None
+    representation: Mapping[str, Any] = field(default_factory=dict)
+
+
+class GetStatementVersionsValidatorUseCase:
+    """Compute a validator for a statement-derived representation.
+
+    Args:
+        uow: Unit-of-work used to access the EDGAR statements repository.
+    """
+
+    def __init__(self, uow: UnitOfWork) -> None:
+        """Initialize the use case.
+
+        Args:
+            uow: Application UnitOfWork abstraction used to resolve repositories.
+        """
+        self._uow = uow
+
+    async def execute(self, req: GetStatementVersionsValidatorRequest) -> str:
+        """Return the validator for ``req`` as a hex digest.
+
+        Args:
+            req: Scope and representation description.
+
+        Returns:
+            SHA-256 hex digest; equal digests imply equal representations.
+        """
+        ciks = sorted({c.strip() for c in req.ciks if c.strip()})
+
+        async with self._uow as tx:
+            statements_repo = _get_edgar_statements_repository(tx)
+            fingerprint = await statements_repo.get_statement_versions_fingerprint(
+                ciks=ciks,
+                statement_type=req.statement_type,
+                from_date=req.from_date,
+                to_date=req.to_date,
+            )
+
+        material = {
+            "ciks": ciks,
+            "statement_type": req.statement_type.value,
+            "from_date": req.from_date.isoformat() if req.from_date else None,
+            "to_date": req.to_date.isoformat() if req.to_date else date.today().isoformat(),
+            "fingerprint": [
+                fingerprint.row_count,
+                fingerprint.max_version_sequence,
+                fingerprint.max_updated_at.isoformat() if fingerprint.max_updated_at else None,
+            ],
+            "representation": dict(req.representation),
+        }
+        encoded = json.dumps(material, sort_keys=True, separators=(",", ":"), default=str)
+        validator = hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+        logger.debug(
+            "edgar.statement_versions_validator.computed",
+            extra={
+                "ciks": ciks,
+                "statement_type": req.statement_type.value,
+                "row_count": fingerprint.row_count,
+            },
+        )
+        return validator
+
+
+def _get_edgar_statements_repository(tx: Any) -> EdgarStatementsRepositoryProtocol:
+    """Resolve the EDGAR statements repository via the UnitOfWork.
+
+    Test doubles may expose `repo`, `statements_repo`, or `_repo` attributes
+    instead of a full repository registry. Prefer those when present to keep
+    tests and fakes simple.
+    """
+    if hasattr(tx, "repo"):
+        return cast(EdgarStatementsRepositoryProtocol, tx.repo)
+    if hasattr(tx, "statements_repo"):
+        return cast(EdgarStatementsRepositoryProtocol, tx.statements_repo)
+    if hasattr(tx, "_repo"):
+        return cast(EdgarStatementsRepositoryProtocol, tx._repo)
+
+    return cast(
+        EdgarStatementsRepositoryProtocol,
+        tx.get_repository(EdgarStatementsRepositoryProtocol),
+    )
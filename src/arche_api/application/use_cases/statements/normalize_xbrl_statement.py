@@ -26,16 +26,15 @@ import logging
 from collections.abc import Sequence
 from dataclasses import dataclass
 
+from arche_api.application.services.restatement_ledger_store import (
+    RestatementLedgerStoreService,
+)
 from arche_api.application.services.xbrl_mapping_overrides import (
     XBRLMappingOverridesService,
 )
 from arche_api.application.uow import UnitOfWork
 from arche_api.domain.entities.edgar_statement_version import EdgarStatementVersion
-from arche_api.domain.entities.xbrl_document import (
-    XBRLContext,
-    XBRLDocument,
-    XBRLUnit,
-)
+from arche_api.domain.entities.xbrl_document import XBRLDocument
 from arche_api.domain.enums.edgar import FiscalPeriod, StatementType
 from arche_api.domain.exceptions.edgar import EdgarIngestionError, EdgarMappingError
 from arche_api.domain.interfaces.repositories.edgar_statements_repository import (
@@ -46,6 +45,7 @@ from arche_api.domain.services.edgar_normalization import (
     EdgarFact,
     NormalizationContext,
 )
+from arche_api.domain.services.xbrl_document_index import XBRLDocumentIndex
 from arche_api.domain.services.xbrl_mapping_overrides import MappingOverrideRule
 
 logger = logging.getLogger(__name__)
@@ -146,6 +146,10 @@ class NormalizeXBRLStatementUseCase:
             override rules are collected for the concepts present in the XBRL
             facts and passed into the normalization engine. When omitted, no
             overrides are applied.
+        restatement_ledger:
+            Restatement ledger store. The ledger hops touching the newly
+            normalized version are written before commit. Defaults to
+            :class:`RestatementLedgerStoreService`.
     """
 
     def __init__(
@@ -156,6 +160,7 @@ class NormalizeXBRLStatementUseCase:
             EdgarStatementsRepositoryProtocol
         ),
         overrides_service: XBRLMappingOverridesService | None = None,
+        restatement_ledger: RestatementLedgerStoreService | None = None,
     ) -> None:
         """Initialize the use case with collaborators.
 
@@ -168,11 +173,19 @@ class NormalizeXBRLStatementUseCase:
             overrides_service:
                 Optional overrides service used to fetch XBRL mapping override
                 rules. When ``None``, override evaluation is skipped.
+            restatement_ledger:
+                Restatement ledger store. When ``None``, a default
+                :class:`RestatementLedgerStoreService` is used.
         """
         self._uow = uow
         self._statements_repo_type = statements_repo_type
         self._normalizer = CanonicalStatementNormalizer()
         self._overrides_service = overrides_service
+        self._restatement_ledger = (
+            restatement_ledger
+            if restatement_ledger is not None
+            else RestatementLedgerStoreService()
+        )
 
     async def execute(self, req: NormalizeXBRLStatementRequest) -> NormalizeXBRLStatementResult:
         """Execute normalization for a single statement version.
@@ -262,10 +275,8 @@ class NormalizeXBRLStatementUseCase:
                     normalized=False,
                 )
 
-            edgar_facts = self._map_xbrl_to_edgar_facts(
-                document=req.xbrl_document,
-                statement_version=version,
-            )
+            document_index = XBRLDocumentIndex(req.xbrl_document)
+            edgar_facts = document_index.edgar_facts(currency=version.currency)
 
             if not edgar_facts:
                 logger.info(
@@ -300,7 +311,7 @@ class NormalizeXBRLStatementUseCase:
             if self._overrides_service is not None:
                 override_rules = await self._collect_override_rules(
                     overrides_service=self._overrides_service,
-                    edgar_facts=tuple(edgar_facts),
+                    edgar_facts=edgar_facts,
                     taxonomy=taxonomy,
                     cik=cik,
                 )
@@ -319,7 +330,8 @@ class NormalizeXBRLStatementUseCase:
                 accession_id=version.accession_id,
                 taxonomy=taxonomy,
                 version_sequence=version.version_sequence,
-                facts=tuple(edgar_facts),
+                facts=edgar_facts,
+                fact_index=document_index.fact_index(currency=version.currency),
                 override_rules=override_rules,
                 enable_override_trace=enable_override_trace,
             )
@@ -346,6 +358,11 @@ class NormalizeXBRLStatementUseCase:
             )
 
             await statements_repo.upsert_statement_versions([updated])
+            await self._restatement_ledger.record_versions(
+                uow=tx,
+                statements_repo=statements_repo,
+                versions=[updated],
+            )
             await tx.commit()
 
         logger.info(
@@ -441,71 +458,6 @@ class NormalizeXBRLStatementUseCase:
         # pick the max version_sequence to be defensive.
         return max(matching, key=lambda v: v.version_sequence)
 
-    @staticmethod
-    def _map_xbrl_to_edgar_facts(
-        *,
-        document: XBRLDocument,
-        statement_version: EdgarStatementVersion,
-    ) -> list[EdgarFact]:
-        """Map XBRL facts into EdgarFact instances for normalization.
-
-        This mapping mirrors the E10-A behavior used in the filing-level
-        XBRL processing use case and focuses on:
-
-            * Concept qname (e.g., "us-gaap:Revenues").
-            * Statement currency / XBRL unit measure.
-            * Period start/end/instant derived from contexts.
-            * Decimals hint.
-            * Empty dimensions (primary consolidated statements).
-
-        Args:
-            document:
-                Parsed XBRLDocument.
-            statement_version:
-                Target statement version for which facts are being prepared.
-
-        Returns:
-            List of EdgarFact instances to feed into the normalization engine.
-        """
-        edgar_facts: list[EdgarFact] = []
-
-        for fact in document.facts:
-            ctx: XBRLContext | None = document.contexts.get(fact.context_ref)
-            if ctx is None:
-                continue
-
-            # Unit mapping: prefer XBRL unit measure, fall back to statement currency.
-            unit_str = statement_version.currency
-            if fact.unit_ref:
-                unit: XBRLUnit | None = document.units.get(fact.unit_ref)
-                if unit is not None and unit.measure:
-                    measure = unit.measure.strip().upper()
-                    unit_str = measure.split(":", 1)[1] if ":" in measure else measure
-
-            period_start = ctx.period.start_date if not ctx.period.is_instant else None
-            period_end = ctx.period.end_date if not ctx.period.is_instant else None
-            instant_date = ctx.period.instant_date if ctx.period.is_instant else None
-
-            if fact.is_nil:
-                # Skip nil facts for E10 normalization.
-                continue
-
-            edgar_facts.append(
-                EdgarFact(
-                    fact_id=fact.id or f"{fact.concept_qname}:{fact.context_ref}",
-                    concept=fact.concept_qname,
-                    value=fact.raw_value,
-                    unit=unit_str,
-                    decimals=fact.decimals,
-                    period_start=period_start,
-                    period_end=period_end,
-                    instant_date=instant_date,
-                    dimensions={},
-                )
-            )
-
-        return edgar_facts
-
     async def _collect_override_rules(
         self,
         *,
@@ -517,21 +469,21 @@ class NormalizeXBRLStatementUseCase:
         """Collect override rules for the concepts present in the facts.
 
         Behavior:
-            * Aggregates rules across all unique concept QNames.
+            * Loads rules for all unique concept QNames in one bulk lookup.
+            * Aggregates them in sorted concept order.
             * Deduplicates by rule_id while preserving deterministic order.
         """
         if not edgar_facts:
             return ()
 
         concepts = sorted({f.concept for f in edgar_facts})
+        rules_by_concept = await overrides_service.list_rules_for_concepts(
+            concepts=concepts,
+            taxonomy=taxonomy,
+        )
         rules: list[MappingOverrideRule] = []
-
         for concept in concepts:
-            concept_rules = await overrides_service.list_rules_for_concept(
-                concept=concept,
-                taxonomy=taxonomy,
-            )
-            rules.extend(concept_rules)
+            rules.extend(rules_by_concept.get(concept, ()))
 
         # Deduplicate by rule_id while preserving first occurrence.
         seen: set[str] = set()
@@ -11,6 +11,7 @@ from datetime import UTC, datetime
 from decimal import Decimal
 from uuid import uuid4
 
+from arche_api.application.interfaces.stage_timing import timed_stage
 from arche_api.application.schemas.dto.edgar_dq import RunStatementDQResultDTO
 from arche_api.application.uow import UnitOfWork
 from arche_api.domain.entities.edgar_dq import (
@@ -112,7 +113,8 @@ class RunStatementDQUseCase:
             facts_repo: EdgarFactsRepositoryProtocol = tx.get_repository(self._facts_repo_type)
             dq_repo: EdgarDQRepositoryProtocol = tx.get_repository(self._dq_repo_type)
 
-            facts = await facts_repo.list_facts_for_statement(identity=identity)
+            with timed_stage("dq.hydrate"):
+                facts = await facts_repo.list_facts_for_statement(identity=identity)
             if not facts:
                 raise EdgarIngestionError(
                     "Cannot run DQ: no facts exist for the target statement identity.",
@@ -125,12 +127,13 @@ class RunStatementDQUseCase:
                     },
                 )
 
-            fact_quality, anomalies = await self._evaluate_rules(
-                identity=identity,
-                facts=facts,
-                facts_repo=facts_repo,
-                history_lookback=req.history_lookback,
-            )
+            with timed_stage("dq.evaluate"):
+                fact_quality, anomalies = await self._evaluate_rules(
+                    identity=identity,
+                    facts=facts,
+                    facts_repo=facts_repo,
+                    history_lookback=req.history_lookback,
+                )
 
             dq_run_id = str(uuid4())
             executed_at = datetime.now(tz=UTC)
@@ -143,13 +146,13 @@ class RunStatementDQUseCase:
                 executed_at=executed_at,
             )
 
-            await dq_repo.create_run(
-                run=dq_run,
-                fact_quality=fact_quality,
-                anomalies=anomalies,
-            )
-
-            await tx.commit()
+            with timed_stage("dq.persist"):
+                await dq_repo.create_run(
+                    run=dq_run,
+                    fact_quality=fact_quality,
+                    anomalies=anomalies,
+                )
+                await tx.commit()
 
         max_severity = _max_severity(fact_quality, anomalies)
 
@@ -0,0 +1,158 @@
+# src/arche_api/application/use_cases/statements/screen_restatements.py
+# Copyright (c)
+# SPDX-License-Identifier: MIT
+"""Restatement screener use case.
+
+Purpose:
+    Answer universe-wide restatement questions (for example "which companies
+    restated revenue by more than 5% in FY2024 Q3") from the persisted
+    restatement ledger, instead of rebuilding a ledger per statement identity.
+
+Design:
+    * Pure application-layer orchestration:
+        - Validation of request parameters into a domain screen query.
+        - One repository call through a read-only UnitOfWork.
+    * No HTTP, logging, or persistence details are embedded here.
+
+Layer:
+    application/use_cases
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from typing import cast
+
+from arche_api.application.uow import UnitOfWork
+from arche_api.domain.entities.edgar_restatement_ledger import (
+    RestatementLedgerRecord,
+    RestatementScreenQuery,
+)
+from arche_api.domain.enums.canonical_statement_metric import CanonicalStatementMetric
+from arche_api.domain.enums.edgar import FiscalPeriod, MaterialityClass, StatementType
+from arche_api.domain.exceptions.edgar import EdgarMappingError
+from arche_api.domain.interfaces.repositories.edgar_restatement_ledger_repository import (
+    EdgarRestatementLedgerRepository,
+)
+
+#: Upper bound on records returned by a single screen.
+MAX_SCREEN_LIMIT = 5000
+
+
+@dataclass(slots=True)
+class ScreenRestatementsRequest:
+    """Parameter object describing a restatement screen.
+
+    Attributes:
+        statement_type: Statement type to screen.
+        metric: Optional canonical metric filter.
+        fiscal_year: Optional fiscal year filter (positive when set).
+        fiscal_period: Optional fiscal period filter.
+        min_abs_pct_change:
+            Optional minimum absolute relative change as a fraction
+            (``0.05`` = 5%).
+        min_materiality: Optional minimum materiality class.
+        restated_from: Optional inclusive lower bound on the restating filing date.
+        restated_to: Optional inclusive upper bound on the restating filing date.
+        limit: Maximum number of records (1..MAX_SCREEN_LIMIT).
+    """
+
+    statement_type: StatementType
+    metric: CanonicalStatementMetric | None = None
+    fiscal_year: int | None = None
+    fiscal_period: FiscalPeriod | None = None
+    min_abs_pct_change: Decimal | None = None
+    min_materiality: MaterialityClass | None = None
+    restated_from: date | None = None
+    restated_to: date | None = None
+    limit: int = 500
+
+
+@dataclass(slots=True)
+class ScreenRestatementsResult:
+    """Screen query and its matching ledger records."""
+
+    query: RestatementScreenQuery
+    records: Sequence[RestatementLedgerRecord]
+
+
+class ScreenRestatementsUseCase:
+    """Use case screening the persisted restatement ledger.
+
+    Args:
+        uow:
+            Unit-of-work instance providing access to the
+            :class:`EdgarRestatementLedgerRepository`.
+    """
+
+    def __init__(self, uow: UnitOfWork) -> None:
+        """Initialize the restatement screener use case.
+
+        Args:
+            uow:
+                Unit-of-work instance providing access to the
+                :class:`EdgarRestatementLedgerRepository`.
+        """
+        self._uow = uow
+
+    async def execute(self, req: ScreenRestatementsRequest) -> ScreenRestatementsResult:
+        """Execute the restatement screen.
+
+        Args:
+            req:
+                Screen filters and limit.
+
+        Returns:
+            A :class:`ScreenRestatementsResult` with the matching records.
+
+        Raises:
+            EdgarMappingError:
+                If the request parameters are invalid (non-positive
+                fiscal_year, limit out of range, negative threshold, or an
+                inverted date window).
+        """
+        if req.fiscal_year is not None and req.fiscal_year <= 0:
+            raise EdgarMappingError(
+                "fiscal_year must be a positive integer for screen_restatements().",
+                details={"fiscal_year": req.fiscal_year},
+            )
+        if not 1 <= req.limit <= MAX_SCREEN_LIMIT:
+            raise EdgarMappingError(
+                f"limit must be between 1 and {MAX_SCREEN_LIMIT} for screen_restatements().",
+                details={"limit": req.limit},
+            )
+
+        try:
+            query = RestatementScreenQuery(
+                statement_type=req.statement_type,
+                metric=req.metric,
+                fiscal_year=req.fiscal_year,
+                fiscal_period=req.fiscal_period,
+                min_abs_pct_change=req.min_abs_pct_change,
+                min_materiality=req.min_materiality,
+                restated_from=req.restated_from,
+                restated_to=req.restated_to,
+                limit=req.limit,
+            )
+        except ValueError as exc:
+            raise EdgarMappingError(str(exc)) from exc
+
+        async with self._uow as uow:
+            repo = cast(
+                EdgarRestatementLedgerRepository,
+                uow.get_repository(EdgarRestatementLedgerRepository),
+            )
+            records = await repo.screen(query=query)
+
+        return ScreenRestatementsResult(query=query, records=records)
+
+
+__all__ = [
+    "MAX_SCREEN_LIMIT",
+    "ScreenRestatementsRequest",
+    "ScreenRestatementsResult",
+    "ScreenRestatementsUseCase",
+]
@@ -78,6 +78,59 @@ class Settings(BaseSettings):
         validation_alias="DATABASE_URL",
     )
 
+    database_replica_urls: str | None = Field(
+        default=None,
+        description=(
+            "Comma-separated SQLAlchemy async URLs of read replicas. Read-only units "
+            "of work are routed to them; unset means every query uses the primary."
+        ),
+        validation_alias="DATABASE_REPLICA_URLS",
+    )
+    database_replica_max_lag_seconds: float = Field(
+        default=5.0,
+        ge=0,
+        description="Replication lag above which a replica receives no reads.",
+        validation_alias="DATABASE_REPLICA_MAX_LAG_SECONDS",
+    )
+    database_replica_lag_check_interval_seconds: float = Field(
+        default=5.0,
+        gt=0,
+        description="Interval between replica lag measurements in seconds.",
+        validation_alias="DATABASE_REPLICA_LAG_CHECK_INTERVAL_SECONDS",
+    )
+    edgar_identity_cache_max_entries: int = Field(
+        default=50_000,
+        ge=0,
+        description=(
+            "Max CIK and accession identities cached in-process by the EDGAR "
+            "repositories (each). 0 disables the identity map."
+        ),
+        validation_alias="EDGAR_IDENTITY_CACHE_MAX_ENTRIES",
+    )
+    edgar_identity_negative_ttl_seconds: float = Field(
+        default=30.0,
+        ge=0,
+        description="How long an unknown CIK or accession is remembered as missing.",
+        validation_alias="EDGAR_IDENTITY_NEGATIVE_TTL_SECONDS",
+    )
+    edgar_identity_warm_ciks: str | None = Field(
+        default=None,
+        description=(
+            "Comma-separated CIKs to preload into the identity map at startup. "
+            "Unset preloads every company with statement versions, up to the cap."
+        ),
+        validation_alias="EDGAR_IDENTITY_WARM_CIKS",
+    )
+    edgar_asyncpg_fast_path: bool = Field(
+        default=False,
+        description=(
+            "Run hot EDGAR reads (statement versions, latest payloads, facts) as "
+            "prepared asyncpg queries mapped straight to domain entities, bypassing "
+            "ORM hydration. Only applies when the database driver is asyncpg."
+        ),
+        validation_alias="EDGAR_ASYNCPG_FAST_PATH",
+    )
+
     db_schema: str | None = Field(
         default="public",
         description="Default PostgreSQL schema for core tables.",
@@ -177,6 +230,18 @@ class Settings(BaseSettings):
         description="TTL for Clerk JWKS entries in Redis.",
         validation_alias="CLERK_JWKS_TTL_SECONDS",
     )
+    clerk_jwks_background_refresh: bool = Field(
+        default=True,
+        description="Keep the Clerk JWKS warm with a background refresher (needs CLERK_ISSUER).",
+        validation_alias="CLERK_JWKS_BACKGROUND_REFRESH",
+    )
+    auth_token_cache_max_entries: int = Field(
+        default=10_000,
+        ge=1,
+        le=1_000_000,
+        description="Max verified JWTs cached (by digest) to skip re-verification until exp.",
+        validation_alias="AUTH_TOKEN_CACHE_MAX_ENTRIES",
+    )
     clerk_secret_key: str | None = Field(
         default=None,
         description="Optional Clerk server secret (not required if using JWKS only).",
@@ -298,6 +363,22 @@ class Settings(BaseSettings):
         validation_alias="MCP_HTTP_BEARER_TOKEN",
     )
 
+    # ---------------------------
+    # Outbound HTTP pools
+    # ---------------------------
+    http_client_http2: bool = Field(
+        default=False,
+        description="Negotiate HTTP/2 on pooled outbound clients (requires the h2 package).",
+        validation_alias="HTTP_CLIENT_HTTP2",
+    )
+    http_client_keepalive_expiry_s: float = Field(
+        default=30.0,
+        ge=0.0,
+        le=600.0,
+        description="Seconds an idle pooled outbound connection is kept alive.",
+        validation_alias="HTTP_CLIENT_KEEPALIVE_EXPIRY_S",
+    )
+
     # ---------------------------
     # Logging
     # ---------------------------
@@ -306,6 +387,85 @@ class Settings(BaseSettings):
         description="Override log level (e.g., 'DEBUG', 'INFO'). If not set, defaults are used.",
         validation_alias="LOG_LEVEL",
     )
+    log_async: bool = Field(
+        default=False,
+        description="Write logs from a background thread via a bounded queue (non-blocking).",
+        validation_alias="LOG_ASYNC",
+    )
+    log_queue_size: int = Field(
+        default=10_000,
+        ge=1,
+        le=1_000_000,
+        description="Capacity of the async logging queue.",
+        validation_alias="LOG_QUEUE_SIZE",
+    )
+    log_drop_policy: Literal["drop", "block"] = Field(
+        default="drop",
+        description=(
+            "When the async log queue is full: 'drop' (never block) or 'block' "
+            "(WARNING+ waits for space; lower levels are dropped)."
+        ),
+        validation_alias="LOG_DROP_POLICY",
+    )
+    log_extra_max_items: int = Field(
+        default=50,
+        ge=1,
+        description="Max items kept per list/mapping field in structured log extras.",
+        validation_alias="LOG_EXTRA_MAX_ITEMS",
+    )
+    log_extra_max_chars: int = Field(
+        default=2048,
+        ge=16,
+        description="Max characters kept per string field in structured log extras.",
+        validation_alias="LOG_EXTRA_MAX_CHARS",
+    )
+    log_success_sample_rates: dict[str, float] = Field(
+        default_factory=dict,
+        description=(
+            "Keep rates for success-path access logs by path prefix as JSON, "
+            'e.g. \'{"/v1/quotes": 0.1, "*": 1.0}\'.'
+        ),
+        validation_alias="LOG_SUCCESS_SAMPLE_RATES",
+    )
+
+    # ---------------------------
+    # Router groups
+    # ---------------------------
+    router_groups: str = Field(
+        default="all",
+        description=(
+            "Comma-separated router groups to mount: core, quotes, edgar, mcp or 'all'. "
+            "Disabled groups are never imported; 'core' is always mounted."
+        ),
+        validation_alias="ROUTER_GROUPS",
+    )
+
+    # ---------------------------
+    # Readiness sampling
+    # ---------------------------
+    health_sampler_enabled: bool = Field(
+        default=True,
+        description="Serve readiness from a background sampler instead of probing per request.",
+        validation_alias="HEALTH_SAMPLER_ENABLED",
+    )
+    health_sample_interval_seconds: float = Field(
+        default=5.0,
+        gt=0,
+        description="Interval between background readiness samples in seconds.",
+        validation_alias="HEALTH_SAMPLE_INTERVAL_SECONDS",
+    )
+    health_probe_timeout_seconds: float = Field(
+        default=1.0,
+        gt=0,
+        description="Per-dependency readiness probe timeout in seconds.",
+        validation_alias="HEALTH_PROBE_TIMEOUT_SECONDS",
+    )
+    health_sample_max_age_seconds: float = Field(
+        default=30.0,
+        gt=0,
+        description="Age after which a readiness sample is stale and reported as degraded.",
+        validation_alias="HEALTH_SAMPLE_MAX_AGE_SECONDS",
+    )
 
     # ---------------------------
     # OTEL / observability
@@ -320,6 +480,86 @@ class Settings(BaseSettings):
         description="OTLP endpoint for OTEL exporters (traces/metrics).",
         validation_alias="OTEL_EXPORTER_OTLP_ENDPOINT",
     )
+    otel_traces_sample_ratio: float = Field(
+        default=1.0,
+        ge=0.0,
+        le=1.0,
+        description="Head sampling ratio for new (root) traces; children follow their parent.",
+        validation_alias="OTEL_TRACES_SAMPLE_RATIO",
+    )
+    otel_traces_route_sample_ratios: dict[str, float] = Field(
+        default_factory=lambda: {"/health": 0.0, "/metrics": 0.0},
+        description=(
+            "JSON map of path prefix to head sampling ratio; the longest matching "
+            "prefix overrides OTEL_TRACES_SAMPLE_RATIO. Routes at 0 are never recorded."
+        ),
+        validation_alias="OTEL_TRACES_ROUTE_SAMPLE_RATIOS",
+    )
+    otel_traces_keep_errors: bool = Field(
+        default=True,
+        description="Export unsampled traces that contain an error span (tail promotion).",
+        validation_alias="OTEL_TRACES_KEEP_ERRORS",
+    )
+    otel_traces_slow_threshold_ms: float | None = Field(
+        default=1000.0,
+        gt=0,
+        description="Export unsampled traces whose root ran at least this long; unset disables.",
+        validation_alias="OTEL_TRACES_SLOW_THRESHOLD_MS",
+    )
+    otel_bsp_max_queue_size: int = Field(
+        default=2048,
+        ge=1,
+        description="Bound on spans queued for export; overflow is dropped and counted.",
+        validation_alias="OTEL_BSP_MAX_QUEUE_SIZE",
+    )
+    otel_bsp_max_export_batch_size: int = Field(
+        default=512,
+        ge=1,
+        description="Maximum spans per OTLP export call (must not exceed the queue size).",
+        validation_alias="OTEL_BSP_MAX_EXPORT_BATCH_SIZE",
+    )
+    otel_bsp_schedule_delay_ms: int = Field(
+        default=5000,
+        ge=1,
+        description="Delay between span export batches (milliseconds).",
+        validation_alias="OTEL_BSP_SCHEDULE_DELAY",
+    )
+    stage_timing_enabled: bool = Field(
+        default=True,
+        description=(
+            "Time use-case pipeline stages (histogram arche_stage_duration_seconds, "
+            "plus a span per stage when OTEL is enabled)."
+        ),
+        validation_alias="STAGE_TIMING_ENABLED",
+    )
+    server_timing_enabled: bool = Field(
+        default=False,
+        description="Report the per-request stage breakdown in a Server-Timing header.",
+        validation_alias="SERVER_TIMING_ENABLED",
+    )
+    json_backend: Literal["auto", "orjson", "stdlib"] = Field(
+        default="auto",
+        description=(
+            "JSON codec for responses, ETags and the Redis cache; 'auto' uses orjson "
+            "when the fastjson extra is installed."
+        ),
+        validation_alias="JSON_BACKEND",
+    )
+    profiling_enabled: bool = Field(
+        default=False,
+        description=(
+            "Expose the admin sampling profiler (/v1/admin/profile). Callers need "
+            "ADMIN_API_KEY or, with auth enabled, a token with the admin:profile scope."
+        ),
+        validation_alias="PROFILING_ENABLED",
+    )
+    profiling_max_seconds: float = Field(
+        default=30.0,
+        gt=0,
+        le=300,
+        description="Upper bound on a single profile's duration (seconds).",
+        validation_alias="PROFILING_MAX_SECONDS",
+    )
 
     # ---------------------------
     # Rate limiting
@@ -348,6 +588,36 @@ class Settings(BaseSettings):
         description="Maximum number of requests per key in a single window.",
         validation_alias="RATE_LIMIT_BURST",
     )
+    rate_limit_plans: dict[str, str] = Field(
+        default_factory=dict,
+        description=(
+            'Named plan quotas as JSON (<limit>/<window seconds>), e.g. \'{"pro": "600/60"}\'.'
+        ),
+        validation_alias="RATE_LIMIT_PLANS",
+    )
+    rate_limit_api_key_plans: dict[str, str] = Field(
+        default_factory=dict,
+        description=(
+            "JSON map of SHA-256(X-Api-Key) hex digest to plan name. Keys not "
+            "listed here are rate limited by client IP."
+        ),
+        validation_alias="RATE_LIMIT_API_KEY_PLANS",
+    )
+    rate_limit_route_quotas: dict[str, str] = Field(
+        default_factory=dict,
+        description=(
+            "JSON map of path prefix to quota (<limit>/<window seconds>); matching "
+            "routes get their own bucket per client."
+        ),
+        validation_alias="RATE_LIMIT_ROUTE_QUOTAS",
+    )
+    rate_limit_max_local_keys: int = Field(
+        default=10_000,
+        ge=1,
+        le=10_000_000,
+        description="Max buckets kept by the in-memory limiter (and the Redis fallback).",
+        validation_alias="RATE_LIMIT_MAX_LOCAL_KEYS",
+    )
 
     # ---------------------------
     # Idempotency
@@ -364,6 +634,32 @@ class Settings(BaseSettings):
         description="Idempotency dedupe window in seconds (default 24 hours).",
         validation_alias="IDEMPOTENCY_TTL_SECONDS",
     )
+    idempotency_backend: str = Field(
+        default="redis",
+        description=(
+            "Idempotency hot store: 'redis' (SET NX locking + replay, async Postgres audit) "
+            "or 'db' (Postgres only)."
+        ),
+        validation_alias="IDEMPOTENCY_BACKEND",
+    )
+    idempotency_persist_audit: bool = Field(
+        default=True,
+        description="With the Redis store, also write completed keys to Postgres for audit.",
+        validation_alias="IDEMPOTENCY_PERSIST_AUDIT",
+    )
+    idempotency_prune_interval_seconds: int = Field(
+        default=300,
+        ge=0,
+        description="Interval of the expired-key pruner in seconds (0 disables it).",
+        validation_alias="IDEMPOTENCY_PRUNE_INTERVAL_SECONDS",
+    )
+    idempotency_prune_batch_size: int = Field(
+        default=1000,
+        ge=1,
+        le=100_000,
+        description="Maximum expired idempotency rows deleted per statement.",
+        validation_alias="IDEMPOTENCY_PRUNE_BATCH_SIZE",
+    )
 
     # ---------------------------
     # Paddle / billing
@@ -526,6 +822,11 @@ class Settings(BaseSettings):
                     "(CLERK_FRONTEND_API + CLERK_PUBLISHER).",
                 )
 
+        # --- Trace sampling ---
+        bad = {k: v for k, v in self.otel_traces_route_sample_ratios.items() if not 0 <= v <= 1}
+        if bad:
+            raise ValueError(f"OTEL_TRACES_ROUTE_SAMPLE_RATIOS values must be in [0, 1]: {bad}")
+
         return self
 
     @model_validator(mode="after")
@@ -607,10 +908,15 @@ def get_settings() -> Settings:
                 "idempotency": {
                     "enabled": settings.idempotency_enabled,
                     "ttl_seconds": settings.idempotency_ttl_seconds,
+                    "backend": settings.idempotency_backend,
                 },
                 "paddle_env": settings.paddle_env if settings.paddle_env else None,
                 "otel_enabled": settings.otel_enabled,
                 "otel_endpoint_set": bool(settings.otel_exporter_otlp_endpoint),
+                "otel_traces_sample_ratio": settings.otel_traces_sample_ratio,
+                "stage_timing_enabled": settings.stage_timing_enabled,
+                "server_timing_enabled": settings.server_timing_enabled,
+                "json_backend": settings.json_backend,
                 "db_schema": settings.db_schema,
                 "marketstack_base_url": settings.marketstack_base_url,
                 "marketstack_timeout_s": settings.marketstack_timeout_s,
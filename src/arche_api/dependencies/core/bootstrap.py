@@ -8,19 +8,26 @@ It is intentionally thin: configuration is read from Settings, and all heavy
 lifting is delegated to the infrastructure modules.
 
 The single public surface is :func:`bootstrap`, an async context manager that
-yields a simple state object with the resolved Settings and shared HTTP client.
+yields a simple state object with the resolved Settings, the shared HTTP client
+and the per-provider pooled HTTP transports.
 """
 
 from __future__ import annotations
 
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 import httpx
 from fastapi import FastAPI
 
 from arche_api.config.settings import Settings, get_settings
+from arche_api.infrastructure.http.transport import (
+    DEFAULT_PROVIDER_POOLS,
+    HTTPTransportRegistry,
+    PoolConfig,
+    set_http_transport_registry,
+)
 from arche_api.infrastructure.logging.logger import get_json_logger
 
 logger = get_json_logger(__name__)
@@ -32,6 +39,20 @@ class BootstrapState:
 
     settings: Settings
     http_client: httpx.AsyncClient
+    transports: HTTPTransportRegistry
+
+
+def _provider_pools(settings: Settings) -> dict[str, PoolConfig]:
+    """Return the per-provider pool configuration derived from Settings."""
+    keepalive = float(settings.http_client_keepalive_expiry_s)
+    pools = {
+        name: replace(cfg, keepalive_expiry_s=keepalive)
+        for name, cfg in DEFAULT_PROVIDER_POOLS.items()
+    }
+    pools["marketstack"] = replace(
+        pools["marketstack"], timeout_s=float(settings.marketstack_timeout_s)
+    )
+    return pools
 
 
 @asynccontextmanager
@@ -43,13 +64,14 @@ async def bootstrap(app: FastAPI) -> AsyncGenerator[BootstrapState, None]:
         * Initialize DB engine/sessionmaker.
         * Initialize Redis client.
         * Create a shared HTTPX AsyncClient.
+        * Install the process-wide pooled HTTP transport registry.
         * Ensure all of the above are shut down on exit, even on error.
 
     Args:
         app: FastAPI application instance (unused today, reserved for future hooks).
 
     Yields:
-        BootstrapState: Resolved settings and shared HTTP client.
+        BootstrapState: Resolved settings, shared HTTP client and transports.
     """
     settings: Settings = get_settings()
     logger.info("bootstrap.start")
@@ -63,13 +85,25 @@ async def bootstrap(app: FastAPI) -> AsyncGenerator[BootstrapState, None]:
     redis_client.init_redis(settings)
 
     http_client = httpx.AsyncClient()
+    transports = HTTPTransportRegistry(
+        _provider_pools(settings),
+        default=http_client,
+        http2=settings.http_client_http2,
+    )
+    set_http_transport_registry(transports)
 
-    state = BootstrapState(settings=settings, http_client=http_client)
+    state = BootstrapState(settings=settings, http_client=http_client, transports=transports)
 
     try:
         yield state
     finally:
-        # Close HTTP client
+        # Close pooled provider transports, then the shared HTTP client
+        set_http_transport_registry(None)
+        try:
+            await transports.aclose()
+        except Exception:
+            logger.exception("bootstrap.http_transports_close_failed")
+
         try:
             await http_client.aclose()
         except Exception:
@@ -37,7 +37,6 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Any, cast
 
-import httpx
 from pydantic import SecretStr
 
 from arche_api.adapters.gateways.marketstack_gateway import MarketstackGateway
@@ -52,6 +51,7 @@ from arche_api.infrastructure.caching.json_cache import RedisJsonCache
 from arche_api.infrastructure.external_apis.marketstack.settings import (
     MarketstackSettings,
 )
+from arche_api.infrastructure.http.transport import get_http_transport_registry
 
 logger = logging.getLogger(__name__)
 
@@ -151,10 +151,7 @@ def _build_real_gateway(settings: MarketstackSettings) -> MarketstackGateway:
     if not key:
         raise MarketDataValidationError("Marketstack access key is required for real gateway")
 
-    client = httpx.AsyncClient(
-        base_url=settings.base_url,
-        timeout=settings.timeout_s,
-    )
+    client = get_http_transport_registry().client("marketstack")
     return MarketstackGateway(client=client, settings=settings)
 
 
@@ -382,16 +379,8 @@ async def get_historical_quotes_use_case() -> AsyncGenerator[GetHistoricalQuotes
         if _is_deterministic_mode(ms_settings)
         else _build_real_gateway(ms_settings)
     )
-    uc = GetHistoricalQuotesUseCase(cache=cache, gateway=gateway)
-    try:
-        yield uc
-    finally:
-        # Real gateway owns an AsyncClient; deterministic gateway does not.
-        if isinstance(gateway, MarketstackGateway) and hasattr(gateway, "client"):
-            try:
-                await gateway.client.aclose()
-            except Exception:  # pragma: no cover
-                logger.exception("error closing Marketstack HTTP client")
+    # The real gateway borrows the process-wide Marketstack pool; nothing to close.
+    yield GetHistoricalQuotesUseCase(cache=cache, gateway=gateway)
 
 
 # =============================================================================
@@ -0,0 +1,167 @@
+# src/arche_api/domain/entities/edgar_restatement_ledger.py
+# Copyright (c) Arche.
+# SPDX-License-Identifier: MIT
+"""Persisted restatement ledger entities.
+
+Purpose:
+    Represent the per-metric rows of the persisted restatement ledger and the
+    filter used to screen them across the whole universe of filers.
+
+    A ledger record is one changed canonical metric on one hop between
+    adjacent normalized statement versions (``from_version_sequence`` →
+    ``to_version_sequence``). Magnitude (absolute and relative change) and a
+    materiality class are precomputed so that universe-wide questions such as
+    "which companies restated revenue by more than 5% last quarter" can be
+    answered without rebuilding ledgers per identity.
+
+Layer:
+    domain/entities
+
+Notes:
+    - Pure domain value objects; no persistence or HTTP concerns.
+    - All numeric values are :class:`decimal.Decimal`.
+    - ``pct_change`` is ``diff / |old_value|`` and is None when the old value
+      is zero (the relative change is undefined).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+
+from arche_api.domain.enums.canonical_statement_metric import CanonicalStatementMetric
+from arche_api.domain.enums.edgar import (
+    AccountingStandard,
+    FiscalPeriod,
+    MaterialityClass,
+    StatementType,
+)
+
+#: Ordering of materiality classes, lowest first.
+MATERIALITY_ORDER: tuple[MaterialityClass, ...] = (
+    MaterialityClass.NONE,
+    MaterialityClass.LOW,
+    MaterialityClass.MEDIUM,
+    MaterialityClass.HIGH,
+)
+
+
+@dataclass(frozen=True)
+class RestatementLedgerRecord:
+    """Single changed metric on one restatement hop.
+
+    Attributes:
+        cik: Central Index Key for the filer.
+        statement_type: Statement type of the identity.
+        accounting_standard: Accounting standard of the identity.
+        statement_date: Reporting period end date.
+        fiscal_year: Fiscal year of the identity.
+        fiscal_period: Fiscal period of the identity.
+        currency: ISO 4217 currency code of the values.
+        from_version_sequence: Version sequence of the "from" side of the hop.
+        to_version_sequence: Version sequence of the "to" side of the hop.
+        metric: Canonical metric that changed.
+        old_value: Value in the "from" version.
+        new_value: Value in the "to" version.
+        diff: ``new_value - old_value``.
+        pct_change: ``diff / |old_value|``, or None when ``old_value`` is zero.
+        materiality: Materiality class of the change.
+        restated_on: Filing date of the "to" version, when known.
+    """
+
+    cik: str
+    statement_type: StatementType
+    accounting_standard: AccountingStandard
+    statement_date: date
+    fiscal_year: int
+    fiscal_period: FiscalPeriod
+    currency: str
+    from_version_sequence: int
+    to_version_sequence: int
+    metric: CanonicalStatementMetric
+    old_value: Decimal
+    new_value: Decimal
+    diff: Decimal
+    pct_change: Decimal | None
+    materiality: MaterialityClass
+    restated_on: date | None = None
+
+    def __post_init__(self) -> None:
+        """Enforce core invariants for ledger records."""
+        if not self.cik.strip():
+            raise ValueError("RestatementLedgerRecord.cik must be a non-empty string.")
+        if self.from_version_sequence >= self.to_version_sequence:
+            raise ValueError(
+                "RestatementLedgerRecord.from_version_sequence must precede "
+                "to_version_sequence.",
+            )
+        if self.diff != self.new_value - self.old_value:
+            raise ValueError("RestatementLedgerRecord.diff must equal new_value - old_value.")
+
+    @property
+    def abs_diff(self) -> Decimal:
+        """Return the absolute change."""
+        return self.diff.copy_abs()
+
+    @property
+    def abs_pct_change(self) -> Decimal | None:
+        """Return the absolute relative change, or None when undefined."""
+        return self.pct_change.copy_abs() if self.pct_change is not None else None
+
+
+@dataclass(frozen=True)
+class RestatementScreenQuery:
+    """Universe-wide restatement screen over the persisted ledger.
+
+    Attributes:
+        statement_type: Statement type to screen (required).
+        metric: Optional canonical metric to restrict to.
+        fiscal_year: Optional fiscal year of the restated statements.
+        fiscal_period: Optional fiscal period of the restated statements.
+        min_abs_pct_change:
+            Optional lower bound (inclusive) on ``|pct_change|`` expressed as
+            a fraction (``0.05`` = 5%). Records with an undefined relative
+            change never match this bound.
+        min_materiality: Optional lower bound (inclusive) on materiality.
+        restated_from: Optional inclusive lower bound on ``restated_on``.
+        restated_to: Optional inclusive upper bound on ``restated_on``.
+        limit: Maximum number of records to return.
+    """
+
+    statement_type: StatementType
+    metric: CanonicalStatementMetric | None = None
+    fiscal_year: int | None = None
+    fiscal_period: FiscalPeriod | None = None
+    min_abs_pct_change: Decimal | None = None
+    min_materiality: MaterialityClass | None = None
+    restated_from: date | None = None
+    restated_to: date | None = None
+    limit: int = 500
+
+    def __post_init__(self) -> None:
+        """Enforce query invariants."""
+        if self.limit <= 0:
+            raise ValueError("RestatementScreenQuery.limit must be a positive integer.")
+        if self.min_abs_pct_change is not None and self.min_abs_pct_change < 0:
+            raise ValueError("RestatementScreenQuery.min_abs_pct_change must be non-negative.")
+        if (
+            self.restated_from is not None
+            and self.restated_to is not None
+            and self.restated_from > self.restated_to
+        ):
+            raise ValueError("RestatementScreenQuery.restated_from must not be after restated_to.")
+
+    @property
+    def materiality_classes(self) -> tuple[MaterialityClass, ...] | None:
+        """Return the materiality classes admitted by ``min_materiality``."""
+        if self.min_materiality is None:
+            return None
+        return MATERIALITY_ORDER[MATERIALITY_ORDER.index(self.min_materiality) :]
+
+
+__all__ = [
+    "MATERIALITY_ORDER",
+    "RestatementLedgerRecord",
+    "RestatementScreenQuery",
+]
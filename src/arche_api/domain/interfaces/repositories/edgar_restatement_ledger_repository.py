@@ -0,0 +1,82 @@
+# src/arche_api/domain/interfaces/repositories/edgar_restatement_ledger_repository.py
+# Copyright (c) Arche.
+# SPDX-License-Identifier: MIT
+"""EDGAR restatement ledger repository interface.
+
+Purpose:
+    Define persistence and screening operations for the precomputed
+    restatement ledger: per-metric deltas between adjacent normalized
+    statement versions, written when a normalized version is stored.
+
+Layer:
+    domain/interfaces/repositories
+
+Notes:
+    Implementations live in the adapters/infrastructure layers and must keep
+    screens answerable with a single indexed scan (no per-identity ledger
+    rebuilds). Deterministic ordering is required for reproducible screens.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Protocol
+
+from arche_api.domain.entities.edgar_dq import NormalizedStatementIdentity
+from arche_api.domain.entities.edgar_restatement_ledger import (
+    RestatementLedgerRecord,
+    RestatementScreenQuery,
+)
+
+
+class EdgarRestatementLedgerRepository(Protocol):
+    """Protocol for repositories managing the persisted restatement ledger."""
+
+    async def replace_hop(
+        self,
+        *,
+        identity: NormalizedStatementIdentity,
+        from_version_sequence: int,
+        records: Sequence[RestatementLedgerRecord],
+    ) -> None:
+        """Replace the ledger records of one hop.
+
+        The hop is keyed by ``identity`` (whose ``version_sequence`` is the
+        "to" side) and ``from_version_sequence``. Existing records for the
+        "to" version are removed first, so re-normalizing a version or
+        normalizing an earlier version out of order leaves exactly one hop
+        per "to" version. An empty ``records`` clears the hop.
+
+        Args:
+            identity:
+                Statement identity of the "to" version.
+            from_version_sequence:
+                Version sequence of the "from" side of the hop.
+            records:
+                Ledger records for the hop (changed metrics only).
+        """
+
+    async def screen(
+        self,
+        *,
+        query: RestatementScreenQuery,
+    ) -> Sequence[RestatementLedgerRecord]:
+        """Screen the ledger across all filers.
+
+        Args:
+            query:
+                Screen filters and limit.
+
+        Returns:
+            Matching records ordered by:
+
+                - |pct_change| DESC NULLS FIRST
+                - cik ASC
+                - fiscal_year DESC
+                - fiscal_period ASC
+                - to_version_sequence ASC
+                - metric_code ASC
+        """
+
+
+__all__ = ["EdgarRestatementLedgerRepository"]
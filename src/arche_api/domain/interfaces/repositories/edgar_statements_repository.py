@@ -20,13 +20,17 @@ Notes:
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
 from datetime import date
 from typing import Protocol
 
+from arche_api.domain.entities.canonical_statement_payload import (
+    CanonicalStatementPayload,
+)
 from arche_api.domain.entities.edgar_company import EdgarCompanyIdentity
 from arche_api.domain.entities.edgar_statement_version import EdgarStatementVersion
 from arche_api.domain.enums.edgar import FiscalPeriod, StatementType
+from arche_api.domain.value_objects import StatementKeyset, StatementVersionsFingerprint
 
 
 class EdgarStatementsRepository(Protocol):
@@ -136,3 +140,119 @@ class EdgarStatementsRepository(Protocol):
         Returns:
             Deterministically ordered versions for the given identity tuple.
         """
+
+    # ------------------------------------------------------------------
+    # Keyset-paginated API used by time-series use cases
+    # ------------------------------------------------------------------
+
+    async def list_latest_statement_payloads(
+        self,
+        *,
+        ciks: Sequence[str],
+        statement_type: StatementType,
+        fiscal_periods: Sequence[FiscalPeriod],
+        from_date: date,
+        to_date: date,
+        after: StatementKeyset | None = None,
+        before: StatementKeyset | None = None,
+        limit: int | None = None,
+    ) -> Sequence[CanonicalStatementPayload]:
+        """List latest normalized payloads per (cik, statement_date, fiscal_period).
+
+        For every identity in the window, only the highest version_sequence
+        carrying a normalized payload is returned. Results are always ordered
+        by (cik, statement_date, fiscal_period) ascending.
+
+        Args:
+            ciks: Universe of company CIKs.
+            statement_type: Statement type to filter by.
+            fiscal_periods: Fiscal periods to include.
+            from_date: Inclusive lower bound on statement_date.
+            to_date: Inclusive upper bound on statement_date.
+            after: When provided, only rows strictly after this keyset.
+            before: When provided, only rows strictly before this keyset;
+                combined with ``limit`` this returns the ``limit`` rows
+                immediately preceding it (history windows).
+            limit: Optional maximum number of rows to return.
+
+        Returns:
+            Canonical payloads in keyset order.
+        """
+
+    def stream_latest_statement_payloads(
+        self,
+        *,
+        ciks: Sequence[str],
+        statement_type: StatementType,
+        fiscal_periods: Sequence[FiscalPeriod],
+        from_date: date,
+        to_date: date,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[CanonicalStatementPayload]:
+        """Stream latest normalized payloads per (cik, statement_date, fiscal_period).
+
+        Same selection and ordering as :meth:`list_latest_statement_payloads`,
+        but rows are fetched from a server-side cursor ``batch_size`` at a
+        time so memory stays constant regardless of the panel size.
+
+        Args:
+            ciks: Universe of company CIKs.
+            statement_type: Statement type to filter by.
+            fiscal_periods: Fiscal periods to include.
+            from_date: Inclusive lower bound on statement_date.
+            to_date: Inclusive upper bound on statement_date.
+            batch_size: Number of rows fetched from the cursor per round trip.
+
+        Returns:
+            Async iterator over canonical payloads in keyset order.
+        """
+        ...
+
+    async def count_latest_statement_payloads(
+        self,
+        *,
+        ciks: Sequence[str],
+        statement_type: StatementType,
+        fiscal_periods: Sequence[FiscalPeriod],
+        from_date: date,
+        to_date: date,
+    ) -> int:
+        """Count the rows :meth:`list_latest_statement_payloads` would return.
+
+        Implementations must answer from an aggregate query without loading
+        payloads, so paginated reads can report a total cheaply.
+
+        Args:
+            ciks: Universe of company CIKs.
+            statement_type: Statement type to filter by.
+            fiscal_periods: Fiscal periods to include.
+            from_date: Inclusive lower bound on statement_date.
+            to_date: Inclusive upper bound on statement_date.
+
+        Returns:
+            Number of latest payloads in the window.
+        """
+
+    async def get_statement_versions_fingerprint(
+        self,
+        *,
+        ciks: Sequence[str],
+        statement_type: StatementType,
+        from_date: date | None = None,
+        to_date: date | None = None,
+    ) -> StatementVersionsFingerprint:
+        """Return an aggregate change marker for statement versions in scope.
+
+        Implementations must answer from a single aggregate query without
+        loading payloads, so callers can validate cached representations
+        before doing any expensive work.
+
+        Args:
+            ciks: Universe of company CIKs.
+            statement_type: Statement type to filter by.
+            from_date: Optional inclusive lower bound on statement_date.
+            to_date: Optional inclusive upper bound on statement_date.
+
+        Returns:
+            Fingerprint of the versions in scope.
+        """
@@ -19,7 +19,7 @@ Notes:
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Collection, Mapping, Sequence
 from typing import Protocol
 
 from arche_api.domain.services.xbrl_mapping_overrides import MappingOverrideRule
@@ -71,3 +71,26 @@ class XBRLMappingOverridesRepository(Protocol):
             candidates rather than filtering too aggressively.
         """
         ...
+
+    async def list_rules_for_concepts(
+        self,
+        *,
+        concepts: Collection[str],
+        taxonomy: str | None = None,
+    ) -> Mapping[str, Sequence[MappingOverrideRule]]:
+        """Return override rules for a set of concepts in a single lookup.
+
+        Args:
+            concepts:
+                XBRL concept QNames for which rules should be retrieved.
+            taxonomy:
+                Optional taxonomy identifier, with the same semantics as in
+                :meth:`list_rules_for_concept`.
+
+        Returns:
+            Mapping[str, Sequence[MappingOverrideRule]]: Rules grouped by
+            concept. Every requested concept is present (possibly with an
+            empty sequence); keys are in sorted order and rules within a
+            concept are in a stable, repository-defined order.
+        """
+        ...
@@ -47,6 +47,10 @@ DECIMAL_ONE = Decimal("1")
 DECIMAL_EPSILON = Decimal("1e-9")  # Guard for tiny denominators.
 RATIO_SCALE = Decimal("1e-6")  # Used for ratio quantization (6 decimal places).
 
+# Version of the metric formulas. Bump whenever a formula or its rounding
+# changes so that HTTP validators derived from stored data are invalidated.
+DERIVED_METRICS_ENGINE_VERSION = "1"
+
 
 class MetricFailureReason(str, Enum):
     """Reasons why a derived metric could not be computed."""
@@ -1073,5 +1077,6 @@ __all__ = [
     "DerivedMetricsResult",
     "DERIVED_METRIC_SPECS",
     "DERIVED_METRIC_REGISTRY",
+    "DERIVED_METRICS_ENGINE_VERSION",
     "DerivedMetricsEngine",
 ]
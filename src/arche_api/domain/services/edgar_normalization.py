@@ -132,6 +132,69 @@ class EdgarFact:
     dimensions: Mapping[str, str]
 
 
+class EdgarFactIndex:
+    """Facts grouped by concept, pre-sorted, with pre-parsed Decimal values.
+
+    Building the index is linear in the number of facts; metric resolution
+    then only touches the candidates of the registry concepts. One index can
+    be shared by every statement type normalized from the same facts (see
+    :class:`~arche_api.domain.services.xbrl_document_index.XBRLDocumentIndex`).
+
+    Args:
+        facts:
+            Facts to index.
+        values:
+            Optional raw Decimal per fact (same order as ``facts``; None where
+            the value does not parse). Parsed here when omitted.
+    """
+
+    def __init__(
+        self,
+        facts: Sequence[EdgarFact],
+        values: Sequence[Decimal | None] | None = None,
+    ) -> None:
+        """Group and sort the facts."""
+        if values is None:
+            values = [_try_decimal(fact.value) for fact in facts]
+        elif len(values) != len(facts):
+            raise ValueError("values must align with facts.")
+
+        buckets: dict[str, list[tuple[EdgarFact, Decimal | None]]] = defaultdict(list)
+        for fact, value in zip(facts, values, strict=True):
+            buckets[fact.concept].append((fact, value))
+
+        # Sorted once by (period_end or instant_date, fact_id); sort is stable,
+        # so filtering a bucket later preserves the per-call sort order.
+        self._by_concept: dict[str, tuple[tuple[EdgarFact, Decimal | None], ...]] = {
+            concept: tuple(sorted(entries, key=lambda e: _fact_sort_key(e[0])))
+            for concept, entries in buckets.items()
+        }
+
+    @property
+    def concepts(self) -> frozenset[str]:
+        """Concepts with at least one fact."""
+        return frozenset(self._by_concept)
+
+    def facts_for(self, concept: str) -> tuple[EdgarFact, ...]:
+        """Return the facts for ``concept`` in selection order."""
+        return tuple(fact for fact, _ in self._by_concept.get(concept, ()))
+
+    def select(self, concept: str, currency: str) -> tuple[EdgarFact, Decimal | None] | None:
+        """Return the fact that feeds ``concept`` and its pre-parsed value.
+
+        Prefers facts whose unit matches ``currency``; among the remaining
+        candidates the most recent (highest ``(date, fact_id)``) wins.
+        """
+        entries = self._by_concept.get(concept)
+        if not entries:
+            return None
+        currency_upper = currency.upper().strip()
+        for entry in reversed(entries):
+            if entry[0].unit.upper().strip() == currency_upper:
+                return entry
+        return entries[-1]
+
+
 class MetricConfidence(Enum):
     """Confidence level for a canonical metric mapping."""
 
@@ -220,6 +283,10 @@ class NormalizationContext:
             When True and override_rules are provided, the override engine
             will produce a structured trace. The normalizer does not persist
             or log this trace; callers are responsible for any side effects.
+        fact_index:
+            Optional pre-built :class:`EdgarFactIndex` over ``facts``. Callers
+            normalizing several statements from one document pass a shared
+            index; when None, the normalizer indexes ``facts`` itself.
     """
 
     cik: str
@@ -237,6 +304,7 @@ class NormalizationContext:
     analyst_profile_id: str | None = None
     override_rules: Sequence[MappingOverrideRule] = ()
     enable_override_trace: bool = False
+    fact_index: EdgarFactIndex | None = None
 
 
 @dataclass(frozen=True)
@@ -372,17 +440,21 @@ class CanonicalStatementNormalizer:
         metric_records: dict[CanonicalStatementMetric, CanonicalMetricRecord] = {}
         warnings: list[str] = []
 
-        # Pre-index facts by concept for deterministic lookup.
-        facts_by_concept: dict[str, list[EdgarFact]] = defaultdict(list)
-        for fact in context.facts:
-            facts_by_concept[fact.concept].append(fact)
+        fact_index = context.fact_index or EdgarFactIndex(context.facts)
+
+        # Only rules for the winning concept can match, so each override
+        # evaluation sees its concept's bucket instead of every rule.
+        rules_by_concept: dict[str, list[MappingOverrideRule]] = defaultdict(list)
+        for rule in context.override_rules:
+            rules_by_concept[rule.source_concept].append(rule)
 
         for registry_metric, concepts in _CANONICAL_METRIC_REGISTRY.items():
             record, warning = self._resolve_metric(
                 registry_metric=registry_metric,
                 concepts=concepts,
                 context=context,
-                facts_by_concept=facts_by_concept,
+                fact_index=fact_index,
+                rules_by_concept=rules_by_concept,
             )
             if record is not None:
                 # Use the record's metric as the key to allow override-based
@@ -421,32 +493,21 @@ class CanonicalStatementNormalizer:
         registry_metric: CanonicalStatementMetric,
         concepts: Sequence[str],
         context: NormalizationContext,
-        facts_by_concept: Mapping[str, Sequence[EdgarFact]],
+        fact_index: EdgarFactIndex,
+        rules_by_concept: Mapping[str, Sequence[MappingOverrideRule]],
     ) -> tuple[CanonicalMetricRecord | None, str | None]:
         """Resolve a single canonical metric from the available facts."""
         for concept in concepts:
-            candidates = list(facts_by_concept.get(concept, ()))
-            if not candidates:
+            selected = fact_index.select(concept, context.currency)
+            if selected is None:
                 continue
 
-            # Prefer facts matching the reporting currency when possible.
-            currency_matches = [
-                f for f in candidates if f.unit.upper().strip() == context.currency.upper().strip()
-            ]
-            if currency_matches:
-                candidates = currency_matches
-
-            # If multiple facts remain, select deterministically by
-            # (period_end or instant_date, fact_id).
-            def _sort_key(fact: EdgarFact) -> tuple[date | None, str]:
-                ref_date = fact.period_end or fact.instant_date
-                return (ref_date, fact.fact_id)
-
-            candidates.sort(key=_sort_key)
-
-            chosen = candidates[-1]  # Most recent / highest fact_id.
+            chosen, parsed = selected
             try:
-                value = _parse_decimal(chosen.value, chosen.decimals)
+                if parsed is None:
+                    value = _parse_decimal(chosen.value, chosen.decimals)
+                else:
+                    value = _quantize(parsed, chosen.decimals)
             except EdgarNormalizationError as exc:
                 raise EdgarNormalizationError(
                     "Failed to parse numeric value for canonical metric.",
@@ -461,7 +522,8 @@ class CanonicalStatementNormalizer:
 
             # Apply override engine when rules are provided.
             effective_metric = registry_metric
-            if context.override_rules:
+            concept_rules = rules_by_concept.get(concept)
+            if concept_rules:
                 decision, _trace = self._override_engine.apply(
                     concept=concept,
                     taxonomy=context.taxonomy,
@@ -470,7 +532,7 @@ class CanonicalStatementNormalizer:
                     industry_code=context.industry_code,
                     analyst_id=context.analyst_profile_id,
                     base_metric=registry_metric,
-                    rules=context.override_rules,
+                    rules=concept_rules,
                     debug=context.enable_override_trace,
                 )
 
@@ -526,6 +588,31 @@ def _validate_context(context: NormalizationContext) -> None:
         )
 
 
+def _fact_sort_key(fact: EdgarFact) -> tuple[bool, date, str]:
+    """Selection order for candidate facts: (period_end or instant_date, fact_id).
+
+    Facts without a date sort first, matching "most recent wins" selection.
+    """
+    ref_date = fact.period_end or fact.instant_date
+    return (ref_date is not None, ref_date or date.min, fact.fact_id)
+
+
+def _try_decimal(value: str) -> Decimal | None:
+    """Parse ``value`` as a Decimal, or return None when it does not parse."""
+    try:
+        return Decimal(value)
+    except (InvalidOperation, ValueError):
+        return None
+
+
+def _quantize(dec: Decimal, decimals: int | None) -> Decimal:
+    """Apply the ``decimals`` precision hint to a parsed value."""
+    if decimals is not None and decimals >= 0:
+        quant = Decimal("1").scaleb(-decimals)
+        dec = dec.quantize(quant)
+    return dec
+
+
 def _parse_decimal(value: str, decimals: int | None) -> Decimal:
     """Parse a numeric string into a Decimal with deterministic rules."""
     try:
@@ -536,11 +623,7 @@ def _parse_decimal(value: str, decimals: int | None) -> Decimal:
             details={"value": value},
         ) from exc
 
-    if decimals is not None and decimals >= 0:
-        quant = Decimal("1").scaleb(-decimals)
-        dec = dec.quantize(quant)
-
-    return dec
+    return _quantize(dec, decimals)
 
 
 def _canonicalize_unit(unit: str) -> str:
@@ -558,6 +641,7 @@ def _canonicalize_unit(unit: str) -> str:
 
 __all__ = [
     "EdgarFact",
+    "EdgarFactIndex",
     "MetricConfidence",
     "CanonicalMetricRecord",
     "NormalizationContext",
@@ -27,6 +27,7 @@ from __future__ import annotations
 from collections import defaultdict
 from collections.abc import Iterable, Mapping, Sequence
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 from arche_api.domain.entities.xbrl_document import (
     XBRLContext,
@@ -38,6 +39,9 @@ from arche_api.domain.entities.xbrl_document import (
 from arche_api.domain.enums.canonical_statement_metric import CanonicalStatementMetric
 from arche_api.domain.exceptions.edgar import EdgarMappingError
 
+if TYPE_CHECKING:
+    from arche_api.domain.services.xbrl_document_index import XBRLDocumentIndex
+
 
 @dataclass(frozen=True)
 class GAAPConcept:
@@ -151,6 +155,25 @@ class GAAPTaxonomy:
                     },
                 )
 
+    def validate_document(self, index: XBRLDocumentIndex) -> None:
+        """Validate every fact of an indexed document against the taxonomy.
+
+        Only the index buckets of concepts known to the taxonomy are visited,
+        with contexts and units already resolved, so the cost is proportional
+        to the in-scope facts rather than the whole document.
+
+        Args:
+            index:
+                Pre-built index of the XBRL document.
+
+        Raises:
+            EdgarMappingError:
+                On the first fact that violates taxonomy-defined invariants.
+        """
+        for qname in sorted(self._concepts.keys() & index.by_concept.keys()):
+            for item in index.by_concept[qname]:
+                self.validate_fact(fact=item.fact, context=item.context, unit=item.unit)
+
 
 # --------------------------------------------------------------------------- #
 # Linkbase view (E10-B)                                                       #
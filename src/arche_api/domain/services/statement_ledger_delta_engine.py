@@ -12,6 +12,8 @@ Purpose:
 Responsibilities:
     * Build a restatement "ledger" for a sequence of statement versions.
     * Compute a single restatement delta between two chosen versions.
+    * Flatten a delta into per-metric ledger records with precomputed
+      magnitude and materiality for the persisted restatement ledger.
     * Enforce minimal invariants around version ordering and availability.
 
 Design:
@@ -28,6 +30,8 @@ Layer:
 from __future__ import annotations
 
 from collections.abc import Iterable, Sequence
+from datetime import date
+from decimal import Decimal
 
 from arche_api.domain.entities.canonical_statement_payload import (
     CanonicalStatementPayload,
@@ -36,10 +40,16 @@ from arche_api.domain.entities.edgar_restatement_delta import (
     RestatementDelta,
     compute_restatement_delta,
 )
+from arche_api.domain.entities.edgar_restatement_ledger import RestatementLedgerRecord
 from arche_api.domain.entities.edgar_statement_version import EdgarStatementVersion
 from arche_api.domain.enums.canonical_statement_metric import CanonicalStatementMetric
+from arche_api.domain.enums.edgar import MaterialityClass
 from arche_api.domain.exceptions.edgar import EdgarIngestionError, EdgarMappingError
 
+#: Relative-change bounds (fractions of |old value|) for per-metric materiality.
+LOW_MATERIALITY_MAX_PCT = Decimal("0.01")
+MEDIUM_MATERIALITY_MAX_PCT = Decimal("0.05")
+
 
 def _normalized_sorted_versions(
     versions: Sequence[EdgarStatementVersion],
@@ -259,3 +269,78 @@ def compute_restatement_delta_between_versions(
         to_payload=to_payload,
         metrics=metric_filter,
     )
+
+
+def classify_metric_restatement(
+    *,
+    diff: Decimal,
+    pct_change: Decimal | None,
+) -> MaterialityClass:
+    """Classify the materiality of a single metric restatement.
+
+    Rules:
+        * No change → NONE.
+        * Undefined relative change (old value of zero) → HIGH.
+        * ``|pct_change|`` below 1% → LOW, below 5% → MEDIUM, otherwise HIGH.
+    """
+    if diff == 0:
+        return MaterialityClass.NONE
+    if pct_change is None:
+        return MaterialityClass.HIGH
+    magnitude = pct_change.copy_abs()
+    if magnitude < LOW_MATERIALITY_MAX_PCT:
+        return MaterialityClass.LOW
+    if magnitude < MEDIUM_MATERIALITY_MAX_PCT:
+        return MaterialityClass.MEDIUM
+    return MaterialityClass.HIGH
+
+
+def build_restatement_ledger_records(
+    delta: RestatementDelta,
+    *,
+    restated_on: date | None = None,
+) -> list[RestatementLedgerRecord]:
+    """Flatten a restatement delta into per-metric ledger records.
+
+    Only metrics with a numeric, non-zero ``diff`` produce a record; records
+    are ordered by metric code.
+
+    Args:
+        delta:
+            Restatement delta for one hop, typically from
+            :func:`compute_restatement_delta`.
+        restated_on:
+            Filing date of the "to" version, stored for date-window screens.
+
+    Returns:
+        Ledger records with precomputed relative change and materiality.
+    """
+    records: list[RestatementLedgerRecord] = []
+    for metric in sorted(delta.metrics, key=lambda m: m.value):
+        metric_delta = delta.metrics[metric]
+        old, new, diff = metric_delta.old, metric_delta.new, metric_delta.diff
+        if old is None or new is None or diff is None or diff == 0:
+            continue
+
+        pct_change = diff / old.copy_abs() if old != 0 else None
+        records.append(
+            RestatementLedgerRecord(
+                cik=delta.cik,
+                statement_type=delta.statement_type,
+                accounting_standard=delta.accounting_standard,
+                statement_date=delta.statement_date,
+                fiscal_year=delta.fiscal_year,
+                fiscal_period=delta.fiscal_period,
+                currency=delta.currency,
+                from_version_sequence=delta.from_version_sequence,
+                to_version_sequence=delta.to_version_sequence,
+                metric=metric,
+                old_value=old,
+                new_value=new,
+                diff=diff,
+                pct_change=pct_change,
+                materiality=classify_metric_restatement(diff=diff, pct_change=pct_change),
+                restated_on=restated_on,
+            )
+        )
+    return records
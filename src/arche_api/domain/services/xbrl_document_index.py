@@ -0,0 +1,241 @@
+# src/arche_api/domain/services/xbrl_document_index.py
+# Copyright (c)
+# SPDX-License-Identifier: MIT
+"""Pre-indexed view of a parsed XBRL document.
+
+Purpose:
+    Normalizing a filing touches the same XBRL facts once per statement type
+    (mapping to EdgarFact, grouping by concept, sorting candidates, parsing
+    values) and again for taxonomy validation and override-rule lookup. This
+    module resolves every fact against its context and unit once and exposes
+    the buckets those consumers need, so per-filing cost is linear in the
+    number of facts rather than facts × statement types.
+
+Layer:
+    domain/services
+
+Design:
+    - Built once per XBRLDocument; read-only afterwards.
+    - Nil facts and facts whose context is missing are dropped, matching the
+      E10 mapping rules of the XBRL normalization use cases.
+    - Facts are bucketed by concept, context, unit and period; raw values are
+      parsed to Decimal once (None when the lexical value does not parse).
+    - EdgarFact projections depend only on the statement currency (the unit
+      fallback), so they and their EdgarFactIndex are cached per currency.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal, InvalidOperation
+
+from arche_api.domain.entities.xbrl_document import (
+    XBRLContext,
+    XBRLDocument,
+    XBRLFact,
+    XBRLUnit,
+)
+from arche_api.domain.services.edgar_normalization import EdgarFact, EdgarFactIndex
+
+#: Period bucket key: (start_date, end_date, instant_date).
+PeriodKey = tuple[date | None, date | None, date | None]
+
+
+@dataclass(frozen=True)
+class IndexedXBRLFact:
+    """An XBRL fact resolved against its context and unit.
+
+    Attributes:
+        fact:
+            Original XBRL fact.
+        context:
+            Context referenced by the fact.
+        unit:
+            Unit referenced by the fact, or None when absent/unknown.
+        unit_code:
+            Upper-cased unit measure without its namespace prefix (e.g.,
+            "USD", "SHARES"), or None when the fact has no usable unit.
+        value:
+            Raw value parsed as Decimal (no decimals quantization), or None
+            when the lexical value is not numeric.
+    """
+
+    fact: XBRLFact
+    context: XBRLContext
+    unit: XBRLUnit | None
+    unit_code: str | None
+    value: Decimal | None
+
+    @property
+    def period_key(self) -> PeriodKey:
+        """Return the (start_date, end_date, instant_date) bucket key."""
+        period = self.context.period
+        if period.is_instant:
+            return (None, None, period.instant_date)
+        return (period.start_date, period.end_date, None)
+
+
+class XBRLDocumentIndex:
+    """One-time index over an XBRLDocument's facts.
+
+    Args:
+        document:
+            Parsed XBRL document to index.
+    """
+
+    def __init__(self, document: XBRLDocument) -> None:
+        """Resolve and bucket every fact of ``document``."""
+        self._document = document
+
+        facts: list[IndexedXBRLFact] = []
+        by_concept: dict[str, list[IndexedXBRLFact]] = defaultdict(list)
+        by_context: dict[str, list[IndexedXBRLFact]] = defaultdict(list)
+        by_unit: dict[str, list[IndexedXBRLFact]] = defaultdict(list)
+        by_period: dict[PeriodKey, list[IndexedXBRLFact]] = defaultdict(list)
+
+        unit_codes: dict[str, str | None] = {}
+        for unit_id, xbrl_unit in document.units.items():
+            measure = xbrl_unit.measure.strip().upper() if xbrl_unit.measure else ""
+            unit_codes[unit_id] = (measure.split(":", 1)[1] if ":" in measure else measure) or None
+
+        for fact in document.facts:
+            if fact.is_nil:
+                continue
+            context = document.contexts.get(fact.context_ref)
+            if context is None:
+                continue
+            unit: XBRLUnit | None = None
+            unit_code: str | None = None
+            if fact.unit_ref:
+                unit = document.units.get(fact.unit_ref)
+                unit_code = unit_codes.get(fact.unit_ref)
+            indexed = IndexedXBRLFact(
+                fact=fact,
+                context=context,
+                unit=unit,
+                unit_code=unit_code,
+                value=_parse_raw_value(fact.raw_value),
+            )
+            facts.append(indexed)
+            by_concept[fact.concept_qname].append(indexed)
+            by_context[fact.context_ref].append(indexed)
+            if fact.unit_ref:
+                by_unit[fact.unit_ref].append(indexed)
+            by_period[indexed.period_key].append(indexed)
+
+        self._facts = tuple(facts)
+        self._by_concept = {k: tuple(v) for k, v in by_concept.items()}
+        self._by_context = {k: tuple(v) for k, v in by_context.items()}
+        self._by_unit = {k: tuple(v) for k, v in by_unit.items()}
+        self._by_period = {k: tuple(v) for k, v in by_period.items()}
+        self._edgar_facts: dict[str, tuple[EdgarFact, ...]] = {}
+        self._fact_indexes: dict[str, EdgarFactIndex] = {}
+
+    # ------------------------------------------------------------------ #
+    # Buckets                                                            #
+    # ------------------------------------------------------------------ #
+
+    @property
+    def document(self) -> XBRLDocument:
+        """Return the indexed document."""
+        return self._document
+
+    @property
+    def facts(self) -> tuple[IndexedXBRLFact, ...]:
+        """Return usable (non-nil, context-resolved) facts in document order."""
+        return self._facts
+
+    @property
+    def concepts(self) -> tuple[str, ...]:
+        """Return the distinct concept QNames, sorted."""
+        return tuple(sorted(self._by_concept))
+
+    @property
+    def by_concept(self) -> Mapping[str, Sequence[IndexedXBRLFact]]:
+        """Return facts bucketed by concept QName."""
+        return self._by_concept
+
+    @property
+    def by_context(self) -> Mapping[str, Sequence[IndexedXBRLFact]]:
+        """Return facts bucketed by context id."""
+        return self._by_context
+
+    @property
+    def by_unit(self) -> Mapping[str, Sequence[IndexedXBRLFact]]:
+        """Return facts bucketed by unit id."""
+        return self._by_unit
+
+    @property
+    def by_period(self) -> Mapping[PeriodKey, Sequence[IndexedXBRLFact]]:
+        """Return facts bucketed by (start_date, end_date, instant_date)."""
+        return self._by_period
+
+    # ------------------------------------------------------------------ #
+    # Normalization inputs                                               #
+    # ------------------------------------------------------------------ #
+
+    def edgar_facts(self, *, currency: str) -> tuple[EdgarFact, ...]:
+        """Return the facts mapped to EdgarFact for a statement currency.
+
+        Args:
+            currency:
+                Statement currency, used as the unit for facts without a
+                usable XBRL unit.
+
+        Returns:
+            EdgarFact tuple in document order (cached per currency).
+        """
+        cached = self._edgar_facts.get(currency)
+        if cached is None:
+            cached = tuple(_to_edgar_fact(item, currency) for item in self._facts)
+            self._edgar_facts[currency] = cached
+        return cached
+
+    def fact_index(self, *, currency: str) -> EdgarFactIndex:
+        """Return the EdgarFactIndex over :meth:`edgar_facts` (cached per currency)."""
+        cached = self._fact_indexes.get(currency)
+        if cached is None:
+            cached = EdgarFactIndex(
+                self.edgar_facts(currency=currency),
+                [item.value for item in self._facts],
+            )
+            self._fact_indexes[currency] = cached
+        return cached
+
+
+def _parse_raw_value(raw_value: str) -> Decimal | None:
+    """Parse a lexical XBRL value, returning None when it is not numeric."""
+    text = raw_value.strip()
+    if not text:
+        return None
+    try:
+        return Decimal(text)
+    except (InvalidOperation, ValueError):
+        return None
+
+
+def _to_edgar_fact(item: IndexedXBRLFact, currency: str) -> EdgarFact:
+    """Project an indexed XBRL fact onto the normalization engine's EdgarFact."""
+    fact = item.fact
+    period = item.context.period
+    return EdgarFact(
+        fact_id=fact.id or f"{fact.concept_qname}:{fact.context_ref}",
+        concept=fact.concept_qname,
+        value=fact.raw_value,
+        unit=item.unit_code or currency,
+        decimals=fact.decimals,
+        period_start=period.start_date if not period.is_instant else None,
+        period_end=period.end_date if not period.is_instant else None,
+        instant_date=period.instant_date if period.is_instant else None,
+        dimensions={},
+    )
+
+
+__all__ = [
+    "IndexedXBRLFact",
+    "PeriodKey",
+    "XBRLDocumentIndex",
+]
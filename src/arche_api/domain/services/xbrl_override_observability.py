@@ -21,9 +21,7 @@ Layer:
 
 from __future__ import annotations
 
-from collections import defaultdict
-from collections.abc import Iterable, Mapping, Sequence
-from datetime import date
+from collections.abc import Iterable, Sequence
 from typing import Any, cast
 
 from arche_api.domain.entities.xbrl_override_observability import (
@@ -35,6 +33,7 @@ from arche_api.domain.enums.canonical_statement_metric import CanonicalStatement
 from arche_api.domain.services.edgar_normalization import (
     _CANONICAL_METRIC_REGISTRY,
     EdgarFact,
+    EdgarFactIndex,
     NormalizationContext,
 )
 from arche_api.domain.services.xbrl_mapping_overrides import (
@@ -100,9 +99,7 @@ class XBRLOverrideObservabilityService:
                 per_metric_traces={},
             )
 
-        facts_by_concept: dict[str, list[EdgarFact]] = defaultdict(list)
-        for fact in context.facts:
-            facts_by_concept[fact.concept].append(fact)
+        fact_index = context.fact_index or EdgarFactIndex(context.facts)
 
         suppression_count = 0
         remap_count = 0
@@ -113,7 +110,7 @@ class XBRLOverrideObservabilityService:
             chosen_fact, chosen_concept = _select_fact_for_metric(
                 concepts=concepts,
                 context=context,
-                facts_by_concept=facts_by_concept,
+                fact_index=fact_index,
             )
             if chosen_fact is None or chosen_concept is None:
                 continue
@@ -225,7 +222,7 @@ def _select_fact_for_metric(
     *,
     concepts: Sequence[str],
     context: NormalizationContext,
-    facts_by_concept: Mapping[str, Sequence[EdgarFact]],
+    fact_index: EdgarFactIndex,
 ) -> tuple[EdgarFact | None, str | None]:
     """Select the fact that would feed into a canonical metric.
 
@@ -237,21 +234,8 @@ def _select_fact_for_metric(
         * Break ties deterministically by (period_end/instant_date, fact_id).
     """
     for concept in concepts:
-        candidates = list(facts_by_concept.get(concept, ()))
-        if not candidates:
-            continue
-
-        # Prefer facts matching the reporting currency when possible.
-        currency_upper = context.currency.upper().strip()
-        preferred = [f for f in candidates if f.unit.upper().strip() == currency_upper]
-        if preferred:
-            candidates = preferred
-
-        def _sort_key(fact: EdgarFact) -> tuple[date | None, str]:
-            ref_date = fact.period_end or fact.instant_date
-            return (ref_date, fact.fact_id)
-
-        candidates.sort(key=_sort_key)
-        return candidates[-1], concept
+        selected = fact_index.select(concept, context.currency)
+        if selected is not None:
+            return selected[0], concept
 
     return None, None
@@ -1,6 +1,6 @@
 # src/arche_api/domain/value_objects/__init__.py
 """Public exports for domain value objects."""
 
-from .value_objects import Principal
+from .value_objects import Principal, StatementKeyset, StatementVersionsFingerprint
 
-__all__ = ["Principal"]
+__all__ = ["Principal", "StatementKeyset", "StatementVersionsFingerprint"]
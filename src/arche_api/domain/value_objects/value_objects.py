@@ -19,11 +19,15 @@ Layer:
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+from datetime import date, datetime
 from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
-__all__ = ["Principal"]
+from arche_api.domain.enums.edgar import FiscalPeriod
+
+__all__ = ["Principal", "StatementKeyset", "StatementVersionsFingerprint"]
 
 
 class Principal(BaseModel):
@@ -146,3 +150,41 @@ class Principal(BaseModel):
         email = claims.get("email") or claims.get("primary_email")
         roles = claims.get("roles") or claims.get("org_roles") or []
         return cls(subject=subject, email=email, roles=roles)
+
+
+@dataclass(frozen=True, slots=True)
+class StatementKeyset:
+    """Keyset position within a statement time series.
+
+    Time-series panels are ordered by ``(cik, statement_date, fiscal_period)``;
+    a keyset identifies one row in that ordering so that the next page can be
+    requested as "rows strictly after this one" instead of by offset.
+
+    Attributes:
+        cik: Company CIK.
+        statement_date: Statement period end date.
+        fiscal_period: Fiscal period of the row.
+    """
+
+    cik: str
+    statement_date: date
+    fiscal_period: FiscalPeriod
+
+
+@dataclass(frozen=True, slots=True)
+class StatementVersionsFingerprint:
+    """Aggregate change marker over a set of statement versions.
+
+    Any insert, delete, restatement or payload rewrite within the scope
+    changes at least one field, which makes the fingerprint a cheap basis for
+    HTTP validators that does not require loading the payloads.
+
+    Attributes:
+        row_count: Number of statement-version rows in scope.
+        max_version_sequence: Highest version_sequence in scope, if any.
+        max_updated_at: Most recent ``updated_at`` in scope, if any.
+    """
+
+    row_count: int
+    max_version_sequence: int | None
+    max_updated_at: datetime | None
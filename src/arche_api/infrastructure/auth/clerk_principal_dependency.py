@@ -8,6 +8,8 @@ Purpose:
 Design:
     - Enforces Bearer token contract at the adapter boundary.
     - Verifies the token with a JWKS client and minimal claim checks.
+    - Uses the process-wide JWKS client and verified-token cache, so repeat
+      requests with the same token skip RS256 verification until ``exp``.
     - Returns a small `Principal` value object, not raw claims.
 
 Security:
@@ -28,9 +30,10 @@ from arche_api.config.settings import Settings, get_settings
 from arche_api.domain.value_objects import Principal
 from arche_api.infrastructure.logging.logger import get_json_logger
 from arche_api.infrastructure.security.clerk_jwks import (
-    ClerkJWKSClient,
+    get_clerk_jwks_client,
     verify_clerk_token,
 )
+from arche_api.infrastructure.security.token_cache import get_verified_token_cache
 
 logger = get_json_logger(__name__)
 
@@ -58,22 +61,19 @@ async def require_clerk_principal(
         )
 
     token: str = authorization.split(" ", 1)[1].strip()
-    jwks = ClerkJWKSClient(
-        issuer=str(settings.clerk_issuer),
+    jwks = get_clerk_jwks_client(
+        str(settings.clerk_issuer),
         ttl_seconds=settings.clerk_jwks_ttl_seconds,
     )
 
-    # Build verify_clerk_token kwargs so we only pass audience when present.
-    verify_kwargs: dict[str, Any] = {
-        "token": token,
-        "jwks_client": jwks,
-        "issuer": str(settings.clerk_issuer),
-    }
-    if settings.clerk_audience is not None:
-        verify_kwargs["audience"] = settings.clerk_audience
-
     try:
-        claims: dict[str, Any] = await verify_clerk_token(**verify_kwargs)
+        claims: dict[str, Any] = await verify_clerk_token(
+            token=token,
+            jwks_client=jwks,
+            issuer=str(settings.clerk_issuer),
+            audience=settings.clerk_audience,
+            token_cache=get_verified_token_cache(settings.auth_token_cache_max_entries),
+        )
     except Exception as exc:
         logger.warning("jwt_verification_failed", extra={"reason": str(exc)})
         raise HTTPException(
@@ -0,0 +1,80 @@
+# src/arche_api/infrastructure/background/tasks/idempotency_pruner.py
+# Copyright (c) Arche.
+# SPDX-License-Identifier: MIT
+"""Background pruning of expired idempotency keys.
+
+Purpose:
+    Remove expired ``idempotency_keys`` rows in bounded bulk deletes on a
+    timer, instead of leaving them to be reset one row at a time by the
+    request path.
+
+Layer:
+    infrastructure/background
+
+Notes:
+    - Each batch runs in its own short session/transaction so locks are held
+      briefly; a pass stops when a batch deletes fewer rows than requested.
+    - Failures are logged and retried on the next interval; the loop only
+      ends on cancellation (application shutdown).
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+from typing import Any
+
+from arche_api.adapters.repositories.idempotency_repository import IdempotencyRepository
+from arche_api.infrastructure.database.session import get_db_session
+from arche_api.infrastructure.logging.logger import get_json_logger
+
+logger = get_json_logger(__name__)
+
+__all__ = ["prune_expired_idempotency_keys", "run_idempotency_pruner"]
+
+
+async def prune_expired_idempotency_keys(
+    *,
+    session_provider: Callable[[], AbstractAsyncContextManager[Any]] = get_db_session,
+    batch_size: int = 1000,
+    max_batches: int = 100,
+) -> int:
+    """Delete expired idempotency rows in batches.
+
+    Args:
+        session_provider: Async context manager factory yielding an ``AsyncSession``.
+        batch_size: Rows deleted per statement.
+        max_batches: Upper bound on statements per pass.
+
+    Returns:
+        Total number of rows deleted.
+    """
+    total = 0
+    for _ in range(max_batches):
+        async with session_provider() as session:
+            deleted = await IdempotencyRepository(session).delete_expired(batch_size=batch_size)
+        total += deleted
+        if deleted < batch_size:
+            break
+    return total
+
+
+async def run_idempotency_pruner(
+    *,
+    interval_s: float,
+    session_provider: Callable[[], AbstractAsyncContextManager[Any]] = get_db_session,
+    batch_size: int = 1000,
+) -> None:
+    """Prune expired keys every ``interval_s`` seconds until cancelled."""
+    while True:
+        await asyncio.sleep(interval_s)
+        try:
+            deleted = await prune_expired_idempotency_keys(
+                session_provider=session_provider, batch_size=batch_size
+            )
+        except Exception as exc:
+            logger.warning("idempotency.prune_failed", extra={"error": type(exc).__name__})
+            continue
+        if deleted:
+            logger.info("idempotency.pruned", extra={"deleted": deleted})
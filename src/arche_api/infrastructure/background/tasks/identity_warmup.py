@@ -0,0 +1,49 @@
+# src/arche_api/infrastructure/background/tasks/identity_warmup.py
+# Copyright (c) Arche.
+# SPDX-License-Identifier: MIT
+"""Startup warm-up of the EDGAR identity map.
+
+Purpose:
+    Preload CIK → company identities for the active universe so the first
+    EDGAR requests after a deploy do not each pay a ``ref.companies`` lookup.
+
+Layer:
+    infrastructure/background
+
+Notes:
+    - Runs once, off the startup path; requests arriving before it finishes
+      simply fill the map on demand.
+    - Reads go through :func:`open_read_session`, so a fresh replica is used
+      when one is configured.
+    - Failures are logged and otherwise ignored.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from arche_api.adapters.repositories.edgar_identity_map import (
+    EdgarIdentityMap,
+    warm_identity_map,
+)
+from arche_api.infrastructure.database.session import open_read_session
+from arche_api.infrastructure.logging.logger import get_json_logger
+
+logger = get_json_logger(__name__)
+
+__all__ = ["run_identity_warmup"]
+
+
+async def run_identity_warmup(
+    identity_map: EdgarIdentityMap,
+    *,
+    ciks: Iterable[str] | None = None,
+) -> None:
+    """Fill ``identity_map`` with the active universe once."""
+    try:
+        async with open_read_session() as session:
+            count = await warm_identity_map(session, identity_map, ciks=ciks)
+    except Exception as exc:
+        logger.warning("edgar.identity_warmup_failed", extra={"error": type(exc).__name__})
+        return
+    logger.info("edgar.identity_warmup_done", extra={"companies": count})
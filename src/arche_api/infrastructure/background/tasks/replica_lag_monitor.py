@@ -0,0 +1,39 @@
+# src/arche_api/infrastructure/background/tasks/replica_lag_monitor.py
+# Copyright (c) Arche.
+# SPDX-License-Identifier: MIT
+"""Background measurement of read-replica lag.
+
+Purpose:
+    Keep the replica router's view of replication lag current, so read-only
+    units of work only go to replicas within the configured lag budget.
+
+Layer:
+    infrastructure/background
+
+Notes:
+    - The first measurement runs immediately; replicas receive no reads until
+      they have been measured once.
+    - Failures mark the replica unhealthy (reads fall back to the primary) and
+      are retried on the next interval.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+from arche_api.infrastructure.database.session import refresh_replica_lag
+from arche_api.infrastructure.logging.logger import get_json_logger
+
+logger = get_json_logger(__name__)
+
+__all__ = ["run_replica_lag_monitor"]
+
+
+async def run_replica_lag_monitor(*, interval_s: float, timeout_s: float = 1.0) -> None:
+    """Measure replica lag every ``interval_s`` seconds until cancelled."""
+    while True:
+        try:
+            await refresh_replica_lag(timeout_s=timeout_s)
+        except Exception as exc:  # pragma: no cover - per-replica errors are trapped
+            logger.warning("db.replica_lag_check_failed", extra={"error": type(exc).__name__})
+        await asyncio.sleep(interval_s)
@@ -0,0 +1,209 @@
+# src/arche_api/infrastructure/caching/idempotency_store.py
+# Copyright (c) Arche.
+# SPDX-License-Identifier: MIT
+"""Redis tier for HTTP idempotency keys.
+
+Purpose:
+    Serve the hot path of :class:`IdempotencyMiddleware` from Redis: an atomic
+    ``SET NX`` claims a key for an in-flight request, and completed responses
+    are kept as compressed bytes for byte-exact replay. Postgres is only
+    written asynchronously for the durable audit trail.
+
+Layer:
+    infrastructure/caching
+
+Notes:
+    - One Redis key per Idempotency-Key holding a small JSON document:
+        * ``{"s": "STARTED", "h": <request hash>}`` while in flight;
+        * ``{"s": "COMPLETED", "h", "c": <status>, "t": <content type>,
+          "b": <base64(zlib(body))>}`` once done.
+      The key expires with the idempotency TTL; completion keeps that TTL.
+    - Any Redis error is surfaced as :class:`IdempotencyStoreUnavailable` and
+      the store bypasses Redis for a short cool-down, so callers can fall back
+      to the database path without paying a timeout per request.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import time
+import zlib
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, Final
+
+from arche_api.infrastructure.logging.logger import get_json_logger
+
+logger = get_json_logger(__name__)
+
+__all__ = [
+    "IdempotencyEntry",
+    "IdempotencyStoreUnavailable",
+    "RedisIdempotencyStore",
+]
+
+STARTED: Final[str] = "STARTED"
+COMPLETED: Final[str] = "COMPLETED"
+
+# SET NX / GET rounds before giving up on a key that keeps expiring between
+# the two commands.
+_CLAIM_ATTEMPTS: Final[int] = 3
+
+
+class IdempotencyStoreUnavailable(RuntimeError):
+    """Raised when the Redis tier cannot serve a request (caller falls back)."""
+
+
+@dataclass(frozen=True)
+class IdempotencyEntry:
+    """State of an idempotency key held in Redis.
+
+    Attributes:
+        state: ``STARTED`` or ``COMPLETED``.
+        request_hash: Hash of the request that claimed the key.
+        status_code: Final HTTP status (COMPLETED only).
+        content_type: Final ``Content-Type`` header, if any (COMPLETED only).
+        body: Final response body bytes (COMPLETED only).
+    """
+
+    state: str
+    request_hash: str
+    status_code: int | None = None
+    content_type: str | None = None
+    body: bytes = b""
+
+
+def _encode(entry: IdempotencyEntry) -> str:
+    doc: dict[str, Any] = {"s": entry.state, "h": entry.request_hash}
+    if entry.state == COMPLETED:
+        doc["c"] = entry.status_code
+        doc["t"] = entry.content_type
+        doc["b"] = base64.b64encode(zlib.compress(entry.body)).decode("ascii")
+    return json.dumps(doc, separators=(",", ":"))
+
+
+def _decode(raw: str | bytes) -> IdempotencyEntry:
+    doc = json.loads(raw)
+    body = zlib.decompress(base64.b64decode(doc["b"])) if "b" in doc else b""
+    return IdempotencyEntry(
+        state=str(doc["s"]),
+        request_hash=str(doc["h"]),
+        status_code=doc.get("c"),
+        content_type=doc.get("t"),
+        body=body,
+    )
+
+
+class RedisIdempotencyStore:
+    """Idempotency key claims and response replay backed by Redis.
+
+    Args:
+        redis_provider: Zero-arg callable returning the shared async Redis client.
+        namespace: Key prefix.
+        cooldown_s: Seconds to bypass Redis after a failure.
+        clock: Monotonic clock used for the cool-down.
+    """
+
+    def __init__(
+        self,
+        redis_provider: Callable[[], Any],
+        *,
+        namespace: str = "arche:idem:v1",
+        cooldown_s: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the store (no I/O)."""
+        self._redis_provider = redis_provider
+        self._namespace = namespace
+        self._cooldown_s = cooldown_s
+        self._clock = clock
+        self._bypass_until = 0.0
+
+    def _key(self, key: str) -> str:
+        # Hash the client-supplied key so Redis key length stays bounded.
+        return f"{self._namespace}:{hashlib.sha256(key.encode('utf-8')).hexdigest()}"
+
+    def _client(self) -> Any:
+        if self._clock() < self._bypass_until:
+            raise IdempotencyStoreUnavailable("redis tier cooling down")
+        return self._redis_provider()
+
+    def _fail(self, op: str, exc: Exception) -> IdempotencyStoreUnavailable:
+        self._bypass_until = self._clock() + self._cooldown_s
+        logger.warning(
+            "idempotency.redis_unavailable",
+            extra={"op": op, "error": type(exc).__name__, "cooldown_s": self._cooldown_s},
+        )
+        return IdempotencyStoreUnavailable(op)
+
+    async def claim(
+        self, key: str, request_hash: str, *, ttl_seconds: int
+    ) -> IdempotencyEntry | None:
+        """Atomically claim ``key`` for a new request.
+
+        Returns:
+            None when the key was claimed by this call; otherwise the entry
+            currently stored for the key.
+
+        Raises:
+            IdempotencyStoreUnavailable: If Redis cannot be used, or the key
+                expired between ``SET NX`` and ``GET`` on every attempt.
+        """
+        started = _encode(IdempotencyEntry(state=STARTED, request_hash=request_hash))
+        redis_key = self._key(key)
+        for _ in range(_CLAIM_ATTEMPTS):
+            try:
+                client = self._client()
+                if await client.set(redis_key, started, nx=True, ex=int(ttl_seconds)):
+                    return None
+                raw = await client.get(redis_key)
+            except IdempotencyStoreUnavailable:
+                raise
+            except Exception as exc:
+                raise self._fail("claim", exc) from exc
+            if raw is not None:
+                return _decode(raw)
+            # Expired between SET NX and GET: try to claim it again.
+
+        logger.warning(
+            "idempotency.claim_contended",
+            extra={"attempts": _CLAIM_ATTEMPTS},
+        )
+        raise IdempotencyStoreUnavailable("claim")
+
+    async def complete(
+        self,
+        key: str,
+        request_hash: str,
+        *,
+        status_code: int,
+        content_type: str | None,
+        body: bytes,
+    ) -> None:
+        """Store the final response for a claimed key, keeping its TTL.
+
+        Raises:
+            IdempotencyStoreUnavailable: If Redis cannot be used.
+        """
+        entry = IdempotencyEntry(
+            state=COMPLETED,
+            request_hash=request_hash,
+            status_code=status_code,
+            content_type=content_type,
+            body=body,
+        )
+        try:
+            await self._client().set(self._key(key), _encode(entry), xx=True, keepttl=True)
+        except IdempotencyStoreUnavailable:
+            raise
+        except Exception as exc:
+            raise self._fail("complete", exc) from exc
+
+    async def release(self, key: str) -> None:
+        """Drop an in-flight claim (e.g. the handler raised) so clients can retry."""
+        try:
+            await self._client().delete(self._key(key))
+        except Exception as exc:
+            logger.debug("idempotency.release_failed", extra={"error": type(exc).__name__})
@@ -11,7 +11,8 @@ Synopsis:
 
 Design:
     * Uses the global Redis client via `get_redis_client()`.
-    * Pure JSON (utf-8) serialization; no pickle.
+    * Pure JSON (utf-8) serialization through the process-wide JSON codec
+      (orjson when installed); no pickle.
     * Key policy:
         - Namespace prefix owns the Arche + vertical + version:
             `arche:market_data:v1`
@@ -30,7 +31,6 @@ See Also:
 from __future__ import annotations
 
 import asyncio
-import json
 import time
 from collections.abc import Awaitable, Callable, Mapping
 from contextlib import suppress
@@ -42,6 +42,7 @@ from arche_api.infrastructure.observability.metrics import (
     get_cache_operation_duration_seconds,
     get_cache_operations_total,
 )
+from arche_api.infrastructure.serialization.json_codec import get_json_codec
 
 __all__ = [
     "RedisJsonCache",
@@ -169,7 +170,8 @@ class RedisJsonCache(CachePort):
             if raw is None:
                 return None
             hit_label = "true"
-            return json.loads(raw)
+            decoded: Mapping[str, Any] = get_json_codec().loads(raw)
+            return decoded
         finally:
             duration = time.perf_counter() - start
             with suppress(Exception):
@@ -201,7 +203,7 @@ class RedisJsonCache(CachePort):
                 return
 
             redis = get_redis_client()
-            await redis.set(self._k(key), json.dumps(value), ex=ttl)
+            await redis.set(self._k(key), get_json_codec().dumps(value), ex=ttl)
         finally:
             duration = time.perf_counter() - start
             with suppress(Exception):
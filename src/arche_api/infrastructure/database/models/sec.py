@@ -15,6 +15,8 @@ Purpose:
     * ``sec.edgar_dq_run``: Data-quality evaluation runs.
     * ``sec.edgar_fact_quality``: Fact-level quality flags and severity.
     * ``sec.edgar_dq_anomalies``: Rule-level DQ anomalies.
+    * ``sec.edgar_restatement_ledger``: Precomputed per-metric restatement
+      deltas between adjacent normalized statement versions.
 
 Design:
     - Filings and statement versions follow the existing metadata-focused
@@ -576,3 +578,81 @@ class EdgarReconciliationCheck(Base):
         nullable=False,
         server_default=text("now()"),
     )
+
+
+# --------------------------------------------------------------------------- #
+# Restatement ledger                                                          #
+# --------------------------------------------------------------------------- #
+
+
+class EdgarRestatementLedgerEntry(Base):
+    """Precomputed restatement delta (sec.edgar_restatement_ledger).
+
+    One row per changed canonical metric on a hop between adjacent normalized
+    statement versions. Magnitude and materiality are stored so that
+    universe-wide screens are a single index range scan.
+    """
+
+    __tablename__ = "edgar_restatement_ledger"
+    __table_args__ = (
+        UniqueConstraint(
+            "company_id",
+            "statement_type",
+            "fiscal_year",
+            "fiscal_period",
+            "to_version_sequence",
+            "metric_code",
+            name="uq_edgar_restatement_ledger_hop_metric",
+        ),
+        Index(
+            "ix_edgar_restatement_ledger_screen",
+            "statement_type",
+            "metric_code",
+            "fiscal_year",
+            "fiscal_period",
+            "abs_pct_change",
+        ),
+        Index(
+            "ix_edgar_restatement_ledger_materiality",
+            "statement_type",
+            "materiality",
+            "restated_on",
+        ),
+        {"schema": "sec"},
+    )  # type: ignore[assignment]
+
+    entry_id: Mapped[UUID] = mapped_column(primary_key=True)
+    company_id: Mapped[UUID] = mapped_column(
+        ForeignKey("ref.companies.company_id"),
+        nullable=False,
+    )
+
+    # Denormalized identity columns (screen-friendly)
+    cik: Mapped[str] = mapped_column(String(10), nullable=False)
+    statement_type: Mapped[str] = mapped_column(String(32), nullable=False)
+    accounting_standard: Mapped[str] = mapped_column(String(32), nullable=False)
+    fiscal_year: Mapped[int] = mapped_column(Integer, nullable=False)
+    fiscal_period: Mapped[str] = mapped_column(String(8), nullable=False)
+    statement_date: Mapped[date] = mapped_column(Date, nullable=False)
+    currency: Mapped[str] = mapped_column(String(16), nullable=False)
+
+    # Hop
+    from_version_sequence: Mapped[int] = mapped_column(Integer, nullable=False)
+    to_version_sequence: Mapped[int] = mapped_column(Integer, nullable=False)
+    restated_on: Mapped[date | None] = mapped_column(Date, nullable=True)
+
+    # Metric delta and precomputed magnitude
+    metric_code: Mapped[str] = mapped_column(String(64), nullable=False)
+    old_value: Mapped[Decimal] = mapped_column(Numeric(38, 6), nullable=False)
+    new_value: Mapped[Decimal] = mapped_column(Numeric(38, 6), nullable=False)
+    diff_value: Mapped[Decimal] = mapped_column(Numeric(38, 6), nullable=False)
+    abs_diff_value: Mapped[Decimal] = mapped_column(Numeric(38, 6), nullable=False)
+    pct_change: Mapped[Decimal | None] = mapped_column(Numeric(38, 12), nullable=True)
+    abs_pct_change: Mapped[Decimal | None] = mapped_column(Numeric(38, 12), nullable=True)
+    materiality: Mapped[str] = mapped_column(String(16), nullable=False)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=text("now()"),
+    )
@@ -10,6 +10,15 @@ Lifecycle:
     * Call `init_engine_and_sessionmaker(settings)` at app startup (lifespan).
     * Use `get_db_session()` as a dependency in request handlers or services.
     * Call `dispose_engine()` during shutdown.
+    * `get_pool_stats()` reports pool occupancy for readiness/metrics.
+
+Read replicas:
+    * `DATABASE_REPLICA_URLS` adds one engine per replica. `open_read_session()`
+      returns a session on a replica whose measured lag is within
+      `DATABASE_REPLICA_MAX_LAG_SECONDS`, round-robin, and falls back to the
+      primary otherwise (no replicas, lag unknown/too high, replica down).
+    * `refresh_replica_lag()` measures lag; the app runs it on an interval.
+      Until a replica has been measured it receives no traffic.
 
 Notes:
     * No business logic here; repositories/services consume the session.
@@ -20,9 +29,13 @@ Notes:
 
 from __future__ import annotations
 
+import asyncio
+import itertools
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager, suppress
+from dataclasses import dataclass
 
+from sqlalchemy import text
 from sqlalchemy.exc import IllegalStateChangeError, InvalidRequestError
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
@@ -30,12 +43,46 @@ from sqlalchemy.ext.asyncio import (
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import QueuePool
 
 from arche_api.config.settings import Settings, get_settings
+from arche_api.infrastructure.logging.logger import get_json_logger
+from arche_api.infrastructure.observability.metrics import (
+    get_db_read_routing_total,
+    get_db_replica_lag_seconds,
+)
+
+logger = get_json_logger(__name__)
 
 _engine: AsyncEngine | None = None
 _sessionmaker: async_sessionmaker[AsyncSession] | None = None
 
+# Replay lag in seconds; 0 on a primary and on a replica that has replayed
+# everything it received (an idle primary must not look like lag).
+_REPLICA_LAG_SQL = text(
+    "SELECT CASE"
+    " WHEN NOT pg_is_in_recovery() THEN 0"
+    " WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0"
+    " ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)"
+    " END"
+)
+
+
+@dataclass
+class _Replica:
+    """A read replica engine and its last measured state."""
+
+    name: str
+    engine: AsyncEngine
+    sessionmaker: async_sessionmaker[AsyncSession]
+    lag_s: float | None = None
+    healthy: bool = False
+
+
+_replicas: list[_Replica] = []
+_replica_cursor = itertools.count()
+_max_replica_lag_s: float = 5.0
+
 
 def init_engine_and_sessionmaker(settings: Settings) -> None:
     """Initialize the global async engine and sessionmaker.
@@ -61,16 +108,137 @@ def init_engine_and_sessionmaker(settings: Settings) -> None:
         echo=False,
     )
     _sessionmaker = async_sessionmaker(bind=_engine, expire_on_commit=False, class_=AsyncSession)
+    _init_replicas(settings)
+
+
+def _init_replicas(settings: Settings) -> None:
+    """Create one engine per configured replica URL."""
+    global _max_replica_lag_s
+
+    _max_replica_lag_s = settings.database_replica_max_lag_seconds
+    urls = [u.strip() for u in (settings.database_replica_urls or "").split(",") if u.strip()]
+    for index, url in enumerate(urls):
+        engine = create_async_engine(url=url, future=True, pool_pre_ping=True, echo=False)
+        _replicas.append(
+            _Replica(
+                name=f"replica-{index}",
+                engine=engine,
+                sessionmaker=async_sessionmaker(
+                    bind=engine, expire_on_commit=False, class_=AsyncSession
+                ),
+            )
+        )
 
 
 async def dispose_engine() -> None:
-    """Dispose the global engine at application shutdown."""
+    """Dispose the global engine (and replica engines) at application shutdown."""
     global _engine
+    replicas = list(_replicas)
+    _replicas.clear()
+    for replica in replicas:
+        with suppress(Exception):
+            await replica.engine.dispose()
     if _engine is not None:
         await _engine.dispose()
         _engine = None
 
 
+def has_replicas() -> bool:
+    """Return whether any read replica is configured."""
+    return bool(_replicas)
+
+
+def open_read_session() -> AsyncSession:
+    """Open a session for read-only work, on a fresh replica when possible.
+
+    Returns:
+        AsyncSession: Bound to an eligible replica (round-robin), otherwise to
+        the primary.
+
+    Raises:
+        RuntimeError: If the primary sessionmaker is not initialized.
+    """
+    if _replicas:
+        eligible = [
+            r
+            for r in _replicas
+            if r.healthy and r.lag_s is not None and r.lag_s <= _max_replica_lag_s
+        ]
+        if eligible:
+            replica = eligible[next(_replica_cursor) % len(eligible)]
+            _count_read_route("replica", "fresh")
+            return replica.sessionmaker()
+        _count_read_route("primary", "no_eligible_replica")
+    return get_sessionmaker()()
+
+
+def _count_read_route(target: str, reason: str) -> None:
+    with suppress(Exception):
+        get_db_read_routing_total().labels(target=target, reason=reason).inc()
+
+
+async def _measure_lag(replica: _Replica, timeout_s: float) -> None:
+    try:
+        async with replica.engine.connect() as conn:
+            result = await asyncio.wait_for(conn.execute(_REPLICA_LAG_SQL), timeout=timeout_s)
+            lag = float(result.scalar_one() or 0.0)
+    except Exception as exc:
+        if replica.healthy:
+            logger.warning(
+                "db.replica_unavailable",
+                extra={"extra": {"replica": replica.name, "error": type(exc).__name__}},
+            )
+        replica.healthy = False
+        replica.lag_s = None
+        return
+    replica.healthy = True
+    replica.lag_s = lag
+    with suppress(Exception):
+        get_db_replica_lag_seconds().labels(replica=replica.name).set(lag)
+
+
+async def refresh_replica_lag(*, timeout_s: float = 1.0) -> dict[str, float | None]:
+    """Measure replication lag on every replica.
+
+    A replica that errors or times out is marked unhealthy and gets no reads
+    until a later measurement succeeds.
+
+    Returns:
+        dict[str, float | None]: Replica name -> lag in seconds (None if down).
+    """
+    replicas = list(_replicas)
+    await asyncio.gather(*(_measure_lag(r, timeout_s) for r in replicas))
+    return {r.name: r.lag_s for r in replicas}
+
+
+def get_pool_stats() -> dict[str, int] | None:
+    """Return connection-pool occupancy for the global engine.
+
+    Returns:
+        dict[str, int] | None: ``size``, ``max_overflow``, ``checked_out``,
+        ``idle``, ``overflow`` and ``waiting``; None when the engine is not
+        initialized or does not use a queue pool (e.g. NullPool in tests).
+    """
+    if _engine is None or not isinstance(_engine.pool, QueuePool):
+        return None
+    pool = _engine.pool
+    waiting = 0
+    # SQLAlchemy has no public waiter count; the asyncio queue behind the async
+    # pool is created lazily, so only look at it once it exists.
+    with suppress(Exception):
+        queue = pool._pool.__dict__.get("_queue")
+        if queue is not None:
+            waiting = sum(1 for fut in queue._getters if not fut.done())
+    return {
+        "size": pool.size(),
+        "max_overflow": max(0, pool._max_overflow),
+        "checked_out": pool.checkedout(),
+        "idle": pool.checkedin(),
+        "overflow": max(0, pool.overflow()),
+        "waiting": waiting,
+    }
+
+
 def get_sessionmaker() -> async_sessionmaker[AsyncSession]:
     """Return the initialized async sessionmaker.
 
@@ -49,7 +49,10 @@ from arche_api.infrastructure.observability.metrics_edgar import (
     get_edgar_retries_total,
 )
 from arche_api.infrastructure.observability.tracing import traced
-from arche_api.infrastructure.resilience.circuit_breaker import CircuitBreaker
+from arche_api.infrastructure.resilience.circuit_breaker import (
+    SupportsGuard,
+    get_circuit_breaker_registry,
+)
 from arche_api.infrastructure.resilience.retry import RetryPolicy, retry_async
 
 _DEFAULT_TIMEOUT: Final[float] = 8.0
@@ -73,7 +76,7 @@ class EdgarClient:
         http: httpx.AsyncClient | None = None,
         timeout_s: float | None = None,
         retry_policy: RetryPolicy | None = None,
-        breaker: CircuitBreaker | None = None,
+        breaker: SupportsGuard | None = None,
     ) -> None:
         """Initialize the transport client.
 
@@ -88,7 +91,8 @@ class EdgarClient:
             retry_policy:
                 Optional retry configuration for retryable failures.
             breaker:
-                Circuit breaker instance to use; created if omitted.
+                Circuit breaker (or keyed registry) to use. Defaults to the
+                process-wide registry, keyed per ``provider:endpoint``.
         """
         self._settings = settings
         self._base_url = str(settings.base_url).rstrip("/")
@@ -98,6 +102,7 @@ class EdgarClient:
         else:
             self._timeout = float(getattr(settings, "timeout_s", _DEFAULT_TIMEOUT))
 
+        self._owns_client = http is None
         self._client = http or httpx.AsyncClient(
             timeout=self._timeout,
             headers=_DEFAULT_HEADERS.copy(),
@@ -114,11 +119,7 @@ class EdgarClient:
             jitter=True,
         )
 
-        self._breaker = breaker or CircuitBreaker(
-            failure_threshold=5,
-            recovery_timeout_s=30.0,
-            half_open_max_calls=1,
-        )
+        self._breaker: SupportsGuard = breaker or get_circuit_breaker_registry()
 
         # Metrics handles.
         self._latency = get_edgar_gateway_latency_seconds()
@@ -131,7 +132,7 @@ class EdgarClient:
 
     async def aclose(self) -> None:
         """Close the underlying HTTP client if this instance owns it."""
-        if self._client and not self._client.is_closed:
+        if self._owns_client and not self._client.is_closed:
             await self._client.aclose()
 
     # ------------------------------------------------------------------ #
@@ -268,7 +269,7 @@ class EdgarClient:
                 endpoint=endpoint,
                 path=path,
             )
-            return self._handle_json_response(
+            return await self._handle_json_response(
                 response=response,
                 provider=provider,
                 endpoint=endpoint,
@@ -356,7 +357,7 @@ class EdgarClient:
                 endpoint=endpoint,
                 path=path,
             )
-            return self._handle_bytes_response(
+            return await self._handle_bytes_response(
                 response=response,
                 provider=provider,
                 endpoint=endpoint,
@@ -420,7 +421,7 @@ class EdgarClient:
     ) -> httpx.Response:
         """Execute a single HTTP GET under breaker control and map transport errors."""
         try:
-            async with self._breaker.guard(provider):
+            async with self._breaker.guard(f"{provider}:{endpoint}"):
                 return await self._client.get(
                     url,
                     headers=headers,
@@ -440,7 +441,7 @@ class EdgarClient:
                 details={"endpoint": endpoint, "path": path, "error": str(exc)},
             ) from exc
 
-    def _handle_json_response(  # noqa: C901
+    async def _handle_json_response(  # noqa: C901
         self,
         *,
         response: httpx.Response,
@@ -469,7 +470,7 @@ class EdgarClient:
             retry_after = self._parse_retry_after(response.headers.get("Retry-After"))
             if retry_after is not None:
                 # Honor upstream back-off hint, but still surface error.
-                asyncio.run(asyncio.sleep(retry_after))  # pragma: no cover
+                await asyncio.sleep(retry_after)
             raise EdgarIngestionError(
                 "EDGAR rate limited.",
                 details={
@@ -514,7 +515,7 @@ class EdgarClient:
 
         return payload
 
-    def _handle_bytes_response(
+    async def _handle_bytes_response(
         self,
         *,
         response: httpx.Response,
@@ -540,7 +541,7 @@ class EdgarClient:
         if response.status_code == 429:
             retry_after = self._parse_retry_after(response.headers.get("Retry-After"))
             if retry_after is not None:
-                asyncio.run(asyncio.sleep(retry_after))  # pragma: no cover
+                await asyncio.sleep(retry_after)
             raise EdgarIngestionError(
                 "EDGAR rate limited.",
                 details={
@@ -41,7 +41,10 @@ from arche_api.infrastructure.observability.metrics_market_data import (
     get_market_data_gateway_latency_seconds,
 )
 from arche_api.infrastructure.observability.tracing import traced
-from arche_api.infrastructure.resilience.circuit_breaker import CircuitBreaker
+from arche_api.infrastructure.resilience.circuit_breaker import (
+    SupportsGuard,
+    get_circuit_breaker_registry,
+)
 from arche_api.infrastructure.resilience.retry import RetryPolicy, retry_async
 
 # --------------------------------------------------------------------------- #
@@ -149,7 +152,7 @@ class MarketstackClient:
         http: httpx.AsyncClient | None = None,
         timeout_s: float | None = None,
         retry_policy: RetryPolicy | None = None,
-        breaker: CircuitBreaker | None = None,
+        breaker: SupportsGuard | None = None,
     ) -> None:
         """Initialize the transport client.
 
@@ -163,7 +166,8 @@ class MarketstackClient:
             retry_policy: Optional retry configuration for retryable failures.
                 When omitted, a jittered exponential policy is built from
                 ``settings.max_retries``.
-            breaker: Circuit breaker instance to use; created if omitted.
+            breaker: Circuit breaker (or keyed registry) to use. Defaults to the
+                process-wide registry, keyed per ``provider:endpoint``.
         """
         self._settings = settings
         self._base_url = str(settings.base_url).rstrip("/")  # normalize AnyHttpUrl → str
@@ -175,6 +179,7 @@ class MarketstackClient:
             self._timeout = float(getattr(settings, "timeout_s", _DEFAULT_TIMEOUT))
 
         # Underlying HTTP client (either injected or owned).
+        self._owns_client = http is None
         self._client = http or httpx.AsyncClient(
             timeout=self._timeout,
             headers=_DEFAULT_HEADERS.copy(),
@@ -194,12 +199,8 @@ class MarketstackClient:
             jitter=True,
         )
 
-        # Circuit breaker: keep thresholds centralized here for now.
-        self._breaker = breaker or CircuitBreaker(
-            failure_threshold=5,
-            recovery_timeout_s=30.0,
-            half_open_max_calls=1,
-        )
+        # Circuit breaker: shared registry so state survives per-request clients.
+        self._breaker: SupportsGuard = breaker or get_circuit_breaker_registry()
 
         # Metrics handles (real or no-op depending on import outcome).
         self._latency = get_market_data_gateway_latency_seconds()
@@ -212,7 +213,7 @@ class MarketstackClient:
 
     async def aclose(self) -> None:
         """Close the underlying HTTP client if this instance owns it."""
-        if self._client and not self._client.is_closed:
+        if self._owns_client and not self._client.is_closed:
             await self._client.aclose()
 
     # ---------------------------- Public API ----------------------------- #
@@ -467,7 +468,7 @@ class MarketstackClient:
             """Execute a single HTTP GET under breaker control."""
             # Circuit breaker guard (OPEN/HALF-OPEN failures are counted below).
             try:
-                async with self._breaker.guard(provider):
+                async with self._breaker.guard(f"{provider}:{op}"):
                     response = await self._client.get(
                         url,
                         params=params,
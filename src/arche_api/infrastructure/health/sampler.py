@@ -0,0 +1,232 @@
+# src/arche_api/infrastructure/health/sampler.py
+# Copyright (c) Arche.
+# SPDX-License-Identifier: MIT
+"""Background readiness sampler.
+
+Purpose:
+    Run dependency checks (DB, Redis, ...) on a fixed interval, each bounded by
+    a timeout, and keep the latest results in memory so readiness endpoints can
+    answer in O(1) without taking a pool connection per request.
+
+Design:
+    * Checks are plain async callables returning ``(ok, detail)`` — the same
+      contract as ``HealthProbe.db()`` / ``.redis()`` — so this module has no
+      DB/Redis imports of its own.
+    * A snapshot carries its age; callers decide how stale is too stale.
+    * Pool occupancy (checked-out connections, waiters) is sampled alongside
+      the checks and exported as gauges.
+    * Refreshes are single-flight: a cold readiness request and the background
+      loop never probe concurrently.
+
+Layer:
+    infrastructure/health
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from contextlib import suppress
+from dataclasses import dataclass, field
+
+from arche_api.infrastructure.logging.logger import get_json_logger
+from arche_api.infrastructure.observability.metrics import (
+    get_db_pool_connections,
+    get_readyz_sample_age_seconds,
+)
+
+__all__ = [
+    "CheckFn",
+    "HealthSampler",
+    "HealthSnapshot",
+    "ProbeSample",
+    "get_health_sampler",
+    "set_health_sampler",
+]
+
+logger = get_json_logger(__name__)
+
+CheckFn = Callable[[], Awaitable[tuple[bool, str | None]]]
+PoolStatsFn = Callable[[], Mapping[str, int] | None]
+
+_POOL_GAUGE_STATES = ("checked_out", "idle", "overflow", "waiting")
+
+
+@dataclass(frozen=True)
+class ProbeSample:
+    """Outcome of one dependency check."""
+
+    name: str
+    ok: bool
+    detail: str | None
+    duration_ms: float
+
+
+@dataclass(frozen=True)
+class HealthSnapshot:
+    """Latest results of all checks plus pool occupancy.
+
+    Attributes:
+        samples: Check results in registration order.
+        taken_at: Monotonic time the sample completed.
+        pool: Pool occupancy from the pool-stats callable, if any.
+    """
+
+    samples: tuple[ProbeSample, ...]
+    taken_at: float
+    pool: Mapping[str, int] | None = field(default=None)
+
+    @property
+    def ok(self) -> bool:
+        """Whether every check passed."""
+        return all(s.ok for s in self.samples)
+
+
+class HealthSampler:
+    """Periodically run readiness checks and cache the results.
+
+    Args:
+        checks: Name -> check callable, in reporting order.
+        interval_s: Delay between refreshes in :meth:`run`.
+        timeout_s: Per-check timeout; a check that exceeds it reports down.
+        max_age_s: Age beyond which :meth:`is_stale` is true.
+        pool_stats: Optional callable returning pool occupancy.
+        clock: Monotonic clock (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        checks: Mapping[str, CheckFn],
+        *,
+        interval_s: float = 5.0,
+        timeout_s: float = 1.0,
+        max_age_s: float = 30.0,
+        pool_stats: PoolStatsFn | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._checks = dict(checks)
+        self._interval_s = max(0.1, interval_s)
+        self._timeout_s = timeout_s
+        self._max_age_s = max_age_s
+        self._pool_stats = pool_stats
+        self._clock = clock
+        self._snapshot: HealthSnapshot | None = None
+        self._lock: asyncio.Lock | None = None
+        self._lock_loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def max_age_s(self) -> float:
+        """Age beyond which a snapshot is considered stale."""
+        return self._max_age_s
+
+    def snapshot(self) -> HealthSnapshot | None:
+        """Return the latest snapshot without doing any I/O."""
+        return self._snapshot
+
+    def age_s(self, snapshot: HealthSnapshot) -> float:
+        """Return the age of ``snapshot`` in seconds."""
+        return max(0.0, self._clock() - snapshot.taken_at)
+
+    def is_stale(self, snapshot: HealthSnapshot) -> bool:
+        """Return whether ``snapshot`` is older than ``max_age_s``."""
+        return self.age_s(snapshot) > self._max_age_s
+
+    def _refresh_lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+    async def _run_check(self, name: str, fn: CheckFn) -> ProbeSample:
+        start = time.perf_counter()
+        try:
+            ok, detail = await asyncio.wait_for(fn(), timeout=self._timeout_s)
+        except TimeoutError:
+            ok, detail = False, f"timed out after {self._timeout_s:g}s"
+        except Exception as exc:
+            ok, detail = False, str(exc) or type(exc).__name__
+        return ProbeSample(
+            name=name,
+            ok=ok,
+            detail=detail,
+            duration_ms=(time.perf_counter() - start) * 1000.0,
+        )
+
+    def _sample_pool(self) -> Mapping[str, int] | None:
+        if self._pool_stats is None:
+            return None
+        try:
+            stats = self._pool_stats()
+        except Exception:
+            return None
+        if stats is not None:
+            gauge = get_db_pool_connections()
+            with suppress(Exception):
+                for state in _POOL_GAUGE_STATES:
+                    gauge.labels(state=state).set(stats.get(state, 0))
+        return stats
+
+    async def refresh(self) -> HealthSnapshot:
+        """Run every check now and replace the cached snapshot (single-flight)."""
+        requested_at = self._clock()
+        async with self._refresh_lock():
+            current = self._snapshot
+            if current is not None and current.taken_at >= requested_at:
+                return current
+            samples = await asyncio.gather(
+                *(self._run_check(name, fn) for name, fn in self._checks.items())
+            )
+            snapshot = HealthSnapshot(
+                samples=tuple(samples),
+                taken_at=self._clock(),
+                pool=self._sample_pool(),
+            )
+            self._snapshot = snapshot
+        if not snapshot.ok:
+            logger.warning(
+                "health_sample_degraded",
+                extra={
+                    "extra": {
+                        "down": [s.name for s in snapshot.samples if not s.ok],
+                        "pool": dict(snapshot.pool) if snapshot.pool else None,
+                    }
+                },
+            )
+        return snapshot
+
+    async def current(self) -> HealthSnapshot:
+        """Return the cached snapshot, sampling once if none exists yet."""
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = await self.refresh()
+        with suppress(Exception):
+            get_readyz_sample_age_seconds().set(self.age_s(snapshot))
+        return snapshot
+
+    async def run(self) -> None:
+        """Refresh every ``interval_s`` until cancelled."""
+        while True:
+            try:
+                await self.refresh()
+            except Exception as exc:  # pragma: no cover - checks already trap errors
+                logger.warning(
+                    "health_sample_failed",
+                    extra={"extra": {"error": type(exc).__name__}},
+                )
+            await asyncio.sleep(self._interval_s)
+
+
+_sampler: HealthSampler | None = None
+
+
+def get_health_sampler() -> HealthSampler | None:
+    """Return the process-wide sampler, or None when readiness probes live."""
+    return _sampler
+
+
+def set_health_sampler(sampler: HealthSampler | None) -> None:
+    """Install (or clear) the process-wide sampler."""
+    global _sampler
+    _sampler = sampler
@@ -0,0 +1,42 @@
+# src/arche_api/infrastructure/http/responses.py
+# Copyright (c) Arche.
+# SPDX-License-Identifier: MIT
+"""JSON response class rendered through the process-wide codec.
+
+Summary:
+    ``FastJSONResponse`` is the application's default response class. It
+    differs from Starlette's ``JSONResponse`` only in how bytes are produced:
+
+        * Pydantic models (envelopes returned by presenters) are rendered
+          straight to JSON bytes by ``model_dump_json``, skipping the
+          intermediate ``model_dump`` dict and its re-encoding.
+        * Anything else goes through the configured JSON codec (orjson when
+          installed, see ``infrastructure.serialization.json_codec``).
+
+    For ``BaseHTTPSchema`` models the output is byte-identical to
+    ``JSONResponse(content=model.model_dump_http())``.
+
+Layer:
+    infrastructure/http
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from arche_api.infrastructure.serialization.json_codec import get_json_codec
+
+__all__ = ["FastJSONResponse"]
+
+
+class FastJSONResponse(JSONResponse):
+    """``JSONResponse`` backed by Pydantic's serializer and the JSON codec."""
+
+    def render(self, content: Any) -> bytes:
+        """Render ``content`` (a Pydantic model or JSON-compatible data) to bytes."""
+        if isinstance(content, BaseModel):
+            return content.model_dump_json().encode("utf-8")
+        return get_json_codec().dumps(content)
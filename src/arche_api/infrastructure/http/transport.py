@@ -0,0 +1,273 @@
+# src/arche_api/infrastructure/http/transport.py
+# Copyright (c) Arche.
+# SPDX-License-Identifier: MIT
+"""Process-wide pooled HTTP transports (one keep-alive pool per upstream).
+
+Purpose:
+    Give every outbound integration (Marketstack, EDGAR, Clerk JWKS, MCP
+    loopback) a long-lived ``httpx.AsyncClient`` with its own connection
+    limits, keep-alive and optional HTTP/2, instead of paying DNS, TCP and TLS
+    setup on every call with a throwaway client.
+
+Layer:
+    infrastructure/http
+
+Notes:
+    - The registry is created by :func:`arche_api.dependencies.core.bootstrap.bootstrap`
+      and installed process-wide, mirroring the circuit-breaker registry:
+      gateways and clients are constructed per request, so the pool must
+      live outside them.
+    - Outside the app lifespan (CLI, MCP server, tests) a registry is created
+      lazily with the default pool configuration.
+    - Clients are bound to the event loop that created them. If the running
+      loop changes (e.g. one loop per test), a fresh client is built and the
+      stale one is dropped, because its connections cannot be reused.
+    - HTTP/2 requires the optional ``h2`` package (``http2`` extra); when it
+      is missing the pools fall back to HTTP/1.1 keep-alive.
+    - Every request records whether it reused a pooled connection, its
+      upstream latency, and the pool's active/idle connection counts.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import time
+from collections.abc import Mapping
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import Any, Final
+
+import httpx
+
+from arche_api.infrastructure.logging.logger import get_json_logger
+from arche_api.infrastructure.observability.metrics import (
+    get_http_client_pool_connections,
+    get_http_client_request_duration_seconds,
+    get_http_client_requests_total,
+)
+
+logger = get_json_logger(__name__)
+
+__all__ = [
+    "DEFAULT_PROVIDER_POOLS",
+    "HTTPTransportRegistry",
+    "PoolConfig",
+    "get_http_transport_registry",
+    "set_http_transport_registry",
+]
+
+
+@dataclass(frozen=True)
+class PoolConfig:
+    """Connection-pool settings for one upstream provider.
+
+    Attributes:
+        max_connections: Hard cap on concurrent connections to the upstream.
+        max_keepalive_connections: Idle connections kept open for reuse.
+        keepalive_expiry_s: Seconds an idle connection is kept before closing.
+        timeout_s: Default per-request timeout in seconds.
+        http2: Negotiate HTTP/2 when the ``h2`` package is installed.
+    """
+
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry_s: float = 30.0
+    timeout_s: float = 10.0
+    http2: bool = False
+
+
+# SEC fair-access policy caps clients at 10 requests/second, so EDGAR gets a
+# small pool; JWKS is fetched rarely and needs only a couple of connections.
+DEFAULT_PROVIDER_POOLS: Final[dict[str, PoolConfig]] = {
+    "marketstack": PoolConfig(max_connections=20, max_keepalive_connections=10, timeout_s=8.0),
+    "edgar": PoolConfig(max_connections=10, max_keepalive_connections=10, timeout_s=10.0),
+    "jwks": PoolConfig(max_connections=4, max_keepalive_connections=2, timeout_s=5.0),
+    "mcp": PoolConfig(max_connections=20, max_keepalive_connections=10, timeout_s=10.0),
+}
+
+_CONNECT_EVENT: Final[str] = "connection.connect_tcp.started"
+
+
+def _http2_available() -> bool:
+    """Return True when the optional ``h2`` package is importable."""
+    return importlib.util.find_spec("h2") is not None
+
+
+class _InstrumentedTransport(httpx.AsyncBaseTransport):
+    """Pooled transport that records connection reuse and pool utilization.
+
+    A request counts as *reused* when httpcore does not open a new TCP
+    connection for it, detected through the request ``trace`` extension.
+    """
+
+    def __init__(self, provider: str, inner: httpx.AsyncHTTPTransport) -> None:
+        self._provider = provider
+        self._inner = inner
+        self._requests = get_http_client_requests_total()
+        self._latency = get_http_client_request_duration_seconds()
+        self._pool_gauge = get_http_client_pool_connections()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send ``request`` through the pool, recording reuse and latency."""
+        connected = False
+        upstream_trace = request.extensions.get("trace")
+
+        async def trace(event_name: str, info: Mapping[str, Any]) -> None:
+            nonlocal connected
+            if event_name == _CONNECT_EVENT:
+                connected = True
+            if upstream_trace is not None:
+                await upstream_trace(event_name, info)
+
+        request.extensions["trace"] = trace
+        start = time.perf_counter()
+        try:
+            return await self._inner.handle_async_request(request)
+        finally:
+            self._record(connected, time.perf_counter() - start)
+
+    def _record(self, connected: bool, elapsed: float) -> None:
+        """Export reuse/latency and a pool snapshot (best effort)."""
+        connection = "new" if connected else "reused"
+        with suppress(Exception):
+            self._requests.labels(provider=self._provider, connection=connection).inc()
+            self._latency.labels(provider=self._provider, connection=connection).observe(elapsed)
+        with suppress(Exception):
+            stats = self.pool_stats()
+            for state, count in stats.items():
+                self._pool_gauge.labels(provider=self._provider, state=state).set(count)
+
+    def pool_stats(self) -> dict[str, int]:
+        """Return ``{"active": n, "idle": m}`` for the underlying pool."""
+        pool = getattr(self._inner, "_pool", None)
+        connections = list(getattr(pool, "connections", ()))
+        idle = sum(1 for conn in connections if conn.is_idle())
+        return {"active": len(connections) - idle, "idle": idle}
+
+    async def aclose(self) -> None:
+        """Close all pooled connections."""
+        await self._inner.aclose()
+
+
+@dataclass
+class _PooledClient:
+    client: httpx.AsyncClient
+    transport: _InstrumentedTransport
+    loop: asyncio.AbstractEventLoop | None
+
+
+class HTTPTransportRegistry:
+    """Lazily created, per-provider pooled ``httpx.AsyncClient`` instances.
+
+    Args:
+        pools: Pool configuration per provider. Providers missing from the
+            mapping use :class:`PoolConfig` defaults.
+        default: Shared general-purpose client (owned by the caller, exposed
+            as :attr:`default` and never closed by the registry).
+        http2: Enable HTTP/2 for every pool (when ``h2`` is installed), in
+            addition to pools that opt in individually.
+    """
+
+    def __init__(
+        self,
+        pools: Mapping[str, PoolConfig] | None = None,
+        *,
+        default: httpx.AsyncClient | None = None,
+        http2: bool = False,
+    ) -> None:
+        """Initialize the registry without opening any connection."""
+        self._pools: dict[str, PoolConfig] = dict(
+            DEFAULT_PROVIDER_POOLS if pools is None else pools
+        )
+        self._default = default
+        self._http2 = http2
+        self._clients: dict[str, _PooledClient] = {}
+
+    @property
+    def default(self) -> httpx.AsyncClient | None:
+        """Return the shared general-purpose client, if one was provided."""
+        return self._default
+
+    def config(self, provider: str) -> PoolConfig:
+        """Return the pool configuration for ``provider``."""
+        return self._pools.get(provider, PoolConfig())
+
+    def client(self, provider: str) -> httpx.AsyncClient:
+        """Return the pooled client for ``provider``, creating it on first use."""
+        loop = _running_loop()
+        pooled = self._clients.get(provider)
+        if pooled is not None and not pooled.client.is_closed and pooled.loop is loop:
+            return pooled.client
+
+        pooled = self._build(provider, loop)
+        self._clients[provider] = pooled
+        return pooled.client
+
+    def _build(self, provider: str, loop: asyncio.AbstractEventLoop | None) -> _PooledClient:
+        cfg = self.config(provider)
+        http2 = (cfg.http2 or self._http2) and _http2_available()
+        if (cfg.http2 or self._http2) and not http2:
+            logger.warning("http_transport.http2_unavailable", extra={"provider": provider})
+
+        inner = httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(
+                max_connections=cfg.max_connections,
+                max_keepalive_connections=cfg.max_keepalive_connections,
+                keepalive_expiry=cfg.keepalive_expiry_s,
+            ),
+            http2=http2,
+        )
+        transport = _InstrumentedTransport(provider, inner)
+        client = httpx.AsyncClient(transport=transport, timeout=cfg.timeout_s)
+        logger.debug(
+            "http_transport.pool_created",
+            extra={
+                "provider": provider,
+                "max_connections": cfg.max_connections,
+                "max_keepalive_connections": cfg.max_keepalive_connections,
+                "http2": http2,
+            },
+        )
+        return _PooledClient(client=client, transport=transport, loop=loop)
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Return a snapshot of ``provider -> {"active", "idle"}`` for diagnostics."""
+        return {name: pooled.transport.pool_stats() for name, pooled in self._clients.items()}
+
+    async def aclose(self) -> None:
+        """Close every provider pool created by this registry."""
+        clients, self._clients = self._clients, {}
+        for name, pooled in clients.items():
+            try:
+                await pooled.client.aclose()
+            except Exception:
+                logger.exception("http_transport.close_failed", extra={"provider": name})
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+_registry: HTTPTransportRegistry | None = None
+
+
+def get_http_transport_registry() -> HTTPTransportRegistry:
+    """Return the process-wide transport registry shared by all outbound clients.
+
+    The registry installed by the app lifespan is returned when present;
+    otherwise one with default pools is created on first use.
+    """
+    global _registry
+    if _registry is None:
+        _registry = HTTPTransportRegistry()
+    return _registry
+
+
+def set_http_transport_registry(registry: HTTPTransportRegistry | None) -> None:
+    """Install (or clear, with ``None``) the process-wide transport registry."""
+    global _registry
+    _registry = registry
@@ -12,17 +12,43 @@ Features:
     * Automatic enrichment with ``request_id`` and ``trace_id`` via contextvars.
     * Fallback enrichment via record attributes or environment variables.
     * No-throw enrichment path (defensive).
+    * Flat ``extra={...}`` fields are emitted, with size caps for large lists,
+      mappings and strings.
+    * Optional non-blocking mode: records are enqueued on a bounded queue and
+      formatted/written in batches by a background thread (``LOG_ASYNC``).
+    * Optional per-route sampling of success-path access logs.
 
 Typical usage:
     configure_root_logging()
     log = get_json_logger(__name__)
+
+Environment (read by :func:`configure_root_logging` for any option not passed
+explicitly; the API passes the matching ``Settings`` fields once they load):
+    LOG_LEVEL                 Level name (default INFO).
+    LOG_ASYNC                 ``true`` to enable the queue-backed pipeline.
+    LOG_QUEUE_SIZE            Bounded queue capacity (default 10000).
+    LOG_DROP_POLICY           ``drop`` (never block; drop new records when the
+                              queue is full) or ``block`` (WARNING and above
+                              wait for space; lower levels are dropped).
+    LOG_EXTRA_MAX_ITEMS       Max items kept per list/mapping extra (default 50).
+    LOG_EXTRA_MAX_CHARS       Max characters kept per string extra (default 2048).
+    LOG_SUCCESS_SAMPLE_RATES  JSON map of path prefix → keep rate for 2xx/3xx
+                              access logs, e.g. ``{"/v1/quotes": 0.1}``.
 """
 
 from __future__ import annotations
 
+import atexit
+import copy
 import json
 import logging
+import logging.handlers
 import os
+import queue
+import random
+import threading
+from collections.abc import Callable, Mapping
+from contextlib import suppress
 from contextvars import ContextVar
 from datetime import UTC, datetime
 from typing import Any
@@ -33,6 +59,7 @@ __all__ = [
     "set_request_context",
     "get_request_id",
     "get_trace_id",
+    "shutdown_logging",
 ]
 
 _REQUEST_ID_ENV_KEY = "REQUEST_ID"
@@ -50,6 +77,29 @@ try:  # pragma: no cover - OTEL may not be installed
 except Exception:  # pragma: no cover - OTEL may not be installed
     _otel_trace = None
 
+# orjson is an optional dependency (``fastjson`` extra); stdlib json otherwise.
+_orjson: Any | None = None
+try:  # pragma: no cover - depends on installed extras
+    import orjson as _orjson_mod
+
+    _orjson = _orjson_mod
+except Exception:  # pragma: no cover - depends on installed extras
+    _orjson = None
+
+_DEFAULT_MAX_ITEMS = 50
+_DEFAULT_MAX_CHARS = 2048
+_MAX_DEPTH = 3
+
+# Attributes present on every LogRecord; anything else came from ``extra=``.
+_RESERVED_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {
+    "message",
+    "asctime",
+    "extra",
+    "request_id",
+    "trace_id",
+    "taskName",
+}
+
 
 def set_request_context(*, request_id: str | None = None, trace_id: str | None = None) -> None:
     """Set per-request correlation identifiers on the current context.
@@ -100,8 +150,79 @@ def _derive_otel_trace_id() -> str | None:
         return None
 
 
+def _cap(value: Any, max_items: int, max_chars: int, depth: int = 0) -> Any:
+    """Return ``value`` with long strings, sequences and mappings truncated."""
+    if isinstance(value, str):
+        if len(value) <= max_chars:
+            return value
+        return f"{value[:max_chars]}...(+{len(value) - max_chars} chars)"
+    if isinstance(value, (int, float, bool)) or value is None:
+        return value
+    if depth >= _MAX_DEPTH:
+        return _cap(str(value), max_items, max_chars, depth)
+    if isinstance(value, Mapping):
+        out: dict[str, Any] = {}
+        for i, (k, v) in enumerate(value.items()):
+            if i >= max_items:
+                out["..."] = f"+{len(value) - max_items} more keys"
+                break
+            out[str(k)] = _cap(v, max_items, max_chars, depth + 1)
+        return out
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = list(value)
+        capped = [_cap(v, max_items, max_chars, depth + 1) for v in items[:max_items]]
+        if len(items) > max_items:
+            capped.append(f"...(+{len(items) - max_items} more)")
+        return capped
+    return value
+
+
+def _dumps(payload: dict[str, Any]) -> str:
+    """Serialize a log payload (orjson when installed; never raises on odd types)."""
+    if _orjson is not None:
+        return _orjson.dumps(payload, default=str, option=_orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def _add_correlation_ids(record: logging.LogRecord, payload: dict[str, Any]) -> None:
+    """Add ``request_id``/``trace_id`` to ``payload`` (never raises)."""
+    # Request id enrichment — prefer record attribute, then contextvar, then env.
+    try:
+        rid: str | None = (
+            getattr(record, "request_id", None)
+            or _REQUEST_ID_CTX.get(None)
+            or os.getenv(_REQUEST_ID_ENV_KEY)
+        )
+        if rid:
+            payload["request_id"] = rid
+    except Exception as exc:  # pragma: no cover (defensive)
+        payload["request_id_error"] = str(exc)
+
+    # Trace id enrichment — prefer record attribute, then contextvar, then OTEL span.
+    try:
+        tid: str | None = getattr(record, "trace_id", None) or _TRACE_ID_CTX.get(None)
+        if not tid:
+            tid = _derive_otel_trace_id()
+        if tid:
+            payload["trace_id"] = tid
+    except Exception as exc:  # pragma: no cover (defensive)
+        payload["trace_id_error"] = str(exc)
+
+
 class _JsonFormatter(logging.Formatter):
-    """JSON log formatter emitting stable keys and optional extras."""
+    """JSON log formatter emitting stable keys and optional extras.
+
+    Args:
+        max_items: Max items kept per list/mapping extra value.
+        max_chars: Max characters kept per string extra value.
+    """
+
+    def __init__(
+        self, *, max_items: int = _DEFAULT_MAX_ITEMS, max_chars: int = _DEFAULT_MAX_CHARS
+    ) -> None:
+        super().__init__()
+        self._max_items = max_items
+        self._max_chars = max_chars
 
     def format(self, record: logging.LogRecord) -> str:
         """Format a log record as a JSON object.
@@ -112,7 +233,8 @@ class _JsonFormatter(logging.Formatter):
         Returns:
             JSON-encoded log line.
         """
-        ts = datetime.now(tz=UTC).isoformat()
+        # Use the record's creation time: in async mode formatting happens later.
+        ts = datetime.fromtimestamp(record.created, tz=UTC).isoformat()
         payload: dict[str, Any] = {
             "ts": ts,
             "level": record.levelname,
@@ -120,27 +242,7 @@ class _JsonFormatter(logging.Formatter):
             "message": record.getMessage(),
         }
 
-        # Request id enrichment — prefer record attribute, then contextvar, then env.
-        try:
-            rid: str | None = (
-                getattr(record, "request_id", None)
-                or _REQUEST_ID_CTX.get(None)
-                or os.getenv(_REQUEST_ID_ENV_KEY)
-            )
-            if rid:
-                payload["request_id"] = rid
-        except Exception as exc:  # pragma: no cover (defensive)
-            payload["request_id_error"] = str(exc)
-
-        # Trace id enrichment — prefer record attribute, then contextvar, then OTEL span.
-        try:
-            tid: str | None = getattr(record, "trace_id", None) or _TRACE_ID_CTX.get(None)
-            if not tid:
-                tid = _derive_otel_trace_id()
-            if tid:
-                payload["trace_id"] = tid
-        except Exception as exc:  # pragma: no cover (defensive)
-            payload["trace_id_error"] = str(exc)
+        _add_correlation_ids(record, payload)
 
         # Exceptions: guard against None in exc_info tuple.
         if record.exc_info:
@@ -150,22 +252,251 @@ class _JsonFormatter(logging.Formatter):
             if exc_value is not None:
                 payload["exc_message"] = str(exc_value)
 
+        # Flat ``extra=`` fields (never overriding the stable keys).
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED_ATTRS and key not in payload:
+                payload[key] = _cap(value, self._max_items, self._max_chars)
+
         # Extra dict, if any (e.g., access_log fields).
         extra = getattr(record, "extra", None)
         if isinstance(extra, dict):
-            payload.update(extra)
+            payload.update(_cap(extra, self._max_items, self._max_chars))
+
+        return _dumps(payload)
+
+
+class _SuccessSampler(logging.Filter):
+    """Keep only a fraction of success-path access logs, per route prefix.
+
+    Applies to records carrying ``path`` and an integer ``status`` below 400
+    (the access log). Everything else, and anything at WARNING or above,
+    passes unchanged. The longest matching prefix wins; ``"*"`` sets a default.
+    """
+
+    def __init__(
+        self, rates: Mapping[str, float], *, rng: Callable[[], float] = random.random
+    ) -> None:
+        super().__init__()
+        self._default = float(rates.get("*", 1.0))
+        self._rates = sorted(
+            ((prefix, float(rate)) for prefix, rate in rates.items() if prefix != "*"),
+            key=lambda item: len(item[0]),
+            reverse=True,
+        )
+        self._rng = rng
+
+    def _rate_for(self, path: str) -> float:
+        for prefix, rate in self._rates:
+            if path.startswith(prefix):
+                return rate
+        return self._default
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Return False for success-path records that are sampled out."""
+        if record.levelno >= logging.WARNING:
+            return True
+        path = getattr(record, "path", None)
+        status = getattr(record, "status", None)
+        if not isinstance(path, str) or not isinstance(status, int) or status >= 400:
+            return True
+        rate = self._rate_for(path)
+        if rate >= 1.0 or self._rng() < rate:
+            return True
+        _count_dropped("sampled")
+        return False
+
+
+_dropped_counter: Any | None = None
+
+
+def _count_dropped(reason: str) -> None:
+    """Increment the dropped-records counter (imported lazily; never raises)."""
+    global _dropped_counter
+    with suppress(Exception):
+        if _dropped_counter is None:
+            from arche_api.infrastructure.observability.metrics import (
+                get_log_records_dropped_total,
+            )
+
+            _dropped_counter = get_log_records_dropped_total()
+        _dropped_counter.labels(reason=reason).inc()
+
+
+class _ContextQueueHandler(logging.handlers.QueueHandler):
+    """Non-blocking queue handler that captures request context at enqueue time.
+
+    The listener thread cannot see the caller's contextvars or OTEL span, so
+    correlation ids are stamped on the record here. Formatting happens on the
+    listener thread; the caller only pays for a shallow copy and size capping.
+    """
+
+    def __init__(
+        self,
+        q: queue.Queue[Any],
+        *,
+        drop_policy: str = "drop",
+        max_items: int = _DEFAULT_MAX_ITEMS,
+        max_chars: int = _DEFAULT_MAX_CHARS,
+    ) -> None:
+        super().__init__(q)
+        self._queue = q
+        self._block_warnings = drop_policy == "block"
+        self._max_items = max_items
+        self._max_chars = max_chars
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Return a detached copy of ``record`` that is safe to format later."""
+        record = copy.copy(record)
+        if not getattr(record, "request_id", None):
+            record.request_id = _REQUEST_ID_CTX.get(None) or os.getenv(_REQUEST_ID_ENV_KEY)
+        if not getattr(record, "trace_id", None):
+            record.trace_id = _TRACE_ID_CTX.get(None) or _derive_otel_trace_id()
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            exc_type, exc_value, _ = record.exc_info
+            if exc_type is not None and exc_value is not None:
+                # Only type and message are emitted; drop frames (and their locals).
+                record.exc_info = (exc_type, exc_value, None)
+        # Snapshot mutable extras so later caller mutations do not leak in.
+        for key, value in list(record.__dict__.items()):
+            if key not in _RESERVED_ATTRS or key == "extra":
+                record.__dict__[key] = _cap(value, self._max_items, self._max_chars)
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Enqueue without blocking; apply the drop policy when the queue is full."""
+        try:
+            self._queue.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+        if self._block_warnings and record.levelno >= logging.WARNING:
+            self._queue.put(record)
+            return
+        _count_dropped("queue_full")
+
+
+class _BatchingListener:
+    """Background writer: drains the queue and writes records in batches.
+
+    One ``write`` + ``flush`` per batch instead of per record keeps syscall
+    overhead off the hot path even when the process logs heavily.
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self, q: queue.Queue[Any], handler: logging.StreamHandler[Any], *, batch_size: int = 256
+    ) -> None:
+        self._queue = q
+        self._handler = handler
+        self._batch_size = batch_size
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start the writer thread."""
+        self._thread = threading.Thread(target=self._run, name="arche-log-writer", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout_s: float = 5.0) -> None:
+        """Flush pending records and stop the writer thread."""
+        if self._thread is None:
+            return
+        self._queue.put(self._STOP)
+        self._thread.join(timeout_s)
+        self._thread = None
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self._batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = any(item is self._STOP for item in batch)
+            self._write([r for r in batch if r is not self._STOP])
+            if stop:
+                return
+
+    def _write(self, records: list[logging.LogRecord]) -> None:
+        lines: list[str] = []
+        for record in records:
+            try:
+                lines.append(self._handler.format(record))
+            except Exception:
+                _count_dropped("format_error")
+        if not lines:
+            return
+        try:
+            stream = self._handler.stream
+            stream.write("\n".join(lines) + "\n")
+            stream.flush()
+        except Exception:  # pragma: no cover - stream closed at interpreter exit
+            _count_dropped("write_error")
+
+
+_listener: _BatchingListener | None = None
+_handler: logging.Handler | None = None
 
-        return json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.getenv(name)
+    try:
+        return int(raw) if raw else default
+    except ValueError:
+        return default
 
 
-def configure_root_logging(level: str | int | None = None) -> None:
+def _env_sample_rates() -> dict[str, float]:
+    raw = os.getenv("LOG_SUCCESS_SAMPLE_RATES")
+    if not raw:
+        return {}
+    try:
+        parsed = json.loads(raw)
+        return {str(k): float(v) for k, v in parsed.items()}
+    except Exception:
+        return {}
+
+
+def configure_root_logging(
+    level: str | int | None = None,
+    *,
+    async_mode: bool | None = None,
+    queue_size: int | None = None,
+    drop_policy: str | None = None,
+    sample_rates: Mapping[str, float] | None = None,
+    max_items: int | None = None,
+    max_chars: int | None = None,
+    force: bool = False,
+) -> None:
     """Initialize the root logger with a JSON stream handler (idempotent).
 
     Args:
         level: Logging level or level name. If ``None``, use env ``LOG_LEVEL`` or ``INFO``.
+        async_mode: Route records through a bounded queue and a background
+            writer. If ``None``, use env ``LOG_ASYNC``.
+        queue_size: Queue capacity in async mode (env ``LOG_QUEUE_SIZE``).
+        drop_policy: ``drop`` or ``block`` (env ``LOG_DROP_POLICY``).
+        sample_rates: Success-path access-log keep rates by path prefix (env
+            ``LOG_SUCCESS_SAMPLE_RATES``).
+        max_items: Max items kept per list/mapping extra (env
+            ``LOG_EXTRA_MAX_ITEMS``).
+        max_chars: Max characters kept per string extra (env
+            ``LOG_EXTRA_MAX_CHARS``).
+        force: Replace the handler installed by an earlier call (flushing its
+            queue first) instead of keeping it. Handlers installed by anyone
+            else are never removed.
     """
+    global _handler, _listener
     root = logging.getLogger()
 
+    if force and _handler is not None:
+        root.removeHandler(_handler)
+        _handler = None
+        shutdown_logging()
+
     env_level = os.getenv("LOG_LEVEL")
     resolved: int | str = (
         level if level is not None else (env_level.upper() if env_level else "INFO")
@@ -176,9 +507,43 @@ def configure_root_logging(level: str | int | None = None) -> None:
         # Already configured—prevent duplicate handlers on hot reload.
         return
 
-    handler = logging.StreamHandler()
-    handler.setFormatter(_JsonFormatter())
+    if max_items is None:
+        max_items = _env_int("LOG_EXTRA_MAX_ITEMS", _DEFAULT_MAX_ITEMS)
+    if max_chars is None:
+        max_chars = _env_int("LOG_EXTRA_MAX_CHARS", _DEFAULT_MAX_CHARS)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(_JsonFormatter(max_items=max_items, max_chars=max_chars))
+
+    if async_mode is None:
+        async_mode = os.getenv("LOG_ASYNC", "").strip().lower() in {"1", "true", "yes"}
+    handler: logging.Handler = stream_handler
+    if async_mode:
+        log_queue: queue.Queue[Any] = queue.Queue(
+            maxsize=max(1, queue_size or _env_int("LOG_QUEUE_SIZE", 10_000))
+        )
+        handler = _ContextQueueHandler(
+            log_queue,
+            drop_policy=(drop_policy or os.getenv("LOG_DROP_POLICY") or "drop").lower(),
+            max_items=max_items,
+            max_chars=max_chars,
+        )
+        _listener = _BatchingListener(log_queue, stream_handler)
+        _listener.start()
+        atexit.register(shutdown_logging)
+
+    rates = sample_rates if sample_rates is not None else _env_sample_rates()
+    if rates:
+        handler.addFilter(_SuccessSampler(rates))
     root.addHandler(handler)
+    _handler = handler
+
+
+def shutdown_logging() -> None:
+    """Flush and stop the async log writer, if running (idempotent)."""
+    global _listener
+    listener, _listener = _listener, None
+    if listener is not None:
+        listener.stop()
 
 
 def get_json_logger(name: str) -> logging.Logger:
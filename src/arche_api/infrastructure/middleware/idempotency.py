@@ -5,7 +5,8 @@
 
 Purpose:
     Provide reusable HTTP idempotency for write operations (POST/PUT/PATCH/DELETE)
-    using a DB-backed dedupe store.
+    using a tiered dedupe store: Redis for in-flight locking and hot replay,
+    Postgres for the durable audit trail (and as the fallback store).
 
 Layer:
     infrastructure
@@ -18,10 +19,18 @@ Behavior:
         * Same key + same request → same response.
         * Same key + different request → 409 conflict.
         * In-flight requests with same key → 409 "in progress".
+
+Tiers:
+    With a :class:`RedisIdempotencyStore` configured, a key is claimed with a
+    single ``SET NX`` and completed responses are replayed byte-for-byte from
+    Redis; the Postgres row is written afterwards in one upsert, off the
+    request path. While Redis is unavailable the middleware uses the original
+    DB-only flow (``get_active`` → ``create_started`` → ``save_result``).
 """
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
 from collections.abc import AsyncIterator, Callable, Collection
@@ -36,7 +45,16 @@ from starlette.types import ASGIApp
 
 from arche_api.adapters.repositories.idempotency_repository import IdempotencyRepository
 from arche_api.adapters.schemas.http.envelopes import ErrorEnvelope, ErrorObject
+from arche_api.infrastructure.caching.idempotency_store import (
+    COMPLETED,
+    IdempotencyEntry,
+    IdempotencyStoreUnavailable,
+    RedisIdempotencyStore,
+)
 from arche_api.infrastructure.database.session import get_db_session
+from arche_api.infrastructure.logging.logger import get_json_logger
+
+logger = get_json_logger(__name__)
 
 
 def _utcnow_naive() -> datetime:
@@ -73,6 +91,8 @@ class IdempotencyMiddleware(BaseHTTPMiddleware):
         ttl_seconds: int = 60 * 60 * 24,
         methods: Collection[str] | None = None,
         session_provider: Callable[[], AbstractAsyncContextManager[Any]] | None = None,
+        store: RedisIdempotencyStore | None = None,
+        persist: bool = True,
     ) -> None:
         """Initialize the middleware.
 
@@ -83,11 +103,19 @@ class IdempotencyMiddleware(BaseHTTPMiddleware):
                 {POST, PUT, PATCH, DELETE}.
             session_provider: Async context manager factory that yields an
                 `AsyncSession`. Defaults to :func:`get_db_session`.
+            store: Optional Redis tier. When set (and reachable) it handles
+                locking and replay, and Postgres is only written for audit.
+            persist: Whether the Redis path also writes the audit row to
+                Postgres (asynchronously, after the response is built).
         """
         super().__init__(app)
         self._ttl_seconds = int(ttl_seconds)
         self._methods = {m.upper() for m in (methods or {"POST", "PUT", "PATCH", "DELETE"})}
         self._session_provider = session_provider or get_db_session
+        self._store = store
+        self._persist = persist
+        # Strong references so fire-and-forget audit writes are not collected.
+        self._audit_tasks: set[asyncio.Task[None]] = set()
 
     async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
         """Dispatch the request through idempotency logic or directly downstream."""
@@ -112,6 +140,19 @@ class IdempotencyMiddleware(BaseHTTPMiddleware):
         request_hash = self._compute_request_hash(request, raw_body)
         trace_id = request.headers.get("X-Request-ID")
 
+        if self._store is not None:
+            try:
+                return await self._dispatch_cached(
+                    self._store,
+                    request,
+                    call_next,
+                    key=key,
+                    request_hash=request_hash,
+                    trace_id=trace_id,
+                )
+            except IdempotencyStoreUnavailable:
+                pass  # Fall back to the database-only flow below.
+
         async with self._session_provider() as session:
             repo = IdempotencyRepository(session)
             now = _utcnow_naive()
@@ -152,16 +193,10 @@ class IdempotencyMiddleware(BaseHTTPMiddleware):
             response = await call_next(request)
             body_bytes = await self._consume_response_body(response)
 
-            response_body: dict[str, Any] | None
-            try:
-                response_body = json.loads(body_bytes.decode("utf-8")) if body_bytes else None
-            except json.JSONDecodeError:
-                response_body = None
-
             await repo.save_result(
                 started_record,
                 status_code=response.status_code,
-                response_body=response_body,
+                response_body=self._json_body(body_bytes),
                 now=_utcnow_naive(),
             )
 
@@ -172,6 +207,116 @@ class IdempotencyMiddleware(BaseHTTPMiddleware):
                 media_type=response.media_type,
             )
 
+    async def _dispatch_cached(
+        self,
+        store: RedisIdempotencyStore,
+        request: Request,
+        call_next: RequestResponseEndpoint,
+        *,
+        key: str,
+        request_hash: str,
+        trace_id: str | None,
+    ) -> Response:
+        """Run the Redis-tier flow; the database is only written for audit.
+
+        Raises:
+            IdempotencyStoreUnavailable: If the key cannot be claimed in Redis;
+                nothing has been executed downstream in that case.
+        """
+        existing = await store.claim(key, request_hash, ttl_seconds=self._ttl_seconds)
+        if existing is not None:
+            return self._replay_cached(existing, request_hash, trace_id=trace_id)
+
+        try:
+            response = await call_next(request)
+            body_bytes = await self._consume_response_body(response)
+        except BaseException:
+            # Let the client retry instead of seeing "in progress" until TTL.
+            await store.release(key)
+            raise
+
+        try:
+            await store.complete(
+                key,
+                request_hash,
+                status_code=response.status_code,
+                content_type=response.headers.get("content-type"),
+                body=body_bytes,
+            )
+        except IdempotencyStoreUnavailable:
+            await store.release(key)
+
+        if self._persist:
+            self._schedule_audit(
+                key=key,
+                request_hash=request_hash,
+                method=request.method.upper(),
+                path=request.url.path,
+                status_code=response.status_code,
+                body_bytes=body_bytes,
+            )
+
+        return Response(
+            content=body_bytes,
+            status_code=response.status_code,
+            headers=dict(response.headers),
+            media_type=response.media_type,
+        )
+
+    def _replay_cached(
+        self, entry: IdempotencyEntry, request_hash: str, *, trace_id: str | None
+    ) -> Response:
+        """Map an existing Redis entry to a replay, conflict or in-progress response."""
+        if entry.request_hash != request_hash:
+            return self._conflict_response(
+                code="IDEMPOTENCY_KEY_CONFLICT",
+                message="Idempotency-Key reused with a different request payload.",
+                trace_id=trace_id,
+            )
+        if entry.state == COMPLETED and entry.status_code is not None:
+            return Response(
+                content=entry.body,
+                status_code=entry.status_code,
+                media_type=entry.content_type,
+            )
+        return self._conflict_response(
+            code="IDEMPOTENCY_KEY_IN_PROGRESS",
+            message="Another request with the same Idempotency-Key is in progress.",
+            trace_id=trace_id,
+        )
+
+    def _schedule_audit(self, *, body_bytes: bytes, **fields: Any) -> None:
+        """Write the durable audit row in the background."""
+        task = asyncio.create_task(
+            self._write_audit(response_body=self._json_body(body_bytes), **fields)
+        )
+        self._audit_tasks.add(task)
+        task.add_done_callback(self._audit_tasks.discard)
+
+    async def _write_audit(self, **fields: Any) -> None:
+        """Upsert the COMPLETED row; failures are logged, never raised."""
+        try:
+            async with self._session_provider() as session:
+                await IdempotencyRepository(session).upsert_completed(
+                    ttl_seconds=self._ttl_seconds, now=_utcnow_naive(), **fields
+                )
+        except Exception as exc:
+            logger.warning(
+                "idempotency.audit_write_failed",
+                extra={"error": type(exc).__name__, "path": fields.get("path")},
+            )
+
+    @staticmethod
+    def _json_body(body_bytes: bytes) -> dict[str, Any] | None:
+        """Return the body parsed as a JSON object, or None."""
+        if not body_bytes:
+            return None
+        try:
+            parsed = json.loads(body_bytes.decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            return None
+        return parsed if isinstance(parsed, dict) else None
+
     @staticmethod
     def _compute_request_hash(request: Request, body: bytes) -> str:
         """Compute a deterministic hash for the given request and body."""
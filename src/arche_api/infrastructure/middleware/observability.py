@@ -0,0 +1,207 @@
+# src/arche_api/infrastructure/middleware/observability.py
+# Copyright (c) Arche.
+# SPDX-License-Identifier: MIT
+"""Fused observability middleware (pure ASGI).
+
+Summary:
+    One pure-ASGI middleware that replaces the per-concern
+    ``BaseHTTPMiddleware`` chain (``TraceIdMiddleware``,
+    ``RequestIdMiddleware``, ``AccessLogMiddleware``,
+    ``RequestLatencyMiddleware``, ``PromMetricsMiddleware`` and
+    ``SecurityHeadersMiddleware``). Every concern runs in a single pass, with
+    no extra task per layer and no response-body wrapping, so streaming
+    responses pass through untouched.
+
+Contract (identical to the individual middlewares):
+    • Reads:  x-trace-id, X-Request-ID (optional, sanitized)
+    • Writes: x-trace-id, X-Request-ID, security headers (only when absent)
+    • Stores: request.state.trace_id, request.state.request_id
+    • Logs:   one ``access_log`` record per request (same fields)
+    • Metrics:
+        - ``http_server_request_duration_seconds`` (method, handler, status)
+        - ``http_requests`` / ``http_request_latency_seconds`` (method, status)
+        - OTEL ``http_server_request_duration_seconds`` when enabled
+
+Notes:
+    - Latency covers the full response, including streamed bodies; the
+      ``BaseHTTPMiddleware`` versions stopped the clock at the response start.
+    - Unhandled exceptions are recorded with status 500 in every instrument
+      and then re-raised for the exception handlers.
+    - The individual middlewares stay available for apps that compose them
+      selectively.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any, Final
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from arche_api.infrastructure.http.middleware.trace import (
+    TRACE_HEADER,
+    _new_trace_id,
+    _sanitize_inbound_trace,
+)
+from arche_api.infrastructure.logging.logger import get_json_logger, set_request_context
+from arche_api.infrastructure.middleware.metrics import (
+    get_http_request_latency_seconds,
+    get_http_requests_counter,
+)
+from arche_api.infrastructure.middleware.request_id import _coerce_request_id
+from arche_api.infrastructure.middleware.request_metrics import (
+    _otel_hist,
+    get_http_server_request_duration_seconds,
+)
+from arche_api.infrastructure.middleware.security_headers import SecurityHeadersMiddleware
+
+__all__ = ["ObservabilityMiddleware"]
+
+logger = logging.getLogger(__name__)
+_access_logger: logging.Logger = get_json_logger("arche_api.infrastructure.middleware.access_log")
+
+_TRACE_HEADER_RAW: Final[bytes] = TRACE_HEADER.encode("latin-1")
+_REQUEST_ID_HEADER_RAW: Final[bytes] = b"x-request-id"
+
+
+class ObservabilityMiddleware:
+    """Correlation ids, access log, latency metrics and security headers in one pass.
+
+    Args:
+        app: The downstream ASGI application.
+        hsts_max_age: If > 0, also set ``Strict-Transport-Security`` with the
+            given max-age (in seconds). Only enable this when serving strictly
+            over HTTPS. Default is 0 (disabled).
+        hsts_include_subdomains: Add ``; includeSubDomains`` to HSTS when enabled.
+        hsts_preload: Add ``; preload`` to HSTS when enabled.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        hsts_max_age: int = 0,
+        hsts_include_subdomains: bool = False,
+        hsts_preload: bool = False,
+    ) -> None:
+        """Initialize middleware, bind collectors and pre-encode headers."""
+        self.app = app
+        self._server_hist = get_http_server_request_duration_seconds()
+        self._requests = get_http_requests_counter()
+        self._latency = get_http_request_latency_seconds()
+
+        static: dict[str, str] = dict(SecurityHeadersMiddleware._BASE_HEADERS)
+        if hsts_max_age > 0:
+            parts = [f"max-age={int(hsts_max_age)}"]
+            if hsts_include_subdomains:
+                parts.append("includeSubDomains")
+            if hsts_preload:
+                parts.append("preload")
+            static["Strict-Transport-Security"] = "; ".join(parts)
+        self._static_headers: tuple[tuple[bytes, bytes], ...] = tuple(
+            (name.lower().encode("latin-1"), value.encode("latin-1"))
+            for name, value in static.items()
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle one ASGI connection; non-HTTP scopes pass straight through."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        inbound_trace: str | None = None
+        inbound_request_id: str | None = None
+        for name, value in scope["headers"]:
+            if name == _TRACE_HEADER_RAW:
+                inbound_trace = value.decode("latin-1")
+            elif name == _REQUEST_ID_HEADER_RAW:
+                inbound_request_id = value.decode("latin-1")
+
+        trace_id = _sanitize_inbound_trace(inbound_trace) or _new_trace_id()
+        request_id = _coerce_request_id(inbound_request_id)
+
+        # Starlette's ``request.state`` is backed by ``scope["state"]``.
+        state = scope.setdefault("state", {})
+        state["trace_id"] = trace_id
+        state["request_id"] = request_id
+        set_request_context(request_id=request_id, trace_id=trace_id)
+
+        correlation = (
+            (_REQUEST_ID_HEADER_RAW, request_id.encode("latin-1")),
+            (_TRACE_HEADER_RAW, trace_id.encode("latin-1")),
+        )
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = list(message.get("headers", ()))
+                present = {name.lower() for name, _ in headers}
+                for name, value in correlation + self._static_headers:
+                    if name not in present:
+                        headers.append((name, value))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        start = time.perf_counter()
+        ok = False
+        try:
+            await self.app(scope, receive, send_wrapper)
+            ok = True
+        finally:
+            self._record(scope, status_code, ok, time.perf_counter() - start, request_id)
+
+    def _record(
+        self,
+        scope: Scope,
+        status_code: int,
+        ok: bool,
+        elapsed: float,
+        request_id: str,
+    ) -> None:
+        """Emit the access log and latency metrics; never raises."""
+        method = scope["method"].upper()
+        path = scope["path"]
+        route = scope.get("route")
+        handler = getattr(route, "path_format", None) or getattr(route, "path", None) or path
+        status = str(status_code)
+
+        try:
+            self._server_hist.labels(method, handler, status).observe(elapsed)
+        except Exception:
+            logger.debug("prom.histogram_observe_failed", exc_info=True)
+
+        try:
+            self._requests.labels(method, status).inc()
+            self._latency.labels(method, status).observe(elapsed)
+        except Exception:
+            logger.debug("prom.metrics_record_failed", exc_info=True)
+
+        try:
+            _otel_hist().record(
+                elapsed,
+                attributes={
+                    "http.method": method,
+                    "http.route": handler,
+                    "http.target": path,
+                    "http.status_code": status_code,
+                },
+            )
+        except Exception:
+            logger.debug("otel.histogram_record_failed", exc_info=True)
+
+        client = scope.get("client")
+        log: dict[str, Any] = {
+            "evt": "access",
+            "method": method,
+            "path": path,
+            "query": scope.get("query_string", b"").decode("latin-1"),
+            "status": status_code,
+            "elapsed_ms": round(elapsed * 1000.0, 2),
+            "client_ip": client[0] if client else None,
+            "request_id": request_id,
+            "ok": ok,
+        }
+        _access_logger.info("access_log", extra=log)
@@ -1,11 +1,21 @@
 # Copyright (c) Arche.
 # SPDX-License-Identifier: MIT
-"""In-memory Rate Limit Middleware (token bucket, dev/local only)
+"""Rate Limit Middleware (GCRA, Redis-backed or in-memory)
 
 Summary:
-    A lightweight token-bucket limiter suitable for development and CI. It
-    tracks tokens per (client_ip, path) key in process memory and emits
-    standard rate limit headers.
+    Pure-ASGI limiter that evaluates one GCRA decision per request through a
+    pluggable backend (see :mod:`arche_api.infrastructure.resilience.rate_limiter`).
+    With the Redis backend every worker shares the same budget; the in-memory
+    backend is per-process and intended for development and CI.
+
+Keys and quotas:
+    * Identity: a hash of ``X-Api-Key`` when the key is mapped to a plan,
+      else the client IP. Unknown keys are ignored so that rotating made-up
+      keys neither escapes the IP budget nor grows the bucket table.
+    * Plan: API-key hashes may be mapped to a named plan quota; everyone else
+      gets the default quota.
+    * Routes: path prefixes may carry their own quota and get a separate
+      bucket per identity; all other paths share the identity's plan bucket.
 
 Emitted headers:
     X-RateLimit-Limit, X-RateLimit-Remaining, X-RateLimit-Reset, Retry-After (on 429)
@@ -13,93 +23,197 @@ Emitted headers:
 
 from __future__ import annotations
 
-import time
-from dataclasses import dataclass
+import hashlib
+import json
+import math
+from collections.abc import Mapping
+from contextlib import suppress
+from typing import Any
 
-from fastapi import Request
 from starlette import status
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.responses import JSONResponse, Response
-from starlette.types import ASGIApp
-
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from arche_api.infrastructure.observability.metrics import get_rate_limit_decisions_total
+from arche_api.infrastructure.resilience.rate_limiter import (
+    InMemoryRateLimiter,
+    Quota,
+    RateLimitDecision,
+    RateLimiter,
+    RedisRateLimiter,
+)
+
+_API_KEY_HEADER = b"x-api-key"
+_DEFAULT_PLAN = "default"
+
+_LIMITED_BODY = json.dumps(
+    {
+        "error": {
+            "code": "RATE_LIMITED",
+            "http_status": 429,
+            "message": "Too many requests",
+        }
+    },
+    separators=(",", ":"),
+).encode("utf-8")
+
+
+def api_key_fingerprint(api_key: str) -> str:
+    """Return the SHA-256 hex digest used to identify an API key (never the key)."""
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+
+
+def build_rate_limiter(backend: str, *, max_local_keys: int = 10_000) -> RateLimiter:
+    """Return the limiter for ``backend`` (``redis`` or ``memory``).
+
+    The Redis limiter resolves the shared client lazily on every call and
+    falls back to a bounded local limiter while Redis is unavailable.
+    """
+    local = InMemoryRateLimiter(max_keys=max_local_keys)
+    if backend.strip().lower() != "redis":
+        return local
 
-@dataclass
-class _Bucket:
-    """Token bucket state."""
+    from arche_api.infrastructure.caching.redis_client import get_redis_client
 
-    tokens: float
-    last: float
+    return RedisRateLimiter(get_redis_client, fallback=local)
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    """Very simple in-memory token bucket for dev/local.
+class RateLimitMiddleware:
+    """GCRA rate limiting with per-plan and per-route quotas.
 
     Args:
         app: ASGI application.
-        rate_per_sec: Token refill rate per second.
-        burst: Maximum bucket capacity (requests allowed at once).
+        quota: Default quota for identities without a plan.
+        limiter: Decision backend. Defaults to a per-process in-memory limiter.
+        plans: Named plan quotas.
+        api_key_plans: Map of API-key fingerprint (see
+            :func:`api_key_fingerprint`) to plan name.
+        route_quotas: Map of path prefix to quota; the longest matching
+            prefix wins and gets its own bucket.
     """
 
-    def __init__(self, app: ASGIApp, rate_per_sec: float = 5.0, burst: int = 10) -> None:
-        super().__init__(app)
-        self.rate: float = float(rate_per_sec)
-        self.capacity: float = float(burst)
-        self.buckets: dict[str, _Bucket] = {}
-
-    def _key(self, request: Request) -> str:
-        """Return a per-client, per-path key."""
-        ip = request.client.host if request.client else "unknown"
-        return f"{ip}:{request.url.path}"
-
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        """Apply token-bucket limiting and annotate responses with standard headers."""
-        now = time.monotonic()
-        key = self._key(request)
-        bucket = self.buckets.get(key)
-        if bucket is None:
-            bucket = _Bucket(tokens=self.capacity, last=now)
-            self.buckets[key] = bucket
-
-        # Refill
-        delta = max(0.0, now - bucket.last)
-        bucket.tokens = min(self.capacity, bucket.tokens + delta * self.rate)
-        bucket.last = now
-
-        # Try to consume a token
-        if bucket.tokens < 1.0:
-            retry_after = max(1, int((1.0 - bucket.tokens) / self.rate) + 1)
-            limited = JSONResponse(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                content={
-                    "error": {
-                        "code": "RATE_LIMITED",
-                        "http_status": 429,
-                        "message": "Too many requests",
-                    }
-                },
-            )
-            limited.headers.update(
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        quota: Quota | None = None,
+        limiter: RateLimiter | None = None,
+        plans: Mapping[str, Quota] | None = None,
+        api_key_plans: Mapping[str, str] | None = None,
+        route_quotas: Mapping[str, Quota] | None = None,
+    ) -> None:
+        """Initialize the middleware and validate plan references."""
+        self.app = app
+        self.quota = quota or Quota(limit=10, window_s=2.0)
+        self.limiter: RateLimiter = limiter if limiter is not None else InMemoryRateLimiter()
+        self.plans: dict[str, Quota] = dict(plans or {})
+        self.api_key_plans: dict[str, str] = dict(api_key_plans or {})
+        unknown = set(self.api_key_plans.values()) - set(self.plans)
+        if unknown:
+            raise ValueError(f"api_key_plans reference unknown plans: {sorted(unknown)}")
+        self.route_quotas: list[tuple[str, Quota]] = sorted(
+            (route_quotas or {}).items(), key=lambda item: len(item[0]), reverse=True
+        )
+        self._decisions = get_rate_limit_decisions_total()
+
+    def _resolve(self, scope: Scope) -> tuple[str, str, Quota]:
+        """Return ``(bucket_key, plan, quota)`` for the request."""
+        api_key: str | None = None
+        for name, value in scope["headers"]:
+            if name == _API_KEY_HEADER:
+                api_key = value.decode("latin-1").strip() or None
+                break
+
+        fingerprint = api_key_fingerprint(api_key) if api_key is not None else None
+        if fingerprint is not None and fingerprint in self.api_key_plans:
+            identity = f"key:{fingerprint[:32]}"
+            plan = self.api_key_plans[fingerprint]
+            quota = self.plans[plan]
+        else:
+            # Unknown or missing keys share the caller's IP bucket.
+            client = scope.get("client")
+            identity = f"ip:{client[0] if client else 'unknown'}"
+            plan = _DEFAULT_PLAN
+            quota = self.quota
+
+        path: str = scope["path"]
+        for prefix, route_quota in self.route_quotas:
+            if path.startswith(prefix):
+                return f"{identity}:{prefix}", plan, route_quota
+        return f"{identity}:*", plan, quota
+
+    def _record(self, decision: RateLimitDecision, plan: str) -> None:
+        outcome = "allowed" if decision.allowed else "limited"
+        with suppress(Exception):
+            self._decisions.labels(backend=decision.backend, outcome=outcome, plan=plan).inc()
+
+    @staticmethod
+    def _headers(decision: RateLimitDecision) -> list[tuple[bytes, bytes]]:
+        headers = [
+            (b"x-ratelimit-limit", str(decision.limit).encode()),
+            (b"x-ratelimit-remaining", str(decision.remaining).encode()),
+            (b"x-ratelimit-reset", str(math.ceil(decision.reset_after_s)).encode()),
+        ]
+        if not decision.allowed:
+            retry_after = max(1, math.ceil(decision.retry_after_s))
+            headers.append((b"retry-after", str(retry_after).encode()))
+        return headers
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Apply the limiter and annotate responses with standard headers."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        key, plan, quota = self._resolve(scope)
+        decision = await self.limiter.hit(key, quota)
+        self._record(decision, plan)
+        rate_headers = self._headers(decision)
+
+        if not decision.allowed:
+            await send(
                 {
-                    "Retry-After": str(retry_after),
-                    "X-RateLimit-Limit": str(int(self.capacity)),
-                    "X-RateLimit-Remaining": "0",
-                    "X-RateLimit-Reset": str(retry_after),
+                    "type": "http.response.start",
+                    "status": status.HTTP_429_TOO_MANY_REQUESTS,
+                    "headers": [
+                        (b"content-type", b"application/json"),
+                        (b"content-length", str(len(_LIMITED_BODY)).encode()),
+                        *rate_headers,
+                    ],
                 }
             )
-            return limited
-
-        # Spend one token before calling downstream
-        bucket.tokens -= 1.0
-        self.buckets[key] = bucket
-
-        response: Response = await call_next(request)
-
-        # After response, expose headers with current remaining tokens
-        response.headers.update(
-            {
-                "X-RateLimit-Limit": str(int(self.capacity)),
-                "X-RateLimit-Remaining": str(int(bucket.tokens)),
-                "X-RateLimit-Reset": "0",
-            }
-        )
-        return response
+            await send({"type": "http.response.body", "body": _LIMITED_BODY})
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", ()))
+                headers.extend(rate_headers)
+                message = {**message, "headers": headers}
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+def rate_limit_options(
+    *,
+    backend: str,
+    quota: Quota,
+    plans: Mapping[str, str] | None = None,
+    api_key_plans: Mapping[str, str] | None = None,
+    route_quotas: Mapping[str, str] | None = None,
+    max_local_keys: int = 10_000,
+) -> dict[str, Any]:
+    """Return ``RateLimitMiddleware`` kwargs from settings-style values.
+
+    ``plans`` and ``route_quotas`` map names/prefixes to ``"<limit>/<seconds>"``
+    specs; malformed specs raise ``ValueError`` at startup.
+    """
+    return {
+        "quota": quota,
+        "limiter": build_rate_limiter(backend, max_local_keys=max_local_keys),
+        "plans": {name: Quota.parse(spec) for name, spec in (plans or {}).items()},
+        "api_key_plans": dict(api_key_plans or {}),
+        "route_quotas": {
+            prefix: Quota.parse(spec) for prefix, spec in (route_quotas or {}).items()
+        },
+    }
@@ -0,0 +1,93 @@
+# src/arche_api/infrastructure/middleware/server_timing.py
+# Copyright (c) Arche.
+# SPDX-License-Identifier: MIT
+"""Server-Timing middleware (pure ASGI).
+
+Summary:
+    Reports the per-request stage breakdown recorded by ``timed_stage`` in a
+    ``Server-Timing`` response header, e.g.::
+
+        Server-Timing: timeseries.hydrate;dur=12.4, timeseries.compute;dur=3.1,
+                       timeseries.serialize;dur=0.8, total;dur=17.9
+
+Contract:
+    • Writes: Server-Timing (only when absent)
+    • Durations are milliseconds. Repeated stages (e.g. one hydrate per
+      company) are summed into one entry, in first-seen order.
+    • ``total`` covers the application from this middleware to the response
+      start; streamed bodies are not included.
+
+Notes:
+    The header discloses internal timings, so the middleware is opt-in
+    (``SERVER_TIMING_ENABLED``). Stages are only recorded while stage timing
+    is enabled; otherwise the header carries ``total`` alone.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Final
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from arche_api.infrastructure.observability.stages import (
+    begin_request_stages,
+    end_request_stages,
+)
+
+__all__ = ["ServerTimingMiddleware", "format_server_timing"]
+
+_HEADER_RAW: Final[bytes] = b"server-timing"
+
+
+def format_server_timing(stages: list[tuple[str, float]], total_s: float) -> str:
+    """Render stage durations (seconds) as a ``Server-Timing`` header value.
+
+    Args:
+        stages: ``(name, seconds)`` pairs in recording order.
+        total_s: Total time in seconds, rendered as the ``total`` entry.
+
+    Returns:
+        Comma-separated ``name;dur=<ms>`` entries.
+    """
+    summed: dict[str, float] = {}
+    for name, seconds in stages:
+        summed[name] = summed.get(name, 0.0) + seconds
+    entries = [f"{name};dur={seconds * 1000:.1f}" for name, seconds in summed.items()]
+    entries.append(f"total;dur={total_s * 1000:.1f}")
+    return ", ".join(entries)
+
+
+class ServerTimingMiddleware:
+    """Attach the request's stage breakdown as a ``Server-Timing`` header.
+
+    Args:
+        app: The downstream ASGI application.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Initialize the middleware."""
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle one ASGI connection; non-HTTP scopes pass straight through."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stages, token = begin_request_stages()
+        start = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", ()))
+                if all(name.lower() != _HEADER_RAW for name, _ in headers):
+                    value = format_server_timing(stages, time.perf_counter() - start)
+                    headers.append((_HEADER_RAW, value.encode("latin-1")))
+                    message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            end_request_stages(token)
@@ -35,7 +35,7 @@ from contextlib import suppress
 from typing import Final
 
 import prometheus_client as prom
-from prometheus_client import Counter, Histogram
+from prometheus_client import Counter, Gauge, Histogram
 
 from .metrics_market_data import (
     observe_upstream_request as observe_market_data_request,
@@ -67,6 +67,7 @@ _BUCKETS: Final[tuple[float, ...]] = (
 _registry_id: int | None = None
 _hist_cache: dict[str, Histogram] = {}
 _counter_cache: dict[str, Counter] = {}
+_gauge_cache: dict[str, Gauge] = {}
 _lock = threading.RLock()
 
 
@@ -95,6 +96,7 @@ def _ensure_registry() -> None:
         if _registry_id is None or _registry_id != rid:
             _hist_cache.clear()
             _counter_cache.clear()
+            _gauge_cache.clear()
             _registry_id = rid
 
 
@@ -134,6 +136,24 @@ def _lookup_existing_counter(name: str) -> Counter | None:
     return None
 
 
+def _lookup_existing_gauge(name: str) -> Gauge | None:
+    """Return a previously-registered ``Gauge`` from the active registry.
+
+    Args:
+        name: Collector name.
+
+    Returns:
+        Gauge | None: Existing collector if present and of the correct type.
+    """
+    with _lock, suppress(Exception):
+        mapping = getattr(prom.REGISTRY, "_names_to_collectors", None)
+        if isinstance(mapping, dict):
+            col = mapping.get(name)
+            if isinstance(col, Gauge):
+                return col
+    return None
+
+
 # ---------------------------------------------------------------------------
 # Get-or-create helpers
 
@@ -245,6 +265,54 @@ def _get_or_create_counter(
             raise
 
 
+def _get_or_create_gauge(
+    name: str,
+    help_text: str,
+    *,
+    labelnames: tuple[str, ...] = (),
+) -> Gauge:
+    """Get or create a registry-bound ``Gauge`` with stable identity.
+
+    Args:
+        name: Metric name (snake_case).
+        help_text: Human-readable description.
+        labelnames: Optional label names tuple.
+
+    Returns:
+        Gauge: Bound to ``prom.REGISTRY``.
+    """
+    _ensure_registry()
+    with _lock:
+        cached = _gauge_cache.get(name)
+        if isinstance(cached, Gauge):
+            return cached
+
+        existing = _lookup_existing_gauge(name)
+        if isinstance(existing, Gauge):
+            _gauge_cache[name] = existing
+            return existing
+
+        labels: tuple[str, ...] = labelnames or ()
+
+        try:
+            g = Gauge(
+                name,
+                help_text,
+                labels,
+                registry=prom.REGISTRY,
+            )
+            _gauge_cache[name] = g
+            return g
+        except ValueError as exc:
+            if "Duplicated timeseries" in str(exc):
+                again = _lookup_existing_gauge(name)
+                if isinstance(again, Gauge):
+                    _gauge_cache[name] = again
+                    return again
+            _log.exception("Failed to register Prometheus gauge %s", name)
+            raise
+
+
 # ---------------------------------------------------------------------------
 # Health metrics (registry-aware singletons)
 
@@ -275,6 +343,73 @@ def get_readyz_redis_latency_seconds() -> Histogram:
     )
 
 
+def get_readyz_sample_age_seconds() -> Gauge:
+    """Return gauge for the age of the cached readiness sample.
+
+    Returns:
+        Gauge: Collector bound to the active registry.
+    """
+    return _get_or_create_gauge(
+        name="readyz_sample_age_seconds",
+        help_text="Age of the cached readiness sample when last served (seconds).",
+    )
+
+
+def get_db_pool_connections() -> Gauge:
+    """Return gauge for the database connection pool.
+
+    Labels:
+        state: ``checked_out``, ``idle``, ``overflow`` or ``waiting``.
+    """
+    return _get_or_create_gauge(
+        name="arche_db_pool_connections",
+        help_text="Database pool connections by state, sampled by the health sampler.",
+        labelnames=("state",),
+    )
+
+
+def get_db_read_routing_total() -> Counter:
+    """Return counter for read-only session routing decisions.
+
+    Labels:
+        target: ``replica`` or ``primary``.
+        reason: ``fresh`` (replica within the lag budget) or
+            ``no_eligible_replica`` (fallback to the primary).
+    """
+    return _get_or_create_counter(
+        name="arche_db_read_routing_total",
+        help_text="Read-only session routing decisions by target and reason.",
+        labelnames=("target", "reason"),
+    )
+
+
+def get_db_replica_lag_seconds() -> Gauge:
+    """Return gauge for measured replica replay lag.
+
+    Labels:
+        replica: Replica name (``replica-<index>``).
+    """
+    return _get_or_create_gauge(
+        name="arche_db_replica_lag_seconds",
+        help_text="Measured replication replay lag per read replica (seconds).",
+        labelnames=("replica",),
+    )
+
+
+def get_edgar_identity_cache_total() -> Counter:
+    """Return counter for EDGAR identity-map lookups.
+
+    Labels:
+        kind: ``company`` (CIK) or ``filing`` (accession).
+        outcome: ``hit``, ``negative_hit`` (known missing) or ``miss``.
+    """
+    return _get_or_create_counter(
+        name="arche_edgar_identity_cache_total",
+        help_text="EDGAR CIK/accession identity-map lookups by kind and outcome.",
+        labelnames=("kind", "outcome"),
+    )
+
+
 # ---------------------------------------------------------------------------
 # Ingest/operations metrics (registry-aware accessors)
 
@@ -417,3 +552,194 @@ def get_cache_operations_total() -> Counter:
         help_text="Total cache operations by type/namespace.",
         labelnames=("operation", "namespace", "hit"),
     )
+
+
+# ---------------------------------------------------------------------------
+# Resilience metrics
+# ---------------------------------------------------------------------------
+
+
+def get_circuit_breaker_transitions_total() -> Counter:
+    """Return counter for circuit-breaker state transitions.
+
+    Labels:
+        provider: Upstream provider (e.g. ``marketstack``).
+        endpoint: Logical endpoint guarded by the breaker (e.g. ``eod``).
+        from_state: Previous state (``CLOSED|OPEN|HALF_OPEN``).
+        to_state: New state (``CLOSED|OPEN|HALF_OPEN``).
+    """
+    return _get_or_create_counter(
+        name="arche_circuit_breaker_transitions_total",
+        help_text="Circuit breaker state transitions by provider/endpoint.",
+        labelnames=("provider", "endpoint", "from_state", "to_state"),
+    )
+
+
+def get_circuit_breaker_state() -> Gauge:
+    """Return gauge for the current circuit-breaker state.
+
+    Values: ``0`` = CLOSED, ``1`` = HALF_OPEN, ``2`` = OPEN.
+
+    Labels:
+        provider: Upstream provider.
+        endpoint: Logical endpoint guarded by the breaker.
+    """
+    return _get_or_create_gauge(
+        name="arche_circuit_breaker_state",
+        help_text="Current circuit breaker state (0=closed, 1=half_open, 2=open).",
+        labelnames=("provider", "endpoint"),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Outbound HTTP pool metrics
+# ---------------------------------------------------------------------------
+
+
+def get_http_client_requests_total() -> Counter:
+    """Return counter for outbound requests sent through pooled transports.
+
+    Labels:
+        provider: Upstream pool (e.g. ``marketstack``, ``edgar``, ``jwks``).
+        connection: ``new`` when a TCP connection was opened, else ``reused``.
+    """
+    return _get_or_create_counter(
+        name="arche_http_client_requests_total",
+        help_text="Outbound HTTP requests by provider and connection reuse.",
+        labelnames=("provider", "connection"),
+    )
+
+
+def get_http_client_request_duration_seconds() -> Histogram:
+    """Return histogram for outbound request latency (until response headers).
+
+    Labels:
+        provider: Upstream pool.
+        connection: ``new`` or ``reused``.
+    """
+    return _get_or_create_hist(
+        name="arche_http_client_request_duration_seconds",
+        help_text="Outbound HTTP latency (seconds) by provider and connection reuse.",
+        labelnames=("provider", "connection"),
+    )
+
+
+def get_http_client_pool_connections() -> Gauge:
+    """Return gauge for pooled connections per provider.
+
+    Labels:
+        provider: Upstream pool.
+        state: ``active`` (serving a request) or ``idle`` (kept alive).
+    """
+    return _get_or_create_gauge(
+        name="arche_http_client_pool_connections",
+        help_text="Pooled outbound HTTP connections by provider and state.",
+        labelnames=("provider", "state"),
+    )
+
+
+def get_rate_limit_decisions_total() -> Counter:
+    """Return counter for HTTP rate-limit decisions.
+
+    Labels:
+        backend: ``memory``, ``redis`` or ``fallback`` (Redis unavailable).
+        outcome: ``allowed`` or ``limited``.
+        plan: Resolved quota plan (``default`` when none applies).
+    """
+    return _get_or_create_counter(
+        name="arche_rate_limit_decisions_total",
+        help_text="HTTP rate-limit decisions by backend, outcome and plan.",
+        labelnames=("backend", "outcome", "plan"),
+    )
+
+
+def get_auth_token_cache_total() -> Counter:
+    """Return counter for verified-token cache lookups.
+
+    Labels:
+        outcome: ``hit`` or ``miss``.
+    """
+    return _get_or_create_counter(
+        name="arche_auth_token_cache_total",
+        help_text="Verified JWT cache lookups by outcome.",
+        labelnames=("outcome",),
+    )
+
+
+def get_jwks_refresh_total() -> Counter:
+    """Return counter for JWKS fetches.
+
+    Labels:
+        trigger: ``cold``, ``stale``, ``background`` or ``unknown_kid``.
+        outcome: ``success`` or ``error``.
+    """
+    return _get_or_create_counter(
+        name="arche_jwks_refresh_total",
+        help_text="JWKS fetches by trigger and outcome.",
+        labelnames=("trigger", "outcome"),
+    )
+
+
+def get_log_records_dropped_total() -> Counter:
+    """Return counter for log records that were not written.
+
+    Labels:
+        reason: ``queue_full``, ``sampled``, ``format_error`` or ``write_error``.
+    """
+    return _get_or_create_counter(
+        name="arche_log_records_dropped_total",
+        help_text="Log records dropped by the logging pipeline, by reason.",
+        labelnames=("reason",),
+    )
+
+
+def get_otel_spans_dropped_total() -> Counter:
+    """Return counter for spans that were recorded but never exported.
+
+    Labels:
+        reason: ``queue_full`` (bounded export queue), ``tail_buffer_full``
+            (tail-sampling buffer evicted an undecided trace) or ``shutdown``.
+    """
+    return _get_or_create_counter(
+        name="arche_otel_spans_dropped_total",
+        help_text="Trace spans dropped before export, by reason.",
+        labelnames=("reason",),
+    )
+
+
+def get_otel_trace_sampling_total() -> Counter:
+    """Return counter for sampling outcomes of locally rooted traces.
+
+    Labels:
+        decision: ``head`` (ratio-sampled), ``error`` / ``slow`` (promoted by the
+            tail processor) or ``unsampled`` (recorded, then discarded).
+    """
+    return _get_or_create_counter(
+        name="arche_otel_trace_sampling_total",
+        help_text="Sampling outcomes of locally rooted traces, by decision.",
+        labelnames=("decision",),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Pipeline stage metrics
+# ---------------------------------------------------------------------------
+
+# Stages are often sub-millisecond (engine passes over a page, presenters), so
+# the stage histogram extends the common buckets downwards.
+_STAGE_BUCKETS: Final[tuple[float, ...]] = (0.0005, 0.001, 0.0025, *_BUCKETS)
+
+
+def get_stage_duration_seconds() -> Histogram:
+    """Return histogram for use-case pipeline stage latency.
+
+    Labels:
+        stage: Static ``<pipeline>.<stage>`` name (e.g. ``timeseries.compute``).
+        outcome: ``success`` or ``error``.
+    """
+    return _get_or_create_hist(
+        name="arche_stage_duration_seconds",
+        help_text="Latency (seconds) of use-case pipeline stages.",
+        labelnames=("stage", "outcome"),
+        buckets=_STAGE_BUCKETS,
+    )
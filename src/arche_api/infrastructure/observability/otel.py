@@ -3,15 +3,22 @@
 # SPDX-License-Identifier: MIT
 """OpenTelemetry bootstrap (soft dependency).
 
-This module wires OTLP exporters for traces and metrics using the canonical
-application :class:`Settings`. OpenTelemetry is treated as an optional
-dependency:
+This module is the single tracing/metrics bootstrap for the process. It wires
+OTLP exporters for traces and metrics using the canonical application
+:class:`Settings`, installs the sampler from
+:mod:`arche_api.infrastructure.observability.sampling` (parent-based ratio,
+per-route overrides, tail promotion of error/slow traces) in front of a bounded
+batch export queue, and instruments FastAPI, HTTPX and SQLAlchemy against that
+provider. OpenTelemetry is treated as an optional dependency:
 
 * If the OTEL packages are not importable, this module degrades to a no-op and
   logs a warning instead of crashing import or test collection.
-* If ``settings.otel_enabled`` is false, :func:`init_otel` is a no-op.
+* If ``settings.otel_enabled`` is false, :func:`init_otel` is a no-op and the
+  SDK/exporter modules are never imported.
 * If ``settings.otel_exporter_otlp_endpoint`` is set, OTLP exporters will
   be configured to use that endpoint; otherwise library defaults apply.
+* Instrumentation packages are optional individually; a missing one is
+  skipped with a log line.
 """
 
 from __future__ import annotations
@@ -59,34 +66,31 @@ BatchSpanProcessor: Any = None
 # Runtime import wiring (soft dependency)
 # ---------------------------------------------------------------------------
 
+_SDK_SYMBOLS: dict[str, tuple[str, str]] = {
+    "OTLPMetricExporter": (
+        "opentelemetry.exporter.otlp.proto.grpc.metric_exporter",
+        "OTLPMetricExporter",
+    ),
+    "OTLPSpanExporter": (
+        "opentelemetry.exporter.otlp.proto.grpc.trace_exporter",
+        "OTLPSpanExporter",
+    ),
+    "MeterProvider": ("opentelemetry.sdk.metrics", "MeterProvider"),
+    "PeriodicExportingMetricReader": (
+        "opentelemetry.sdk.metrics.export",
+        "PeriodicExportingMetricReader",
+    ),
+    "Resource": ("opentelemetry.sdk.resources", "Resource"),
+    "TracerProvider": ("opentelemetry.sdk.trace", "TracerProvider"),
+    "BatchSpanProcessor": ("opentelemetry.sdk.trace.export", "BatchSpanProcessor"),
+}
+
+# Only the lightweight API packages are imported eagerly. The SDK and the gRPC
+# exporters (protobuf, grpcio) are loaded by init_otel when OTEL is enabled, so
+# deployments with OTEL off never pay for them at import time.
 try:  # pragma: no cover - import wiring is exercised indirectly via init_otel
     metrics = importlib.import_module("opentelemetry.metrics")
     trace = importlib.import_module("opentelemetry.trace")
-
-    from opentelemetry.exporter.otlp.proto.grpc.metric_exporter import (
-        OTLPMetricExporter as _RealOTLPMetricExporter,
-    )
-    from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import (
-        OTLPSpanExporter as _RealOTLPSpanExporter,
-    )
-    from opentelemetry.sdk.metrics import MeterProvider as _RealMeterProvider
-    from opentelemetry.sdk.metrics.export import (
-        PeriodicExportingMetricReader as _RealPeriodicExportingMetricReader,
-    )
-    from opentelemetry.sdk.resources import Resource as _RealResource
-    from opentelemetry.sdk.trace import TracerProvider as _RealTracerProvider
-    from opentelemetry.sdk.trace.export import (
-        BatchSpanProcessor as _RealBatchSpanProcessor,
-    )
-
-    OTLPMetricExporter = _RealOTLPMetricExporter
-    OTLPSpanExporter = _RealOTLPSpanExporter
-    MeterProvider = _RealMeterProvider
-    PeriodicExportingMetricReader = _RealPeriodicExportingMetricReader
-    Resource = _RealResource
-    TracerProvider = _RealTracerProvider
-    BatchSpanProcessor = _RealBatchSpanProcessor
-
     _OTEL_AVAILABLE = True
 except ModuleNotFoundError:  # pragma: no cover - only hit when OTEL is absent
     _OTEL_AVAILABLE = False
@@ -104,8 +108,72 @@ except ModuleNotFoundError:  # pragma: no cover - only hit when OTEL is absent
     )
 
 
-def init_otel(service_name: str, service_version: str) -> None:
-    """Initialize OpenTelemetry tracing and metrics exporters.
+def _load_sdk() -> bool:
+    """Import the OTEL SDK and OTLP exporters on first use.
+
+    Names that are already bound (for example, fakes installed by tests) are
+    left untouched.
+
+    Returns:
+        bool: False if any SDK/exporter module is not importable.
+    """
+    module_globals = globals()
+    for name, (module_name, attr) in _SDK_SYMBOLS.items():
+        if module_globals.get(name) is not None:
+            continue
+        try:
+            module_globals[name] = getattr(importlib.import_module(module_name), attr)
+        except ModuleNotFoundError:
+            return False
+    return True
+
+
+def _instrument(app: Any, tracer_provider: Any) -> None:
+    """Instrument FastAPI (``app``), HTTPX and SQLAlchemy with ``tracer_provider``.
+
+    Each instrumentation is optional; import or wiring failures are logged and
+    skipped so observability never breaks startup.
+    """
+    targets = (
+        ("fastapi", "opentelemetry.instrumentation.fastapi", "FastAPIInstrumentor"),
+        ("httpx", "opentelemetry.instrumentation.httpx", "HTTPXClientInstrumentor"),
+        ("sqlalchemy", "opentelemetry.instrumentation.sqlalchemy", "SQLAlchemyInstrumentor"),
+    )
+    for name, module_name, attr in targets:
+        try:
+            instrumentor = getattr(importlib.import_module(module_name), attr)
+            if name == "fastapi":
+                instrumentor.instrument_app(app, tracer_provider=tracer_provider)
+            else:
+                instrumentor().instrument(tracer_provider=tracer_provider)
+        except Exception as exc:  # noqa: BLE001 - optional instrumentation
+            logger.info(
+                "otel.instrumentation_skipped",
+                extra={"extra": {"instrumentation": name, "error": str(exc)}},
+            )
+
+
+def _build_span_processor(settings: Any, span_exporter: Any) -> Any:
+    """Return the bounded batch processor behind the tail-sampling gate."""
+    from arche_api.infrastructure.observability.sampling import TailSamplingSpanProcessor
+
+    queue_size = settings.otel_bsp_max_queue_size
+    batch = BatchSpanProcessor(
+        span_exporter,
+        max_queue_size=queue_size,
+        schedule_delay_millis=settings.otel_bsp_schedule_delay_ms,
+        max_export_batch_size=min(settings.otel_bsp_max_export_batch_size, queue_size),
+    )
+    return TailSamplingSpanProcessor(
+        batch,
+        max_queue_size=queue_size,
+        keep_errors=settings.otel_traces_keep_errors,
+        slow_threshold_ms=settings.otel_traces_slow_threshold_ms,
+    )
+
+
+def init_otel(service_name: str, service_version: str, app: Any | None = None) -> None:
+    """Initialize OpenTelemetry tracing, metrics and instrumentation.
 
     This function configures OTLP exporters for traces and metrics based on the
     canonical application :class:`Settings`:
@@ -115,10 +183,15 @@ def init_otel(service_name: str, service_version: str) -> None:
       structured warning.
     * If ``settings.otel_exporter_otlp_endpoint`` is set, OTLP exporters will
       be configured to use that endpoint; otherwise library defaults apply.
+    * Root traces are head-sampled at ``otel_traces_sample_ratio`` with
+      ``otel_traces_route_sample_ratios`` overrides; unsampled traces that error
+      or exceed ``otel_traces_slow_threshold_ms`` are still exported.
 
     Args:
         service_name: Logical service name (for example, ``"arche_api"``).
         service_version: Deployed service version string.
+        app: FastAPI application to instrument. When omitted only providers and
+            exporters are configured.
     """
     global _OTEL_INITIALIZED
 
@@ -136,7 +209,7 @@ def init_otel(service_name: str, service_version: str) -> None:
         )
         return
 
-    if not _OTEL_AVAILABLE:
+    if not _OTEL_AVAILABLE or not _load_sdk():
         logger.warning(
             "otel.unavailable",
             extra={
@@ -177,12 +250,13 @@ def init_otel(service_name: str, service_version: str) -> None:
         return
 
     # At this point OTEL is importable and enabled in settings.
-    resource = Resource.create(
-        {
-            "service.name": service_name,
-            "service.version": service_version,
-        }
-    )
+    from arche_api.infrastructure.observability.sampling import build_sampler
+
+    resource_attributes = {"service.name": service_name, "service.version": service_version}
+    environment = getattr(settings.environment, "value", None)
+    if environment:
+        resource_attributes["deployment.environment"] = environment
+    resource = Resource.create(resource_attributes)
 
     # -----------------------------------------------------------------------
     # Tracing
@@ -192,9 +266,18 @@ def init_otel(service_name: str, service_version: str) -> None:
     else:
         span_exporter = OTLPSpanExporter()
 
-    tracer_provider = TracerProvider(resource=resource)
-    tracer_provider.add_span_processor(BatchSpanProcessor(span_exporter))
+    sampler = build_sampler(
+        settings.otel_traces_sample_ratio,
+        settings.otel_traces_route_sample_ratios,
+        tail_enabled=(
+            settings.otel_traces_keep_errors or settings.otel_traces_slow_threshold_ms is not None
+        ),
+    )
+    tracer_provider = TracerProvider(resource=resource, sampler=sampler)
+    tracer_provider.add_span_processor(_build_span_processor(settings, span_exporter))
     trace.set_tracer_provider(tracer_provider)
+    if app is not None:
+        _instrument(app, tracer_provider)
 
     # -----------------------------------------------------------------------
     # Metrics
@@ -221,6 +304,7 @@ def init_otel(service_name: str, service_version: str) -> None:
                     if settings.otel_exporter_otlp_endpoint
                     else "default"
                 ),
+                "sampler": sampler.get_description(),
             }
         },
     )
@@ -0,0 +1,189 @@
+# src/arche_api/infrastructure/observability/profiler.py
+# Copyright (c) Arche.
+# SPDX-License-Identifier: MIT
+"""On-demand wall-clock stack sampler for the current worker process.
+
+:func:`sample_stacks` snapshots every Python thread's stack with
+:func:`sys._current_frames` at a fixed interval for a bounded duration and
+aggregates identical stacks into flamegraph "collapsed" lines::
+
+    thread:MainThread;run (asyncio/runners.py:86);...;compute (.../derived_metrics_engine.py:120) 42
+
+The output feeds ``flamegraph.pl``, speedscope or Grafana/Pyroscope directly.
+
+Async awareness:
+    A coroutine that is executing sits on the event-loop thread's real stack
+    (each ``await`` frame is a Python frame), so CPU time is attributed to the
+    full coroutine chain. Suspended tasks cost no CPU and appear as the loop's
+    idle ``select`` leaf, which is dropped unless ``include_idle`` is set.
+
+Overhead:
+    Nothing runs while no profile is in progress: there is no hook, no
+    ``sys.setprofile`` and no background thread. During a profile, one thread
+    walks the frames at the sampling interval (default 100 Hz). Only one
+    profile runs per process at a time; a second caller gets
+    :class:`ProfilerBusy`.
+
+Layer:
+    infrastructure/observability
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from types import CodeType, FrameType
+from typing import Final
+
+__all__ = ["Profile", "ProfilerBusy", "sample_stacks"]
+
+#: Deepest stack recorded; deeper stacks keep their innermost frames.
+MAX_STACK_DEPTH: Final[int] = 128
+
+# (file name, function) of leaf frames where a thread is parked rather than
+# working: the event loop's selector, Event/Condition waits and idle executor
+# workers.
+_IDLE_LEAVES: Final[frozenset[tuple[str, str]]] = frozenset(
+    {
+        ("selectors.py", "select"),
+        ("threading.py", "wait"),
+        ("threading.py", "_wait_for_tstate_lock"),
+        ("thread.py", "_worker"),
+        ("queue.py", "get"),
+    }
+)
+
+_lock = threading.Lock()
+
+
+class ProfilerBusy(RuntimeError):
+    """Raised when a profile is already running in this process."""
+
+
+@dataclass(frozen=True, slots=True)
+class Profile:
+    """Result of one sampling run.
+
+    Attributes:
+        stacks: Collapsed stack -> number of samples.
+        samples: Sampling ticks taken (each tick samples every thread).
+        duration_s: Wall-clock duration of the run.
+        interval_s: Target interval between ticks.
+    """
+
+    stacks: dict[str, int]
+    samples: int
+    duration_s: float
+    interval_s: float
+
+    def collapsed(self) -> str:
+        """Return the profile in collapsed-stack format, one stack per line."""
+        return "".join(f"{stack} {count}\n" for stack, count in sorted(self.stacks.items()))
+
+
+def _path_prefixes() -> tuple[str, ...]:
+    """Return import roots, longest first, used to shorten file names."""
+    roots = {os.path.abspath(p) + os.sep for p in sys.path if p}
+    return tuple(sorted(roots, key=len, reverse=True))
+
+
+class _FrameLabels:
+    """Caches ``function (file:line)`` labels per code object for one run."""
+
+    def __init__(self) -> None:
+        self._prefixes = _path_prefixes()
+        self._labels: dict[CodeType, str] = {}
+
+    def __call__(self, code: CodeType) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            filename = code.co_filename
+            for prefix in self._prefixes:
+                if filename.startswith(prefix):
+                    filename = filename[len(prefix) :]
+                    break
+            label = f"{code.co_qualname} ({filename}:{code.co_firstlineno})".replace(";", ":")
+            self._labels[code] = label
+        return label
+
+
+def _is_idle(frame: FrameType) -> bool:
+    code = frame.f_code
+    return (os.path.basename(code.co_filename), code.co_name) in _IDLE_LEAVES
+
+
+def _collapse(frame: FrameType, labels: _FrameLabels, root: str) -> str:
+    parts: list[str] = []
+    current: FrameType | None = frame
+    while current is not None and len(parts) < MAX_STACK_DEPTH:
+        parts.append(labels(current.f_code))
+        current = current.f_back
+    parts.append(root)
+    parts.reverse()
+    return ";".join(parts)
+
+
+def sample_stacks(
+    seconds: float,
+    *,
+    interval_s: float = 0.01,
+    include_idle: bool = False,
+) -> Profile:
+    """Sample all threads of this process (except the caller) for ``seconds``.
+
+    Blocking: run it on a worker thread (``asyncio.to_thread``) so the event
+    loop keeps serving the traffic being profiled.
+
+    Args:
+        seconds: Profile duration. Callers enforce the upper bound.
+        interval_s: Target interval between sampling ticks.
+        include_idle: Keep samples whose leaf frame is an idle wait.
+
+    Returns:
+        The aggregated :class:`Profile`.
+
+    Raises:
+        ProfilerBusy: If another profile is running in this process.
+    """
+    if not _lock.acquire(blocking=False):
+        raise ProfilerBusy("a profile is already running in this worker")
+    try:
+        own_ident = threading.get_ident()
+        labels = _FrameLabels()
+        stacks: Counter[str] = Counter()
+        ticks = 0
+        started = time.perf_counter()
+        deadline = started + seconds
+        next_tick = started
+
+        while True:
+            now = time.perf_counter()
+            if now >= deadline:
+                break
+            if now < next_tick:
+                time.sleep(min(next_tick, deadline) - now)
+                continue
+            # Schedule from now rather than the previous tick, so a slow tick
+            # is not followed by a burst of catch-up samples.
+            next_tick = now + interval_s
+
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own_ident or (not include_idle and _is_idle(frame)):
+                    continue
+                root = f"thread:{names.get(ident, ident)}"
+                stacks[_collapse(frame, labels, root)] += 1
+            ticks += 1
+
+        return Profile(
+            stacks=dict(stacks),
+            samples=ticks,
+            duration_s=time.perf_counter() - started,
+            interval_s=interval_s,
+        )
+    finally:
+        _lock.release()
@@ -0,0 +1,321 @@
+# src/arche_api/infrastructure/observability/sampling.py
+# Copyright (c) Arche.
+# SPDX-License-Identifier: MIT
+"""Trace sampling for the OpenTelemetry bootstrap (head + local tail).
+
+Head sampling decides at span start, from the trace id, whether a trace is
+exported. Per-route ratios override the default ratio by longest path prefix,
+so ``/health`` and ``/metrics`` can be sampled at 0% while business routes use
+the configured ratio. Child spans follow their parent (parent-based), and
+upstream ``traceparent`` decisions are honored.
+
+Tail promotion keeps the traces head sampling would have missed but that
+matter most: requests that errored or ran slower than a threshold. Unsampled
+traces on non-zero routes are *recorded* (not exported) and buffered in this
+process until their local root span ends; the buffer is then either promoted
+to the exporter or discarded. Routes overridden to 0% are never recorded.
+
+:class:`TailSamplingSpanProcessor` is also the single gate in front of the
+bounded :class:`~opentelemetry.sdk.trace.export.BatchSpanProcessor` queue and
+counts spans dropped because that queue (or the tail buffer) was full.
+
+This module imports the OTEL SDK and is only loaded by
+:func:`arche_api.infrastructure.observability.otel.init_otel` when OTEL is
+enabled.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+from contextlib import suppress
+from typing import Any
+
+from opentelemetry import trace
+from opentelemetry.context import Context
+from opentelemetry.sdk.trace import ReadableSpan, Span, SpanProcessor
+from opentelemetry.sdk.trace.sampling import (
+    ALWAYS_OFF,
+    Decision,
+    ParentBased,
+    Sampler,
+    SamplingResult,
+    TraceIdRatioBased,
+)
+from opentelemetry.trace import Link, SpanContext, SpanKind, StatusCode, TraceFlags
+from opentelemetry.trace.span import TraceState
+from opentelemetry.util.types import Attributes
+
+from arche_api.infrastructure.observability.metrics import (
+    get_otel_spans_dropped_total,
+    get_otel_trace_sampling_total,
+)
+
+__all__ = [
+    "RouteRatioSampler",
+    "TailSamplingSpanProcessor",
+    "build_sampler",
+]
+
+#: Span attribute set on promoted spans (``error`` or ``slow``).
+PROMOTED_ATTRIBUTE = "sampling.promoted"
+
+_PATH_ATTRIBUTES = ("url.path", "http.target", "http.route")
+
+
+def _path_of(attributes: Attributes) -> str | None:
+    """Return the request path from HTTP server span attributes, if any."""
+    if not attributes:
+        return None
+    for key in _PATH_ATTRIBUTES:
+        value = attributes.get(key)
+        if isinstance(value, str) and value:
+            return value.split("?", 1)[0]
+    return None
+
+
+class RouteRatioSampler(Sampler):
+    """Root sampler: trace-id ratio with per-route overrides.
+
+    Args:
+        ratio: Default sampling ratio in ``[0, 1]``.
+        route_ratios: Path prefix -> ratio. The longest matching prefix wins.
+        record_unsampled: When true, traces not selected by the ratio are
+            recorded (``RECORD_ONLY``) so the tail processor can still promote
+            them; when false they are dropped outright. Routes overridden to
+            ``0`` are always dropped.
+    """
+
+    def __init__(
+        self,
+        ratio: float,
+        route_ratios: Mapping[str, float] | None = None,
+        *,
+        record_unsampled: bool = False,
+    ) -> None:
+        self._default = TraceIdRatioBased(ratio)
+        self._routes = sorted(
+            ((prefix, TraceIdRatioBased(r)) for prefix, r in (route_ratios or {}).items()),
+            key=lambda item: len(item[0]),
+            reverse=True,
+        )
+        self._record_unsampled = record_unsampled
+
+    def _route_sampler_for(self, attributes: Attributes) -> TraceIdRatioBased | None:
+        path = _path_of(attributes)
+        if path is not None:
+            for prefix, sampler in self._routes:
+                if path.startswith(prefix):
+                    return sampler
+        return None
+
+    def should_sample(
+        self,
+        parent_context: Context | None,
+        trace_id: int,
+        name: str,
+        kind: SpanKind | None = None,
+        attributes: Attributes = None,
+        links: Sequence[Link] | None = None,
+        trace_state: TraceState | None = None,
+    ) -> SamplingResult:
+        """Return the head decision for a root span."""
+        route = self._route_sampler_for(attributes)
+        if route is not None and route.rate <= 0:
+            # Explicitly silenced routes are never recorded, not even for tail promotion.
+            return SamplingResult(Decision.DROP, None, trace_state)
+        result = (route or self._default).should_sample(
+            parent_context, trace_id, name, kind, attributes, links, trace_state
+        )
+        if result.decision is Decision.DROP and self._record_unsampled:
+            return SamplingResult(Decision.RECORD_ONLY, attributes, result.trace_state)
+        return result
+
+    def get_description(self) -> str:
+        """Return a stable sampler description."""
+        routes = ",".join(f"{prefix}={s.rate}" for prefix, s in self._routes)
+        return f"RouteRatioSampler{{{self._default.rate};{routes}}}"
+
+
+class _RecordIfParentRecording(Sampler):
+    """Local-parent-not-sampled policy: record children of recorded roots only.
+
+    Children of a ``RECORD_ONLY`` root are recorded so a promoted trace is
+    complete; children of a dropped root (non-recording) stay dropped.
+    """
+
+    def should_sample(
+        self,
+        parent_context: Context | None,
+        trace_id: int,
+        name: str,
+        kind: SpanKind | None = None,
+        attributes: Attributes = None,
+        links: Sequence[Link] | None = None,
+        trace_state: TraceState | None = None,
+    ) -> SamplingResult:
+        parent = trace.get_current_span(parent_context)
+        if parent.is_recording():
+            return SamplingResult(Decision.RECORD_ONLY, attributes, trace_state)
+        return SamplingResult(Decision.DROP, None, trace_state)
+
+    def get_description(self) -> str:
+        return "RecordIfParentRecording"
+
+
+def build_sampler(
+    ratio: float,
+    route_ratios: Mapping[str, float] | None = None,
+    *,
+    tail_enabled: bool,
+) -> Sampler:
+    """Return the parent-based sampler used by the tracer provider.
+
+    Args:
+        ratio: Default head sampling ratio.
+        route_ratios: Per-route overrides (path prefix -> ratio).
+        tail_enabled: Whether unsampled traces are recorded for tail promotion.
+    """
+    return ParentBased(
+        root=RouteRatioSampler(ratio, route_ratios, record_unsampled=tail_enabled),
+        local_parent_not_sampled=_RecordIfParentRecording() if tail_enabled else ALWAYS_OFF,
+    )
+
+
+def _as_sampled(span: ReadableSpan, reason: str) -> ReadableSpan:
+    """Return a copy of ``span`` flagged as sampled (exporters skip unsampled spans)."""
+    ctx = span.context
+    assert ctx is not None  # noqa: S101 - SDK spans always carry a context
+    return ReadableSpan(
+        name=span.name,
+        context=SpanContext(
+            ctx.trace_id,
+            ctx.span_id,
+            ctx.is_remote,
+            TraceFlags(ctx.trace_flags | TraceFlags.SAMPLED),
+            ctx.trace_state,
+        ),
+        parent=span.parent,
+        resource=span.resource,
+        attributes={**(span.attributes or {}), PROMOTED_ATTRIBUTE: reason},
+        events=span.events,
+        links=span.links,
+        kind=span.kind,
+        status=span.status,
+        start_time=span.start_time,
+        end_time=span.end_time,
+        instrumentation_scope=span.instrumentation_scope,
+    )
+
+
+def _queue_of(processor: SpanProcessor) -> Any:
+    """Return the batch processor's internal queue, if the SDK exposes one."""
+    inner = getattr(processor, "_batch_processor", None)  # SDK >= 1.33
+    return (
+        getattr(inner, "_queue", None) if inner is not None else getattr(processor, "queue", None)
+    )
+
+
+class TailSamplingSpanProcessor(SpanProcessor):
+    """Promote errored/slow unsampled traces and meter the export queue.
+
+    Args:
+        delegate: Export processor (normally a bounded ``BatchSpanProcessor``).
+        max_queue_size: The delegate's queue bound, used to count drops.
+        keep_errors: Promote traces containing a span with ERROR status.
+        slow_threshold_ms: Promote traces whose local root ran at least this
+            long; ``None`` disables slow promotion.
+        max_pending_traces: Bound on traces buffered while awaiting their root.
+    """
+
+    def __init__(
+        self,
+        delegate: SpanProcessor,
+        *,
+        max_queue_size: int,
+        keep_errors: bool = True,
+        slow_threshold_ms: float | None = None,
+        max_pending_traces: int = 2048,
+    ) -> None:
+        self._delegate = delegate
+        self._max_queue_size = max_queue_size
+        self._keep_errors = keep_errors
+        self._slow_ns = int(slow_threshold_ms * 1_000_000) if slow_threshold_ms else None
+        self._max_pending = max_pending_traces
+        self._pending: OrderedDict[int, list[ReadableSpan]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._dropped = get_otel_spans_dropped_total()
+        self._decisions = get_otel_trace_sampling_total()
+
+    def on_start(self, span: Span, parent_context: Context | None = None) -> None:
+        """Forward span start to the delegate."""
+        self._delegate.on_start(span, parent_context=parent_context)
+
+    def on_end(self, span: ReadableSpan) -> None:
+        """Export sampled spans; buffer and decide recorded-only traces at their root."""
+        ctx = span.context
+        if ctx is None:
+            return
+        is_local_root = span.parent is None or span.parent.is_remote
+        if ctx.trace_flags.sampled:
+            if is_local_root:
+                self._count("head")
+            self._export(span)
+            return
+
+        with self._lock:
+            spans = self._pending.pop(ctx.trace_id, [])
+            spans.append(span)
+            if not is_local_root:
+                self._pending[ctx.trace_id] = spans
+                while len(self._pending) > self._max_pending:
+                    _, evicted = self._pending.popitem(last=False)
+                    self._drop("tail_buffer_full", len(evicted))
+                return
+
+        reason = self._promotion_reason(span, spans)
+        self._count(reason or "unsampled")
+        if reason is not None:
+            for item in spans:
+                self._export(_as_sampled(item, reason))
+
+    def _promotion_reason(self, root: ReadableSpan, spans: list[ReadableSpan]) -> str | None:
+        if self._keep_errors and any(s.status.status_code is StatusCode.ERROR for s in spans):
+            return "error"
+        if (
+            self._slow_ns is not None
+            and root.start_time is not None
+            and root.end_time is not None
+            and root.end_time - root.start_time >= self._slow_ns
+        ):
+            return "slow"
+        return None
+
+    def _export(self, span: ReadableSpan) -> None:
+        queue = _queue_of(self._delegate)
+        if queue is not None and len(queue) >= self._max_queue_size:
+            # The SDK evicts silently from a full deque; count it here.
+            self._drop("queue_full", 1)
+        self._delegate.on_end(span)
+
+    def _count(self, decision: str) -> None:
+        with suppress(Exception):
+            self._decisions.labels(decision=decision).inc()
+
+    def _drop(self, reason: str, count: int) -> None:
+        with suppress(Exception):
+            self._dropped.labels(reason=reason).inc(count)
+
+    def shutdown(self) -> None:
+        """Discard undecided traces and shut the delegate down."""
+        with self._lock:
+            pending = sum(len(spans) for spans in self._pending.values())
+            self._pending.clear()
+        if pending:
+            self._drop("shutdown", pending)
+        self._delegate.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        """Flush the delegate."""
+        return self._delegate.force_flush(timeout_millis)
@@ -0,0 +1,140 @@
+# src/arche_api/infrastructure/observability/stages.py
+# Copyright (c) Arche.
+# SPDX-License-Identifier: MIT
+"""Stage timing backend for :mod:`arche_api.application.interfaces.stage_timing`.
+
+Each stage a use case marks with ``timed_stage(name)`` is:
+
+* observed in ``arche_stage_duration_seconds{stage, outcome}``;
+* wrapped in a child span named after the stage when OpenTelemetry was
+  initialized (exceptions are recorded and set the span status to ERROR);
+* appended to the current request's stage list when
+  :class:`~arche_api.infrastructure.middleware.server_timing.ServerTimingMiddleware`
+  opened one, so the breakdown can be reported in ``Server-Timing``.
+
+:func:`install_stage_timing` is called once from ``create_app``; with stage
+timing disabled no observer is installed and ``timed_stage`` stays a no-op.
+
+Layer:
+    infrastructure/observability
+"""
+
+from __future__ import annotations
+
+import logging
+from contextlib import suppress
+from contextvars import ContextVar, Token
+from time import perf_counter
+from types import TracebackType
+from typing import Any
+
+from arche_api.application.interfaces.stage_timing import set_stage_observer
+from arche_api.infrastructure.observability.metrics import get_stage_duration_seconds
+from arche_api.infrastructure.observability.otel import is_otel_initialized
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "StageTimer",
+    "begin_request_stages",
+    "end_request_stages",
+    "install_stage_timing",
+]
+
+# (stage name, seconds) pairs for the in-flight request. The list is mutated in
+# place, so stages timed in copied contexts (threadpool endpoints, tasks
+# spawned by the request) still land in the request's list.
+_request_stages: ContextVar[list[tuple[str, float]] | None] = ContextVar(
+    "arche_request_stages", default=None
+)
+
+
+def begin_request_stages() -> tuple[list[tuple[str, float]], Token[list[tuple[str, float]] | None]]:
+    """Open a stage list for the current request.
+
+    Returns:
+        The list stages will be appended to and the token for
+        :func:`end_request_stages`.
+    """
+    stages: list[tuple[str, float]] = []
+    return stages, _request_stages.set(stages)
+
+
+def end_request_stages(token: Token[list[tuple[str, float]] | None]) -> None:
+    """Close the stage list opened by :func:`begin_request_stages`."""
+    _request_stages.reset(token)
+
+
+class _Stage:
+    """Context manager timing one stage occurrence."""
+
+    __slots__ = ("_name", "_span_cm", "_start", "_tracer")
+
+    def __init__(self, name: str, tracer: Any | None) -> None:
+        self._name = name
+        self._tracer = tracer
+        self._span_cm: Any | None = None
+        self._start = 0.0
+
+    def __enter__(self) -> None:
+        if self._tracer is not None:
+            self._span_cm = self._tracer.start_as_current_span(self._name)
+            self._span_cm.__enter__()
+        self._start = perf_counter()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        elapsed = perf_counter() - self._start
+        with suppress(Exception):
+            get_stage_duration_seconds().labels(
+                stage=self._name,
+                outcome="success" if exc_type is None else "error",
+            ).observe(elapsed)
+        stages = _request_stages.get()
+        if stages is not None:
+            stages.append((self._name, elapsed))
+        if self._span_cm is not None:
+            self._span_cm.__exit__(exc_type, exc, tb)
+
+
+class StageTimer:
+    """:class:`~arche_api.application.interfaces.stage_timing.StageObserver` backend.
+
+    Args:
+        tracer: OpenTelemetry tracer for per-stage spans, or ``None`` to only
+            record metrics and Server-Timing entries.
+    """
+
+    def __init__(self, *, tracer: Any | None = None) -> None:
+        self._tracer = tracer
+
+    def stage(self, name: str) -> _Stage:
+        """Return a context manager timing one occurrence of ``name``."""
+        return _Stage(name, self._tracer)
+
+
+def install_stage_timing(*, enabled: bool) -> None:
+    """Install (or remove) the process-wide stage observer.
+
+    Call after :func:`~arche_api.infrastructure.observability.otel.init_otel`
+    so stage spans attach to the configured tracer provider.
+
+    Args:
+        enabled: Whether stages are timed at all.
+    """
+    if not enabled:
+        set_stage_observer(None)
+        return
+
+    tracer: Any | None = None
+    if is_otel_initialized():
+        from opentelemetry import trace  # local: OTEL is an optional dependency
+
+        tracer = trace.get_tracer("arche_api.stages")
+
+    set_stage_observer(StageTimer(tracer=tracer))
+    logger.info("stage_timing.enabled", extra={"extra": {"spans": tracer is not None}})
@@ -7,7 +7,7 @@ individual operations with an OTEL span. If OTEL is not installed or is
 disabled, the helper acts as a no-op.
 
 This module is separate from the bootstrapper to keep concerns clean:
-- `infrastructure.logging.tracing` initializes instrumentation and exporters.
+- `infrastructure.observability.otel` initializes providers, sampling and exporters.
 - `infrastructure.observability.tracing` provides the convenience span helper.
 
 Layer:
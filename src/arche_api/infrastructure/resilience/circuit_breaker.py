@@ -1,22 +1,57 @@
 # Copyright (c)
 # SPDX-License-Identifier: MIT
-"""Minimal async circuit breaker (in-memory).
+"""Async circuit breakers (in-memory, keyed).
 
 State machine:
     - CLOSED -> count failures; when threshold reached, go OPEN.
     - OPEN   -> fail-fast until recovery timeout expires; then HALF-OPEN.
-    - HALF-OPEN -> allow limited calls; on success -> CLOSED; on failure -> OPEN.
+    - HALF-OPEN -> allow a bounded probe budget; on success -> CLOSED; on failure -> OPEN.
+
+Cancellation (``asyncio.wait_for`` timeouts, client disconnects) is no verdict
+on the dependency: a cancelled call changes no counters, and a cancelled
+half-open probe hands its slot back so the next call can probe.
+
+Two building blocks are provided:
+
+* :class:`CircuitBreaker` — a single state machine.
+* :class:`CircuitBreakerRegistry` — independent breakers per key (typically
+  ``"<provider>:<endpoint>"``), so a failing ``/intraday`` endpoint does not
+  trip ``/eod``.
+
+Concurrency:
+    Every state check and transition runs synchronously between ``await``
+    points, so it is atomic with respect to the event loop and needs no lock.
+    The CLOSED path is a single attribute read; concurrent fan-outs never
+    contend on shared state.
 
 This is process-local. For distributed breakers, use a shared store.
 """
 
 from __future__ import annotations
 
-import asyncio
 import time
-from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
-from dataclasses import dataclass
+from collections.abc import AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager, suppress
+from dataclasses import dataclass, field
+from typing import Final, Protocol
+
+CLOSED: Final[str] = "CLOSED"
+OPEN: Final[str] = "OPEN"
+HALF_OPEN: Final[str] = "HALF_OPEN"
+
+# Numeric encoding used by the state gauge.
+_STATE_CODES: Final[dict[str, int]] = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+TransitionListener = Callable[[str, str, str], None]
+"""Callback invoked as ``listener(key, from_state, to_state)`` on transitions."""
+
+
+class SupportsGuard(Protocol):
+    """Structural type for objects exposing ``guard(key)`` (breakers, registries, fakes)."""
+
+    def guard(self, key: str) -> AbstractAsyncContextManager[None]:  # pragma: no cover
+        """Return an async context manager guarding one call for ``key``."""
+        ...
 
 
 @dataclass
@@ -26,46 +61,165 @@ class CircuitBreaker:
     failure_threshold: int
     recovery_timeout_s: float
     half_open_max_calls: int
+    name: str = "default"
+    on_transition: TransitionListener | None = field(default=None, repr=False)
 
-    _state: str = "CLOSED"  # CLOSED|OPEN|HALF_OPEN
+    _state: str = CLOSED  # CLOSED|OPEN|HALF_OPEN
     _failures: int = 0
     _opened_at: float = 0.0
     _half_open_calls: int = 0
-    _lock: asyncio.Lock = asyncio.Lock()
+    _half_open_epoch: int = 0
+
+    @property
+    def state(self) -> str:
+        """Return the current state label."""
+        return self._state
+
+    def _transition(self, to_state: str) -> None:
+        """Move to ``to_state`` and notify the listener (best effort)."""
+        from_state = self._state
+        if from_state == to_state:
+            return
+        self._state = to_state
+        if to_state == OPEN:
+            self._opened_at = time.monotonic()
+        elif to_state == HALF_OPEN:
+            self._half_open_calls = 0
+            self._half_open_epoch += 1
+        if self.on_transition is not None:
+            with suppress(Exception):
+                self.on_transition(self.name, from_state, to_state)
+
+    def _before_call(self) -> int | None:
+        """Admit or reject a call; raises ``RuntimeError`` when rejected.
+
+        Returns:
+            The half-open epoch when the call took a probe slot, else ``None``.
+        """
+        if self._state == CLOSED:
+            return None
+        if self._state == OPEN:
+            if time.monotonic() - self._opened_at < self.recovery_timeout_s:
+                raise RuntimeError("circuit_open")
+            self._transition(HALF_OPEN)
+        if self._half_open_calls >= self.half_open_max_calls:
+            raise RuntimeError("circuit_half_open_limit")
+        self._half_open_calls += 1
+        return self._half_open_epoch
+
+    def _release_probe(self, epoch: int | None) -> None:
+        """Hand back a probe slot taken in the current half-open window."""
+        if epoch is not None and self._state == HALF_OPEN and epoch == self._half_open_epoch:
+            self._half_open_calls = max(0, self._half_open_calls - 1)
+
+    def _on_failure(self) -> None:
+        if self._state == HALF_OPEN:
+            self._transition(OPEN)
+            return
+        self._failures += 1
+        if self._state == CLOSED and self._failures >= self.failure_threshold:
+            self._transition(OPEN)
+
+    def _on_success(self) -> None:
+        if self._state == HALF_OPEN:
+            self._transition(CLOSED)
+            self._failures = 0
+        elif self._state == CLOSED and self._failures:
+            self._failures = 0
 
     @asynccontextmanager
-    async def guard(self, _key: str) -> AsyncIterator[None]:  # noqa: C901
-        """Guard an async call with the breaker."""
-        async with self._lock:
-            now = time.monotonic()
-            if self._state == "OPEN":
-                if now - self._opened_at >= self.recovery_timeout_s:
-                    self._state = "HALF_OPEN"
-                    self._half_open_calls = 0
-                else:
-                    raise RuntimeError("circuit_open")
-            if self._state == "HALF_OPEN":
-                if self._half_open_calls >= self.half_open_max_calls:
-                    raise RuntimeError("circuit_half_open_limit")
-                self._half_open_calls += 1
+    async def guard(self, _key: str = "") -> AsyncIterator[None]:
+        """Guard an async call with the breaker.
 
+        The key is accepted for interface compatibility with
+        :class:`CircuitBreakerRegistry`; a bare breaker has a single state.
+        """
+        probe = self._before_call()
         try:
             yield
         except Exception:
-            async with self._lock:
-                if self._state == "HALF_OPEN":
-                    self._state = "OPEN"
-                    self._opened_at = time.monotonic()
-                else:
-                    self._failures += 1
-                    if self._failures >= self.failure_threshold:
-                        self._state = "OPEN"
-                        self._opened_at = time.monotonic()
+            self._on_failure()
+            raise
+        except BaseException:
+            # Cancelled: no verdict, but never strand a half-open probe slot.
+            self._release_probe(probe)
             raise
         else:
-            async with self._lock:
-                if self._state == "HALF_OPEN":
-                    self._state = "CLOSED"
-                    self._failures = 0
-                elif self._state == "CLOSED":
-                    self._failures = 0
+            self._on_success()
+
+
+def _record_transition_metrics(key: str, from_state: str, to_state: str) -> None:
+    """Export a breaker state transition to Prometheus (best effort)."""
+    from arche_api.infrastructure.observability.metrics import (
+        get_circuit_breaker_state,
+        get_circuit_breaker_transitions_total,
+    )
+
+    provider, _, endpoint = key.partition(":")
+    endpoint = endpoint or "all"
+    get_circuit_breaker_transitions_total().labels(
+        provider=provider,
+        endpoint=endpoint,
+        from_state=from_state,
+        to_state=to_state,
+    ).inc()
+    get_circuit_breaker_state().labels(provider=provider, endpoint=endpoint).set(
+        _STATE_CODES[to_state]
+    )
+
+
+@dataclass
+class CircuitBreakerRegistry:
+    """Independent circuit breakers per key, created lazily.
+
+    Keys are free-form, but clients use ``"<provider>:<endpoint>"`` so that
+    metrics can be labelled per provider and endpoint.
+    """
+
+    failure_threshold: int = 5
+    recovery_timeout_s: float = 30.0
+    half_open_max_calls: int = 1
+    on_transition: TransitionListener | None = field(default=_record_transition_metrics, repr=False)
+
+    _breakers: dict[str, CircuitBreaker] = field(default_factory=dict, repr=False)
+
+    def get(self, key: str) -> CircuitBreaker:
+        """Return the breaker for ``key``, creating it on first use."""
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                failure_threshold=self.failure_threshold,
+                recovery_timeout_s=self.recovery_timeout_s,
+                half_open_max_calls=self.half_open_max_calls,
+                name=key,
+                on_transition=self.on_transition,
+            )
+            self._breakers[key] = breaker
+        return breaker
+
+    def guard(self, key: str) -> AbstractAsyncContextManager[None]:
+        """Guard an async call with the breaker registered under ``key``."""
+        return self.get(key).guard(key)
+
+    def states(self) -> dict[str, str]:
+        """Return a snapshot of ``key -> state`` for diagnostics."""
+        return {key: breaker.state for key, breaker in self._breakers.items()}
+
+    def reset(self) -> None:
+        """Drop all breakers (tests and admin tooling)."""
+        self._breakers.clear()
+
+
+_registry: CircuitBreakerRegistry | None = None
+
+
+def get_circuit_breaker_registry() -> CircuitBreakerRegistry:
+    """Return the process-wide breaker registry shared by all provider clients.
+
+    Clients are frequently constructed per request, so breaker state must live
+    outside the client instance to be meaningful.
+    """
+    global _registry
+    if _registry is None:
+        _registry = CircuitBreakerRegistry()
+    return _registry
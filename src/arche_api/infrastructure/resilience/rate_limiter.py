@@ -0,0 +1,272 @@
+# src/arche_api/infrastructure/resilience/rate_limiter.py
+# Copyright (c) Arche.
+# SPDX-License-Identifier: MIT
+"""GCRA rate limiters (Redis-backed with a bounded in-memory fallback).
+
+Purpose:
+    Decide whether a request identified by a bucket key may proceed under a
+    ``limit``-per-``window`` quota, using the Generic Cell Rate Algorithm
+    (GCRA). GCRA stores a single timestamp per key (the theoretical arrival
+    time, TAT), allows bursts of up to ``limit`` requests, and refills
+    smoothly at ``limit / window``.
+
+Layer:
+    infrastructure/resilience
+
+Backends:
+    * :class:`InMemoryRateLimiter` — per-process, LRU-bounded; idle keys whose
+      bucket has fully refilled are evicted.
+    * :class:`RedisRateLimiter` — one atomic Lua call per decision, using the
+      Redis server clock, so all workers share one budget. Keys expire as soon
+      as their bucket is full again. When Redis fails the limiter degrades to
+      a local fallback and retries Redis after a short cool-down.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+from typing import Any, Final, Protocol
+
+from arche_api.infrastructure.logging.logger import get_json_logger
+
+logger = get_json_logger(__name__)
+
+__all__ = [
+    "InMemoryRateLimiter",
+    "Quota",
+    "RateLimitDecision",
+    "RateLimiter",
+    "RedisRateLimiter",
+]
+
+
+@dataclass(frozen=True)
+class Quota:
+    """``limit`` requests per ``window_s`` seconds (burst of up to ``limit``)."""
+
+    limit: int
+    window_s: float
+
+    def __post_init__(self) -> None:
+        if self.limit < 1 or self.window_s <= 0:
+            raise ValueError(f"invalid quota: {self.limit}/{self.window_s}")
+
+    @property
+    def emission_interval_s(self) -> float:
+        """Return the steady-state spacing between admitted requests."""
+        return self.window_s / self.limit
+
+    @classmethod
+    def parse(cls, spec: str) -> Quota:
+        """Parse ``"<limit>/<window_seconds>"`` (e.g. ``"600/60"``).
+
+        Raises:
+            ValueError: If ``spec`` is malformed or non-positive.
+        """
+        limit_raw, sep, window_raw = spec.partition("/")
+        if not sep:
+            raise ValueError(f"invalid quota spec: {spec!r} (expected '<limit>/<seconds>')")
+        return cls(limit=int(limit_raw), window_s=float(window_raw))
+
+
+@dataclass(frozen=True)
+class RateLimitDecision:
+    """Outcome of one rate-limit evaluation.
+
+    Attributes:
+        allowed: Whether the request may proceed.
+        limit: Quota limit (burst size) applied.
+        remaining: Requests still admissible right now.
+        reset_after_s: Seconds until the bucket is completely refilled.
+        retry_after_s: Seconds until the next request would be admitted
+            (0 when allowed).
+        backend: Backend that made the decision (``memory``, ``redis`` or
+            ``fallback`` when Redis was unavailable).
+    """
+
+    allowed: bool
+    limit: int
+    remaining: int
+    reset_after_s: float
+    retry_after_s: float
+    backend: str = "memory"
+
+
+class RateLimiter(Protocol):
+    """Structural type for rate-limiter backends."""
+
+    async def hit(self, key: str, quota: Quota) -> RateLimitDecision:  # pragma: no cover
+        """Consume one request for ``key`` under ``quota``."""
+        ...
+
+
+def _gcra(tat: float, now: float, quota: Quota) -> tuple[RateLimitDecision, float]:
+    """Evaluate GCRA; return the decision and the TAT to store when allowed."""
+    interval = quota.emission_interval_s
+    tat = max(tat, now)
+    new_tat = tat + interval
+    horizon = new_tat - now
+    if horizon > quota.window_s + 1e-9:
+        decision = RateLimitDecision(
+            allowed=False,
+            limit=quota.limit,
+            remaining=0,
+            reset_after_s=tat - now,
+            retry_after_s=horizon - quota.window_s,
+        )
+        return decision, tat
+    remaining = int((quota.window_s - horizon) / interval + 1e-9)
+    decision = RateLimitDecision(
+        allowed=True,
+        limit=quota.limit,
+        remaining=remaining,
+        reset_after_s=horizon,
+        retry_after_s=0.0,
+    )
+    return decision, new_tat
+
+
+class InMemoryRateLimiter:
+    """Per-process GCRA limiter with LRU-bounded state.
+
+    Args:
+        max_keys: Maximum number of tracked buckets; least recently used
+            buckets are dropped beyond this (dropping a bucket only ever
+            grants a fresh burst, it never wrongly rejects).
+        clock: Monotonic clock in seconds (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        *,
+        max_keys: int = 10_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize an empty limiter."""
+        self._max_keys = max(1, int(max_keys))
+        self._clock = clock
+        self._tats: OrderedDict[str, float] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._tats)
+
+    async def hit(self, key: str, quota: Quota) -> RateLimitDecision:
+        """Consume one request for ``key`` under ``quota``."""
+        return self.hit_sync(key, quota)
+
+    def hit_sync(self, key: str, quota: Quota) -> RateLimitDecision:
+        """Synchronous variant of :meth:`hit` (no I/O involved)."""
+        now = self._clock()
+        decision, tat = _gcra(self._tats.get(key, now), now, quota)
+        self._tats[key] = tat
+        self._tats.move_to_end(key)
+        self._evict(now)
+        return decision
+
+    def _evict(self, now: float) -> None:
+        """Drop fully refilled buckets from the LRU end, then enforce the cap."""
+        tats = self._tats
+        while tats:
+            oldest_key, oldest_tat = next(iter(tats.items()))
+            if oldest_tat > now and len(tats) <= self._max_keys:
+                break
+            del tats[oldest_key]
+
+
+# KEYS[1] = bucket key
+# ARGV[1] = emission interval (ms), ARGV[2] = window (ms)
+# Returns {allowed, remaining, reset_after_ms, retry_after_ms}.
+_GCRA_LUA: Final[str] = """
+local interval = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local tat = tonumber(redis.call('GET', KEYS[1])) or now
+if tat < now then tat = now end
+local new_tat = tat + interval
+local horizon = new_tat - now
+if horizon > window then
+  return {0, 0, tat - now, horizon - window}
+end
+redis.call('SET', KEYS[1], new_tat, 'PX', math.max(1, math.ceil(horizon)))
+return {1, math.floor((window - horizon) / interval), horizon, 0}
+"""
+
+
+class RedisRateLimiter:
+    """Distributed GCRA limiter evaluated atomically in Redis.
+
+    Args:
+        redis_provider: Zero-arg callable returning the shared async Redis
+            client (resolved per call, so loop-aware clients keep working).
+        fallback: Local limiter used while Redis is unavailable.
+        namespace: Key prefix for bucket keys.
+        cooldown_s: Seconds to bypass Redis after a failure before retrying.
+        clock: Monotonic clock used for the cool-down.
+    """
+
+    def __init__(
+        self,
+        redis_provider: Callable[[], Any],
+        *,
+        fallback: InMemoryRateLimiter | None = None,
+        namespace: str = "arche:ratelimit:v1",
+        cooldown_s: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the limiter; the Lua script is registered lazily."""
+        self._redis_provider = redis_provider
+        self._fallback = fallback or InMemoryRateLimiter()
+        self._namespace = namespace
+        self._cooldown_s = cooldown_s
+        self._clock = clock
+        self._script: Any = None
+        self._script_client: Any = None
+        self._bypass_until = 0.0
+
+    @property
+    def degraded(self) -> bool:
+        """Return True while decisions are served by the local fallback."""
+        return self._clock() < self._bypass_until
+
+    def _script_for(self, client: Any) -> Any:
+        if self._script is None or self._script_client is not client:
+            self._script = client.register_script(_GCRA_LUA)
+            self._script_client = client
+        return self._script
+
+    async def hit(self, key: str, quota: Quota) -> RateLimitDecision:
+        """Consume one request for ``key`` under ``quota`` (Redis, else local)."""
+        if self.degraded:
+            return replace(self._fallback.hit_sync(key, quota), backend="fallback")
+
+        interval_ms = max(1, math.ceil(quota.emission_interval_s * 1000.0))
+        window_ms = interval_ms * quota.limit
+        try:
+            client = self._redis_provider()
+            raw = await self._script_for(client)(
+                keys=[f"{self._namespace}:{key}"],
+                args=[interval_ms, window_ms],
+            )
+            allowed, remaining, reset_ms, retry_ms = (int(v) for v in raw)
+        except Exception as exc:
+            self._bypass_until = self._clock() + self._cooldown_s
+            self._script = None
+            logger.warning(
+                "rate_limit.redis_unavailable",
+                extra={"error": type(exc).__name__, "cooldown_s": self._cooldown_s},
+            )
+            return replace(self._fallback.hit_sync(key, quota), backend="fallback")
+
+        return RateLimitDecision(
+            allowed=bool(allowed),
+            limit=quota.limit,
+            remaining=max(0, remaining),
+            reset_after_s=reset_ms / 1000.0,
+            retry_after_s=retry_ms / 1000.0,
+            backend="redis",
+        )
@@ -1,6 +1,11 @@
 from __future__ import annotations
 
+import asyncio
+import random
 import time
+from collections import OrderedDict
+from collections.abc import Callable
+from contextlib import suppress
 from dataclasses import dataclass
 from typing import Any
 
@@ -8,7 +13,10 @@ import httpx
 from jose import jwk, jwt
 from jose.utils import base64url_decode
 
+from arche_api.infrastructure.http.transport import get_http_transport_registry
 from arche_api.infrastructure.logging.logger import get_json_logger
+from arche_api.infrastructure.observability.metrics import get_jwks_refresh_total
+from arche_api.infrastructure.security.token_cache import VerifiedTokenCache
 
 logger = get_json_logger(__name__)
 
@@ -18,45 +26,149 @@ class _CachedJWKS:
     """In-memory JWKS cache entry."""
 
     keys: dict[str, Any]
+    fetched_at: float
     expires_at: float
 
 
 class ClerkJWKSClient:
     """Fetch and cache Clerk JWKS; verify JWT signatures (infrastructure-only).
 
+    The key set is refreshed off the request path: an expired cache is served
+    (for up to one more TTL) while a single background fetch revalidates it,
+    and :meth:`run_refresher` can keep it warm for the process lifetime.
+    Unknown ``kid`` values trigger at most one forced refresh per
+    ``min_refresh_interval_s`` and are negatively cached, so a flood of forged
+    tokens cannot turn into a flood of JWKS requests.
+
     Attributes:
         issuer: OIDC issuer (e.g., https://<subdomain>.clerk.accounts.dev)
-        ttl_seconds: In-memory JWKS cache TTL.
+        ttl_seconds: In-memory JWKS cache TTL (jittered by ``jitter_ratio``).
+        http: Optional ``httpx.AsyncClient``; defaults to the process-wide
+            pooled ``jwks`` transport.
     """
 
-    def __init__(self, issuer: str, ttl_seconds: int = 300) -> None:
+    def __init__(
+        self,
+        issuer: str,
+        ttl_seconds: int = 300,
+        *,
+        http: httpx.AsyncClient | None = None,
+        jitter_ratio: float = 0.1,
+        min_refresh_interval_s: float = 30.0,
+        unknown_kid_ttl_s: float = 60.0,
+        max_unknown_kids: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
         self._issuer = issuer.rstrip("/")
         self._jwks_url = f"{self._issuer}/.well-known/jwks.json"
         self._ttl_seconds = ttl_seconds
+        self._http = http
+        self._jitter_ratio = jitter_ratio
+        self._min_refresh_interval_s = min_refresh_interval_s
+        self._unknown_kid_ttl_s = unknown_kid_ttl_s
+        self._max_unknown_kids = max(1, max_unknown_kids)
+        self._clock = clock
         self._cache: _CachedJWKS | None = None
+        self._unknown_kids: OrderedDict[str, float] = OrderedDict()
+        self._last_forced_refresh = float("-inf")
+        self._lock: asyncio.Lock | None = None
+        self._lock_loop: asyncio.AbstractEventLoop | None = None
+        self._revalidate_task: asyncio.Task[Any] | None = None
+        self._refreshes = get_jwks_refresh_total()
 
-    async def _get_jwks(self) -> dict[str, Any]:
-        """Return a mapping of kid -> JWK, using a short-lived in-memory cache."""
-        now = time.time()
-        if self._cache and self._cache.expires_at > now:
-            return self._cache.keys
+    def _jittered_ttl(self) -> float:
+        """Return the TTL spread by ±``jitter_ratio`` so workers do not refetch in lockstep."""
+        spread = self._ttl_seconds * self._jitter_ratio
+        return max(1.0, self._ttl_seconds + random.uniform(-spread, spread))  # noqa: S311
 
+    def _refresh_lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+    async def _fetch(self, trigger: str) -> dict[str, Any]:
+        """Fetch the JWKS document and replace the cache atomically."""
         logger.debug("fetch_clerk_jwks", extra={"extra": {"jwks_url": self._jwks_url}})
-        async with httpx.AsyncClient(timeout=5.0) as client:
+        client = self._http or get_http_transport_registry().client("jwks")
+        try:
             resp = await client.get(self._jwks_url)
             resp.raise_for_status()
             payload: dict[str, Any] = resp.json()
+        except Exception:
+            with suppress(Exception):
+                self._refreshes.labels(trigger=trigger, outcome="error").inc()
+            raise
 
         keys: dict[str, Any] = {
             k["kid"]: k for k in payload.get("keys", []) if isinstance(k, dict) and "kid" in k
         }
-        self._cache = _CachedJWKS(keys=keys, expires_at=now + self._ttl_seconds)
+        now = self._clock()
+        ttl = self._jittered_ttl()
+        self._cache = _CachedJWKS(keys=keys, fetched_at=now, expires_at=now + ttl)
+        # Newly published keys must not stay negatively cached.
+        for kid in keys:
+            self._unknown_kids.pop(kid, None)
+        with suppress(Exception):
+            self._refreshes.labels(trigger=trigger, outcome="success").inc()
         logger.info(
             "clerk_jwks_cached",
-            extra={"extra": {"key_count": len(keys), "ttl_seconds": self._ttl_seconds}},
+            extra={"extra": {"key_count": len(keys), "ttl_seconds": round(ttl, 1)}},
         )
         return keys
 
+    async def _refresh(self, trigger: str) -> dict[str, Any]:
+        """Single-flight refresh: concurrent callers share one fetch."""
+        requested_at = self._clock()
+        async with self._refresh_lock():
+            cache = self._cache
+            if cache is not None and cache.fetched_at >= requested_at:
+                return cache.keys
+            return await self._fetch(trigger)
+
+    def _revalidate_in_background(self) -> None:
+        task = self._revalidate_task
+        if task is not None and not task.done():
+            return
+
+        def _done(t: asyncio.Task[Any]) -> None:
+            if not t.cancelled() and t.exception() is not None:
+                logger.warning(
+                    "clerk_jwks_revalidate_failed",
+                    extra={"extra": {"error": type(t.exception()).__name__}},
+                )
+
+        self._revalidate_task = asyncio.create_task(self._refresh("stale"))
+        self._revalidate_task.add_done_callback(_done)
+
+    async def _get_jwks(self) -> dict[str, Any]:
+        """Return a mapping of kid -> JWK, using a short-lived in-memory cache."""
+        cache = self._cache
+        now = self._clock()
+        if cache is not None and cache.expires_at > now:
+            return cache.keys
+        if cache is not None and cache.expires_at + self._ttl_seconds > now:
+            # Stale-while-revalidate: never block requests on a routine refresh.
+            self._revalidate_in_background()
+            return cache.keys
+        return await self._refresh("cold")
+
+    def _is_known_unknown(self, kid: str, now: float) -> bool:
+        expires_at = self._unknown_kids.get(kid)
+        if expires_at is None:
+            return False
+        if expires_at <= now:
+            del self._unknown_kids[kid]
+            return False
+        return True
+
+    def _remember_unknown(self, kid: str, now: float) -> None:
+        self._unknown_kids[kid] = now + self._unknown_kid_ttl_s
+        self._unknown_kids.move_to_end(kid)
+        while len(self._unknown_kids) > self._max_unknown_kids:
+            self._unknown_kids.popitem(last=False)
+
     async def get_key_for_token(self, token: str) -> tuple[dict[str, Any], dict[str, Any]]:
         """Return `(jwk, unverified_header)` for the token's `kid`.
 
@@ -75,15 +187,40 @@ class ClerkJWKSClient:
             raise KeyError("Missing 'kid' in JWT header")
 
         keys = await self._get_jwks()
+        if kid in keys:
+            return keys[kid], unverified_header
+
+        now = self._clock()
+        if self._is_known_unknown(kid, now):
+            raise KeyError(f"Unknown 'kid': {kid}")
+
+        # Key rotation: force a refresh, but at most once per interval. A kid
+        # rejected without a refresh is not remembered, so it is re-checked
+        # as soon as the next forced refresh is allowed.
+        if now - self._last_forced_refresh < self._min_refresh_interval_s:
+            raise KeyError(f"Unknown 'kid': {kid}")
+        self._last_forced_refresh = now
+        keys = await self._refresh("unknown_kid")
         if kid not in keys:
-            # Force a one-time refresh in case of key rotation.
-            self._cache = None
-            keys = await self._get_jwks()
-            if kid not in keys:
-                raise KeyError(f"Unknown 'kid': {kid}")
+            self._remember_unknown(kid, now)
+            raise KeyError(f"Unknown 'kid': {kid}")
 
         return keys[kid], unverified_header
 
+    async def run_refresher(self) -> None:
+        """Keep the JWKS warm until cancelled (refreshes at ~80% of the jittered TTL)."""
+        while True:
+            try:
+                await self._refresh("background")
+            except Exception as exc:
+                logger.warning(
+                    "clerk_jwks_refresh_failed",
+                    extra={"extra": {"error": type(exc).__name__}},
+                )
+                await asyncio.sleep(self._min_refresh_interval_s)
+                continue
+            await asyncio.sleep(self._jittered_ttl() * 0.8)
+
     @staticmethod
     def verify_signature(token: str, key_data: dict[str, Any]) -> None:
         """Verify the JWS signature using the provided JWK.
@@ -103,12 +240,30 @@ class ClerkJWKSClient:
             raise ValueError("Invalid token signature")
 
 
+_clients: dict[str, ClerkJWKSClient] = {}
+
+
+def get_clerk_jwks_client(issuer: str, *, ttl_seconds: int = 300) -> ClerkJWKSClient:
+    """Return the process-wide JWKS client for ``issuer``.
+
+    Dependencies run per request, so the JWKS cache must live outside any
+    single call to be useful.
+    """
+    key = issuer.rstrip("/")
+    client = _clients.get(key)
+    if client is None:
+        client = ClerkJWKSClient(issuer=key, ttl_seconds=ttl_seconds)
+        _clients[key] = client
+    return client
+
+
 async def verify_clerk_token(
     *,
     token: str,
     jwks_client: ClerkJWKSClient,
     issuer: str,
-    audience: str,
+    audience: str | None = None,
+    token_cache: VerifiedTokenCache | None = None,
 ) -> dict[str, Any]:
     """Verify a Clerk JWT end-to-end (signature + claims).
 
@@ -116,7 +271,9 @@ async def verify_clerk_token(
         token: Raw bearer token from the Authorization header.
         jwks_client: JWKS client used to resolve the signing key.
         issuer: Expected `iss` claim (string).
-        audience: Expected `aud` claim (string).
+        audience: Expected `aud` claim; not checked when None.
+        token_cache: Optional cache of already-verified tokens; a hit skips
+            header parsing, key lookup and signature verification.
 
     Returns:
         Decoded JWT claims.
@@ -126,10 +283,15 @@ async def verify_clerk_token(
         KeyError: When `kid` is missing/unknown.
         httpx.HTTPError: If JWKS cannot be fetched.
     """
+    context = f"{issuer}|{audience or ''}"
+    if token_cache is not None:
+        cached = token_cache.get(token, context=context)
+        if cached is not None:
+            return cached
+
     key_data, _ = await jwks_client.get_key_for_token(token)
-    ClerkJWKSClient.verify_signature(token, key_data)
 
-    # Verify claims (iss/aud/exp/nbf) with python-jose.
+    # jwt.decode verifies the signature and the claims (iss/aud/exp/nbf) in one pass.
     alg = key_data.get("alg") or "RS256"
     if not isinstance(alg, str):
         alg = "RS256"
@@ -140,6 +302,13 @@ async def verify_clerk_token(
         algorithms=[alg],
         audience=audience,
         issuer=issuer,
-        options={"verify_aud": True, "verify_iss": True, "verify_exp": True, "verify_nbf": True},
+        options={
+            "verify_aud": audience is not None,
+            "verify_iss": True,
+            "verify_exp": True,
+            "verify_nbf": True,
+        },
     )
+    if token_cache is not None:
+        token_cache.put(token, claims, context=context)
     return claims
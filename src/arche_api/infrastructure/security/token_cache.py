@@ -0,0 +1,113 @@
+# src/arche_api/infrastructure/security/token_cache.py
+# Copyright (c) Arche.
+# SPDX-License-Identifier: MIT
+"""Verified-token cache.
+
+Purpose:
+    Skip repeated RS256 verification for bearer tokens that were already
+    verified by this process. Entries map a SHA-256 digest of the token (never
+    the token itself) to its verified claims and live until the token's
+    ``exp``, capped by ``max_ttl_s`` so claim changes (e.g. ``blocked``)
+    propagate within a bounded delay.
+
+Layer:
+    infrastructure/security
+
+Notes:
+    - Bounded LRU; least recently used entries are evicted beyond
+      ``max_entries``.
+    - Tokens without a numeric ``exp`` are never cached.
+    - The ``context`` argument (issuer/audience) is mixed into the digest so
+      a token verified for one audience is not accepted for another.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from contextlib import suppress
+from typing import Any
+
+from arche_api.infrastructure.observability.metrics import get_auth_token_cache_total
+
+__all__ = ["VerifiedTokenCache", "get_verified_token_cache"]
+
+
+class VerifiedTokenCache:
+    """LRU of verified token digests → claims, valid until ``exp``.
+
+    Args:
+        max_entries: Maximum number of cached tokens.
+        max_ttl_s: Upper bound on how long an entry is trusted.
+        clock: Wall clock in epoch seconds (``exp`` is an epoch timestamp).
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        *,
+        max_ttl_s: float = 300.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize an empty cache."""
+        self._max_entries = max(1, int(max_entries))
+        self._max_ttl_s = max_ttl_s
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[dict[str, Any], float]] = OrderedDict()
+        self._lookups = get_auth_token_cache_total()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _digest(token: str, context: str) -> str:
+        return hashlib.sha256(f"{context}\x00{token}".encode()).hexdigest()
+
+    def get(self, token: str, *, context: str = "") -> dict[str, Any] | None:
+        """Return a copy of the cached claims, or None on miss/expiry."""
+        digest = self._digest(token, context)
+        entry = self._entries.get(digest)
+        if entry is not None and entry[1] <= self._clock():
+            del self._entries[digest]
+            entry = None
+        with suppress(Exception):
+            self._lookups.labels(outcome="miss" if entry is None else "hit").inc()
+        if entry is None:
+            return None
+        self._entries.move_to_end(digest)
+        return dict(entry[0])
+
+    def put(self, token: str, claims: Mapping[str, Any], *, context: str = "") -> None:
+        """Cache verified ``claims`` until ``exp`` (bounded by ``max_ttl_s``)."""
+        exp = claims.get("exp")
+        if not isinstance(exp, (int, float)) or isinstance(exp, bool):
+            return
+        now = self._clock()
+        expires_at = min(float(exp), now + self._max_ttl_s)
+        if expires_at <= now:
+            return
+        digest = self._digest(token, context)
+        self._entries[digest] = (dict(claims), expires_at)
+        self._entries.move_to_end(digest)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+
+_cache: VerifiedTokenCache | None = None
+
+
+def get_verified_token_cache(max_entries: int = 10_000) -> VerifiedTokenCache:
+    """Return the process-wide verified-token cache.
+
+    ``max_entries`` only applies to the call that creates the cache.
+    """
+    global _cache
+    if _cache is None:
+        _cache = VerifiedTokenCache(max_entries)
+    return _cache
@@ -0,0 +1,225 @@
+# src/arche_api/infrastructure/serialization/json_codec.py
+# Copyright (c) Arche.
+# SPDX-License-Identifier: MIT
+"""Pluggable JSON codec for hot serialization paths.
+
+Purpose:
+    One place that decides how JSON is encoded and decoded on the paths that
+    run per request: the Redis JSON cache, strong-ETag hashing and HTTP
+    response rendering. Two backends share the same contract:
+
+        * ``orjson`` — native encoder (``fastjson`` extra), several times faster
+          than the stdlib on envelope-sized payloads.
+        * ``stdlib`` — :mod:`json`, always available.
+
+    ``JSON_BACKEND=auto`` (default) picks orjson when it is installed.
+
+Contract:
+    * ``dumps`` returns compact UTF-8 bytes (no whitespace, non-ASCII kept
+      as-is), optionally with sorted keys for hashing.
+    * Decimals are encoded exactly, as strings (never through float); dates
+      and datetimes as ISO 8601; UUIDs as strings. Callers that need another
+      canonical form (e.g. ETag material) pass their own ``default``.
+    * Dict keys are stringified: ``None``, bools and numbers as their JSON
+      text, other types (dates, UUIDs, ...) through ``default``. Key types
+      may be mixed, also with ``sort_keys`` (keys sort as strings).
+    * Integers of any size are exact. Non-finite floats (NaN, Infinity)
+      encode as ``null``; the non-standard ``NaN`` tokens are never emitted.
+    * Values ``default`` does not handle raise ``TypeError``.
+    * ``loads`` accepts ``bytes`` or ``str``.
+
+Notes:
+    Each backend encodes natively first. Inputs it rejects (for the stdlib:
+    keys it cannot stringify or sort, non-finite floats; for orjson: integers
+    beyond 64 bits) are re-encoded once through a slower normalizing path
+    (``_normalize``), so the contract holds without a pre-pass on every call.
+
+    Output is semantically identical across backends; bytes can differ for
+    floats in exponent form (``1e+16`` vs ``1e16``). ETags are therefore only
+    comparable between processes running the same backend.
+
+Layer:
+    infrastructure/serialization
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from collections.abc import Callable
+from datetime import date
+from decimal import Decimal
+from typing import Any, Final, Literal, Protocol
+from uuid import UUID
+
+# orjson is an optional dependency (``fastjson`` extra); stdlib json otherwise.
+_orjson: Any | None = None
+try:  # pragma: no cover - depends on installed extras
+    import orjson as _orjson_mod
+
+    _orjson = _orjson_mod
+except Exception:  # pragma: no cover - depends on installed extras
+    _orjson = None
+
+__all__ = [
+    "JsonBackend",
+    "JsonCodec",
+    "OrjsonCodec",
+    "StdlibJsonCodec",
+    "configure_json_codec",
+    "get_json_codec",
+    "json_default",
+]
+
+JsonBackend = Literal["auto", "orjson", "stdlib"]
+
+Default = Callable[[Any], Any]
+
+
+def json_default(value: Any) -> Any:
+    """Encode the non-native types that appear in envelopes and cache payloads.
+
+    Raises:
+        TypeError: For any other type, so unsupported values fail loudly.
+    """
+    if isinstance(value, Decimal):
+        return format(value, "f")
+    if isinstance(value, date):  # includes datetime
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _json_key(key: Any, default: Default) -> str:
+    """Stringify a dict key the way orjson's ``OPT_NON_STR_KEYS`` does."""
+    if isinstance(key, str):
+        return key
+    if key is None or isinstance(key, bool | int | float):
+        return json.dumps(key)
+    return str(default(key))
+
+
+def _normalize(obj: Any, default: Default) -> Any:
+    """Return ``obj`` with string dict keys and non-finite floats as ``None``."""
+    if isinstance(obj, dict):
+        return {_json_key(k, default): _normalize(v, default) for k, v in obj.items()}
+    if isinstance(obj, list | tuple):
+        return [_normalize(v, default) for v in obj]
+    if isinstance(obj, float) and not math.isfinite(obj):
+        return None
+    return obj
+
+
+class JsonCodec(Protocol):
+    """Encode/decode JSON documents."""
+
+    name: str
+
+    def dumps(self, obj: Any, *, sort_keys: bool = False, default: Default | None = None) -> bytes:
+        """Encode ``obj`` as compact UTF-8 JSON."""
+        ...
+
+    def loads(self, data: bytes | str) -> Any:
+        """Decode a JSON document."""
+        ...
+
+
+class StdlibJsonCodec:
+    """Codec backed by :mod:`json`."""
+
+    name = "stdlib"
+
+    def dumps(self, obj: Any, *, sort_keys: bool = False, default: Default | None = None) -> bytes:
+        """Encode ``obj`` as compact UTF-8 JSON."""
+        default = default or json_default
+        try:
+            return self._dumps(obj, sort_keys=sort_keys, default=default)
+        except (TypeError, ValueError):
+            # Keys json cannot stringify or sort (dates, mixed int/str) or
+            # non-finite floats: retry once on a normalized copy.
+            return self._dumps(_normalize(obj, default), sort_keys=sort_keys, default=default)
+
+    @staticmethod
+    def _dumps(obj: Any, *, sort_keys: bool, default: Default) -> bytes:
+        return json.dumps(
+            obj,
+            sort_keys=sort_keys,
+            separators=(",", ":"),
+            ensure_ascii=False,
+            allow_nan=False,
+            default=default,
+        ).encode("utf-8")
+
+    def loads(self, data: bytes | str) -> Any:
+        """Decode a JSON document."""
+        return json.loads(data)
+
+
+class OrjsonCodec:
+    """Codec backed by orjson.
+
+    Raises:
+        RuntimeError: On construction when orjson is not installed.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        """Initialize the codec."""
+        if _orjson is None:
+            raise RuntimeError("orjson is not installed (install the 'fastjson' extra)")
+        self._orjson = _orjson
+        self._options = _orjson.OPT_NON_STR_KEYS
+        self._sorted_options = _orjson.OPT_NON_STR_KEYS | _orjson.OPT_SORT_KEYS
+
+    def dumps(self, obj: Any, *, sort_keys: bool = False, default: Default | None = None) -> bytes:
+        """Encode ``obj`` as compact UTF-8 JSON."""
+        options = self._sorted_options if sort_keys else self._options
+        try:
+            encoded: bytes = self._orjson.dumps(
+                obj, default=default or json_default, option=options
+            )
+        except TypeError:
+            # Integers beyond 64 bits (values or keys) and keys orjson cannot
+            # stringify; anything ``default`` rejects fails there too.
+            return _STDLIB.dumps(obj, sort_keys=sort_keys, default=default)
+        return encoded
+
+    def loads(self, data: bytes | str) -> Any:
+        """Decode a JSON document."""
+        return self._orjson.loads(data)
+
+
+_STDLIB: Final = StdlibJsonCodec()
+
+_codec: JsonCodec | None = None
+
+_BACKENDS: Final[dict[str, Callable[[], JsonCodec]]] = {
+    "orjson": OrjsonCodec,
+    "stdlib": StdlibJsonCodec,
+}
+
+
+def configure_json_codec(backend: JsonBackend = "auto") -> JsonCodec:
+    """Select the process-wide codec.
+
+    Args:
+        backend: ``orjson``, ``stdlib``, or ``auto`` (orjson when installed).
+
+    Returns:
+        The installed codec.
+
+    Raises:
+        RuntimeError: If ``orjson`` is requested but not installed.
+    """
+    global _codec
+    if backend == "auto":
+        backend = "orjson" if _orjson is not None else "stdlib"
+    _codec = _BACKENDS[backend]()
+    return _codec
+
+
+def get_json_codec() -> JsonCodec:
+    """Return the process-wide codec, selecting ``auto`` on first use."""
+    return _codec if _codec is not None else configure_json_codec()
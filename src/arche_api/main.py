@@ -10,20 +10,25 @@ Synopsis:
 
 Design:
     • Bootstrap only (no business logic): routers + middleware + contract registry.
+    • Routers are mounted by feature group (``ROUTER_GROUPS``) and imported on
+      demand, so disabled groups (e.g. EDGAR in a quotes-only deployment) are
+      never loaded.
     • OpenAPI Contract Registry is attached first to stabilize snapshots.
     • Lifespan initializes DB/Redis/HTTP and tears them down safely.
     • CORS and security headers are applied consistently across environments.
     • Observability:
         - Root JSON logging configured at import time.
-        - OpenTelemetry exporters initialized (soft dependency).
+        - OpenTelemetry exporters initialized (soft dependency; SDK imported
+          only when enabled).
         - Tracing/metrics middleware installed for every request.
 """
 
 from __future__ import annotations
 
+import asyncio
 import os
 from collections.abc import AsyncGenerator
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI, HTTPException
 from fastapi.exceptions import RequestValidationError
@@ -34,45 +39,47 @@ from starlette.requests import Request
 from starlette.responses import JSONResponse
 from starlette.responses import Response as StarletteResponse
 
-from arche_api.adapters.routers import mcp_router
-from arche_api.adapters.routers.api_router import router as api_router
-from arche_api.adapters.routers.edgar_router import router as edgar_router
-from arche_api.adapters.routers.metrics_router import router as metrics_router
 from arche_api.adapters.routers.openapi_registry import (
     attach_openapi_contract_registry,
 )
-from arche_api.adapters.routers.reconciliation_router import router as reconciliation_router
+from arche_api.adapters.routers.router_groups import (
+    include_router_groups,
+    parse_router_groups,
+)
 from arche_api.config.settings import Settings, get_settings
 from arche_api.dependencies.core.bootstrap import bootstrap
+from arche_api.infrastructure.background.tasks.idempotency_pruner import run_idempotency_pruner
+from arche_api.infrastructure.background.tasks.replica_lag_monitor import run_replica_lag_monitor
+from arche_api.infrastructure.caching.idempotency_store import RedisIdempotencyStore
+from arche_api.infrastructure.caching.redis_client import get_redis_client
+from arche_api.infrastructure.health.probe import DbRedisProbe
+from arche_api.infrastructure.health.sampler import HealthSampler, set_health_sampler
 from arche_api.infrastructure.http.errors import (
     handle_http_exception,
     handle_unhandled_exception,
     handle_validation_error,
 )
-from arche_api.infrastructure.http.middleware.trace import TraceIdMiddleware
+from arche_api.infrastructure.http.responses import FastJSONResponse
 from arche_api.infrastructure.logging.logger import (
     configure_root_logging,
     get_json_logger,
 )
-from arche_api.infrastructure.logging.tracing import configure_tracing
-from arche_api.infrastructure.middleware.access_log import AccessLogMiddleware
 from arche_api.infrastructure.middleware.idempotency import IdempotencyMiddleware
-from arche_api.infrastructure.middleware.metrics import (
-    PromMetricsMiddleware,  # optional extra counters
-)
-from arche_api.infrastructure.middleware.rate_limit import RateLimitMiddleware
-from arche_api.infrastructure.middleware.request_id import RequestIdMiddleware
-from arche_api.infrastructure.middleware.request_metrics import (
-    RequestLatencyMiddleware,
-)
-from arche_api.infrastructure.middleware.security_headers import (
-    SecurityHeadersMiddleware,
+from arche_api.infrastructure.middleware.observability import ObservabilityMiddleware
+from arche_api.infrastructure.middleware.rate_limit import (
+    RateLimitMiddleware,
+    rate_limit_options,
 )
+from arche_api.infrastructure.middleware.server_timing import ServerTimingMiddleware
 from arche_api.infrastructure.observability.metrics import (
     get_readyz_db_latency_seconds,
     get_readyz_redis_latency_seconds,
 )
 from arche_api.infrastructure.observability.otel import init_otel
+from arche_api.infrastructure.observability.stages import install_stage_timing
+from arche_api.infrastructure.resilience.rate_limiter import Quota
+from arche_api.infrastructure.security.clerk_jwks import get_clerk_jwks_client
+from arche_api.infrastructure.serialization.json_codec import configure_json_codec
 
 # -----------------------------------------------------------------------------
 # Logging
@@ -111,8 +118,9 @@ async def runtime_lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     This context manager delegates initialization of settings, logging, database
     engine, Redis client, HTTP clients, and tracing to the shared
-    :func:`bootstrap` helper. It also exposes the resolved settings and shared
-    HTTP client on ``app.state`` for downstream dependencies.
+    :func:`bootstrap` helper. It also exposes the resolved settings, shared
+    HTTP client and pooled provider transports on ``app.state`` for downstream
+    dependencies.
 
     Args:
         app: FastAPI application instance.
@@ -123,7 +131,144 @@ async def runtime_lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     async with bootstrap(app) as state:
         app.state.settings = state.settings
         app.state.http_client = state.http_client
-        yield
+        app.state.http_transports = state.transports
+        fast_reads = _enable_fast_reads(state.settings)
+        tasks = [
+            task
+            for task in (
+                _start_idempotency_pruner(state.settings),
+                _start_jwks_refresher(state.settings),
+                _start_health_sampler(state.settings),
+                _start_replica_lag_monitor(state.settings),
+                _start_identity_map(state.settings),
+            )
+            if task is not None
+        ]
+        try:
+            yield
+        finally:
+            set_health_sampler(None)
+            _clear_identity_map()
+            if fast_reads:
+                _disable_fast_reads()
+            for task in tasks:
+                task.cancel()
+            for task in tasks:
+                with suppress(asyncio.CancelledError):
+                    await task
+
+
+def _start_idempotency_pruner(settings: Settings) -> asyncio.Task[None] | None:
+    """Start the background pruner for expired idempotency keys, if enabled."""
+    interval = settings.idempotency_prune_interval_seconds
+    if not settings.idempotency_enabled or interval <= 0:
+        return None
+    return asyncio.create_task(
+        run_idempotency_pruner(
+            interval_s=float(interval),
+            batch_size=settings.idempotency_prune_batch_size,
+        ),
+        name="idempotency-pruner",
+    )
+
+
+def _start_jwks_refresher(settings: Settings) -> asyncio.Task[None] | None:
+    """Keep the Clerk JWKS warm off the request path, if Clerk auth is configured."""
+    if not (settings.clerk_issuer and settings.clerk_jwks_background_refresh):
+        return None
+    jwks = get_clerk_jwks_client(settings.clerk_issuer, ttl_seconds=settings.clerk_jwks_ttl_seconds)
+    return asyncio.create_task(jwks.run_refresher(), name="clerk-jwks-refresher")
+
+
+def _start_health_sampler(settings: Settings) -> asyncio.Task[None] | None:
+    """Sample DB/Redis readiness in the background so readiness requests do no I/O."""
+    if not settings.health_sampler_enabled:
+        return None
+    import arche_api.infrastructure.database.session as db_session
+
+    try:
+        probe = DbRedisProbe(db_session.get_sessionmaker(), get_redis_client())
+    except Exception as exc:
+        logger.warning(
+            "startup: health sampler disabled",
+            extra={"extra": {"error": str(exc)}},
+        )
+        return None
+    sampler = HealthSampler(
+        {"db": probe.db, "redis": probe.redis},
+        interval_s=settings.health_sample_interval_seconds,
+        timeout_s=settings.health_probe_timeout_seconds,
+        max_age_s=settings.health_sample_max_age_seconds,
+        pool_stats=db_session.get_pool_stats,
+    )
+    set_health_sampler(sampler)
+    return asyncio.create_task(sampler.run(), name="health-sampler")
+
+
+def _start_replica_lag_monitor(settings: Settings) -> asyncio.Task[None] | None:
+    """Measure read-replica lag in the background, if replicas are configured."""
+    import arche_api.infrastructure.database.session as db_session
+
+    if not db_session.has_replicas():
+        return None
+    return asyncio.create_task(
+        run_replica_lag_monitor(
+            interval_s=settings.database_replica_lag_check_interval_seconds,
+            timeout_s=settings.health_probe_timeout_seconds,
+        ),
+        name="replica-lag-monitor",
+    )
+
+
+def _start_identity_map(settings: Settings) -> asyncio.Task[None] | None:
+    """Install the EDGAR identity map and warm it in the background, if EDGAR is mounted."""
+    if settings.edgar_identity_cache_max_entries <= 0:
+        return None
+    if "edgar" not in parse_router_groups(settings.router_groups):
+        return None
+    from arche_api.adapters.repositories.edgar_identity_map import (
+        EdgarIdentityMap,
+        set_edgar_identity_map,
+    )
+    from arche_api.infrastructure.background.tasks.identity_warmup import run_identity_warmup
+
+    identity_map = EdgarIdentityMap(
+        settings.edgar_identity_cache_max_entries,
+        negative_ttl_s=settings.edgar_identity_negative_ttl_seconds,
+    )
+    set_edgar_identity_map(identity_map)
+    raw = settings.edgar_identity_warm_ciks
+    ciks = [c.strip() for c in raw.split(",") if c.strip()] if raw else None
+    return asyncio.create_task(
+        run_identity_warmup(identity_map, ciks=ciks),
+        name="edgar-identity-warmup",
+    )
+
+
+def _clear_identity_map() -> None:
+    """Uninstall the EDGAR identity map so later app instances start cold."""
+    from arche_api.adapters.repositories.edgar_identity_map import set_edgar_identity_map
+
+    set_edgar_identity_map(None)
+
+
+def _enable_fast_reads(settings: Settings) -> bool:
+    """Turn on the asyncpg fast path for EDGAR reads, if enabled and EDGAR is mounted."""
+    if not settings.edgar_asyncpg_fast_path:
+        return False
+    if "edgar" not in parse_router_groups(settings.router_groups):
+        return False
+    from arche_api.adapters.repositories.edgar_fast_reads import set_fast_reads_enabled
+
+    set_fast_reads_enabled(True)
+    return True
+
+
+def _disable_fast_reads() -> None:
+    """Turn the EDGAR asyncpg fast path back off so later app instances start on the ORM."""
+    from arche_api.adapters.repositories.edgar_fast_reads import set_fast_reads_enabled
+
+    set_fast_reads_enabled(False)
 
 
 # -----------------------------------------------------------------------------
@@ -133,44 +278,42 @@ def _attach_middlewares(app: FastAPI, settings: Settings) -> None:
     """Attach core middleware in the recommended order.
 
     Middleware ordering is intentionally strict to preserve logging and
-    observability guarantees:
+    observability guarantees. From outermost to innermost (CORS is attached
+    afterwards and wraps the whole stack):
+
+        1. GZipMiddleware (response compression)
+        2. ObservabilityMiddleware (correlation IDs, access log, latency
+           metrics, security headers — one pure-ASGI pass)
+        3. RateLimitMiddleware (optional GCRA rate limiting; Redis or memory)
+        4. IdempotencyMiddleware (dedupe write operations)
 
-        1. RequestIdMiddleware / TraceIdMiddleware (correlation IDs)
-        2. AccessLogMiddleware (structured access logs)
-        3. RequestLatencyMiddleware + PromMetricsMiddleware (metrics)
-        4. SecurityHeadersMiddleware (defensive headers)
-        5. IdempotencyMiddleware (dedupe write operations)
-        6. RateLimitMiddleware (optional HTTP rate limiting)
-        7. GZipMiddleware (response compression)
+    Observability wraps the rate limiter and idempotency layer so that 429s
+    and idempotent replays still carry ``x-trace-id`` and are access-logged.
+    ``ServerTimingMiddleware`` (opt-in) is added first, i.e. innermost, so its
+    ``total`` covers the application rather than the middleware stack.
 
     Args:
         app: FastAPI application.
         settings: Runtime settings for environment-aware toggles.
     """
-    # Correlation ID chain: RequestIdMiddleware complements TraceIdMiddleware.
-    app.add_middleware(RequestIdMiddleware)
-
-    # Access log should see request_id/trace_id on request.state and contextvars.
-    app.add_middleware(AccessLogMiddleware)
-
-    # Canonical server latency histogram (required by tests).
-    app.add_middleware(RequestLatencyMiddleware)
-
-    # Optional additional Prometheus counters/histograms.
-    app.add_middleware(PromMetricsMiddleware)
-
-    app.add_middleware(SecurityHeadersMiddleware)
+    # Per-request stage breakdown (Server-Timing); innermost.
+    if settings.server_timing_enabled:
+        app.add_middleware(ServerTimingMiddleware)
 
     # HTTP idempotency for write operations (POST/PUT/PATCH/DELETE).
     if settings.idempotency_enabled:
+        idem_backend = settings.idempotency_backend.strip().lower()
         app.add_middleware(
             IdempotencyMiddleware,
             ttl_seconds=settings.idempotency_ttl_seconds,
+            store=RedisIdempotencyStore(get_redis_client) if idem_backend == "redis" else None,
+            persist=settings.idempotency_persist_audit,
         )
         logger.info(
             "idempotency_enabled",
             extra={
                 "ttl_seconds": settings.idempotency_ttl_seconds,
+                "backend": idem_backend,
             },
         )
 
@@ -182,13 +325,35 @@ def _attach_middlewares(app: FastAPI, settings: Settings) -> None:
             1, int(os.getenv("RATE_LIMIT_WINDOW_SECONDS") or settings.rate_limit_window_seconds)
         )
         burst = max(1, int(os.getenv("RATE_LIMIT_BURST") or settings.rate_limit_burst))
-        rate_per_sec = max(1.0, float(burst) / float(window))
-        app.add_middleware(RateLimitMiddleware, rate_per_sec=rate_per_sec, burst=burst)
+        backend = (os.getenv("RATE_LIMIT_BACKEND") or settings.rate_limit_backend).strip().lower()
+        app.add_middleware(
+            RateLimitMiddleware,
+            **rate_limit_options(
+                backend=backend,
+                quota=Quota(limit=burst, window_s=float(window)),
+                plans=settings.rate_limit_plans,
+                api_key_plans=settings.rate_limit_api_key_plans,
+                route_quotas=settings.rate_limit_route_quotas,
+                max_local_keys=settings.rate_limit_max_local_keys,
+            ),
+        )
         logger.info(
             "rate_limit_enabled",
-            extra={"window_s": window, "burst": burst, "rate_per_sec": rate_per_sec},
+            extra={
+                "window_s": window,
+                "burst": burst,
+                "backend": backend,
+                "plans": sorted(settings.rate_limit_plans),
+            },
         )
 
+    # Correlation IDs, access log, canonical latency histogram, request
+    # counters and security headers. Added after the rate limiter and the
+    # idempotency layer so it wraps their short-circuit responses. Pure ASGI:
+    # no per-layer task or body wrapping, so streaming responses are passed
+    # through as produced.
+    app.add_middleware(ObservabilityMiddleware)
+
     # Response compression.
     app.add_middleware(GZipMiddleware, minimum_size=1024)
 
@@ -252,37 +417,46 @@ def create_app() -> FastAPI:
     """
     settings: Settings = get_settings()
 
+    # Logging was configured from the environment at import; re-apply it from
+    # the validated settings now that they are available.
+    configure_root_logging(
+        settings.log_level,
+        async_mode=settings.log_async,
+        queue_size=settings.log_queue_size,
+        drop_policy=settings.log_drop_policy,
+        sample_rates=settings.log_success_sample_rates,
+        max_items=settings.log_extra_max_items,
+        max_chars=settings.log_extra_max_chars,
+        force=True,
+    )
+
     service_name = "arche_api"
     service_version = os.getenv("SERVICE_VERSION") or settings.service_version or "0.0.0"
 
+    # Before routers load: catalogs render (and hash) their ETags at import.
+    configure_json_codec(settings.json_backend)
+
     app = FastAPI(
         title="Arche API",
         version=service_version,
         description="Secure, governed financial data API.",
         lifespan=runtime_lifespan,
         generate_unique_id_function=_stable_operation_id,
+        default_response_class=FastJSONResponse,
     )
 
-    # Initialize OpenTelemetry exporters/providers (soft dependency).
+    # OpenTelemetry providers, sampling, exporters and FastAPI/HTTPX/SQLAlchemy
+    # instrumentation (soft dependency).
     try:
-        init_otel(service_name=service_name, service_version=service_version)
+        init_otel(service_name=service_name, service_version=service_version, app=app)
     except Exception as exc:  # pragma: no cover - observability must not break startup
         logger.debug(
             "otel.init_failed",
             extra={"extra": {"error": str(exc)}},
         )
 
-    # Attach OTEL ASGI/FastAPI/HTTPX/SQLAlchemy instrumentation (soft dependency).
-    try:
-        configure_tracing(app)
-    except Exception as exc:  # pragma: no cover - observability must not break startup
-        logger.debug(
-            "otel.configure_tracing_failed",
-            extra={"extra": {"error": str(exc)}},
-        )
-
-    # Attach trace-id middleware early so logs can correlate requests.
-    app.add_middleware(TraceIdMiddleware)
+    # Use-case stage timing (histogram + per-stage spans on the provider above).
+    install_stage_timing(enabled=settings.stage_timing_enabled)
 
     _patch_exception_handlers(app)
 
@@ -302,20 +476,9 @@ def create_app() -> FastAPI:
     _attach_middlewares(app, settings)
     _attach_cors(app, settings)
 
-    # Mount all API routers via the aggregator (health, historical, protected, etc.)
-    app.include_router(api_router)
-
-    # EDGAR router (v1/edgar/* endpoints)
-    app.include_router(edgar_router)
-
-    # EDGAR reconciliation router (v1/edgar/reconciliation/* endpoints)
-    app.include_router(reconciliation_router)
-
-    # MCP router
-    app.include_router(mcp_router.router)
-
-    # Metrics router (typically exposes /metrics).
-    app.include_router(metrics_router)
+    # Mount the enabled router groups (core, quotes, edgar, mcp). Routers are
+    # imported here, so disabled groups never load their modules.
+    include_router_groups(app, parse_router_groups(settings.router_groups))
 
     # Simple /healthz endpoint used by rate-limit header tests.
     @app.get("/healthz")
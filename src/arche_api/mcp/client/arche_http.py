@@ -55,6 +55,7 @@ from typing import Any
 import httpx
 
 from arche_api.config.settings import Settings, get_settings
+from arche_api.infrastructure.http.transport import get_http_transport_registry
 from arche_api.mcp.schemas.errors import MCPError
 
 
@@ -103,7 +104,12 @@ class ArcheHTTPClient:
     business logic.
     """
 
-    def __init__(self, settings: Settings | Any | None = None) -> None:
+    def __init__(
+        self,
+        settings: Settings | Any | None = None,
+        *,
+        http: httpx.AsyncClient | None = None,
+    ) -> None:
         """Initialize the HTTP client.
 
         Args:
@@ -114,8 +120,12 @@ class ArcheHTTPClient:
                 When a lightweight object (such as tests' FakeSettings) is
                 provided, only `api_base_url` is read and MCP-specific fields
                 are ignored.
+            http:
+                Optional ``httpx.AsyncClient``. Defaults to the process-wide
+                pooled ``mcp`` transport so loopback calls reuse connections.
         """
         self._settings: Any = settings or get_settings()
+        self._http = http
 
         # Base URL precedence when using real Settings:
         #   1. mcp_http_base_url
@@ -162,21 +172,22 @@ class ArcheHTTPClient:
         url = f"{self._base_url}{normalized_path}"
         headers = self._build_headers(request_id=request_id)
 
-        async with httpx.AsyncClient(timeout=self._timeout_s) as client:
-            try:
-                resp = await client.get(
-                    url,
-                    params=params,
-                    headers=headers,
-                )
-            except httpx.RequestError as exc:
-                raise ArcheHTTPError(
-                    message=f"Network error calling Arche API: {exc}",
-                    status_code=None,
-                    error_code="NETWORK_ERROR",
-                    trace_id=None,
-                    retry_after_s=None,
-                ) from exc
+        client = self._http or get_http_transport_registry().client("mcp")
+        try:
+            resp = await client.get(
+                url,
+                params=params,
+                headers=headers,
+                timeout=self._timeout_s,
+            )
+        except httpx.RequestError as exc:
+            raise ArcheHTTPError(
+                message=f"Network error calling Arche API: {exc}",
+                status_code=None,
+                error_code="NETWORK_ERROR",
+                trace_id=None,
+                retry_after_s=None,
+            ) from exc
 
         # Normalize headers to lowercase keys for easier lookup.
         normalized_headers: dict[str, str] = {k.lower(): v for k, v in resp.headers.items()}
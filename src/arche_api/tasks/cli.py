@@ -1,12 +1,13 @@
 # src/arche_api/tasks/cli.py
 # Copyright (c)
 # SPDX-License-Identifier: MIT
-"""Arche CLI: operational commands (ingest, partitions, replay).
+"""Arche CLI: operational commands (ingest, partitions, replay, ledger).
 
 Commands:
     ingest intraday        Ingest intraday bars using Marketstack (real client).
     partitions create      Pre-create forward monthly partitions.
     replay staging-to-md   Reprocess raw payloads from staging into md.
+    ledger backfill        Rebuild the restatement ledger from stored versions.
 
 Environment:
     DATABASE_URL                           Async SQLAlchemy URL.
@@ -34,6 +35,11 @@ from arche_api.application.use_cases.maintenance.replay_staging_to_md import (
     ReplayRequest,
     ReplayStagingToMd,
 )
+from arche_api.application.use_cases.statements.backfill_restatement_ledger import (
+    BackfillRestatementLedgerRequest,
+    BackfillRestatementLedgerUseCase,
+)
+from arche_api.domain.enums.edgar import StatementType
 from arche_api.domain.exceptions.market_data import MarketDataBadRequest
 from arche_api.infrastructure.database.maintenance.partitions import (
     create_forward_partitions,
@@ -50,9 +56,11 @@ app = typer.Typer(add_completion=False, no_args_is_help=True)
 ingest_app = typer.Typer(no_args_is_help=True)
 partitions_app = typer.Typer(no_args_is_help=True)
 replay_app = typer.Typer(no_args_is_help=True)
+ledger_app = typer.Typer(no_args_is_help=True)
 app.add_typer(ingest_app, name="ingest")
 app.add_typer(partitions_app, name="partitions")
 app.add_typer(replay_app, name="replay")
+app.add_typer(ledger_app, name="ledger")
 
 
 def _sessionmaker(database_url: str) -> async_sessionmaker[AsyncSession]:
@@ -283,6 +291,56 @@ def replay_staging_to_md(
     asyncio.run(_run())
 
 
+@ledger_app.command("backfill")
+def ledger_backfill(
+    database_url: str = typer.Option(..., envvar="DATABASE_URL"),  # noqa: B008
+    cik: list[str] = typer.Option(..., help="Company CIK (repeatable)."),  # noqa: B008
+    from_year: int = typer.Option(..., min=1, help="First fiscal year (inclusive)."),  # noqa: B008
+    to_year: int = typer.Option(..., min=1, help="Last fiscal year (inclusive)."),  # noqa: B008
+    statement_type: list[StatementType] | None = typer.Option(  # noqa: B008
+        None, help="Statement type (repeatable; all types when omitted)."
+    ),
+) -> None:
+    """Rebuild restatement ledger hops for already-normalized statement versions.
+
+    Safe to run repeatedly: every hop is replaced. Commits once per CIK.
+
+    Args:
+        database_url: Async SQLAlchemy URL.
+        cik: Companies to backfill.
+        from_year: First fiscal year to backfill.
+        to_year: Last fiscal year to backfill.
+        statement_type: Optional statement types; defaults to all.
+    """
+    from arche_api.adapters.uow.sqlalchemy_uow import SqlAlchemyUnitOfWork
+
+    Session = _sessionmaker(database_url)
+    req = BackfillRestatementLedgerRequest(
+        ciks=cik,
+        fiscal_year_from=from_year,
+        fiscal_year_to=to_year,
+    )
+    if statement_type:
+        req.statement_types = statement_type
+
+    async def _run() -> None:
+        uc = BackfillRestatementLedgerUseCase(SqlAlchemyUnitOfWork(session_factory=Session))
+        result = await uc.execute(req)
+        log.info(
+            "ledger.backfill.done",
+            extra={
+                "extra": {
+                    "companies": result.companies,
+                    "records_written": result.records_written,
+                    "from_year": from_year,
+                    "to_year": to_year,
+                }
+            },
+        )
+
+    asyncio.run(_run())
+
+
 # Colon alias for convenience.
 @app.command("ingest:intraday")
 def ingest_intraday_alias(
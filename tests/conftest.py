@@ -21,6 +21,7 @@ from arche_api.application.schemas.dto.quotes import HistoricalBarDTO
 from arche_api.config.settings import get_settings
 from arche_api.dependencies.market_data import get_historical_quotes_use_case
 from arche_api.domain.entities.historical_bar import BarInterval
+from arche_api.infrastructure.resilience.circuit_breaker import get_circuit_breaker_registry
 from arche_api.main import create_app
 
 
@@ -213,6 +214,14 @@ async def http_client() -> AsyncGenerator[_LazyAsyncClient, None]:
         await lazy.aclose()
 
 
+@pytest.fixture(autouse=True)
+def _reset_circuit_breakers() -> Generator[None, None, None]:
+    """Isolate tests from breaker state tripped by earlier provider failures."""
+    get_circuit_breaker_registry().reset()
+    yield
+    get_circuit_breaker_registry().reset()
+
+
 @pytest.fixture(scope="session")
 def anyio_backend() -> str:
     """Force pytest-anyio to use asyncio (not trio)."""
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+
+from arche_api.adapters.routers.router_groups import (
+    ROUTER_GROUPS,
+    ROUTER_SPECS,
+    include_router_groups,
+    parse_router_groups,
+)
+
+SRC_DIR = Path(__file__).resolve().parents[2] / "src"
+
+# Generous default: catches a regression back to eager imports without
+# flaking on slow CI runners. Tighten locally with ARCHE_STARTUP_BUDGET_S.
+STARTUP_BUDGET_S = float(os.getenv("ARCHE_STARTUP_BUDGET_S", "15"))
+
+_PROBE = """
+import json, sys, time
+t0 = time.perf_counter()
+import arche_api.main as m
+elapsed = time.perf_counter() - t0
+print(json.dumps({
+    "elapsed": elapsed,
+    "paths": sorted(m.app.openapi()["paths"]),
+    "modules": sorted(k for k in sys.modules if k.startswith("arche_api.")),
+}))
+"""
+
+
+def _boot(groups: str) -> dict[str, object]:
+    env = {
+        **os.environ,
+        "ROUTER_GROUPS": groups,
+        "PYTHONPATH": os.pathsep.join(filter(None, [str(SRC_DIR), os.getenv("PYTHONPATH")])),
+    }
+    proc = subprocess.run(  # noqa: S603 - fixed interpreter and arguments
+        [sys.executable, "-c", _PROBE],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+        timeout=120,
+    )
+    assert proc.returncode == 0, proc.stderr
+    result: dict[str, object] = json.loads(proc.stdout.strip().splitlines()[-1])
+    return result
+
+
+def test_parse_router_groups() -> None:
+    assert parse_router_groups("all") == frozenset(ROUTER_GROUPS)
+    assert parse_router_groups(None) == frozenset(ROUTER_GROUPS)
+    assert parse_router_groups(" Quotes, mcp ") == frozenset({"core", "quotes", "mcp"})
+    with pytest.raises(ValueError):
+        parse_router_groups("quotes,bogus")
+    assert {spec.group for spec in ROUTER_SPECS} == set(ROUTER_GROUPS)
+
+
+def test_api_router_aggregates_every_router_spec() -> None:
+    from arche_api.adapters.routers.api_router import router
+
+    app = FastAPI(openapi_url=None, docs_url=None, redoc_url=None)
+    include_router_groups(app, ROUTER_GROUPS)
+
+    def _table(routes: list[object]) -> list[tuple[str, tuple[str, ...]]]:
+        return sorted(
+            (str(getattr(r, "path", "")), tuple(sorted(getattr(r, "methods", None) or ())))
+            for r in routes
+        )
+
+    assert _table(router.routes) == _table(app.routes)
+
+
+def test_quotes_only_boot_skips_edgar_and_meets_budget() -> None:
+    result = _boot("quotes")
+    modules = set(result["modules"])  # type: ignore[call-overload]
+    paths = result["paths"]
+
+    assert "arche_api.adapters.routers.quotes_router" in modules
+    for name in (
+        "arche_api.adapters.routers.edgar_router",
+        "arche_api.adapters.routers.fundamentals_router",
+        "arche_api.adapters.routers.mcp_router",
+        "arche_api.adapters.dependencies.edgar_uow",
+        "arche_api.adapters.controllers.edgar_controller",
+        "arche_api.adapters.repositories.edgar_fast_reads",
+    ):
+        assert name not in modules, name
+
+    assert "/health/z" in paths and "/v2/quotes" in paths  # type: ignore[operator]
+    assert not any(str(p).startswith("/v1/edgar") for p in paths)  # type: ignore[attr-defined]
+    assert result["elapsed"] < STARTUP_BUDGET_S  # type: ignore[operator]
+
+
+def test_all_groups_boot_meets_budget() -> None:
+    result = _boot("all")
+    paths = result["paths"]
+
+    assert any(str(p).startswith("/v1/edgar") for p in paths)  # type: ignore[attr-defined]
+    assert "/mcp" in paths  # type: ignore[operator]
+    assert result["elapsed"] < STARTUP_BUDGET_S  # type: ignore[operator]
@@ -38,7 +38,7 @@ class _FakeEdgarController(EdgarController):  # type: ignore[misc]
 
     def __init__(self) -> None:
         # Bypass BaseController init; we do not need real use-cases.
-        pass  # type: ignore[no-untyped-call]
+        self.list_statements_calls = 0
 
     async def list_filings(  # type: ignore[override]
         self,
@@ -100,6 +100,7 @@ class _FakeEdgarController(EdgarController):  # type: ignore[misc]
         page: int,
         page_size: int,
     ):
+        self.list_statements_calls += 1
         dto = EdgarStatementVersionDTO(
             accession_id="0000000001-24-000001",
             cik=cik,
@@ -120,6 +121,17 @@ class _FakeEdgarController(EdgarController):  # type: ignore[misc]
         )
         return [dto], 1
 
+    async def statement_versions_validator(  # type: ignore[override]
+        self,
+        *,
+        cik: str,
+        statement_type: StatementType,
+        from_date,
+        to_date,
+        representation: dict[str, Any],
+    ) -> str:
+        return f"{cik}-{statement_type.value}-{representation['page']}"
+
     async def get_statement_versions_for_filing(  # type: ignore[override]
         self,
         *,
@@ -154,12 +166,16 @@ class _FakeEdgarController(EdgarController):  # type: ignore[misc]
 
 
 @pytest.fixture()
-def client() -> TestClient:
+def fake_controller() -> _FakeEdgarController:
+    return _FakeEdgarController()
+
+
+@pytest.fixture()
+def client(fake_controller: _FakeEdgarController) -> TestClient:
     """Return a TestClient with the EDGAR router mounted and controller overridden."""
     app = FastAPI()
     app.include_router(edgar_router)
 
-    fake_controller = _FakeEdgarController()
     app.dependency_overrides[get_edgar_controller] = lambda: fake_controller
 
     return TestClient(app)
@@ -216,6 +232,37 @@ def test_list_statements_happy_path(client: TestClient) -> None:
     assert body["items"][0]["statement_type"] == StatementType.INCOME_STATEMENT.value
 
 
+def test_list_statements_emits_weak_etag_and_honors_if_none_match(
+    client: TestClient,
+    fake_controller: _FakeEdgarController,
+) -> None:
+    """A matching If-None-Match should return 304 without listing versions."""
+    params = {"statement_type": StatementType.INCOME_STATEMENT.value}
+    first = client.get("/v1/edgar/companies/0000000001/statements", params=params)
+    assert first.status_code == 200, first.text
+    etag = first.headers["ETag"]
+    assert etag.startswith('W/"')
+    assert fake_controller.list_statements_calls == 1
+
+    second = client.get(
+        "/v1/edgar/companies/0000000001/statements",
+        params=params,
+        headers={"If-None-Match": etag},
+    )
+    assert second.status_code == 304
+    assert second.headers["ETag"] == etag
+    assert second.content == b""
+    assert fake_controller.list_statements_calls == 1
+
+    stale = client.get(
+        "/v1/edgar/companies/0000000001/statements",
+        params={**params, "page": "2"},
+        headers={"If-None-Match": etag},
+    )
+    assert stale.status_code == 200, stale.text
+    assert stale.headers["ETag"] != etag
+
+
 def test_list_statements_invalid_type_returns_400(client: TestClient) -> None:
     """Invalid statement_type should result in 400 VALIDATION_ERROR."""
     resp = client.get(
@@ -28,3 +28,7 @@ async def test_rate_limit_emits_429_and_headers(monkeypatch: pytest.MonkeyPatch)
 
         for h in ("X-RateLimit-Limit", "X-RateLimit-Remaining", "X-RateLimit-Reset", "Retry-After"):
             assert h in limited.headers, f"missing header: {h}"
+
+        # The 429 is produced inside the observability layer, so it is traced.
+        assert limited.headers.get("x-trace-id")
+        assert limited.headers.get("X-Request-ID")
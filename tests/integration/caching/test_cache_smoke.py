@@ -1,6 +1,4 @@
 # tests/integration/caching/test_cache_smoke.py
-import json
-
 import pytest
 
 from arche_api.infrastructure.caching.json_cache import RedisJsonCache
@@ -9,6 +7,7 @@ from arche_api.infrastructure.observability.metrics import (
     get_cache_operation_duration_seconds,
     get_cache_operations_total,
 )
+from arche_api.infrastructure.serialization.json_codec import get_json_codec
 
 
 @pytest.mark.asyncio
@@ -22,7 +21,7 @@ async def test_cache_roundtrip():
 
     # Verify raw exists with namespace
     redis = get_redis_client()
-    assert await redis.get("test:v1:abc123") == json.dumps(val)
+    assert await redis.get("test:v1:abc123") == get_json_codec().dumps(val).decode()
 
     # Verify cache metrics were recorded with expected labels.
     ops_counter = get_cache_operations_total()
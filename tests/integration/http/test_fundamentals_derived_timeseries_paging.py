@@ -0,0 +1,178 @@
+# tests/integration/http/test_fundamentals_derived_timeseries_paging.py
+# Copyright (c)
+# SPDX-License-Identifier: MIT
+"""HTTP-level tests for paging on the derived metrics time series.
+
+These tests validate that /v1/fundamentals/derived/time-series pages by
+derived points on every request: offset pages and keyset cursors agree, and
+`total` counts points even when some statement rows yield none.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+from typing import Any
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from arche_api.adapters.routers.fundamentals_router import get_uow
+from arche_api.adapters.routers.fundamentals_router import (
+    router as fundamentals_router,
+)
+from arche_api.domain.entities.canonical_statement_payload import (
+    CanonicalStatementPayload,
+)
+from arche_api.domain.entities.edgar_company import EdgarCompanyIdentity
+from arche_api.domain.entities.edgar_filing import EdgarFiling
+from arche_api.domain.entities.edgar_statement_version import EdgarStatementVersion
+from arche_api.domain.enums.canonical_statement_metric import CanonicalStatementMetric
+from arche_api.domain.enums.edgar import (
+    AccountingStandard,
+    FilingType,
+    FiscalPeriod,
+    StatementType,
+)
+
+CIK = "0000320193"
+
+# Fiscal years whose statements carry no gross profit, so no point is derived.
+GAP_YEARS = {2015, 2018, 2019, 2021}
+
+PARAMS: dict[str, Any] = {
+    "ciks": [CIK],
+    "statement_type": "INCOME_STATEMENT",
+    "metrics": ["GROSS_MARGIN"],
+    "frequency": "annual",
+    "from": "2014-01-01",
+    "to": "2023-12-31",
+    "page_size": 2,
+}
+
+
+def _version(year: int) -> EdgarStatementVersion:
+    company = EdgarCompanyIdentity(
+        cik=CIK,
+        ticker=None,
+        legal_name="Apple Inc.",
+        exchange=None,
+        country=None,
+    )
+    filing = EdgarFiling(
+        accession_id=f"acc-{year}",
+        company=company,
+        filing_type=FilingType.FORM_10_K,
+        filing_date=date(year + 1, 2, 1),
+        period_end_date=date(year, 9, 28),
+        accepted_at=None,
+        is_amendment=False,
+        amendment_sequence=None,
+        primary_document="doc.htm",
+        data_source="edgar",
+    )
+    core_metrics = {CanonicalStatementMetric.REVENUE: Decimal(1000 + year)}
+    if year not in GAP_YEARS:
+        core_metrics[CanonicalStatementMetric.GROSS_PROFIT] = Decimal(year)
+    payload = CanonicalStatementPayload(
+        cik=CIK,
+        statement_type=StatementType.INCOME_STATEMENT,
+        accounting_standard=AccountingStandard.US_GAAP,
+        statement_date=date(year, 9, 28),
+        fiscal_year=year,
+        fiscal_period=FiscalPeriod.FY,
+        currency="USD",
+        unit_multiplier=1,
+        core_metrics=core_metrics,
+        extra_metrics={},
+        dimensions={},
+        source_accession_id=filing.accession_id,
+        source_taxonomy="us-gaap-2024",
+        source_version_sequence=1,
+    )
+    return EdgarStatementVersion(
+        company=company,
+        filing=filing,
+        statement_type=StatementType.INCOME_STATEMENT,
+        accounting_standard=AccountingStandard.US_GAAP,
+        statement_date=date(year, 9, 28),
+        fiscal_year=year,
+        fiscal_period=FiscalPeriod.FY,
+        currency="USD",
+        is_restated=False,
+        restatement_reason=None,
+        version_source="EDGAR_XBRL_NORMALIZED",
+        version_sequence=1,
+        accession_id=filing.accession_id,
+        filing_date=filing.filing_date,
+        normalized_payload=payload,
+        normalized_payload_version="v1",
+    )
+
+
+VERSIONS = [_version(year) for year in range(2014, 2024)]
+
+
+class _FakeStatementsRepo:
+    async def list_statement_versions_for_company(
+        self,
+        *,
+        cik: str,
+        statement_type: StatementType,
+        fiscal_year: int,
+        fiscal_period: FiscalPeriod | None = None,
+    ) -> list[EdgarStatementVersion]:
+        return [v for v in VERSIONS if v.company.cik == cik and v.fiscal_year == fiscal_year]
+
+
+class _FakeUoW:
+    def __init__(self) -> None:
+        self.repo = _FakeStatementsRepo()
+
+    async def __aenter__(self) -> _FakeUoW:  # pragma: no cover - trivial
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:  # pragma: no cover - trivial
+        return None
+
+
+def _client() -> TestClient:
+    app = FastAPI()
+    app.include_router(fundamentals_router)
+    app.dependency_overrides[get_uow] = lambda: _FakeUoW()
+    return TestClient(app)
+
+
+def _years(body: dict[str, Any]) -> list[int]:
+    return [item["fiscal_year"] for item in body["items"]]
+
+
+def test_offset_and_cursor_pages_walk_every_point_once() -> None:
+    http = _client()
+    expected = [year for year in range(2014, 2024) if year not in GAP_YEARS]
+
+    first = http.get("/v1/fundamentals/derived/time-series", params=PARAMS)
+    assert first.status_code == 200, first.text
+    second = http.get("/v1/fundamentals/derived/time-series", params={**PARAMS, "page": 2})
+    assert second.status_code == 200, second.text
+    third = http.get(
+        "/v1/fundamentals/derived/time-series",
+        params={**PARAMS, "cursor": second.headers["X-Next-Cursor"]},
+    )
+    assert third.status_code == 200, third.text
+    assert "X-Next-Cursor" not in third.headers
+
+    bodies = [first.json(), second.json(), third.json()]
+    assert [body["page"] for body in bodies] == [1, 2, 3]
+    # `total` counts derived points on every page, whichever way it was reached.
+    assert {body["total"] for body in bodies} == {len(expected)}
+    walked = [year for body in bodies for year in _years(body)]
+    assert walked == expected
+
+    # The first page's cursor lands on the same points as `?page=2`.
+    via_cursor = http.get(
+        "/v1/fundamentals/derived/time-series",
+        params={**PARAMS, "cursor": first.headers["X-Next-Cursor"]},
+    )
+    assert via_cursor.status_code == 200, via_cursor.text
+    assert via_cursor.json() == bodies[1]
@@ -0,0 +1,179 @@
+# tests/integration/http/test_fundamentals_timeseries_cursor.py
+# Copyright (c)
+# SPDX-License-Identifier: MIT
+"""HTTP-level tests for keyset cursor pagination on fundamentals time series.
+
+These tests validate that /v1/fundamentals/time-series:
+
+    * Emits an opaque `X-Next-Cursor` header when more items follow.
+    * Serves the first page and cursor requests from the keyset use-case
+      path (no full-panel read); only deep offset pages read the full panel.
+    * Rejects malformed cursors with a 400 ErrorEnvelope.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+from typing import Any
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from arche_api.adapters.routers.fundamentals_router import get_uow
+from arche_api.adapters.routers.fundamentals_router import (
+    router as fundamentals_router,
+)
+from arche_api.application.use_cases.statements.get_fundamentals_timeseries import (
+    FundamentalsTimeSeriesPage,
+    GetFundamentalsTimeSeriesRequest,
+    GetFundamentalsTimeSeriesUseCase,
+)
+from arche_api.domain.entities.edgar_fundamentals_timeseries import (
+    FundamentalsTimeSeriesPoint,
+)
+from arche_api.domain.enums.canonical_statement_metric import CanonicalStatementMetric
+from arche_api.domain.enums.edgar import (
+    AccountingStandard,
+    FiscalPeriod,
+    StatementType,
+)
+from arche_api.domain.value_objects import StatementKeyset
+
+
+class _DummyUoW:
+    async def __aenter__(self) -> _DummyUoW:  # pragma: no cover - trivial
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:  # pragma: no cover - trivial
+        return None
+
+
+def _point(year: int) -> FundamentalsTimeSeriesPoint:
+    return FundamentalsTimeSeriesPoint(
+        cik="0000320193",
+        statement_type=StatementType.INCOME_STATEMENT,
+        accounting_standard=AccountingStandard.US_GAAP,
+        statement_date=date(year, 9, 28),
+        fiscal_year=year,
+        fiscal_period=FiscalPeriod.FY,
+        currency="USD",
+        metrics={CanonicalStatementMetric.REVENUE: Decimal(year)},
+        normalized_payload_version_sequence=1,
+    )
+
+
+POINTS = [_point(2022), _point(2023), _point(2024)]
+
+PARAMS: dict[str, Any] = {
+    "ciks": ["0000320193"],
+    "statement_type": "INCOME_STATEMENT",
+    "frequency": "annual",
+    "page_size": 2,
+}
+
+
+@pytest.fixture(name="client")
+def _client(monkeypatch: pytest.MonkeyPatch) -> tuple[TestClient, list[Any]]:
+    app = FastAPI()
+    app.include_router(fundamentals_router)
+    app.dependency_overrides[get_uow] = lambda: _DummyUoW()
+
+    page_calls: list[Any] = []
+
+    async def _fake_execute(
+        self: GetFundamentalsTimeSeriesUseCase,
+        req: GetFundamentalsTimeSeriesRequest,
+    ) -> list[FundamentalsTimeSeriesPoint]:
+        page_calls.append("full")
+        return list(POINTS)
+
+    async def _fake_execute_page(
+        self: GetFundamentalsTimeSeriesUseCase,
+        req: GetFundamentalsTimeSeriesRequest,
+        *,
+        after: StatementKeyset | None,
+        limit: int,
+        with_total: bool = False,
+    ) -> FundamentalsTimeSeriesPage:
+        page_calls.append((after, limit, with_total))
+        remaining = [p for p in POINTS if after is None or p.statement_date > after.statement_date]
+        next_keyset = None
+        if len(remaining) > limit:
+            last = remaining[limit - 1]
+            next_keyset = StatementKeyset(
+                cik=last.cik,
+                statement_date=last.statement_date,
+                fiscal_period=last.fiscal_period,
+            )
+        return FundamentalsTimeSeriesPage(
+            points=remaining[:limit],
+            next_keyset=next_keyset,
+            total=len(POINTS) if with_total else None,
+        )
+
+    monkeypatch.setattr(GetFundamentalsTimeSeriesUseCase, "execute", _fake_execute)
+    monkeypatch.setattr(GetFundamentalsTimeSeriesUseCase, "execute_page", _fake_execute_page)
+
+    return TestClient(app), page_calls
+
+
+def test_cursor_pagination_follows_next_cursor_header(
+    client: tuple[TestClient, list[Any]],
+) -> None:
+    http, page_calls = client
+
+    first = http.get("/v1/fundamentals/time-series", params=PARAMS)
+    assert first.status_code == 200, first.text
+    assert first.json()["total"] == 3
+    assert [item["fiscal_year"] for item in first.json()["items"]] == [2022, 2023]
+    cursor = first.headers["X-Next-Cursor"]
+
+    second = http.get("/v1/fundamentals/time-series", params={**PARAMS, "cursor": cursor})
+    assert second.status_code == 200, second.text
+    body = second.json()
+
+    # Envelope shape is unchanged; page/total are carried by the cursor.
+    assert set(body) == {"items", "page", "page_size", "total"}
+    assert body["page"] == 2
+    assert body["total"] == 3
+    assert [item["fiscal_year"] for item in body["items"]] == [2024]
+    assert "X-Next-Cursor" not in second.headers
+
+    # Neither page reads the full panel; only the first one counts the total.
+    assert page_calls == [
+        (None, 2, True),
+        (
+            StatementKeyset(
+                cik="0000320193",
+                statement_date=date(2023, 9, 28),
+                fiscal_period=FiscalPeriod.FY,
+            ),
+            2,
+            False,
+        ),
+    ]
+
+
+def test_deep_offset_page_still_slices_the_full_panel(
+    client: tuple[TestClient, list[Any]],
+) -> None:
+    http, page_calls = client
+
+    response = http.get("/v1/fundamentals/time-series", params={**PARAMS, "page": 2})
+
+    assert response.status_code == 200, response.text
+    assert response.json()["total"] == 3
+    assert [item["fiscal_year"] for item in response.json()["items"]] == [2024]
+    assert page_calls == ["full"]
+
+
+def test_malformed_cursor_is_rejected(client: tuple[TestClient, list[Any]]) -> None:
+    http, page_calls = client
+
+    response = http.get("/v1/fundamentals/time-series", params={**PARAMS, "cursor": "not-a-cursor"})
+
+    assert response.status_code == 400
+    assert response.json()["error"]["code"] == "VALIDATION_ERROR"
+    assert page_calls == []
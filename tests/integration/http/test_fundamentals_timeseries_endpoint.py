@@ -27,6 +27,7 @@ from arche_api.adapters.routers.fundamentals_router import (
     router as fundamentals_router,
 )
 from arche_api.application.use_cases.statements.get_fundamentals_timeseries import (
+    FundamentalsTimeSeriesPage,
     GetFundamentalsTimeSeriesRequest,
     GetFundamentalsTimeSeriesUseCase,
 )
@@ -41,6 +42,7 @@ from arche_api.domain.enums.edgar import (
 from arche_api.domain.services.canonical_metric_registry import (
     get_tier1_metrics_for_statement_type,
 )
+from arche_api.domain.value_objects import StatementKeyset
 
 
 class _DummyUoW:
@@ -62,11 +64,15 @@ def _client(monkeypatch: pytest.MonkeyPatch) -> TestClient:
     # Override the EDGAR UoW dependency so the handler can construct the use case.
     app.dependency_overrides[get_uow] = lambda: _DummyUoW()
 
-    # Patch the fundamentals use case execute method so we don't hit real infra.
-    async def _fake_execute(
+    # Patch the fundamentals use case page read so we don't hit real infra.
+    async def _fake_execute_page(
         self: GetFundamentalsTimeSeriesUseCase,
         req: GetFundamentalsTimeSeriesRequest,
-    ) -> list[FundamentalsTimeSeriesPoint]:
+        *,
+        after: StatementKeyset | None,
+        limit: int,
+        with_total: bool = False,
+    ) -> FundamentalsTimeSeriesPage:
         # Assert that the HTTP layer propagated the Tier-1 toggle correctly.
         assert req.use_tier1_only is True
         assert req.metrics is None
@@ -88,12 +94,12 @@ def _client(monkeypatch: pytest.MonkeyPatch) -> TestClient:
             normalized_payload_version_sequence=1,
         )
 
-        return [point]
+        return FundamentalsTimeSeriesPage(points=[point], next_keyset=None, total=1)
 
     monkeypatch.setattr(
         GetFundamentalsTimeSeriesUseCase,
-        "execute",
-        _fake_execute,
+        "execute_page",
+        _fake_execute_page,
         raising=True,
     )
 
@@ -0,0 +1,167 @@
+# tests/integration/http/test_fundamentals_timeseries_etag.py
+# Copyright (c)
+# SPDX-License-Identifier: MIT
+"""HTTP-level tests for conditional GETs on fundamentals time series.
+
+These tests validate that /v1/fundamentals/time-series:
+
+    * Emits a weak ETag derived from the statement-versions validator.
+    * Answers a matching If-None-Match with 304 without running the read path.
+    * Degrades to a plain 200 (no ETag) when the validator is unavailable.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+from typing import Any
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from arche_api.adapters.routers.fundamentals_router import get_uow
+from arche_api.adapters.routers.fundamentals_router import (
+    router as fundamentals_router,
+)
+from arche_api.application.use_cases.statements.get_fundamentals_timeseries import (
+    FundamentalsTimeSeriesPage,
+    GetFundamentalsTimeSeriesRequest,
+    GetFundamentalsTimeSeriesUseCase,
+)
+from arche_api.application.use_cases.statements.get_statement_versions_validator import (
+    GetStatementVersionsValidatorRequest,
+    GetStatementVersionsValidatorUseCase,
+)
+from arche_api.domain.entities.edgar_fundamentals_timeseries import (
+    FundamentalsTimeSeriesPoint,
+)
+from arche_api.domain.enums.canonical_statement_metric import CanonicalStatementMetric
+from arche_api.domain.enums.edgar import (
+    AccountingStandard,
+    FiscalPeriod,
+    StatementType,
+)
+from arche_api.domain.value_objects import StatementKeyset
+
+
+class _DummyUoW:
+    async def __aenter__(self) -> _DummyUoW:  # pragma: no cover - trivial
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:  # pragma: no cover - trivial
+        return None
+
+
+POINT = FundamentalsTimeSeriesPoint(
+    cik="0000320193",
+    statement_type=StatementType.INCOME_STATEMENT,
+    accounting_standard=AccountingStandard.US_GAAP,
+    statement_date=date(2024, 9, 28),
+    fiscal_year=2024,
+    fiscal_period=FiscalPeriod.FY,
+    currency="USD",
+    metrics={CanonicalStatementMetric.REVENUE: Decimal("100")},
+    normalized_payload_version_sequence=1,
+)
+
+PARAMS: dict[str, Any] = {
+    "ciks": ["0000320193"],
+    "statement_type": "INCOME_STATEMENT",
+    "frequency": "annual",
+}
+
+
+@pytest.fixture(name="app")
+def _app(monkeypatch: pytest.MonkeyPatch) -> tuple[FastAPI, list[Any]]:
+    app = FastAPI()
+    app.include_router(fundamentals_router)
+    app.dependency_overrides[get_uow] = lambda: _DummyUoW()
+
+    execute_calls: list[Any] = []
+
+    async def _fake_execute_page(
+        self: GetFundamentalsTimeSeriesUseCase,
+        req: GetFundamentalsTimeSeriesRequest,
+        *,
+        after: StatementKeyset | None,
+        limit: int,
+        with_total: bool = False,
+    ) -> FundamentalsTimeSeriesPage:
+        execute_calls.append(req)
+        return FundamentalsTimeSeriesPage(points=[POINT], next_keyset=None, total=1)
+
+    async def _fake_validator(
+        self: GetStatementVersionsValidatorUseCase,
+        req: GetStatementVersionsValidatorRequest,
+    ) -> str:
+        return f"v1-{req.representation['page']}"
+
+    monkeypatch.setattr(GetFundamentalsTimeSeriesUseCase, "execute_page", _fake_execute_page)
+    monkeypatch.setattr(GetStatementVersionsValidatorUseCase, "execute", _fake_validator)
+
+    return app, execute_calls
+
+
+def test_matching_if_none_match_returns_304_without_reading(
+    app: tuple[FastAPI, list[Any]],
+) -> None:
+    application, execute_calls = app
+    http = TestClient(application)
+
+    first = http.get("/v1/fundamentals/time-series", params=PARAMS)
+    assert first.status_code == 200, first.text
+    etag = first.headers["ETag"]
+    assert etag.startswith('W/"')
+    assert len(execute_calls) == 1
+
+    second = http.get(
+        "/v1/fundamentals/time-series",
+        params=PARAMS,
+        headers={"If-None-Match": etag},
+    )
+    assert second.status_code == 304
+    assert second.headers["ETag"] == etag
+    assert second.content == b""
+    assert len(execute_calls) == 1
+
+
+def test_stale_if_none_match_returns_full_response(app: tuple[FastAPI, list[Any]]) -> None:
+    application, execute_calls = app
+    http = TestClient(application)
+
+    response = http.get(
+        "/v1/fundamentals/time-series",
+        params=PARAMS,
+        headers={"If-None-Match": 'W/"stale"'},
+    )
+
+    assert response.status_code == 200, response.text
+    assert response.json()["total"] == 1
+    assert len(execute_calls) == 1
+
+
+def test_validator_failure_degrades_to_unconditional_response(
+    app: tuple[FastAPI, list[Any]],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    application, execute_calls = app
+
+    async def _broken_validator(
+        self: GetStatementVersionsValidatorUseCase,
+        req: GetStatementVersionsValidatorRequest,
+    ) -> str:
+        raise RuntimeError("database unavailable")
+
+    monkeypatch.setattr(GetStatementVersionsValidatorUseCase, "execute", _broken_validator)
+    http = TestClient(application)
+
+    response = http.get(
+        "/v1/fundamentals/time-series",
+        params=PARAMS,
+        headers={"If-None-Match": "*"},
+    )
+
+    assert response.status_code == 200, response.text
+    assert "ETag" not in response.headers
+    assert len(execute_calls) == 1
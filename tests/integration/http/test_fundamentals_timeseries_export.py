@@ -0,0 +1,173 @@
+# tests/integration/http/test_fundamentals_timeseries_export.py
+# Copyright (c)
+# SPDX-License-Identifier: MIT
+"""HTTP-level tests for /v1/fundamentals/time-series:export.
+
+These tests validate that the export endpoint:
+
+    * Streams NDJSON rows read from the repository's streaming API.
+    * Streams a readable Arrow IPC stream with projected metric columns.
+    * Rejects unsupported formats and invalid requests before streaming.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import AsyncIterator, Sequence
+from datetime import date
+from decimal import Decimal
+from typing import Any
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from arche_api.adapters.routers.fundamentals_router import get_uow
+from arche_api.adapters.routers.fundamentals_router import (
+    router as fundamentals_router,
+)
+from arche_api.domain.entities.canonical_statement_payload import (
+    CanonicalStatementPayload,
+)
+from arche_api.domain.enums.canonical_statement_metric import CanonicalStatementMetric
+from arche_api.domain.enums.edgar import (
+    AccountingStandard,
+    FiscalPeriod,
+    StatementType,
+)
+
+
+def _payload(cik: str, year: int) -> CanonicalStatementPayload:
+    return CanonicalStatementPayload(
+        cik=cik,
+        statement_type=StatementType.INCOME_STATEMENT,
+        accounting_standard=AccountingStandard.US_GAAP,
+        statement_date=date(year, 12, 31),
+        fiscal_year=year,
+        fiscal_period=FiscalPeriod.FY,
+        currency="USD",
+        unit_multiplier=1,
+        core_metrics={
+            CanonicalStatementMetric.REVENUE: Decimal(year * 10),
+            CanonicalStatementMetric.NET_INCOME: Decimal(year),
+        },
+        extra_metrics={},
+        dimensions={},
+        source_accession_id="acc",
+        source_taxonomy="us-gaap-2024",
+        source_version_sequence=1,
+    )
+
+
+PAYLOADS = [_payload(cik, year) for cik in ("0000320193", "0000789019") for year in (2022, 2023)]
+
+
+class _StreamingRepo:
+    def __init__(self) -> None:
+        self.calls: list[dict[str, Any]] = []
+
+    async def stream_latest_statement_payloads(
+        self,
+        *,
+        ciks: Sequence[str],
+        statement_type: StatementType,
+        fiscal_periods: Sequence[FiscalPeriod],
+        from_date: date,
+        to_date: date,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[CanonicalStatementPayload]:
+        self.calls.append({"ciks": list(ciks), "fiscal_periods": list(fiscal_periods)})
+        for payload in PAYLOADS:
+            if payload.cik in ciks:
+                yield payload
+
+
+class _StreamingUoW:
+    def __init__(self, repo: _StreamingRepo) -> None:
+        self.statements_repo = repo
+
+    async def __aenter__(self) -> _StreamingUoW:
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        return None
+
+
+@pytest.fixture(name="client")
+def _client() -> tuple[TestClient, _StreamingRepo]:
+    repo = _StreamingRepo()
+    app = FastAPI()
+    app.include_router(fundamentals_router)
+    app.dependency_overrides[get_uow] = lambda: _StreamingUoW(repo)
+    return TestClient(app), repo
+
+
+PARAMS: dict[str, Any] = {
+    "ciks": ["0000320193", "0000789019"],
+    "statement_type": "INCOME_STATEMENT",
+}
+
+
+def test_export_streams_ndjson_rows(client: tuple[TestClient, _StreamingRepo]) -> None:
+    http, repo = client
+
+    response = http.get(
+        "/v1/fundamentals/time-series:export",
+        params={**PARAMS, "metrics": ["REVENUE"]},
+    )
+
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [(r["cik"], r["fiscal_year"]) for r in rows] == [
+        ("0000320193", 2022),
+        ("0000320193", 2023),
+        ("0000789019", 2022),
+        ("0000789019", 2023),
+    ]
+    assert all(set(r["metrics"]) == {"REVENUE"} for r in rows)
+    assert repo.calls == [
+        {"ciks": ["0000320193", "0000789019"], "fiscal_periods": [FiscalPeriod.FY]}
+    ]
+
+
+def test_export_streams_arrow_ipc(client: tuple[TestClient, _StreamingRepo]) -> None:
+    pa = pytest.importorskip("pyarrow")
+    http, _ = client
+
+    response = http.get(
+        "/v1/fundamentals/time-series:export",
+        params={**PARAMS, "metrics": ["NET_INCOME"], "format": "arrow"},
+    )
+
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"] == "application/vnd.apache.arrow.stream"
+    table = pa.ipc.open_stream(response.content).read_all()
+    assert table.num_rows == 4
+    assert table.column_names[-1] == "NET_INCOME"
+    assert table.column("NET_INCOME")[0].as_py() == Decimal(2022)
+
+
+def test_export_rejects_unknown_format(client: tuple[TestClient, _StreamingRepo]) -> None:
+    http, repo = client
+
+    response = http.get("/v1/fundamentals/time-series:export", params={**PARAMS, "format": "csv"})
+
+    assert response.status_code == 400
+    assert response.json()["error"]["code"] == "VALIDATION_ERROR"
+    assert repo.calls == []
+
+
+def test_export_validates_request_before_streaming(
+    client: tuple[TestClient, _StreamingRepo],
+) -> None:
+    http, repo = client
+
+    response = http.get(
+        "/v1/fundamentals/time-series:export",
+        params={**PARAMS, "frequency": "monthly"},
+    )
+
+    assert response.status_code == 400
+    assert response.json()["error"]["code"] == "EDGAR_MAPPING_ERROR"
+    assert repo.calls == []
@@ -0,0 +1,73 @@
+import pytest
+from fastapi import Request
+
+from arche_api.adapters.presenters.base_presenter import (
+    PrerenderedResponse,
+    PresentResult,
+    accepts_gzip,
+    if_none_match_satisfied,
+    weak_etag,
+)
+from arche_api.adapters.schemas.http.envelopes import SuccessEnvelope
+
+
+def test_weak_etag_wraps_validator():
+    assert weak_etag("abc") == 'W/"abc"'
+
+
+def test_if_none_match_uses_weak_comparison():
+    etag = weak_etag("abc")
+    assert if_none_match_satisfied('W/"abc"', etag)
+    assert if_none_match_satisfied('"abc"', etag)
+    assert if_none_match_satisfied('"zzz", W/"abc"', etag)
+    assert if_none_match_satisfied("*", etag)
+
+
+def test_if_none_match_rejects_missing_or_different_tags():
+    etag = weak_etag("abc")
+    assert not if_none_match_satisfied(None, etag)
+    assert not if_none_match_satisfied("", etag)
+    assert not if_none_match_satisfied('W/"abd"', etag)
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "expected"),
+    [
+        (None, False),
+        ("", False),
+        ("gzip", True),
+        ("br, gzip;q=0.5", True),
+        ("GZIP; Q=1.0", True),
+        ("x-gzip", True),
+        ("*", True),
+        ("identity", False),
+        ("gzip;q=0", False),
+        ("gzip;q=0.000, deflate", False),
+        ("*;q=0", False),
+        ("gzip;q=0, *", False),
+        ("*;q=0, gzip", True),
+        ("gzip;q=abc", False),
+    ],
+)
+def test_accepts_gzip_honors_q_values(accept_encoding, expected):
+    assert accepts_gzip(accept_encoding) is expected
+
+
+def test_prerendered_response_skips_gzip_when_refused():
+    result = PresentResult(
+        body=SuccessEnvelope[dict[str, int]](data={"n": 1}),
+        headers={"ETag": '"abc"'},
+    )
+    prerendered = PrerenderedResponse.from_result(result)
+
+    def _request(accept_encoding):
+        scope = {"type": "http", "headers": [(b"accept-encoding", accept_encoding.encode())]}
+        return Request(scope)
+
+    refused = prerendered.respond(_request("gzip;q=0, identity"))
+    accepted = prerendered.respond(_request("deflate, gzip;q=0.8"))
+
+    assert "Content-Encoding" not in refused.headers
+    assert refused.body == prerendered.body
+    assert accepted.headers["Content-Encoding"] == "gzip"
+    assert accepted.body == prerendered.gzip_body
@@ -0,0 +1,89 @@
+# tests/unit/adapters/presenters/test_fundamentals_export_presenter.py
+# Copyright (c)
+# SPDX-License-Identifier: MIT
+"""Unit tests for the fundamentals bulk-export encoders."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import AsyncIterator
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from arche_api.adapters.presenters.fundamentals_export_presenter import (
+    iter_fundamentals_arrow,
+    iter_fundamentals_ndjson,
+)
+from arche_api.domain.entities.edgar_fundamentals_timeseries import (
+    FundamentalsTimeSeriesPoint,
+)
+from arche_api.domain.enums.canonical_statement_metric import CanonicalStatementMetric
+from arche_api.domain.enums.edgar import AccountingStandard, FiscalPeriod, StatementType
+
+
+def _point(year: int, revenue: str) -> FundamentalsTimeSeriesPoint:
+    return FundamentalsTimeSeriesPoint(
+        cik="0000320193",
+        statement_type=StatementType.INCOME_STATEMENT,
+        accounting_standard=AccountingStandard.US_GAAP,
+        statement_date=date(year, 9, 28),
+        fiscal_year=year,
+        fiscal_period=FiscalPeriod.FY,
+        currency="USD",
+        metrics={CanonicalStatementMetric.REVENUE: Decimal(revenue)},
+        normalized_payload_version_sequence=1,
+    )
+
+
+async def _aiter(
+    points: list[FundamentalsTimeSeriesPoint],
+) -> AsyncIterator[FundamentalsTimeSeriesPoint]:
+    for point in points:
+        yield point
+
+
+@pytest.mark.anyio
+async def test_ndjson_emits_one_row_per_point_in_http_shape() -> None:
+    points = [_point(2022, "394328000000"), _point(2023, "383285000000.25")]
+
+    chunks = [chunk async for chunk in iter_fundamentals_ndjson(_aiter(points), chunk_bytes=1)]
+
+    assert len(chunks) == 2
+    rows = [json.loads(line) for line in b"".join(chunks).splitlines()]
+    assert rows[1] == {
+        "cik": "0000320193",
+        "statement_type": "INCOME_STATEMENT",
+        "accounting_standard": "US_GAAP",
+        "statement_date": "2023-09-28",
+        "fiscal_year": 2023,
+        "fiscal_period": "FY",
+        "currency": "USD",
+        "metrics": {"REVENUE": "383285000000.25"},
+        "normalized_payload_version_sequence": 1,
+    }
+
+
+@pytest.mark.anyio
+async def test_arrow_stream_round_trips_with_projected_columns() -> None:
+    pa = pytest.importorskip("pyarrow")
+    points = [_point(year, f"{year}.5") for year in range(2018, 2024)]
+
+    chunks = [
+        chunk
+        async for chunk in iter_fundamentals_arrow(
+            _aiter(points),
+            metrics=[CanonicalStatementMetric.REVENUE, CanonicalStatementMetric.NET_INCOME],
+            batch_size=4,
+        )
+    ]
+
+    # Schema, two record batches, end-of-stream marker.
+    assert len(chunks) == 4
+    table = pa.ipc.open_stream(b"".join(chunks)).read_all()
+    assert table.num_rows == 6
+    assert table.column_names[-2:] == ["REVENUE", "NET_INCOME"]
+    assert table.column("REVENUE")[0].as_py() == Decimal("2018.5")
+    assert table.column("NET_INCOME").null_count == 6
+    assert table.column("statement_date")[5].as_py() == date(2023, 9, 28)
@@ -0,0 +1,49 @@
+# tests/unit/adapters/presenters/test_fundamentals_presenter_cursor.py
+# Copyright (c)
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+from arche_api.adapters.presenters.fundamentals_presenter import (
+    TimeSeriesCursor,
+    decode_time_series_cursor,
+    encode_time_series_cursor,
+)
+from arche_api.domain.enums.edgar import FiscalPeriod
+from arche_api.domain.value_objects import StatementKeyset
+
+
+def test_cursor_round_trips_and_is_url_safe() -> None:
+    cursor = TimeSeriesCursor(
+        keyset=StatementKeyset(
+            cik="0000789019",
+            statement_date=date(2024, 6, 30),
+            fiscal_period=FiscalPeriod.Q4,
+        ),
+        page=41,
+        total=12_000,
+    )
+
+    token = encode_time_series_cursor(cursor)
+
+    assert "=" not in token and "+" not in token and "/" not in token
+    assert decode_time_series_cursor(token) == cursor
+
+
+@pytest.mark.parametrize(
+    "token",
+    [
+        "",
+        "%%%",
+        "bm90LWpzb24",  # "not-json"
+        "eyJrIjpbIjEiLCIyMDI0LTAxLTAxIiwiWDkiXSwicCI6MSwidCI6MX0",  # bad period
+        "eyJrIjpbIjEiLCIyMDI0LTAxLTAxIiwiRlkiXSwicCI6MCwidCI6MX0",  # page 0
+    ],
+)
+def test_malformed_cursor_raises_value_error(token: str) -> None:
+    with pytest.raises(ValueError):
+        decode_time_series_cursor(token)
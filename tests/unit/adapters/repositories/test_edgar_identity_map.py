@@ -0,0 +1,189 @@
+# tests/unit/adapters/repositories/test_edgar_identity_map.py
+# Copyright (c)
+# SPDX-License-Identifier: MIT
+"""Tests for the shared EDGAR identity map.
+
+Design:
+    An in-memory fake session records every ``execute`` so the tests can
+    assert which lookups reached the database.
+"""
+
+from __future__ import annotations
+
+import importlib
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from typing import Any, cast
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+@dataclass
+class _FakeCompanyRow:
+    company_id: UUID
+    cik: str | None
+    name: str
+
+
+class _FakeResult:
+    def __init__(self, rows: Sequence[Any]) -> None:
+        self._rows = list(rows)
+
+    def scalar_one_or_none(self) -> Any:
+        return self._rows[0] if self._rows else None
+
+    def scalars(self) -> _FakeResult:
+        return self
+
+    def all(self) -> list[Any]:
+        return list(self._rows)
+
+
+class _FakeSession:
+    """Returns rows from ``companies`` whose CIK appears in the statement."""
+
+    def __init__(self, companies: Sequence[_FakeCompanyRow]) -> None:
+        self._companies = list(companies)
+        self.calls = 0
+
+    async def execute(self, stmt: Any) -> _FakeResult:
+        self.calls += 1
+        params = stmt.compile().params.values()
+        wanted = {v for p in params for v in (p if isinstance(p, list) else [p])}
+        return _FakeResult([c for c in self._companies if c.cik in wanted])
+
+
+class _FakeFilingSession(AsyncSession):
+    """Real session transaction bookkeeping over an in-memory ``sec.filings``."""
+
+    def __init__(self, filings: dict[str, UUID]) -> None:
+        super().__init__()
+        self.filings = filings
+        self.calls = 0
+
+    async def execute(self, stmt: Any, *args: Any, **kwargs: Any) -> Any:  # type: ignore[override]
+        if not self.in_transaction():
+            self.sync_session.begin()  # autobegin, as a real statement would
+        self.calls += 1
+        params = stmt.compile().params.values()
+        wanted = {v for p in params for v in (p if isinstance(p, list) else [p])}
+        return _FakeResult([(fid, acc) for acc, fid in self.filings.items() if acc in wanted])
+
+
+def _module() -> Any:
+    return importlib.import_module("arche_api.adapters.repositories.edgar_identity_map")
+
+
+@pytest.fixture
+def identity_map() -> Iterator[Any]:
+    mod = _module()
+    now = [0.0]
+    instance = mod.EdgarIdentityMap(2, negative_ttl_s=10.0, clock=lambda: now[0])
+    instance.now = now
+    mod.set_edgar_identity_map(instance)
+    try:
+        yield instance
+    finally:
+        mod.set_edgar_identity_map(None)
+
+
+@pytest.mark.asyncio
+async def test_hits_negative_entries_and_recheck(identity_map: Any) -> None:
+    mod = _module()
+    acme = _FakeCompanyRow(company_id=uuid4(), cik="0000000001", name="Acme")
+    session = _FakeSession([acme])
+
+    first = await mod.get_company_by_cik(cast(Any, session), "0000000001")
+    again = await mod.get_company_by_cik(cast(Any, session), "0000000001")
+    assert first == again == mod.CompanyRef(acme.company_id, "0000000001", "Acme")
+    assert session.calls == 1
+
+    assert await mod.get_company_by_cik(cast(Any, session), "0000000404") is None
+    assert await mod.get_company_by_cik(cast(Any, session), "0000000404") is None
+    assert session.calls == 2
+
+    batch = await mod.fetch_companies_by_cik(cast(Any, session), {"0000000001", "0000000404"})
+    assert set(batch) == {"0000000001"}
+    assert session.calls == 2
+
+    await mod.fetch_companies_by_cik(cast(Any, session), {"0000000404"}, recheck_missing=True)
+    assert session.calls == 3
+
+    identity_map.now[0] = 11.0
+    assert await mod.get_company_by_cik(cast(Any, session), "0000000404") is None
+    assert session.calls == 4
+
+
+@pytest.mark.asyncio
+async def test_bounded_lru_evicts_least_recent(identity_map: Any) -> None:
+    mod = _module()
+    rows = [
+        _FakeCompanyRow(company_id=uuid4(), cik=f"000000000{i}", name=str(i)) for i in (1, 2, 3)
+    ]
+    session = _FakeSession(rows)
+
+    for cik in ("0000000001", "0000000002", "0000000001", "0000000003"):
+        await mod.get_company_by_cik(cast(Any, session), cik)
+    assert len(identity_map.companies) == 2
+    assert session.calls == 3
+
+    await mod.get_company_by_cik(cast(Any, session), "0000000001")
+    assert session.calls == 3
+    await mod.get_company_by_cik(cast(Any, session), "0000000002")
+    assert session.calls == 4
+
+
+@pytest.mark.asyncio
+async def test_without_installed_map_every_lookup_queries() -> None:
+    mod = _module()
+    mod.set_edgar_identity_map(None)
+    acme = _FakeCompanyRow(company_id=uuid4(), cik="0000000001", name="Acme")
+    session = _FakeSession([acme])
+
+    assert await mod.get_company_by_cik(cast(Any, session), "0000000001") is acme
+    assert await mod.get_company_by_cik(cast(Any, session), "0000000001") is acme
+    assert session.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_filing_refs_from_rolled_back_ingest_are_not_cached(identity_map: Any) -> None:
+    mod = _module()
+    session = _FakeFilingSession({})
+
+    # The ingest upserts a filing, resolves it in the same transaction, then fails.
+    session.filings["0000000001-24-000001"] = uuid4()
+    resolved = await mod.fetch_filings_by_accession(
+        cast(Any, session), {"0000000001-24-000001"}, recheck_missing=True
+    )
+    assert set(resolved) == {"0000000001-24-000001"}
+    await session.rollback()
+    session.filings.clear()
+
+    assert len(identity_map.filings) == 0
+    again = await mod.fetch_filings_by_accession(
+        cast(Any, session), {"0000000001-24-000001"}, recheck_missing=True
+    )
+    assert again == {}
+    await session.close()
+
+
+@pytest.mark.asyncio
+async def test_filing_refs_are_published_on_commit(identity_map: Any) -> None:
+    mod = _module()
+    filing_id = uuid4()
+    session = _FakeFilingSession({"0000000001-24-000002": filing_id})
+
+    await mod.fetch_filings_by_accession(cast(Any, session), {"0000000001-24-000002"})
+    await mod.fetch_filings_by_accession(cast(Any, session), {"0000000001-24-000002"})
+    assert session.calls == 1  # staged refs serve the rest of the transaction
+    assert len(identity_map.filings) == 0
+    await session.commit()
+
+    other = _FakeFilingSession({})
+    cached = await mod.fetch_filings_by_accession(cast(Any, other), {"0000000001-24-000002"})
+    assert cached == {"0000000001-24-000002": mod.FilingRef(filing_id, "0000000001-24-000002")}
+    assert other.calls == 0
+    await session.close()
+    await other.close()
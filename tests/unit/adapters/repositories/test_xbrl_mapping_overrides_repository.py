@@ -102,3 +102,55 @@ async def test_list_rules_for_concept_passes_concept_through() -> None:
 
     assert rules == []
     assert session.last_stmt is not None
+
+
+def _rule(rule_id: str, concept: str) -> MappingOverrideRule:
+    return MappingOverrideRule(
+        rule_id=rule_id,
+        scope=OverrideScope.GLOBAL,
+        source_concept=concept,
+        source_taxonomy=None,
+        match_cik=None,
+        match_industry_code=None,
+        match_analyst_id=None,
+        match_dimensions={},
+        target_metric=CanonicalStatementMetric.REVENUE,
+        is_suppression=False,
+        priority=0,
+    )
+
+
+async def test_list_rules_for_concepts_groups_rows_from_one_query() -> None:
+    """list_rules_for_concepts() should issue one query and group rows by concept."""
+    session = _DummySession()
+    repo = SqlAlchemyXBRLMappingOverridesRepository(session=session)
+    session.add_result(
+        _DummyResult(
+            rows=[
+                _rule("a1", "us-gaap:Assets"),
+                _rule("r1", "us-gaap:Revenues"),
+                _rule("r2", "us-gaap:Revenues"),
+            ]
+        )
+    )
+
+    grouped = await repo.list_rules_for_concepts(
+        concepts={"us-gaap:Revenues", "us-gaap:NetIncomeLoss", "us-gaap:Assets"},
+        taxonomy="US_GAAP_2024",
+    )
+
+    assert list(grouped) == ["us-gaap:Assets", "us-gaap:NetIncomeLoss", "us-gaap:Revenues"]
+    assert [r.rule_id for r in grouped["us-gaap:Revenues"]] == ["r1", "r2"]
+    assert grouped["us-gaap:NetIncomeLoss"] == []
+    assert session._results == []
+    compiled = str(session.last_stmt)
+    assert "IN" in compiled
+    assert "ORDER BY" in compiled
+
+
+async def test_list_rules_for_concepts_skips_query_for_empty_input() -> None:
+    session = _DummySession()
+    repo = SqlAlchemyXBRLMappingOverridesRepository(session=session)
+
+    assert await repo.list_rules_for_concepts(concepts=[]) == {}
+    assert session.last_stmt is None
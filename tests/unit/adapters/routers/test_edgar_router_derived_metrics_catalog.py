@@ -90,6 +90,35 @@ async def test_get_derived_metrics_catalog_schema_integrity(app: FastAPI) -> Non
         assert isinstance(metric["window_requirements"], dict)
 
 
+@pytest.mark.anyio
+async def test_get_derived_metrics_catalog_is_prerendered_and_cacheable(app: FastAPI) -> None:
+    """The catalog is served from pre-rendered bytes with ETag, gzip and 304."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        first = await client.get("/v1/edgar/derived-metrics/catalog")
+        second = await client.get("/v1/edgar/derived-metrics/catalog")
+        zipped = await client.get(
+            "/v1/edgar/derived-metrics/catalog",
+            headers={"Accept-Encoding": "gzip"},
+        )
+        not_modified = await client.get(
+            "/v1/edgar/derived-metrics/catalog",
+            headers={"If-None-Match": first.headers["ETag"]},
+        )
+
+    etag = first.headers["ETag"]
+    assert first.content == second.content
+    assert second.headers["ETag"] == etag
+    assert "max-age=" in first.headers["Cache-Control"]
+
+    assert zipped.headers["Content-Encoding"] == "gzip"
+    assert zipped.json() == first.json()
+
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["ETag"] == etag
+
+
 class _FaultyPresenter:
     """Presenter stub that forces an unhandled error."""
 
@@ -110,6 +139,9 @@ async def test_get_derived_metrics_catalog_unhandled_error_maps_to_503(
     from arche_api.adapters.routers import edgar_router as edgar_router_module
 
     monkeypatch.setattr(edgar_router_module, "presenter", _FaultyPresenter())
+    # The catalog is rendered once per process; drop it so the request renders
+    # with the patched presenter (the failed render is not cached).
+    edgar_router_module._derived_metrics_catalog.cache_clear()
 
     # Need an app that includes the patched router.
     app = FastAPI()
@@ -0,0 +1,146 @@
+# tests/unit/adapters/routers/test_edgar_router_restatement_screen.py
+# Copyright (c)
+# SPDX-License-Identifier: MIT
+"""HTTP tests for the EDGAR restatement screener endpoint.
+
+Scope:
+    - Happy path for GET /v1/edgar/statements/restatements/screen.
+    - Enum validation mapped to 400 envelopes.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+from typing import Any
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from arche_api.adapters.dependencies.edgar_uow import get_edgar_read_uow
+from arche_api.adapters.routers.edgar_router import router as edgar_router
+from arche_api.domain.entities.edgar_restatement_ledger import (
+    RestatementLedgerRecord,
+    RestatementScreenQuery,
+)
+from arche_api.domain.enums.canonical_statement_metric import CanonicalStatementMetric
+from arche_api.domain.enums.edgar import (
+    AccountingStandard,
+    FiscalPeriod,
+    MaterialityClass,
+    StatementType,
+)
+
+
+class _FakeLedgerRepo:
+    def __init__(self, records: list[RestatementLedgerRecord]) -> None:
+        self.records = records
+        self.queries: list[RestatementScreenQuery] = []
+
+    async def screen(self, *, query: RestatementScreenQuery) -> list[RestatementLedgerRecord]:
+        self.queries.append(query)
+        return self.records
+
+
+class _FakeUoW:
+    def __init__(self, repo: _FakeLedgerRepo) -> None:
+        self._repo = repo
+
+    async def __aenter__(self) -> _FakeUoW:
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        return None
+
+    def get_repository(self, repo_type: type) -> Any:
+        del repo_type
+        return self._repo
+
+
+def _record() -> RestatementLedgerRecord:
+    return RestatementLedgerRecord(
+        cik="0000320193",
+        statement_type=StatementType.INCOME_STATEMENT,
+        accounting_standard=AccountingStandard.US_GAAP,
+        statement_date=date(2024, 9, 30),
+        fiscal_year=2024,
+        fiscal_period=FiscalPeriod.Q3,
+        currency="USD",
+        from_version_sequence=1,
+        to_version_sequence=2,
+        metric=CanonicalStatementMetric.REVENUE,
+        old_value=Decimal("200"),
+        new_value=Decimal("180"),
+        diff=Decimal("-20"),
+        pct_change=Decimal("-0.1"),
+        materiality=MaterialityClass.HIGH,
+        restated_on=date(2025, 1, 15),
+    )
+
+
+@pytest.fixture
+def repo() -> _FakeLedgerRepo:
+    return _FakeLedgerRepo([_record()])
+
+
+@pytest.fixture
+def app(repo: _FakeLedgerRepo) -> FastAPI:
+    """FastAPI app with the EDGAR router and a fake read-only UoW."""
+    app = FastAPI()
+    app.include_router(edgar_router)
+    app.dependency_overrides[get_edgar_read_uow] = lambda: _FakeUoW(repo)
+    return app
+
+
+@pytest.mark.anyio
+async def test_screen_restatements_happy_path(app: FastAPI, repo: _FakeLedgerRepo) -> None:
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        resp = await client.get(
+            "/v1/edgar/statements/restatements/screen",
+            params={
+                "statement_type": "INCOME_STATEMENT",
+                "metric": "REVENUE",
+                "fiscal_year": 2024,
+                "fiscal_period": "Q3",
+                "min_abs_pct_change": "0.05",
+            },
+        )
+
+    assert resp.status_code == 200
+    data = resp.json()["data"]
+    assert data["metric"] == "REVENUE"
+    assert data["min_abs_pct_change"] == "0.05"
+    assert data["total"] == 1
+    hit = data["hits"][0]
+    assert hit["cik"] == "0000320193"
+    assert hit["diff"] == "-20"
+    assert hit["pct_change"] == "-0.1"
+    assert hit["materiality"] == "HIGH"
+    assert hit["restated_on"] == "2025-01-15"
+
+    (query,) = repo.queries
+    assert query.metric is CanonicalStatementMetric.REVENUE
+    assert query.fiscal_period is FiscalPeriod.Q3
+    assert query.min_abs_pct_change == Decimal("0.05")
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"statement_type": "INCOME_STATEMENT", "metric": "NOT_A_METRIC"},
+        {"statement_type": "INCOME_STATEMENT", "min_materiality": "HUGE"},
+    ],
+)
+async def test_screen_restatements_invalid_enum_returns_400(
+    app: FastAPI, repo: _FakeLedgerRepo, params: dict[str, str]
+) -> None:
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        resp = await client.get("/v1/edgar/statements/restatements/screen", params=params)
+
+    assert resp.status_code == 400
+    assert resp.json()["error"]["code"] == "VALIDATION_ERROR"
+    assert repo.queries == []
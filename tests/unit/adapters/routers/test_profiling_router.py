@@ -0,0 +1,89 @@
+# tests/unit/adapters/routers/test_profiling_router.py
+"""HTTP tests for the admin sampling profiler (/v1/admin/profile)."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import jwt
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from arche_api.adapters.routers import profiling_router
+
+_SECRET = "test-hs256-secret-with-enough-entropy"  # noqa: S105
+
+
+def _token(scope: str) -> str:
+    return jwt.encode({"sub": "ops", "scope": scope}, _SECRET, algorithm="HS256")
+
+
+def _client(
+    monkeypatch: pytest.MonkeyPatch,
+    *,
+    enabled: bool = True,
+    admin_key: str | None = "s3cret",
+    auth_enabled: bool = False,
+) -> TestClient:
+    settings = SimpleNamespace(
+        profiling_enabled=enabled,
+        profiling_max_seconds=1.0,
+        admin_api_key=admin_key,
+    )
+    monkeypatch.setattr(profiling_router, "get_settings", lambda: settings)
+    monkeypatch.setenv("AUTH_ENABLED", "true" if auth_enabled else "false")
+    monkeypatch.setenv("AUTH_HS256_SECRET", _SECRET)
+    app = FastAPI()
+    app.include_router(profiling_router.router)
+    return TestClient(app)
+
+
+def test_profile_is_not_found_when_disabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = _client(monkeypatch, enabled=False)
+
+    resp = client.get("/v1/admin/profile", headers={"X-Admin-Key": "s3cret"})
+
+    assert resp.status_code == 404
+
+
+def test_profile_requires_admin_key_when_auth_disabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = _client(monkeypatch)
+
+    assert client.get("/v1/admin/profile").status_code == 403
+    assert client.get("/v1/admin/profile", headers={"X-Admin-Key": "nope"}).status_code == 403
+
+
+def test_profile_requires_token_when_auth_enabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = _client(monkeypatch, admin_key=None, auth_enabled=True)
+
+    url = "/v1/admin/profile?seconds=0.05"
+    assert client.get(url).status_code == 401
+    denied = client.get(url, headers={"Authorization": f"Bearer {_token('read')}"})
+    assert denied.status_code == 403
+    allowed = client.get(url, headers={"Authorization": f"Bearer {_token('admin:profile')}"})
+    assert allowed.status_code == 200
+
+
+def test_profile_rejects_duration_above_cap(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = _client(monkeypatch)
+
+    resp = client.get("/v1/admin/profile?seconds=5", headers={"X-Admin-Key": "s3cret"})
+
+    assert resp.status_code == 400
+
+
+def test_profile_returns_collapsed_stacks(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = _client(monkeypatch)
+
+    resp = client.get(
+        "/v1/admin/profile?seconds=0.1&interval_ms=5&idle=true",
+        headers={"X-Admin-Key": "s3cret"},
+    )
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/plain")
+    assert int(resp.headers["X-Profile-Samples"]) > 0
+    lines = resp.text.splitlines()
+    assert lines
+    assert all(line.startswith("thread:") and line.rsplit(" ", 1)[1].isdigit() for line in lines)
@@ -5,6 +5,7 @@
 
 Scope:
     - Validate happy-path behavior for GET /v1/views/metrics (catalog).
+    - Validate conditional GET (ETag / 304) on the catalog.
     - Validate that GET /v1/views/metrics/{bundle_code} sets the `view`
       metadata field on the derived time-series payload.
 """
@@ -99,6 +100,19 @@ def test_list_metric_views_catalog_happy_path(app: FastAPI) -> None:
     assert "GROSS_MARGIN" in core_view["metrics"]
 
 
+def test_list_metric_views_catalog_supports_conditional_get(app: FastAPI) -> None:
+    """The catalog carries a stable ETag and answers If-None-Match with 304."""
+    client = TestClient(app)
+
+    first = client.get("/v1/views/metrics")
+    etag = first.headers["ETag"]
+    assert "max-age=" in first.headers["Cache-Control"]
+
+    resp = client.get("/v1/views/metrics", headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+    assert resp.headers["ETag"] == etag
+
+
 def test_get_metric_view_timeseries_sets_view_metadata(app: FastAPI) -> None:
     """View-based time series should populate the `view` field."""
     app.dependency_overrides[get_edgar_controller] = (  # type: ignore[assignment]
@@ -0,0 +1,53 @@
+# tests/unit/adapters/uow/test_sqlalchemy_uow_read_only.py
+from __future__ import annotations
+
+import pytest
+
+from arche_api.adapters.uow.sqlalchemy_uow import SqlAlchemyUnitOfWork
+
+
+class _FakeAsyncSession:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.committed = False
+        self.rolled_back = False
+        self.closed = False
+
+    async def commit(self) -> None:
+        self.committed = True
+
+    async def rollback(self) -> None:
+        self.rolled_back = True
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_read_only_uow_uses_read_factory_and_never_commits() -> None:
+    opened: list[_FakeAsyncSession] = []
+
+    def _factory(name: str):
+        def _open() -> _FakeAsyncSession:
+            session = _FakeAsyncSession(name)
+            opened.append(session)
+            return session
+
+        return _open
+
+    uow = SqlAlchemyUnitOfWork(
+        session_factory=_factory("primary"),  # type: ignore[arg-type]
+        read_session_factory=_factory("replica"),  # type: ignore[arg-type]
+    )
+    reader = uow.as_read_only()
+    assert reader.read_only and not uow.read_only
+
+    async with reader as tx:
+        await tx.commit()
+    async with uow as tx:
+        await tx.commit()
+
+    replica, primary = opened
+    assert replica.name == "replica" and replica.rolled_back and not replica.committed
+    assert primary.name == "primary" and primary.committed
+    assert replica.closed and primary.closed
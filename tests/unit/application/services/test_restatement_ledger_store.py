@@ -0,0 +1,181 @@
+# tests/unit/application/services/test_restatement_ledger_store.py
+# Copyright (c)
+# SPDX-License-Identifier: MIT
+"""Unit tests for the restatement ledger store service."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import date
+from decimal import Decimal
+from typing import Any
+
+import pytest
+
+from arche_api.application.services.restatement_ledger_store import (
+    RestatementLedgerStoreService,
+)
+from arche_api.domain.entities.canonical_statement_payload import CanonicalStatementPayload
+from arche_api.domain.entities.edgar_company import EdgarCompanyIdentity
+from arche_api.domain.entities.edgar_dq import NormalizedStatementIdentity
+from arche_api.domain.entities.edgar_filing import EdgarFiling
+from arche_api.domain.entities.edgar_restatement_ledger import RestatementLedgerRecord
+from arche_api.domain.entities.edgar_statement_version import EdgarStatementVersion
+from arche_api.domain.enums.canonical_statement_metric import CanonicalStatementMetric
+from arche_api.domain.enums.edgar import (
+    AccountingStandard,
+    FilingType,
+    FiscalPeriod,
+    MaterialityClass,
+    StatementType,
+)
+from arche_api.domain.interfaces.repositories.edgar_restatement_ledger_repository import (
+    EdgarRestatementLedgerRepository,
+)
+
+_COMPANY = EdgarCompanyIdentity(
+    cik="0000320193", ticker="AAPL", legal_name="Apple Inc.", exchange=None, country=None
+)
+_FY_END = date(2024, 12, 31)
+
+
+def _version(sequence: int, revenue: str | None) -> EdgarStatementVersion:
+    filing_date = date(2025, 2, sequence)
+    filing = EdgarFiling(
+        accession_id=f"0000320193-25-{sequence:06d}",
+        company=_COMPANY,
+        filing_type=FilingType.FORM_10_K,
+        filing_date=filing_date,
+        period_end_date=_FY_END,
+        accepted_at=None,
+        is_amendment=sequence > 1,
+        amendment_sequence=sequence - 1 if sequence > 1 else None,
+        primary_document=None,
+        data_source="TEST",
+    )
+    payload = (
+        CanonicalStatementPayload(
+            cik=_COMPANY.cik,
+            statement_type=StatementType.INCOME_STATEMENT,
+            accounting_standard=AccountingStandard.US_GAAP,
+            statement_date=_FY_END,
+            fiscal_year=2024,
+            fiscal_period=FiscalPeriod.FY,
+            currency="USD",
+            unit_multiplier=1,
+            core_metrics={CanonicalStatementMetric.REVENUE: Decimal(revenue)},
+            extra_metrics={},
+            dimensions={},
+            source_accession_id=filing.accession_id,
+            source_taxonomy="us-gaap-2024",
+            source_version_sequence=sequence,
+        )
+        if revenue is not None
+        else None
+    )
+    return EdgarStatementVersion(
+        company=_COMPANY,
+        filing=filing,
+        statement_type=StatementType.INCOME_STATEMENT,
+        accounting_standard=AccountingStandard.US_GAAP,
+        statement_date=_FY_END,
+        fiscal_year=2024,
+        fiscal_period=FiscalPeriod.FY,
+        currency="USD",
+        is_restated=sequence > 1,
+        restatement_reason="AMENDMENT" if sequence > 1 else None,
+        version_source="EDGAR_XBRL_NORMALIZED",
+        version_sequence=sequence,
+        accession_id=filing.accession_id,
+        filing_date=filing_date,
+        normalized_payload=payload,
+        normalized_payload_version="v1" if payload is not None else None,
+    )
+
+
+class _FakeStatementsRepo:
+    def __init__(self, versions: Sequence[EdgarStatementVersion]) -> None:
+        self._versions = list(versions)
+
+    async def list_statement_versions_for_company(self, **_: Any) -> list[EdgarStatementVersion]:
+        return list(self._versions)
+
+
+class _FakeLedgerRepo:
+    def __init__(self) -> None:
+        self.hops: dict[int, tuple[int, list[RestatementLedgerRecord]]] = {}
+
+    async def replace_hop(
+        self,
+        *,
+        identity: NormalizedStatementIdentity,
+        from_version_sequence: int,
+        records: Sequence[RestatementLedgerRecord],
+    ) -> None:
+        self.hops[identity.version_sequence] = (from_version_sequence, list(records))
+
+
+class _FakeUoW:
+    def __init__(self, ledger_repo: _FakeLedgerRepo) -> None:
+        self._ledger_repo = ledger_repo
+
+    def get_repository(self, repo_type: type) -> Any:
+        assert repo_type is EdgarRestatementLedgerRepository
+        return self._ledger_repo
+
+
+@pytest.mark.anyio
+async def test_record_versions_writes_incoming_and_outgoing_hops() -> None:
+    """An out-of-order version rewrites both hops around it."""
+    v1, v2, v3 = _version(1, "1000"), _version(2, "1100"), _version(3, "1100")
+    stale_v2 = _version(2, None)  # metadata-only row at the same sequence
+    ledger = _FakeLedgerRepo()
+
+    written = await RestatementLedgerStoreService().record_versions(
+        uow=_FakeUoW(ledger),  # type: ignore[arg-type]
+        statements_repo=_FakeStatementsRepo([v1, stale_v2, v3]),  # type: ignore[arg-type]
+        versions=[v2],
+    )
+
+    assert written == 1
+    assert sorted(ledger.hops) == [2, 3]
+    from_seq, records = ledger.hops[2]
+    assert from_seq == 1
+    assert [(r.diff, r.pct_change, r.materiality) for r in records] == [
+        (Decimal("100"), Decimal("0.1"), MaterialityClass.HIGH)
+    ]
+    assert records[0].restated_on == date(2025, 2, 2)
+    # v2 → v3 has no change, so the hop is cleared.
+    assert ledger.hops[3] == (2, [])
+
+
+@pytest.mark.anyio
+async def test_record_versions_skips_first_and_unnormalized_versions() -> None:
+    """The first normalized version has no hop; metadata-only versions are ignored."""
+    ledger = _FakeLedgerRepo()
+    v1 = _version(1, "1000")
+
+    written = await RestatementLedgerStoreService().record_versions(
+        uow=_FakeUoW(ledger),  # type: ignore[arg-type]
+        statements_repo=_FakeStatementsRepo([v1]),  # type: ignore[arg-type]
+        versions=[v1, _version(2, None)],
+    )
+
+    assert written == 0
+    assert ledger.hops == {}
+
+
+@pytest.mark.anyio
+async def test_record_history_writes_every_adjacent_hop() -> None:
+    """Backfill rebuilds all hops between normalized versions, in sequence order."""
+    ledger = _FakeLedgerRepo()
+    v1, v3, v4 = _version(1, "1000"), _version(3, "1100"), _version(4, "1000")
+
+    written = await RestatementLedgerStoreService().record_history(
+        uow=_FakeUoW(ledger),  # type: ignore[arg-type]
+        versions=[v4, _version(2, None), v1, v3],
+    )
+
+    assert written == 2
+    assert {seq: hop[0] for seq, hop in ledger.hops.items()} == {3: 1, 4: 3}
+    assert [r.diff for r in ledger.hops[4][1]] == [Decimal("-100")]
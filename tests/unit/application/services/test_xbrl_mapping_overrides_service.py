@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Mapping, Sequence
+from collections.abc import Collection, Mapping, Sequence
 from typing import Any
 
 import pytest
@@ -32,6 +32,15 @@ class _FakeRepo(XBRLMappingOverridesRepository):
         self.calls.append({"concept": concept, "taxonomy": taxonomy})
         return [r for r in self._rules if r.source_concept == concept]
 
+    async def list_rules_for_concepts(
+        self,
+        *,
+        concepts: Collection[str],
+        taxonomy: str | None = None,
+    ) -> Mapping[str, Sequence[MappingOverrideRule]]:
+        self.calls.append({"concepts": sorted(concepts), "taxonomy": taxonomy})
+        return {c: [r for r in self._rules if r.source_concept == c] for c in sorted(concepts)}
+
 
 class _FakeDecision:
     def __init__(self, final_metric: CanonicalStatementMetric | None, applied_rule_id: str | None):
@@ -155,3 +164,33 @@ async def test_apply_overrides_calls_engine_with_repo_rules() -> None:
     assert engine.calls[0]["concept"] == "us-gaap:Revenues"
     assert engine.calls[0]["rules"][0].rule_id == "r1"
     assert isinstance(trace, dict)
+
+
+@pytest.mark.asyncio
+async def test_list_rules_for_concepts_uses_one_repo_call() -> None:
+    rule = MappingOverrideRule(
+        rule_id="r1",
+        scope=OverrideScope.GLOBAL,
+        source_concept="us-gaap:Revenues",
+        source_taxonomy=None,
+        match_cik=None,
+        match_industry_code=None,
+        match_analyst_id=None,
+        match_dimensions={},
+        target_metric=CanonicalStatementMetric.REVENUE,
+        is_suppression=False,
+        priority=0,
+    )
+    repo = _FakeRepo(rules=[rule])
+    service = XBRLMappingOverridesService(repository=repo, engine=_FakeEngine())
+
+    grouped = await service.list_rules_for_concepts(
+        concepts=["us-gaap:Revenues", "us-gaap:Assets"],
+        taxonomy="US_GAAP_2024",
+    )
+
+    assert [r.rule_id for r in grouped["us-gaap:Revenues"]] == ["r1"]
+    assert grouped["us-gaap:Assets"] == []
+    assert repo.calls == [
+        {"concepts": ["us-gaap:Assets", "us-gaap:Revenues"], "taxonomy": "US_GAAP_2024"}
+    ]
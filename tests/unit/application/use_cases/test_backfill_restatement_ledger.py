@@ -0,0 +1,110 @@
+# tests/unit/application/use_cases/test_backfill_restatement_ledger.py
+# Copyright (c)
+# SPDX-License-Identifier: MIT
+"""Unit tests for BackfillRestatementLedgerUseCase."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any
+
+import pytest
+
+from arche_api.application.use_cases.statements.backfill_restatement_ledger import (
+    BackfillRestatementLedgerRequest,
+    BackfillRestatementLedgerUseCase,
+)
+from arche_api.domain.enums.edgar import StatementType
+from arche_api.domain.exceptions.edgar import EdgarMappingError
+from arche_api.domain.interfaces.repositories.edgar_statements_repository import (
+    EdgarStatementsRepository,
+)
+
+
+class _FakeStatementsRepo:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, StatementType, int, Any]] = []
+
+    async def list_statement_versions_for_company(
+        self,
+        *,
+        cik: str,
+        statement_type: StatementType,
+        fiscal_year: int,
+        fiscal_period: Any = None,
+    ) -> list[Any]:
+        self.calls.append((cik, statement_type, fiscal_year, fiscal_period))
+        return [(cik, statement_type, fiscal_year)]
+
+
+class _FakeLedgerStore:
+    def __init__(self) -> None:
+        self.batches: list[Sequence[Any]] = []
+
+    async def record_history(self, *, uow: Any, versions: Sequence[Any]) -> int:
+        self.batches.append(versions)
+        return 2
+
+
+class _FakeUoW:
+    def __init__(self, repo: _FakeStatementsRepo) -> None:
+        self._repo = repo
+        self.commits = 0
+
+    async def __aenter__(self) -> _FakeUoW:
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:  # type: ignore[override]
+        return None
+
+    def get_repository(self, repo_type: type) -> Any:
+        assert repo_type is EdgarStatementsRepository
+        return self._repo
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+
+@pytest.mark.anyio
+async def test_backfill_rebuilds_each_year_and_commits_per_company() -> None:
+    repo = _FakeStatementsRepo()
+    store = _FakeLedgerStore()
+    uow = _FakeUoW(repo)
+    uc = BackfillRestatementLedgerUseCase(uow, restatement_ledger=store)  # type: ignore[arg-type]
+
+    result = await uc.execute(
+        BackfillRestatementLedgerRequest(
+            ciks=["0000320193", " ", "0000789019"],
+            fiscal_year_from=2023,
+            fiscal_year_to=2024,
+            statement_types=[StatementType.INCOME_STATEMENT],
+        )
+    )
+
+    assert (result.companies, result.records_written) == (2, 8)
+    assert uow.commits == 2
+    assert repo.calls == [
+        ("0000320193", StatementType.INCOME_STATEMENT, 2023, None),
+        ("0000320193", StatementType.INCOME_STATEMENT, 2024, None),
+        ("0000789019", StatementType.INCOME_STATEMENT, 2023, None),
+        ("0000789019", StatementType.INCOME_STATEMENT, 2024, None),
+    ]
+    assert len(store.batches) == 4
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    ("ciks", "year_from", "year_to"),
+    [([], 2023, 2024), (["  "], 2023, 2024), (["0000320193"], 2024, 2023), (["x"], 0, 2024)],
+)
+async def test_backfill_rejects_invalid_requests(
+    ciks: list[str], year_from: int, year_to: int
+) -> None:
+    uc = BackfillRestatementLedgerUseCase(_FakeUoW(_FakeStatementsRepo()))  # type: ignore[arg-type]
+
+    with pytest.raises(EdgarMappingError):
+        await uc.execute(
+            BackfillRestatementLedgerRequest(
+                ciks=ciks, fiscal_year_from=year_from, fiscal_year_to=year_to
+            )
+        )
@@ -4,9 +4,10 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Sequence
 from datetime import date
 from decimal import Decimal
-from typing import Any
+from typing import Any, cast
 
 import pytest
 
@@ -35,6 +36,7 @@ from arche_api.domain.enums.edgar import (
     StatementType,
 )
 from arche_api.domain.exceptions.edgar import EdgarMappingError
+from arche_api.domain.value_objects import StatementKeyset
 
 
 class FakeUnitOfWork(UnitOfWork):  # type: ignore[misc]
@@ -61,6 +63,9 @@ class FakeUnitOfWork(UnitOfWork):  # type: ignore[misc]
 class FakeEdgarStatementsRepository(EdgarStatementsRepository):  # type: ignore[misc]
     def __init__(self, versions: list[EdgarStatementVersion]) -> None:
         self._versions = versions
+        self.keyset_calls: list[dict[str, Any]] = []
+        self.stream_calls: list[dict[str, Any]] = []
+        self.count_calls = 0
 
     async def list_statement_versions_for_company(  # type: ignore[override]
         self,
@@ -79,6 +84,90 @@ class FakeEdgarStatementsRepository(EdgarStatementsRepository):  # type: ignore[
             and (fiscal_period is None or v.fiscal_period is fiscal_period)
         ]
 
+    async def list_latest_statement_payloads(  # type: ignore[override]
+        self,
+        *,
+        ciks: Sequence[str],
+        statement_type: StatementType,
+        fiscal_periods: Sequence[FiscalPeriod],
+        from_date: date,
+        to_date: date,
+        after: StatementKeyset | None = None,
+        before: StatementKeyset | None = None,
+        limit: int | None = None,
+    ) -> list[CanonicalStatementPayload]:
+        self.keyset_calls.append(
+            {"ciks": list(ciks), "after": after, "before": before, "limit": limit}
+        )
+        latest: dict[tuple[str, date, str], EdgarStatementVersion] = {}
+        for v in self._versions:
+            if (
+                v.company.cik in ciks
+                and v.statement_type is statement_type
+                and v.fiscal_period in fiscal_periods
+                and from_date <= v.statement_date <= to_date
+                and v.normalized_payload is not None
+            ):
+                key = (v.company.cik, v.statement_date, v.fiscal_period.value)
+                if key not in latest or v.version_sequence > latest[key].version_sequence:
+                    latest[key] = v
+
+        keys = sorted(latest)
+        if after is not None:
+            keys = [
+                k for k in keys if k > (after.cik, after.statement_date, after.fiscal_period.value)
+            ]
+        if before is not None:
+            keys = [
+                k
+                for k in keys
+                if k < (before.cik, before.statement_date, before.fiscal_period.value)
+            ]
+            keys = keys[-limit:] if limit is not None else keys
+        elif limit is not None:
+            keys = keys[:limit]
+        return [cast(CanonicalStatementPayload, latest[k].normalized_payload) for k in keys]
+
+    async def count_latest_statement_payloads(  # type: ignore[override]
+        self,
+        *,
+        ciks: Sequence[str],
+        statement_type: StatementType,
+        fiscal_periods: Sequence[FiscalPeriod],
+        from_date: date,
+        to_date: date,
+    ) -> int:
+        self.count_calls += 1
+        payloads = await self.list_latest_statement_payloads(
+            ciks=ciks,
+            statement_type=statement_type,
+            fiscal_periods=fiscal_periods,
+            from_date=from_date,
+            to_date=to_date,
+        )
+        return len(payloads)
+
+    async def stream_latest_statement_payloads(  # type: ignore[override]
+        self,
+        *,
+        ciks: Sequence[str],
+        statement_type: StatementType,
+        fiscal_periods: Sequence[FiscalPeriod],
+        from_date: date,
+        to_date: date,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[CanonicalStatementPayload]:
+        self.stream_calls.append({"ciks": list(ciks), "batch_size": batch_size})
+        payloads = await self.list_latest_statement_payloads(
+            ciks=ciks,
+            statement_type=statement_type,
+            fiscal_periods=fiscal_periods,
+            from_date=from_date,
+            to_date=to_date,
+        )
+        for payload in payloads:
+            yield payload
+
 
 def _make_company(cik: str, name: str) -> EdgarCompanyIdentity:
     return EdgarCompanyIdentity(
@@ -330,3 +419,147 @@ async def test_get_fundamentals_timeseries_validates_inputs() -> None:
     )
     with pytest.raises(EdgarMappingError):
         await uc.execute(req_bad_window)
+
+
+def _quarterly_panel() -> list[EdgarStatementVersion]:
+    """Two companies with eight quarters each, plus a restated quarter."""
+    quarter_ends = {
+        FiscalPeriod.Q1: (3, 31),
+        FiscalPeriod.Q2: (6, 30),
+        FiscalPeriod.Q3: (9, 30),
+        FiscalPeriod.Q4: (12, 31),
+    }
+    versions: list[EdgarStatementVersion] = []
+    for cik in ("0000320193", "0000789019"):
+        company = _make_company(cik, f"Company {cik}")
+        filing = _make_filing(company, f"acc-{cik}")
+        for idx, year in enumerate((2022, 2023)):
+            for q_idx, (period, (month, day)) in enumerate(quarter_ends.items()):
+                versions.append(
+                    _make_version(
+                        company=company,
+                        filing=filing,
+                        statement_date=date(year, month, day),
+                        fiscal_year=year,
+                        fiscal_period=period,
+                        version_sequence=1,
+                        revenue=str(100 + idx * 40 + q_idx * 10),
+                    ),
+                )
+        versions.append(
+            _make_version(
+                company=company,
+                filing=filing,
+                statement_date=date(2023, 6, 30),
+                fiscal_year=2023,
+                fiscal_period=FiscalPeriod.Q2,
+                version_sequence=2,
+                revenue="999",
+            ),
+        )
+    return versions
+
+
+@pytest.mark.anyio
+async def test_execute_page_walks_panel_with_keyset_cursor() -> None:
+    repo = FakeEdgarStatementsRepository(_quarterly_panel())
+    uc = GetFundamentalsTimeSeriesUseCase(uow=FakeUnitOfWork(repo))
+
+    req = GetFundamentalsTimeSeriesRequest(
+        ciks=["0000789019", "0000320193"],
+        statement_type=StatementType.INCOME_STATEMENT,
+        frequency="quarterly",
+        from_date=date(2022, 1, 1),
+        to_date=date(2023, 12, 31),
+    )
+
+    full = await uc.execute(req)
+
+    paged: list[FundamentalsTimeSeriesPoint] = []
+    after: StatementKeyset | None = None
+    pages = 0
+    while True:
+        page = await uc.execute_page(req, after=after, limit=5)
+        paged.extend(page.points)
+        pages += 1
+        if page.next_keyset is None:
+            break
+        after = page.next_keyset
+
+    assert len(full) == 16
+    assert paged == full
+    assert pages == 4
+    # Each page reads exactly one row beyond its limit, never the whole panel.
+    assert all(call["limit"] == 6 for call in repo.keyset_calls)
+
+
+@pytest.mark.anyio
+async def test_execute_page_counts_total_only_on_request() -> None:
+    repo = FakeEdgarStatementsRepository(_quarterly_panel())
+    uc = GetFundamentalsTimeSeriesUseCase(uow=FakeUnitOfWork(repo))
+
+    req = GetFundamentalsTimeSeriesRequest(
+        ciks=["0000789019", "0000320193"],
+        statement_type=StatementType.INCOME_STATEMENT,
+        frequency="quarterly",
+        from_date=date(2022, 1, 1),
+        to_date=date(2023, 12, 31),
+    )
+
+    first = await uc.execute_page(req, after=None, limit=5, with_total=True)
+    second = await uc.execute_page(req, after=first.next_keyset, limit=5)
+
+    assert first.total == 16
+    assert len(first.points) == 5
+    assert second.total is None
+    assert repo.count_calls == 1
+
+
+@pytest.mark.anyio
+async def test_execute_page_validates_inputs() -> None:
+    uc = GetFundamentalsTimeSeriesUseCase(uow=FakeUnitOfWork(FakeEdgarStatementsRepository([])))
+
+    req = GetFundamentalsTimeSeriesRequest(
+        ciks=["0000320193"],
+        statement_type=StatementType.INCOME_STATEMENT,
+        frequency="monthly",
+    )
+    with pytest.raises(EdgarMappingError):
+        await uc.execute_page(req, after=None, limit=10)
+
+
+@pytest.mark.anyio
+async def test_stream_matches_execute_and_applies_projection() -> None:
+    repo = FakeEdgarStatementsRepository(_quarterly_panel())
+    uc = GetFundamentalsTimeSeriesUseCase(uow=FakeUnitOfWork(repo))
+
+    req = GetFundamentalsTimeSeriesRequest(
+        ciks=["0000789019", "0000320193"],
+        statement_type=StatementType.INCOME_STATEMENT,
+        metrics=[CanonicalStatementMetric.REVENUE],
+        frequency="quarterly",
+        from_date=date(2022, 1, 1),
+        to_date=date(2023, 12, 31),
+    )
+
+    full = await uc.execute(req)
+    stream = uc.stream(req, batch_size=3)
+    streamed = [point async for point in stream.points]
+
+    assert stream.metrics == (CanonicalStatementMetric.REVENUE,)
+    assert streamed == full
+    assert repo.stream_calls == [{"ciks": ["0000320193", "0000789019"], "batch_size": 3}]
+
+
+def test_stream_validates_inputs_before_reading() -> None:
+    repo = FakeEdgarStatementsRepository([])
+    uc = GetFundamentalsTimeSeriesUseCase(uow=FakeUnitOfWork(repo))
+
+    req = GetFundamentalsTimeSeriesRequest(
+        ciks=["0000320193"],
+        statement_type=StatementType.INCOME_STATEMENT,
+        frequency="monthly",
+    )
+    with pytest.raises(EdgarMappingError):
+        uc.stream(req)
+    assert repo.stream_calls == []
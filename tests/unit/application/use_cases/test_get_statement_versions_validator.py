@@ -0,0 +1,114 @@
+# tests/unit/application/use_cases/test_get_statement_versions_validator.py
+# Copyright (c)
+# SPDX-License-Identifier: MIT
+"""Tests for GetStatementVersionsValidatorUseCase."""
+
+from __future__ import annotations
+
+from datetime import UTC, date, datetime
+from typing import Any
+
+import pytest
+
+from arche_api.application.use_cases.statements.get_statement_versions_validator import (
+    GetStatementVersionsValidatorRequest,
+    GetStatementVersionsValidatorUseCase,
+)
+from arche_api.domain.enums.edgar import StatementType
+from arche_api.domain.value_objects import StatementVersionsFingerprint
+
+# ---------------------------------------------------------------------------
+# Fakes
+# ---------------------------------------------------------------------------
+
+
+class FakeStatementsRepository:
+    """Fake repository returning a configurable fingerprint."""
+
+    def __init__(self, fingerprint: StatementVersionsFingerprint) -> None:
+        self.fingerprint = fingerprint
+        self.calls: list[dict[str, Any]] = []
+
+    async def get_statement_versions_fingerprint(
+        self, **kwargs: Any
+    ) -> StatementVersionsFingerprint:
+        self.calls.append(kwargs)
+        return self.fingerprint
+
+
+class FakeUnitOfWork:
+    """Minimal async UnitOfWork exposing `statements_repo`."""
+
+    def __init__(self, repo: FakeStatementsRepository) -> None:
+        self.statements_repo = repo
+
+    async def __aenter__(self) -> FakeUnitOfWork:
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        return None
+
+
+def _request(**overrides: Any) -> GetStatementVersionsValidatorRequest:
+    params: dict[str, Any] = {
+        "ciks": ["0000320193", " 0000789019 "],
+        "statement_type": StatementType.INCOME_STATEMENT,
+        "from_date": date(2020, 1, 1),
+        "to_date": date(2024, 12, 31),
+        "representation": {"route": "test", "page": 1},
+    }
+    params.update(overrides)
+    return GetStatementVersionsValidatorRequest(**params)
+
+
+_FINGERPRINT = StatementVersionsFingerprint(
+    row_count=12,
+    max_version_sequence=3,
+    max_updated_at=datetime(2024, 6, 1, tzinfo=UTC),
+)
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.anyio
+async def test_validator_is_deterministic_and_normalizes_ciks() -> None:
+    repo = FakeStatementsRepository(_FINGERPRINT)
+    uc = GetStatementVersionsValidatorUseCase(uow=FakeUnitOfWork(repo))  # type: ignore[arg-type]
+
+    first = await uc.execute(_request())
+    second = await uc.execute(_request(ciks=["0000789019", "0000320193"]))
+
+    assert first == second
+    assert len(first) == 64
+    assert repo.calls[0]["ciks"] == ["0000320193", "0000789019"]
+    assert repo.calls[0]["statement_type"] is StatementType.INCOME_STATEMENT
+
+
+@pytest.mark.anyio
+async def test_validator_changes_when_fingerprint_changes() -> None:
+    repo = FakeStatementsRepository(_FINGERPRINT)
+    uc = GetStatementVersionsValidatorUseCase(uow=FakeUnitOfWork(repo))  # type: ignore[arg-type]
+
+    before = await uc.execute(_request())
+    repo.fingerprint = StatementVersionsFingerprint(
+        row_count=12,
+        max_version_sequence=3,
+        max_updated_at=datetime(2024, 6, 2, tzinfo=UTC),
+    )
+    after = await uc.execute(_request())
+
+    assert before != after
+
+
+@pytest.mark.anyio
+async def test_validator_changes_when_representation_changes() -> None:
+    repo = FakeStatementsRepository(_FINGERPRINT)
+    uc = GetStatementVersionsValidatorUseCase(uow=FakeUnitOfWork(repo))  # type: ignore[arg-type]
+
+    page_one = await uc.execute(_request())
+    page_two = await uc.execute(_request(representation={"route": "test", "page": 2}))
+
+    assert page_one != page_two
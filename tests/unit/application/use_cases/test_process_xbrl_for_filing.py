@@ -5,6 +5,7 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
+from dataclasses import replace
 from datetime import date
 from decimal import Decimal
 from typing import Any
@@ -17,8 +18,10 @@ from arche_api.application.use_cases.external_apis.edgar.process_xbrl_for_filing
 )
 from arche_api.domain.entities.canonical_statement_payload import CanonicalStatementPayload
 from arche_api.domain.entities.edgar_company import EdgarCompanyIdentity
+from arche_api.domain.entities.edgar_dq import NormalizedStatementIdentity
 from arche_api.domain.entities.edgar_filing import EdgarFiling
 from arche_api.domain.entities.edgar_normalized_fact import EdgarNormalizedFact
+from arche_api.domain.entities.edgar_restatement_ledger import RestatementLedgerRecord
 from arche_api.domain.entities.edgar_statement_version import EdgarStatementVersion
 from arche_api.domain.entities.xbrl_document import (
     XBRLContext,
@@ -35,6 +38,9 @@ from arche_api.domain.enums.edgar import (
     StatementType,
 )
 from arche_api.domain.exceptions.edgar import EdgarIngestionError, EdgarMappingError
+from arche_api.domain.interfaces.repositories.edgar_restatement_ledger_repository import (
+    EdgarRestatementLedgerRepository,
+)
 from arche_api.domain.services.edgar_normalization import (
     NormalizationContext,
     NormalizationResult,
@@ -100,11 +106,32 @@ class _FakeFactsRepo:
         self.replacements.append((identity, list(facts)))
 
 
+class _FakeLedgerRepo:
+    def __init__(self) -> None:
+        self.hops: dict[int, tuple[int, list[RestatementLedgerRecord]]] = {}
+
+    async def replace_hop(
+        self,
+        *,
+        identity: NormalizedStatementIdentity,
+        from_version_sequence: int,
+        records: Sequence[RestatementLedgerRecord],
+    ) -> None:
+        self.hops[identity.version_sequence] = (from_version_sequence, list(records))
+
+
 class _FakeUoW:
-    def __init__(self, statements_repo: _FakeStatementsRepo, facts_repo: _FakeFactsRepo) -> None:
-        self._repo_map = {
+    def __init__(
+        self,
+        statements_repo: _FakeStatementsRepo,
+        facts_repo: _FakeFactsRepo,
+        ledger_repo: _FakeLedgerRepo | None = None,
+    ) -> None:
+        self.ledger_repo = ledger_repo or _FakeLedgerRepo()
+        self._repo_map: dict[type, Any] = {
             _FakeStatementsRepo: statements_repo,
             _FakeFactsRepo: facts_repo,
+            EdgarRestatementLedgerRepository: self.ledger_repo,
         }
         self.committed = False
 
@@ -283,6 +310,59 @@ async def test_process_xbrl_for_filing_happy_path_normalizes_and_persists() -> N
     assert facts[0].value == Decimal("100")
 
 
+@pytest.mark.asyncio
+async def test_process_xbrl_for_filing_writes_restatement_ledger_by_default() -> None:
+    accession_id = "0000123456-25-000002"
+    previous = _build_statement_version("0000123456-25-000001")
+    previous = replace(
+        previous,
+        version_source="EDGAR_XBRL_NORMALIZED",
+        normalized_payload=CanonicalStatementPayload(
+            cik=previous.company.cik,
+            statement_type=previous.statement_type,
+            accounting_standard=previous.accounting_standard,
+            statement_date=previous.statement_date,
+            fiscal_year=previous.fiscal_year,
+            fiscal_period=previous.fiscal_period,
+            currency=previous.currency,
+            unit_multiplier=0,
+            core_metrics={CanonicalStatementMetric.REVENUE: Decimal("80")},
+            extra_metrics={},
+            dimensions={"consolidation": "CONSOLIDATED"},
+            source_accession_id=previous.accession_id,
+            source_taxonomy="us-gaap",
+            source_version_sequence=1,
+        ),
+        normalized_payload_version="v_test",
+    )
+    statement = replace(_build_statement_version(accession_id), version_sequence=2)
+    statements_repo = _FakeStatementsRepo(versions=[previous, statement])
+    uow = _FakeUoW(statements_repo=statements_repo, facts_repo=_FakeFactsRepo())
+
+    use_case = ProcessXBRLForFilingUseCase(
+        uow=uow,
+        ingestion_gateway=_FakeIngestionGateway(payload=b"<xbrli:xbrl/>"),
+        xbrl_parser_gateway=_FakeXBRLParserGateway(document=_build_xbrl_document()),
+        statements_repo_type=_FakeStatementsRepo,
+        facts_repo_type=_FakeFactsRepo,
+    )
+    use_case._normalizer = _FakeNormalizer()  # type: ignore[attr-defined]
+
+    await use_case.execute(
+        ProcessXBRLForFilingRequest(
+            cik="0000123456",
+            accession_id=accession_id,
+            statement_types=[StatementType.INCOME_STATEMENT],
+        )
+    )
+
+    from_seq, records = uow.ledger_repo.hops[2]
+    assert from_seq == 1
+    assert [(r.metric, r.diff) for r in records] == [
+        (CanonicalStatementMetric.REVENUE, Decimal("20"))
+    ]
+
+
 @pytest.mark.asyncio
 async def test_process_xbrl_for_filing_raises_on_empty_cik() -> None:
     use_case = ProcessXBRLForFilingUseCase(
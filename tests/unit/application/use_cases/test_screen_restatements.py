@@ -0,0 +1,95 @@
+# tests/unit/application/use_cases/test_screen_restatements.py
+# Copyright (c)
+# SPDX-License-Identifier: MIT
+"""Unit tests for ScreenRestatementsUseCase."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Any
+
+import pytest
+
+from arche_api.application.use_cases.statements.screen_restatements import (
+    MAX_SCREEN_LIMIT,
+    ScreenRestatementsRequest,
+    ScreenRestatementsUseCase,
+)
+from arche_api.domain.entities.edgar_restatement_ledger import (
+    RestatementLedgerRecord,
+    RestatementScreenQuery,
+)
+from arche_api.domain.enums.canonical_statement_metric import CanonicalStatementMetric
+from arche_api.domain.enums.edgar import FiscalPeriod, MaterialityClass, StatementType
+from arche_api.domain.exceptions.edgar import EdgarMappingError
+from arche_api.domain.interfaces.repositories.edgar_restatement_ledger_repository import (
+    EdgarRestatementLedgerRepository,
+)
+
+
+class _FakeLedgerRepo:
+    def __init__(self) -> None:
+        self.queries: list[RestatementScreenQuery] = []
+
+    async def screen(self, *, query: RestatementScreenQuery) -> list[RestatementLedgerRecord]:
+        self.queries.append(query)
+        return []
+
+
+class _FakeUoW:
+    def __init__(self, repo: _FakeLedgerRepo) -> None:
+        self._repo = repo
+        self.entered = False
+
+    async def __aenter__(self) -> _FakeUoW:
+        self.entered = True
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        return None
+
+    def get_repository(self, repo_type: type) -> Any:
+        assert repo_type is EdgarRestatementLedgerRepository
+        return self._repo
+
+
+@pytest.mark.anyio
+async def test_execute_builds_query_and_screens_ledger() -> None:
+    repo = _FakeLedgerRepo()
+    uow = _FakeUoW(repo)
+
+    result = await ScreenRestatementsUseCase(uow=uow).execute(  # type: ignore[arg-type]
+        ScreenRestatementsRequest(
+            statement_type=StatementType.INCOME_STATEMENT,
+            metric=CanonicalStatementMetric.REVENUE,
+            fiscal_year=2024,
+            fiscal_period=FiscalPeriod.Q3,
+            min_abs_pct_change=Decimal("0.05"),
+            min_materiality=MaterialityClass.MEDIUM,
+        )
+    )
+
+    assert uow.entered
+    assert repo.queries == [result.query]
+    assert result.records == []
+    assert result.query.materiality_classes == (MaterialityClass.MEDIUM, MaterialityClass.HIGH)
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"fiscal_year": 0},
+        {"limit": 0},
+        {"limit": MAX_SCREEN_LIMIT + 1},
+        {"min_abs_pct_change": Decimal("-0.01")},
+    ],
+)
+async def test_execute_rejects_invalid_parameters(overrides: dict[str, Any]) -> None:
+    repo = _FakeLedgerRepo()
+    req = ScreenRestatementsRequest(statement_type=StatementType.BALANCE_SHEET, **overrides)
+
+    with pytest.raises(EdgarMappingError):
+        await ScreenRestatementsUseCase(uow=_FakeUoW(repo)).execute(req)  # type: ignore[arg-type]
+
+    assert repo.queries == []
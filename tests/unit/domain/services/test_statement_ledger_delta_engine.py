@@ -22,11 +22,19 @@ import pytest
 from arche_api.domain.entities.canonical_statement_payload import (
     CanonicalStatementPayload,
 )
+from arche_api.domain.entities.edgar_restatement_delta import compute_restatement_delta
 from arche_api.domain.enums.canonical_statement_metric import CanonicalStatementMetric
-from arche_api.domain.enums.edgar import AccountingStandard, FiscalPeriod, StatementType
+from arche_api.domain.enums.edgar import (
+    AccountingStandard,
+    FiscalPeriod,
+    MaterialityClass,
+    StatementType,
+)
 from arche_api.domain.exceptions.edgar import EdgarIngestionError, EdgarMappingError
 from arche_api.domain.services.statement_ledger_delta_engine import (
     build_restatement_ledger,
+    build_restatement_ledger_records,
+    classify_metric_restatement,
     compute_restatement_delta_between_versions,
 )
 
@@ -370,3 +378,43 @@ def test_compute_restatement_delta_between_versions_unknown_sequence_raises_mapp
             versions=[v1, v2],
             to_version_sequence=999,
         )
+
+
+@pytest.mark.parametrize(
+    ("diff", "pct_change", "expected"),
+    [
+        (Decimal("0"), Decimal("0"), MaterialityClass.NONE),
+        (Decimal("5"), None, MaterialityClass.HIGH),
+        (Decimal("-1"), Decimal("-0.005"), MaterialityClass.LOW),
+        (Decimal("3"), Decimal("0.03"), MaterialityClass.MEDIUM),
+        (Decimal("-5"), Decimal("-0.05"), MaterialityClass.HIGH),
+    ],
+)
+def test_classify_metric_restatement_thresholds(
+    diff: Decimal, pct_change: Decimal | None, expected: MaterialityClass
+) -> None:
+    """Materiality follows the relative-change bands, HIGH when undefined."""
+    assert classify_metric_restatement(diff=diff, pct_change=pct_change) is expected
+
+
+def test_build_restatement_ledger_records_precomputes_magnitude() -> None:
+    """Each changed metric becomes a record with relative change and materiality."""
+    delta = compute_restatement_delta(
+        from_payload=_make_payload(revenue=Decimal("200"), net_income=Decimal("-40")),
+        to_payload=_make_payload(
+            revenue=Decimal("190"),
+            net_income=Decimal("-40"),
+            source_version_sequence=2,
+        ),
+    )
+
+    records = build_restatement_ledger_records(delta, restated_on=date(2025, 3, 1))
+
+    assert [r.metric for r in records] == [CanonicalStatementMetric.REVENUE]
+    record = records[0]
+    assert (record.from_version_sequence, record.to_version_sequence) == (1, 2)
+    assert record.diff == Decimal("-10")
+    assert record.pct_change == Decimal("-0.05")
+    assert record.abs_pct_change == Decimal("0.05")
+    assert record.materiality is MaterialityClass.HIGH
+    assert record.restated_on == date(2025, 3, 1)
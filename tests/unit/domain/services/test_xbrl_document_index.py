@@ -0,0 +1,171 @@
+# tests/unit/domain/services/test_xbrl_document_index.py
+# Copyright (c)
+# SPDX-License-Identifier: MIT
+"""Unit tests for the pre-indexed XBRL document view."""
+
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from arche_api.domain.entities.xbrl_document import (
+    XBRLContext,
+    XBRLDocument,
+    XBRLFact,
+    XBRLPeriod,
+    XBRLUnit,
+)
+from arche_api.domain.enums.canonical_statement_metric import CanonicalStatementMetric
+from arche_api.domain.enums.edgar import AccountingStandard, FiscalPeriod, StatementType
+from arche_api.domain.exceptions.edgar import EdgarMappingError
+from arche_api.domain.services.edgar_normalization import (
+    CanonicalStatementNormalizer,
+    NormalizationContext,
+)
+from arche_api.domain.services.gaap_taxonomy import build_minimal_gaap_taxonomy
+from arche_api.domain.services.xbrl_document_index import XBRLDocumentIndex
+
+
+def _fact(
+    fact_id: str,
+    concept: str,
+    context_ref: str,
+    value: str,
+    *,
+    unit_ref: str | None = "USD",
+    is_nil: bool = False,
+) -> XBRLFact:
+    return XBRLFact(
+        id=fact_id,
+        concept_qname=concept,
+        context_ref=context_ref,
+        unit_ref=unit_ref,
+        raw_value=value,
+        decimals=0,
+        precision=None,
+        is_nil=is_nil,
+        footnote_refs=(),
+    )
+
+
+def _document() -> XBRLDocument:
+    duration = XBRLPeriod(
+        is_instant=False,
+        instant_date=None,
+        start_date=date(2024, 1, 1),
+        end_date=date(2024, 12, 31),
+    )
+    prior = XBRLPeriod(
+        is_instant=False,
+        instant_date=None,
+        start_date=date(2023, 1, 1),
+        end_date=date(2023, 12, 31),
+    )
+    instant = XBRLPeriod(
+        is_instant=True, instant_date=date(2024, 12, 31), start_date=None, end_date=None
+    )
+    contexts = {
+        "D2024": XBRLContext(id="D2024", entity_identifier="1", period=duration, dimensions=()),
+        "D2023": XBRLContext(id="D2023", entity_identifier="1", period=prior, dimensions=()),
+        "I2024": XBRLContext(id="I2024", entity_identifier="1", period=instant, dimensions=()),
+    }
+    units = {
+        "USD": XBRLUnit(id="USD", measure="iso4217:USD"),
+        "EUR": XBRLUnit(id="EUR", measure="iso4217:EUR"),
+    }
+    facts = (
+        _fact("r24", "us-gaap:Revenues", "D2024", "1000"),
+        _fact("r23", "us-gaap:Revenues", "D2023", "900"),
+        _fact("r24eur", "us-gaap:Revenues", "D2024", "950", unit_ref="EUR"),
+        _fact("ni", "us-gaap:NetIncomeLoss", "D2024", "120.4"),
+        _fact("a", "us-gaap:Assets", "I2024", "5000"),
+        _fact("nil", "us-gaap:Liabilities", "I2024", "", is_nil=True),
+        _fact("orphan", "us-gaap:Liabilities", "MISSING", "1"),
+        _fact("text", "dei:EntityRegistrantName", "D2024", "Acme", unit_ref=None),
+    )
+    return XBRLDocument(
+        accession_id="0000000001-24-000001", contexts=contexts, units=units, facts=facts
+    )
+
+
+def _context(
+    index: XBRLDocumentIndex | None, document: XBRLDocument, st: StatementType
+) -> NormalizationContext:
+    source = index or XBRLDocumentIndex(document)
+    return NormalizationContext(
+        cik="0000000001",
+        statement_type=st,
+        accounting_standard=AccountingStandard.US_GAAP,
+        statement_date=date(2024, 12, 31),
+        fiscal_year=2024,
+        fiscal_period=FiscalPeriod.FY,
+        currency="USD",
+        accession_id=document.accession_id,
+        taxonomy="US_GAAP_MIN_E10A",
+        version_sequence=1,
+        facts=source.edgar_facts(currency="USD"),
+        fact_index=index.fact_index(currency="USD") if index is not None else None,
+    )
+
+
+def test_index_buckets_usable_facts_once() -> None:
+    index = XBRLDocumentIndex(_document())
+
+    assert [item.fact.id for item in index.facts] == ["r24", "r23", "r24eur", "ni", "a", "text"]
+    assert [i.fact.id for i in index.by_concept["us-gaap:Revenues"]] == ["r24", "r23", "r24eur"]
+    assert {i.fact.id for i in index.by_unit["EUR"]} == {"r24eur"}
+    assert {i.fact.id for i in index.by_period[(None, None, date(2024, 12, 31))]} == {"a"}
+    assert index.by_concept["us-gaap:NetIncomeLoss"][0].value == Decimal("120.4")
+    assert index.by_concept["dei:EntityRegistrantName"][0].value is None
+
+    facts = index.edgar_facts(currency="USD")
+    assert index.edgar_facts(currency="USD") is facts
+    assert index.fact_index(currency="USD") is index.fact_index(currency="USD")
+    assert [f.unit for f in facts] == ["USD", "USD", "EUR", "USD", "USD", "USD"]
+    assert index.edgar_facts(currency="CAD")[-1].unit == "CAD"
+
+
+def test_shared_index_matches_per_statement_normalization() -> None:
+    document = _document()
+    index = XBRLDocumentIndex(document)
+    normalizer = CanonicalStatementNormalizer()
+
+    for st in (StatementType.INCOME_STATEMENT, StatementType.BALANCE_SHEET):
+        shared = normalizer.normalize(_context(index, document, st))
+        standalone = normalizer.normalize(_context(None, document, st))
+        assert shared == standalone
+
+    payload = normalizer.normalize(
+        _context(index, document, StatementType.INCOME_STATEMENT)
+    ).payload
+    assert payload.core_metrics[CanonicalStatementMetric.REVENUE] == Decimal("1000")
+    assert payload.core_metrics[CanonicalStatementMetric.NET_INCOME] == Decimal("120")
+
+
+def _with_facts(document: XBRLDocument, facts: tuple[XBRLFact, ...]) -> XBRLDocument:
+    return XBRLDocument(
+        accession_id=document.accession_id,
+        contexts=document.contexts,
+        units=document.units,
+        facts=facts,
+    )
+
+
+def test_gaap_taxonomy_validates_indexed_document() -> None:
+    taxonomy = build_minimal_gaap_taxonomy()
+    document = _document()
+    usd_only = tuple(f for f in document.facts if f.unit_ref != "EUR")
+    taxonomy.validate_document(XBRLDocumentIndex(_with_facts(document, usd_only)))
+
+    # EUR revenue fails the unit suffix check.
+    with pytest.raises(EdgarMappingError):
+        taxonomy.validate_document(XBRLDocumentIndex(document))
+
+    # Revenue on an instant context fails the period type check.
+    instant_revenue = _fact("bad", "us-gaap:Revenues", "I2024", "1")
+    with pytest.raises(EdgarMappingError):
+        taxonomy.validate_document(
+            XBRLDocumentIndex(_with_facts(document, (*usd_only, instant_revenue)))
+        )
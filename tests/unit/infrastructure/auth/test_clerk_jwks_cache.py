@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+import httpx
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwk, jwt
+
+from arche_api.infrastructure.security.clerk_jwks import ClerkJWKSClient, verify_clerk_token
+from arche_api.infrastructure.security.token_cache import VerifiedTokenCache
+
+ISSUER = "https://issuer.test"
+
+
+def _signing_material(kid: str) -> tuple[bytes, dict[str, Any]]:
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_pem = key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+    public_pem = key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    )
+    public_jwk = jwk.construct(public_pem, "RS256").to_dict()
+    public_jwk["kid"] = kid
+    return private_pem, public_jwk
+
+
+def _token(private_pem: bytes, kid: str, **claims: Any) -> str:
+    payload = {"sub": "user_1", "iss": ISSUER, "exp": int(time.time()) + 600, **claims}
+    return jwt.encode(payload, private_pem, algorithm="RS256", headers={"kid": kid})
+
+
+def _jwks_http(keys: list[dict[str, Any]], calls: list[str]) -> httpx.AsyncClient:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(str(request.url))
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"keys": keys})
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.anyio
+async def test_verified_token_is_served_from_cache() -> None:
+    private_pem, public_jwk = _signing_material("k1")
+    calls: list[str] = []
+    client = ClerkJWKSClient(ISSUER, http=_jwks_http([public_jwk], calls))
+    cache = VerifiedTokenCache(max_entries=8)
+    token = _token(private_pem, "k1")
+
+    first = await verify_clerk_token(
+        token=token, jwks_client=client, issuer=ISSUER, token_cache=cache
+    )
+
+    async def _unexpected(_token: str) -> Any:
+        raise AssertionError("cached token must not hit the JWKS client")
+
+    client.get_key_for_token = _unexpected  # type: ignore[method-assign]
+    second = await verify_clerk_token(
+        token=token, jwks_client=client, issuer=ISSUER, token_cache=cache
+    )
+
+    assert second == first and second["sub"] == "user_1"
+    assert len(calls) == 1
+    # A different audience context is a separate entry.
+    assert cache.get(token, context=f"{ISSUER}|other-aud") is None
+
+
+def test_token_cache_respects_exp_cap_and_lru_bound() -> None:
+    now = [1_000.0]
+    cache = VerifiedTokenCache(max_entries=2, max_ttl_s=60.0, clock=lambda: now[0])
+
+    cache.put("a", {"exp": 1_030})
+    cache.put("b", {"exp": 5_000})
+    cache.put("no-exp", {"sub": "x"})
+    assert cache.get("a") is not None and cache.get("no-exp") is None
+
+    now[0] = 1_031.0
+    assert cache.get("a") is None  # past exp
+    assert cache.get("b") is not None
+
+    now[0] = 1_061.0
+    assert cache.get("b") is None  # past max_ttl_s
+
+    for name in ("c", "d", "e"):
+        cache.put(name, {"exp": 9_999})
+    assert len(cache) == 2 and cache.get("c") is None
+
+
+@pytest.mark.anyio
+async def test_unknown_kid_is_negatively_cached_and_refresh_rate_limited() -> None:
+    private_pem, public_jwk = _signing_material("k1")
+    calls: list[str] = []
+    client = ClerkJWKSClient(
+        ISSUER, http=_jwks_http([public_jwk], calls), min_refresh_interval_s=30.0
+    )
+    forged = [_token(private_pem, f"bogus-{i}") for i in range(20)]
+
+    for token in forged + forged:
+        with pytest.raises(KeyError):
+            await client.get_key_for_token(token)
+
+    # One cold fetch plus a single forced refresh for the first unknown kid.
+    assert len(calls) == 2
+
+
+@pytest.mark.anyio
+async def test_kid_rejected_during_refresh_cooldown_is_not_negatively_cached() -> None:
+    private_pem, k1 = _signing_material("k1")
+    _, k3 = _signing_material("k3")
+    published = [k1]
+    calls: list[str] = []
+    now = [0.0]
+    client = ClerkJWKSClient(
+        ISSUER,
+        ttl_seconds=600,
+        jitter_ratio=0.0,
+        http=_jwks_http(published, calls),
+        min_refresh_interval_s=30.0,
+        unknown_kid_ttl_s=300.0,
+        clock=lambda: now[0],
+    )
+
+    now[0] = 1.0
+    with pytest.raises(KeyError):
+        # The cold fetch doubles as the forced refresh: k2 is confirmed missing.
+        await client.get_key_for_token(_token(private_pem, "k2"))
+    now[0] = 2.0
+    with pytest.raises(KeyError):
+        await client.get_key_for_token(_token(private_pem, "k3"))  # cooldown, no refresh
+    assert len(calls) == 1
+
+    published.append(k3)
+    now[0] = 40.0
+    jwk_k3, _ = await client.get_key_for_token(_token(private_pem, "k3"))
+    assert jwk_k3["kid"] == "k3"
+    assert len(calls) == 2
+
+    # k2 was confirmed missing by a real refresh, so it stays negatively cached.
+    now[0] = 41.0
+    with pytest.raises(KeyError):
+        await client.get_key_for_token(_token(private_pem, "k2"))
+    assert len(calls) == 2
+
+
+@pytest.mark.anyio
+async def test_concurrent_cold_fetch_is_single_flight_and_stale_is_revalidated() -> None:
+    _, public_jwk = _signing_material("k1")
+    calls: list[str] = []
+    now = [0.0]
+    client = ClerkJWKSClient(
+        ISSUER,
+        ttl_seconds=60,
+        jitter_ratio=0.0,
+        http=_jwks_http([public_jwk], calls),
+        clock=lambda: now[0],
+    )
+
+    results = await asyncio.gather(*(client._get_jwks() for _ in range(10)))
+    assert all("k1" in keys for keys in results)
+    assert len(calls) == 1
+
+    now[0] = 61.0  # expired but within the stale window
+    assert "k1" in await client._get_jwks()
+    assert len(calls) == 1  # served stale, refresh runs in the background
+    await asyncio.sleep(0.05)
+    assert len(calls) == 2
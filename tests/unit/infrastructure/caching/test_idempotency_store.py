@@ -0,0 +1,98 @@
+# tests/unit/infrastructure/caching/test_idempotency_store.py
+from __future__ import annotations
+
+import fakeredis.aioredis
+import pytest
+
+from arche_api.infrastructure.caching.idempotency_store import (
+    COMPLETED,
+    STARTED,
+    IdempotencyStoreUnavailable,
+    RedisIdempotencyStore,
+)
+
+
+@pytest.mark.anyio
+async def test_claim_complete_and_replay_round_trip() -> None:
+    fake = fakeredis.aioredis.FakeRedis()
+    store = RedisIdempotencyStore(lambda: fake)
+
+    assert await store.claim("k1", "h1", ttl_seconds=60) is None
+
+    in_flight = await store.claim("k1", "h1", ttl_seconds=60)
+    assert in_flight is not None and in_flight.state == STARTED
+
+    body = b'{"run_id":"abc"}' * 50
+    await store.complete("k1", "h1", status_code=201, content_type="application/json", body=body)
+
+    replay = await store.claim("k1", "h1", ttl_seconds=60)
+    assert replay is not None
+    assert replay.state == COMPLETED
+    assert (replay.status_code, replay.content_type, replay.body) == (
+        201,
+        "application/json",
+        body,
+    )
+
+    (redis_key,) = await fake.keys("*")
+    assert b"k1" not in redis_key  # client keys are hashed
+    assert 0 < await fake.ttl(redis_key) <= 60  # completion keeps the TTL
+    assert len(await fake.get(redis_key)) < len(body)  # stored compressed
+
+
+@pytest.mark.anyio
+async def test_release_drops_in_flight_claim() -> None:
+    fake = fakeredis.aioredis.FakeRedis()
+    store = RedisIdempotencyStore(lambda: fake)
+
+    assert await store.claim("k2", "h", ttl_seconds=60) is None
+    await store.release("k2")
+    assert await store.claim("k2", "h", ttl_seconds=60) is None
+
+
+@pytest.mark.anyio
+async def test_redis_failure_raises_unavailable_and_cools_down() -> None:
+    calls = 0
+    now = [100.0]
+
+    def broken() -> object:
+        nonlocal calls
+        calls += 1
+        raise ConnectionError("redis down")
+
+    store = RedisIdempotencyStore(broken, cooldown_s=5.0, clock=lambda: now[0])
+
+    with pytest.raises(IdempotencyStoreUnavailable):
+        await store.claim("k", "h", ttl_seconds=60)
+    with pytest.raises(IdempotencyStoreUnavailable):
+        await store.claim("k", "h", ttl_seconds=60)
+    assert calls == 1  # second call bypassed Redis during the cool-down
+
+    now[0] += 6.0
+    with pytest.raises(IdempotencyStoreUnavailable):
+        await store.claim("k", "h", ttl_seconds=60)
+    assert calls == 2
+
+
+class _VanishingRedis:
+    """Key always held by someone else on SET NX, but gone by the GET."""
+
+    def __init__(self) -> None:
+        self.sets = 0
+
+    async def set(self, *args: object, **kwargs: object) -> bool:
+        self.sets += 1
+        return False
+
+    async def get(self, key: str) -> None:
+        return None
+
+
+@pytest.mark.anyio
+async def test_claim_gives_up_when_key_keeps_vanishing() -> None:
+    redis = _VanishingRedis()
+    store = RedisIdempotencyStore(lambda: redis)
+
+    with pytest.raises(IdempotencyStoreUnavailable):
+        await store.claim("k3", "h", ttl_seconds=60)
+    assert redis.sets == 3
@@ -1,13 +1,12 @@
 # tests/unit/infrastructure/caching/test_redis_json_cache_keys_ttl.py
 from __future__ import annotations
 
-import json
-
 import fakeredis.aioredis
 import pytest
 
 from arche_api.infrastructure.caching import redis_client as redis_client_module
 from arche_api.infrastructure.caching.json_cache import TTL_INTRADAY_RECENT_S, RedisJsonCache
+from arche_api.infrastructure.serialization.json_codec import get_json_codec
 
 
 @pytest.mark.asyncio
@@ -24,7 +23,7 @@ async def test_redis_json_cache_key_shape_and_ttl(monkeypatch):
     await cache.set_json(tail, payload, ttl=TTL_INTRADAY_RECENT_S)
 
     full_key = f"arche:market_data:v1:{tail}"
-    assert await fake.get(full_key) == json.dumps(payload)
+    assert await fake.get(full_key) == get_json_codec().dumps(payload).decode()
 
     ttl = await fake.ttl(full_key)
     # TTL should be positive and not exceed the configured band by much.
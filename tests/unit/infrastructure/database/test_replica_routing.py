@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+import pytest
+
+
+class _Engine:
+    def connect(self) -> Any:
+        raise OSError("replica unreachable")
+
+
+@pytest.fixture()
+def db_session(monkeypatch: pytest.MonkeyPatch) -> Any:
+    mod = importlib.import_module("arche_api.infrastructure.database.session")
+    monkeypatch.setattr(mod, "_replicas", [])
+    monkeypatch.setattr(mod, "_max_replica_lag_s", 5.0)
+    monkeypatch.setattr(mod, "_sessionmaker", lambda: "primary-session")
+    return mod
+
+
+def _replica(mod: Any, name: str, *, lag: float | None, healthy: bool = True) -> Any:
+    return mod._Replica(
+        name=name,
+        engine=_Engine(),
+        sessionmaker=lambda: f"{name}-session",
+        lag_s=lag,
+        healthy=healthy,
+    )
+
+
+def test_reads_round_robin_over_fresh_replicas_and_fall_back(db_session: Any) -> None:
+    assert db_session.open_read_session() == "primary-session"  # no replicas
+
+    db_session._replicas.extend(
+        [
+            _replica(db_session, "replica-0", lag=0.2),
+            _replica(db_session, "replica-1", lag=0.0),
+            _replica(db_session, "replica-2", lag=30.0),  # beyond the lag budget
+            _replica(db_session, "replica-3", lag=None),  # never measured
+        ]
+    )
+    picked = {db_session.open_read_session() for _ in range(6)}
+    assert picked == {"replica-0-session", "replica-1-session"}
+
+    for replica in db_session._replicas:
+        replica.lag_s = 60.0
+    assert db_session.open_read_session() == "primary-session"
+
+
+@pytest.mark.asyncio
+async def test_unreachable_replica_is_marked_unhealthy(db_session: Any) -> None:
+    db_session._replicas.append(_replica(db_session, "replica-0", lag=0.1))
+
+    lags = await db_session.refresh_replica_lag(timeout_s=0.1)
+
+    assert lags == {"replica-0": None}
+    assert not db_session._replicas[0].healthy
+    assert db_session.open_read_session() == "primary-session"
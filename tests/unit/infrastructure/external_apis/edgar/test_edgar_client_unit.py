@@ -75,3 +75,23 @@ async def test_edgar_client_status_mapping_and_json_validation() -> None:
         )
         with pytest.raises(EdgarMappingError):
             await client.fetch_company_submissions("4")
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_edgar_client_honors_retry_after_inside_running_loop() -> None:
+    settings = EdgarSettings()
+    async with httpx.AsyncClient() as http:
+        client = EdgarClient(settings=settings, http=http)
+
+        route = respx.get(f"{settings.base_url.rstrip('/')}/submissions/CIK0000000005.json").mock(
+            side_effect=[
+                httpx.Response(429, headers={"Retry-After": "0"}),
+                httpx.Response(200, json={"cik": "5"}),
+            ]
+        )
+
+        payload = await client.fetch_company_submissions("5")
+
+        assert route.call_count == 2
+        assert payload["cik"] == "5"
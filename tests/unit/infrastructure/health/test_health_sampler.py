@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from arche_api.adapters.routers import health_router as health_mod
+from arche_api.infrastructure.health.sampler import HealthSampler
+
+
+@pytest.mark.anyio
+async def test_sampler_times_out_slow_checks_and_is_single_flight() -> None:
+    calls = {"db": 0, "redis": 0}
+
+    async def db() -> tuple[bool, str | None]:
+        calls["db"] += 1
+        await asyncio.sleep(1.0)
+        return True, None
+
+    async def redis() -> tuple[bool, str | None]:
+        calls["redis"] += 1
+        return True, None
+
+    sampler = HealthSampler(
+        {"db": db, "redis": redis},
+        timeout_s=0.05,
+        pool_stats=lambda: {"size": 5, "max_overflow": 5, "checked_out": 9, "waiting": 3},
+    )
+
+    snapshots = await asyncio.gather(*(sampler.current() for _ in range(5)))
+
+    assert calls == {"db": 1, "redis": 1}
+    snapshot = snapshots[0]
+    assert all(s is snapshot for s in snapshots)
+    assert not snapshot.ok
+    db_sample, redis_sample = snapshot.samples
+    assert db_sample.name == "db" and not db_sample.ok
+    assert "timed out" in (db_sample.detail or "")
+    assert redis_sample.ok
+    assert snapshot.pool is not None and snapshot.pool["waiting"] == 3
+
+
+@pytest.mark.anyio
+async def test_readiness_serves_cached_snapshot_and_reports_staleness() -> None:
+    now = [100.0]
+    probes = [0]
+
+    async def ok() -> tuple[bool, str | None]:
+        probes[0] += 1
+        return True, None
+
+    sampler = HealthSampler(
+        {"db": ok, "redis": ok},
+        max_age_s=30.0,
+        pool_stats=lambda: {"size": 4, "max_overflow": 0, "checked_out": 2, "idle": 2},
+        clock=lambda: now[0],
+    )
+    await sampler.refresh()
+
+    app = FastAPI()
+    app.include_router(health_mod.router, prefix="/health")
+    app.dependency_overrides[health_mod.sampler_provider] = lambda: sampler
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        for _ in range(3):
+            fresh = await client.get("/health/readiness")
+        now[0] += 31.0
+        stale = await client.get("/health/ready")
+
+    assert probes[0] == 2  # one refresh, two checks; requests did no I/O
+    assert fresh.status_code == 200
+    body = fresh.json()
+    assert body["status"] == "ok" and body["stale"] is False
+    assert body["pool"]["saturation"] == 0.5 and body["pool"]["checked_out"] == 2
+
+    assert stale.status_code == 503
+    assert stale.json()["stale"] is True and stale.json()["status"] == "degraded"
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import asyncio
+import importlib
+from collections.abc import Mapping
+from typing import Any
+
+import httpx
+import prometheus_client as prom
+import pytest
+from fastapi import FastAPI
+
+from arche_api.infrastructure.http.transport import (
+    HTTPTransportRegistry,
+    PoolConfig,
+    _InstrumentedTransport,
+    set_http_transport_registry,
+)
+from arche_api.infrastructure.security.clerk_jwks import ClerkJWKSClient
+
+
+class _FakePoolTransport(httpx.AsyncHTTPTransport):
+    """Inner transport that 'opens' a TCP connection only on the first request."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.opened = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        trace = request.extensions.get("trace")
+        if self.opened == 0 and trace is not None:
+            self.opened += 1
+            await trace("connection.connect_tcp.started", {})
+        return httpx.Response(200, json={"ok": True}, request=request)
+
+
+def _requests_sample(provider: str, connection: str) -> float:
+    value = prom.REGISTRY.get_sample_value(
+        "arche_http_client_requests_total",
+        {"provider": provider, "connection": connection},
+    )
+    return value or 0.0
+
+
+@pytest.mark.anyio
+async def test_instrumented_transport_counts_new_and_reused_connections() -> None:
+    before_new = _requests_sample("unit-pool", "new")
+    before_reused = _requests_sample("unit-pool", "reused")
+
+    transport = _InstrumentedTransport("unit-pool", _FakePoolTransport())
+    async with httpx.AsyncClient(transport=transport) as client:
+        for _ in range(3):
+            resp = await client.get("https://upstream.test/x")
+            assert resp.status_code == 200
+
+    assert _requests_sample("unit-pool", "new") - before_new == 1
+    assert _requests_sample("unit-pool", "reused") - before_reused == 2
+
+
+@pytest.mark.anyio
+async def test_instrumented_transport_chains_caller_trace() -> None:
+    events: list[str] = []
+
+    async def caller_trace(event_name: str, info: Mapping[str, Any]) -> None:
+        events.append(event_name)
+
+    transport = _InstrumentedTransport("unit-chain", _FakePoolTransport())
+    async with httpx.AsyncClient(transport=transport) as client:
+        await client.get("https://upstream.test/x", extensions={"trace": caller_trace})
+
+    assert events == ["connection.connect_tcp.started"]
+
+
+@pytest.mark.anyio
+async def test_registry_reuses_client_per_provider_and_applies_config() -> None:
+    registry = HTTPTransportRegistry({"edgar": PoolConfig(max_connections=3, timeout_s=2.5)})
+
+    edgar = registry.client("edgar")
+    assert registry.client("edgar") is edgar
+    assert registry.client("mcp") is not edgar
+    assert edgar.timeout.read == 2.5
+    assert registry.config("unknown") == PoolConfig()
+    assert set(registry.stats()) == {"edgar", "mcp"}
+
+    await registry.aclose()
+    assert edgar.is_closed
+    assert registry.stats() == {}
+
+
+def test_registry_rebuilds_client_when_event_loop_changes() -> None:
+    registry = HTTPTransportRegistry()
+
+    async def grab() -> httpx.AsyncClient:
+        return registry.client("marketstack")
+
+    first = asyncio.run(grab())
+    second = asyncio.run(grab())
+    assert first is not second
+
+
+@pytest.mark.anyio
+async def test_registry_never_closes_default_client() -> None:
+    default = httpx.AsyncClient()
+    registry = HTTPTransportRegistry(default=default)
+    registry.client("jwks")
+
+    await registry.aclose()
+    assert registry.default is default
+    assert not default.is_closed
+    await default.aclose()
+
+
+@pytest.mark.anyio
+async def test_bootstrap_installs_and_clears_process_registry(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import arche_api.infrastructure.caching.redis_client as redis_client
+    import arche_api.infrastructure.database.session as db_session
+    from arche_api.dependencies.core.bootstrap import bootstrap
+
+    async def _noop() -> None:
+        return None
+
+    monkeypatch.setattr(db_session, "init_engine_and_sessionmaker", lambda s: None)
+    monkeypatch.setattr(db_session, "dispose_engine", _noop)
+    monkeypatch.setattr(redis_client, "init_redis", lambda s: None)
+    monkeypatch.setattr(redis_client, "close_redis", _noop)
+    # Resolve the live module: other suites may purge ``arche_api`` from sys.modules.
+    live = importlib.import_module("arche_api.infrastructure.http.transport")
+    monkeypatch.setattr(live, "_registry", None)
+
+    async with bootstrap(FastAPI()) as state:
+        assert live.get_http_transport_registry() is state.transports
+        assert state.transports.default is state.http_client
+        pooled = state.transports.client("marketstack")
+        assert pooled.timeout.read == state.settings.marketstack_timeout_s
+
+    assert pooled.is_closed
+    assert live._registry is None
+
+
+@pytest.mark.anyio
+async def test_jwks_client_fetches_through_pooled_transport() -> None:
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(str(request.url))
+        return httpx.Response(200, json={"keys": [{"kid": "k1", "kty": "RSA"}]})
+
+    registry = HTTPTransportRegistry()
+    set_http_transport_registry(registry)
+    try:
+        pooled = registry.client("jwks")
+        pooled._transport = httpx.MockTransport(handler)
+        jwks = ClerkJWKSClient(issuer="https://issuer.test")
+        keys = await jwks._get_jwks()
+    finally:
+        set_http_transport_registry(None)
+        await registry.aclose()
+
+    assert calls == ["https://issuer.test/.well-known/jwks.json"]
+    assert set(keys) == {"k1"}
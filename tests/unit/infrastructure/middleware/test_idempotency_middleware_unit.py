@@ -9,11 +9,13 @@ hashing logic to force specific branches (e.g., IN_PROGRESS).
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from datetime import datetime
 from typing import Any
 
+import fakeredis.aioredis
 import pytest
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
@@ -111,3 +113,89 @@ async def test_in_progress_record_returns_409(monkeypatch: pytest.MonkeyPatch) -
     assert r.status_code == 409
     payload = r.json()
     assert payload["error"]["code"] == "IDEMPOTENCY_KEY_IN_PROGRESS"
+
+
+class _AuditOnlyRepo:
+    """Fake repository for the Redis path: only the audit upsert is allowed."""
+
+    upserts: list[dict[str, Any]] = []
+
+    def __init__(self, _session: object) -> None:
+        pass
+
+    async def get_active(self, key: str, *, now: datetime | None = None) -> None:
+        raise AssertionError("get_active() must not run on the Redis path")
+
+    async def create_started(self, **_: Any) -> None:
+        raise AssertionError("create_started() must not run on the Redis path")
+
+    async def upsert_completed(self, **fields: Any) -> None:
+        _AuditOnlyRepo.upserts.append(fields)
+
+
+def _redis_app(store: Any) -> tuple[FastAPI, list[int]]:
+    calls: list[int] = []
+    app = FastAPI()
+    app.add_middleware(
+        idem_mod.IdempotencyMiddleware,
+        ttl_seconds=3600,
+        session_provider=_dummy_session_provider,
+        store=store,
+    )
+
+    @app.post("/runs")
+    async def runs(_request: Request) -> JSONResponse:
+        calls.append(1)
+        return JSONResponse({"run": len(calls)}, status_code=201)
+
+    return app, calls
+
+
+@pytest.mark.anyio
+async def test_redis_store_replays_without_touching_db(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Replays and conflicts are served from Redis; Postgres only sees one audit upsert."""
+    _AuditOnlyRepo.upserts = []
+    monkeypatch.setattr(idem_mod, "IdempotencyRepository", _AuditOnlyRepo)
+    fake = fakeredis.aioredis.FakeRedis()
+    app, calls = _redis_app(idem_mod.RedisIdempotencyStore(lambda: fake))
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://testserver") as client:
+        headers = {"Idempotency-Key": "redis-key"}
+        first = await client.post("/runs", json={"a": 1}, headers=headers)
+        second = await client.post("/runs", json={"a": 1}, headers=headers)
+        conflict = await client.post("/runs", json={"a": 2}, headers=headers)
+        await asyncio.sleep(0)
+
+    assert calls == [1]
+    assert first.status_code == second.status_code == 201
+    assert second.content == first.content
+    assert second.headers["content-type"] == "application/json"
+    assert conflict.status_code == 409
+    assert conflict.json()["error"]["code"] == "IDEMPOTENCY_KEY_CONFLICT"
+    assert len(_AuditOnlyRepo.upserts) == 1
+    assert _AuditOnlyRepo.upserts[0]["response_body"] == {"run": 1}
+
+
+@pytest.mark.anyio
+async def test_redis_unavailable_falls_back_to_db_flow(monkeypatch: pytest.MonkeyPatch) -> None:
+    """When Redis is down the original DB-backed flow is used."""
+    monkeypatch.setattr(
+        idem_mod.IdempotencyMiddleware,
+        "_compute_request_hash",
+        staticmethod(lambda _request, _body: "fixed-hash"),
+    )
+    monkeypatch.setattr(idem_mod, "IdempotencyRepository", _FakeRepo)
+
+    def broken() -> object:
+        raise ConnectionError("redis down")
+
+    app, calls = _redis_app(idem_mod.RedisIdempotencyStore(broken))
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://testserver") as client:
+        r = await client.post("/runs", json={"a": 1}, headers={"Idempotency-Key": "test-key"})
+
+    assert calls == []
+    assert r.status_code == 409
+    assert r.json()["error"]["code"] == "IDEMPOTENCY_KEY_IN_PROGRESS"
@@ -0,0 +1,153 @@
+# Copyright (c) Arche.
+# SPDX-License-Identifier: MIT
+"""Unit tests for the fused pure-ASGI ObservabilityMiddleware."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from arche_api.infrastructure.middleware import observability as obs
+from arche_api.infrastructure.middleware.observability import ObservabilityMiddleware
+
+
+class _FakeCollector:
+    def __init__(self) -> None:
+        self.calls: list[tuple[tuple[str, ...], str, float]] = []
+        self._labels: tuple[str, ...] = ()
+
+    def labels(self, *labels: str) -> _FakeCollector:
+        self._labels = labels
+        return self
+
+    def observe(self, value: float) -> None:
+        self.calls.append((self._labels, "observe", value))
+
+    def inc(self) -> None:
+        self.calls.append((self._labels, "inc", 1.0))
+
+
+@pytest.fixture()
+def collectors(monkeypatch: pytest.MonkeyPatch) -> dict[str, _FakeCollector]:
+    fakes = {"server": _FakeCollector(), "requests": _FakeCollector(), "latency": _FakeCollector()}
+    monkeypatch.setattr(obs, "get_http_server_request_duration_seconds", lambda: fakes["server"])
+    monkeypatch.setattr(obs, "get_http_requests_counter", lambda: fakes["requests"])
+    monkeypatch.setattr(obs, "get_http_request_latency_seconds", lambda: fakes["latency"])
+    return fakes
+
+
+def _app(**kwargs: Any) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(ObservabilityMiddleware, **kwargs)
+
+    @app.get("/items/{item_id}")
+    async def item(item_id: str, request: Request) -> dict[str, Any]:
+        return {
+            "item_id": item_id,
+            "trace_id": request.state.trace_id,
+            "request_id": request.state.request_id,
+        }
+
+    @app.get("/override")
+    async def override() -> JSONResponse:
+        return JSONResponse({}, headers={"X-Frame-Options": "SAMEORIGIN", "X-Request-ID": "own"})
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def body() -> AsyncIterator[bytes]:
+            for i in range(3):
+                yield f"chunk-{i}\n".encode()
+
+        return StreamingResponse(body(), media_type="text/plain")
+
+    @app.get("/boom")
+    async def boom() -> None:
+        raise RuntimeError("boom")
+
+    return app
+
+
+def test_correlation_ids_state_and_security_headers(
+    collectors: dict[str, _FakeCollector],
+) -> None:
+    client = TestClient(_app())
+
+    r = client.get("/items/42", headers={"x-trace-id": "  trace-1  ", "X-Request-ID": "req-1"})
+
+    assert r.status_code == 200
+    assert r.json() == {"item_id": "42", "trace_id": "trace-1", "request_id": "req-1"}
+    assert r.headers["x-trace-id"] == "trace-1"
+    assert r.headers["X-Request-ID"] == "req-1"
+    assert r.headers["X-Content-Type-Options"] == "nosniff"
+    assert r.headers["X-Frame-Options"] == "DENY"
+    assert r.headers["Referrer-Policy"] == "no-referrer-when-downgrade"
+    assert r.headers["Permissions-Policy"] == "geolocation=()"
+    assert "Strict-Transport-Security" not in r.headers
+
+
+def test_invalid_inbound_ids_are_replaced_and_downstream_headers_win(
+    collectors: dict[str, _FakeCollector],
+) -> None:
+    client = TestClient(_app())
+
+    r = client.get("/items/1", headers={"X-Request-ID": "bad id with spaces"})
+    assert r.headers["X-Request-ID"] == r.json()["request_id"] != "bad id with spaces"
+
+    r = client.get("/override")
+    assert r.headers["X-Frame-Options"] == "SAMEORIGIN"
+    assert r.headers["X-Request-ID"] == "own"
+    assert r.headers.get_list("X-Request-ID") == ["own"]
+
+
+def test_metrics_use_templated_route(collectors: dict[str, _FakeCollector]) -> None:
+    client = TestClient(_app())
+
+    client.get("/items/7")
+
+    ((labels, kind, _),) = collectors["server"].calls
+    assert labels == ("GET", "/items/{item_id}", "200")
+    assert kind == "observe"
+    assert [c[:2] for c in collectors["requests"].calls] == [(("GET", "200"), "inc")]
+    assert [c[:2] for c in collectors["latency"].calls] == [(("GET", "200"), "observe")]
+
+
+def test_streaming_body_is_passed_through(collectors: dict[str, _FakeCollector]) -> None:
+    client = TestClient(_app())
+
+    r = client.get("/stream")
+
+    assert r.text == "chunk-0\nchunk-1\nchunk-2\n"
+    assert r.headers["X-Content-Type-Options"] == "nosniff"
+    assert collectors["server"].calls[0][0] == ("GET", "/stream", "200")
+
+
+def test_unhandled_error_is_recorded_as_500_and_logged(
+    collectors: dict[str, _FakeCollector],
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    client = TestClient(_app(), raise_server_exceptions=False)
+
+    with caplog.at_level(logging.INFO, logger="arche_api.infrastructure.middleware.access_log"):
+        r = client.get("/boom", headers={"X-Request-ID": "req-err"})
+
+    assert r.status_code == 500
+    assert collectors["server"].calls[0][0] == ("GET", "/boom", "500")
+    records = [rec for rec in caplog.records if rec.getMessage() == "access_log"]
+    assert len(records) == 1
+    assert records[0].status == 500  # type: ignore[attr-defined]
+    assert records[0].ok is False  # type: ignore[attr-defined]
+    assert records[0].request_id == "req-err"  # type: ignore[attr-defined]
+
+
+def test_hsts_is_opt_in(collectors: dict[str, _FakeCollector]) -> None:
+    client = TestClient(_app(hsts_max_age=600, hsts_include_subdomains=True))
+
+    r = client.get("/items/1")
+
+    assert r.headers["Strict-Transport-Security"] == "max-age=600; includeSubDomains"
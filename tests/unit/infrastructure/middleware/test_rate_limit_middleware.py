@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from arche_api.infrastructure.middleware.rate_limit import (
+    RateLimitMiddleware,
+    api_key_fingerprint,
+    rate_limit_options,
+)
+from arche_api.infrastructure.resilience.rate_limiter import (
+    InMemoryRateLimiter,
+    Quota,
+    RedisRateLimiter,
+)
+
+
+def _app(**options: object) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/a")
+    async def a() -> dict[str, str]:
+        return {"ok": "a"}
+
+    @app.get("/b")
+    async def b() -> dict[str, str]:
+        return {"ok": "b"}
+
+    @app.get("/export/x")
+    async def export() -> dict[str, str]:
+        return {"ok": "export"}
+
+    app.add_middleware(RateLimitMiddleware, **options)  # type: ignore[arg-type]
+    return app
+
+
+@pytest.mark.anyio
+async def test_default_quota_is_shared_across_paths_and_emits_headers() -> None:
+    app = _app(quota=Quota(limit=2, window_s=60.0))
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://t") as client:
+        first = await client.get("/a")
+        second = await client.get("/b")
+        limited = await client.get("/a")
+
+    assert first.status_code == second.status_code == 200
+    assert first.headers["X-RateLimit-Limit"] == "2"
+    assert first.headers["X-RateLimit-Remaining"] == "1"
+    assert second.headers["X-RateLimit-Remaining"] == "0"
+    assert limited.status_code == 429
+    assert limited.json()["error"]["code"] == "RATE_LIMITED"
+    assert limited.headers["Retry-After"] == "30"
+    assert limited.headers["X-RateLimit-Reset"] == "60"
+
+
+@pytest.mark.anyio
+async def test_api_key_plan_and_route_quota_get_separate_buckets() -> None:
+    app = _app(
+        quota=Quota(limit=1, window_s=60.0),
+        plans={"pro": Quota(limit=3, window_s=60.0)},
+        api_key_plans={api_key_fingerprint("secret-pro"): "pro"},
+        route_quotas={"/export": Quota(limit=1, window_s=60.0)},
+    )
+    pro = {"X-Api-Key": "secret-pro"}
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://t") as client:
+        pro_codes = [(await client.get("/a", headers=pro)).status_code for _ in range(4)]
+        export_codes = [(await client.get("/export/x", headers=pro)).status_code for _ in range(2)]
+        anon_codes = [(await client.get("/a")).status_code for _ in range(2)]
+
+    assert pro_codes == [200, 200, 200, 429]
+    assert export_codes == [200, 429]
+    assert anon_codes == [200, 429]
+
+
+@pytest.mark.anyio
+async def test_rotating_unknown_api_keys_share_the_ip_bucket() -> None:
+    limiter = InMemoryRateLimiter()
+    app = _app(
+        quota=Quota(limit=2, window_s=60.0),
+        limiter=limiter,
+        plans={"pro": Quota(limit=100, window_s=60.0)},
+        api_key_plans={api_key_fingerprint("secret-pro"): "pro"},
+    )
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://t") as client:
+        codes = [
+            (await client.get("/a", headers={"X-Api-Key": f"made-up-{i}"})).status_code
+            for i in range(4)
+        ]
+        anon = await client.get("/a")
+
+    assert codes == [200, 200, 429, 429]
+    assert anon.status_code == 429
+    assert len(limiter) == 1
+
+
+def test_unknown_plan_reference_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        RateLimitMiddleware(FastAPI(), api_key_plans={"abc": "missing"})
+
+
+def test_rate_limit_options_select_backend_and_parse_specs() -> None:
+    redis_opts = rate_limit_options(
+        backend="redis",
+        quota=Quota(limit=5, window_s=1.0),
+        plans={"pro": "600/60"},
+        route_quotas={"/v1/export": "10/60"},
+    )
+    assert isinstance(redis_opts["limiter"], RedisRateLimiter)
+    assert redis_opts["plans"] == {"pro": Quota(limit=600, window_s=60.0)}
+    assert redis_opts["route_quotas"] == {"/v1/export": Quota(limit=10, window_s=60.0)}
+
+    memory_opts = rate_limit_options(backend="memory", quota=Quota(limit=5, window_s=1.0))
+    assert isinstance(memory_opts["limiter"], InMemoryRateLimiter)
+
+    with pytest.raises(ValueError):
+        rate_limit_options(backend="memory", quota=Quota(1, 1.0), plans={"bad": "oops"})
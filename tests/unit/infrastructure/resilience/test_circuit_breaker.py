@@ -4,7 +4,11 @@ import asyncio
 
 import pytest
 
-from arche_api.infrastructure.resilience.circuit_breaker import CircuitBreaker
+from arche_api.infrastructure.resilience.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    get_circuit_breaker_registry,
+)
 
 
 @pytest.mark.anyio
@@ -146,3 +150,104 @@ async def test_circuit_breaker_half_open_call_limit() -> None:
 
     # Exactly one should be RuntimeError("circuit_half_open_limit").
     assert any(isinstance(r, RuntimeError) and "circuit_half_open_limit" in str(r) for r in results)
+
+
+@pytest.mark.anyio
+async def test_registry_isolates_state_per_key() -> None:
+    """A failing endpoint must not trip the breaker of a sibling endpoint."""
+    registry = CircuitBreakerRegistry(
+        failure_threshold=1,
+        recovery_timeout_s=60.0,
+        half_open_max_calls=1,
+        on_transition=None,
+    )
+
+    with pytest.raises(RuntimeError, match="boom"):
+        async with registry.guard("marketstack:intraday"):
+            raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError, match="circuit_open"):
+        async with registry.guard("marketstack:intraday"):
+            pass
+
+    async with registry.guard("marketstack:eod"):
+        pass
+
+    assert registry.states() == {
+        "marketstack:intraday": "OPEN",
+        "marketstack:eod": "CLOSED",
+    }
+
+
+@pytest.mark.anyio
+async def test_registry_reports_transitions_to_listener() -> None:
+    transitions: list[tuple[str, str, str]] = []
+    registry = CircuitBreakerRegistry(
+        failure_threshold=1,
+        recovery_timeout_s=0.01,
+        half_open_max_calls=1,
+        on_transition=lambda key, old, new: transitions.append((key, old, new)),
+    )
+
+    with pytest.raises(RuntimeError):
+        async with registry.guard("edgar:xbrl_instance"):
+            raise RuntimeError("boom")
+
+    await asyncio.sleep(0.02)
+    async with registry.guard("edgar:xbrl_instance"):
+        pass
+
+    assert transitions == [
+        ("edgar:xbrl_instance", "CLOSED", "OPEN"),
+        ("edgar:xbrl_instance", "OPEN", "HALF_OPEN"),
+        ("edgar:xbrl_instance", "HALF_OPEN", "CLOSED"),
+    ]
+
+
+def test_default_registry_is_process_wide() -> None:
+    assert get_circuit_breaker_registry() is get_circuit_breaker_registry()
+
+
+@pytest.mark.anyio
+async def test_cancelled_half_open_probe_releases_its_slot() -> None:
+    """A probe cancelled by a timeout must not leave HALF_OPEN stuck at its limit."""
+    breaker = CircuitBreaker(
+        failure_threshold=1,
+        recovery_timeout_s=0.01,
+        half_open_max_calls=1,
+    )
+
+    with pytest.raises(RuntimeError, match="boom"):
+        async with breaker.guard("svc"):
+            raise RuntimeError("boom")
+    await asyncio.sleep(0.02)
+
+    async def hanging_probe() -> None:
+        async with breaker.guard("svc"):
+            await asyncio.sleep(10)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(hanging_probe(), 0.01)
+
+    assert breaker.state == "HALF_OPEN"
+    assert breaker._half_open_calls == 0
+
+    async with breaker.guard("svc"):
+        pass
+
+    assert breaker.state == "CLOSED"
+
+
+@pytest.mark.anyio
+async def test_cancelled_call_in_closed_state_is_not_a_failure() -> None:
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout_s=60.0, half_open_max_calls=1)
+
+    async def hanging() -> None:
+        async with breaker.guard("svc"):
+            await asyncio.sleep(10)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(hanging(), 0.01)
+
+    assert breaker.state == "CLOSED"
+    assert breaker._failures == 0
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from arche_api.infrastructure.resilience.rate_limiter import (
+    InMemoryRateLimiter,
+    Quota,
+    RedisRateLimiter,
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_quota_parse_and_validation() -> None:
+    assert Quota.parse("600/60") == Quota(limit=600, window_s=60.0)
+    for bad in ("600", "0/60", "10/0", "x/1"):
+        with pytest.raises(ValueError):
+            Quota.parse(bad)
+
+
+@pytest.mark.anyio
+async def test_in_memory_gcra_allows_burst_then_refills_smoothly() -> None:
+    clock = _Clock()
+    limiter = InMemoryRateLimiter(clock=clock)
+    quota = Quota(limit=3, window_s=3.0)
+
+    decisions = [await limiter.hit("k", quota) for _ in range(4)]
+    assert [d.allowed for d in decisions] == [True, True, True, False]
+    assert [d.remaining for d in decisions] == [2, 1, 0, 0]
+    assert decisions[-1].retry_after_s == pytest.approx(1.0)
+
+    clock.now += 1.0
+    assert (await limiter.hit("k", quota)).allowed
+    assert not (await limiter.hit("k", quota)).allowed
+
+
+def test_in_memory_evicts_refilled_and_least_recent_buckets() -> None:
+    clock = _Clock()
+    limiter = InMemoryRateLimiter(max_keys=2, clock=clock)
+    quota = Quota(limit=2, window_s=1.0)
+
+    limiter.hit_sync("a", quota)
+    limiter.hit_sync("b", quota)
+    limiter.hit_sync("c", quota)
+    assert len(limiter) == 2
+
+    clock.now += 5.0
+    limiter.hit_sync("d", quota)
+    assert len(limiter) == 1
+
+
+class _Script:
+    def __init__(self, result: list[int] | Exception) -> None:
+        self.result = result
+        self.calls: list[dict[str, Any]] = []
+
+    async def __call__(self, *, keys: list[str], args: list[Any]) -> list[int]:
+        self.calls.append({"keys": keys, "args": args})
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+
+class _Redis:
+    def __init__(self, script: _Script) -> None:
+        self.script = script
+        self.registered = 0
+
+    def register_script(self, lua: str) -> _Script:
+        self.registered += 1
+        return self.script
+
+
+@pytest.mark.anyio
+async def test_redis_limiter_maps_script_result() -> None:
+    redis = _Redis(_Script([0, 0, 2500, 400]))
+    limiter = RedisRateLimiter(lambda: redis, namespace="rl")
+
+    decision = await limiter.hit("ip:1:*", Quota(limit=5, window_s=5.0))
+    await limiter.hit("ip:1:*", Quota(limit=5, window_s=5.0))
+
+    assert redis.registered == 1
+    assert redis.script.calls[0] == {"keys": ["rl:ip:1:*"], "args": [1000, 5000]}
+    assert not decision.allowed
+    assert decision.backend == "redis"
+    assert decision.reset_after_s == pytest.approx(2.5)
+    assert decision.retry_after_s == pytest.approx(0.4)
+
+
+@pytest.mark.anyio
+async def test_redis_limiter_falls_back_locally_and_retries_after_cooldown() -> None:
+    clock = _Clock()
+    redis = _Redis(_Script(ConnectionError("down")))
+    limiter = RedisRateLimiter(lambda: redis, cooldown_s=5.0, clock=clock)
+    quota = Quota(limit=1, window_s=60.0)
+
+    first = await limiter.hit("k", quota)
+    second = await limiter.hit("k", quota)
+    assert (first.allowed, first.backend) == (True, "fallback")
+    assert (second.allowed, second.backend) == (False, "fallback")
+    assert len(redis.script.calls) == 1
+    assert limiter.degraded
+
+    clock.now += 6.0
+    redis.script.result = [1, 0, 60000, 0]
+    assert (await limiter.hit("k", quota)).backend == "redis"
@@ -0,0 +1,133 @@
+# tests/unit/infrastructure/test_json_codec.py
+from __future__ import annotations
+
+import json
+from collections.abc import Iterator
+from datetime import UTC, date, datetime
+from decimal import Decimal
+from uuid import UUID
+
+import pytest
+from fastapi.responses import JSONResponse
+
+from arche_api.adapters.schemas.http.envelopes import SuccessEnvelope
+from arche_api.adapters.schemas.http.fundamentals import FundamentalsTimeSeriesPointHTTP
+from arche_api.infrastructure.http.responses import FastJSONResponse
+from arche_api.infrastructure.serialization import json_codec
+from arche_api.infrastructure.serialization.json_codec import (
+    JsonCodec,
+    OrjsonCodec,
+    StdlibJsonCodec,
+    configure_json_codec,
+    get_json_codec,
+)
+
+
+def _codecs() -> list[JsonCodec]:
+    codecs: list[JsonCodec] = [StdlibJsonCodec()]
+    if json_codec._orjson is not None:
+        codecs.append(OrjsonCodec())
+    return codecs
+
+
+@pytest.fixture(autouse=True)
+def _restore_codec() -> Iterator[None]:
+    previous = json_codec._codec
+    yield
+    json_codec._codec = previous
+
+
+@pytest.mark.parametrize("codec", _codecs(), ids=lambda c: c.name)
+def test_codec_is_compact_exact_and_round_trips(codec: JsonCodec) -> None:
+    payload = {
+        "b": Decimal("1234567890.123456789012"),
+        "a": [date(2024, 3, 31), datetime(2024, 3, 31, 12, 0, tzinfo=UTC)],
+        "id": UUID(int=1),
+        "name": "Société",
+    }
+
+    encoded = codec.dumps(payload, sort_keys=True)
+
+    assert encoded == (
+        b'{"a":["2024-03-31","2024-03-31T12:00:00+00:00"],'
+        b'"b":"1234567890.123456789012","id":"00000000-0000-0000-0000-000000000001",'
+        b'"name":"Soci\xc3\xa9t\xc3\xa9"}'
+    )
+    assert codec.loads(encoded) == codec.loads(encoded.decode()) == json.loads(encoded)
+    assert codec.dumps({1: None}) == b'{"1":null}'
+
+
+@pytest.mark.parametrize("codec", _codecs(), ids=lambda c: c.name)
+@pytest.mark.parametrize(
+    ("payload", "sort_keys", "expected"),
+    [
+        ({date(2024, 3, 31): 1}, False, b'{"2024-03-31":1}'),
+        ({UUID(int=1): 1}, True, b'{"00000000-0000-0000-0000-000000000001":1}'),
+        ({"b": 1, 10: 2, 9: 3}, True, b'{"10":2,"9":3,"b":1}'),
+        ({True: 1, None: 2, 1.5: 3}, True, b'{"1.5":3,"null":2,"true":1}'),
+        (
+            {"n": 2**70, 2**70: [-(2**70)]},
+            False,
+            b'{"n":1180591620717411303424,"1180591620717411303424":[-1180591620717411303424]}',
+        ),
+        (
+            {"x": [float("nan"), float("inf"), -float("inf"), 1.5]},
+            False,
+            b'{"x":[null,null,null,1.5]}',
+        ),
+        ({"d": {date(2024, 1, 1): float("nan")}, "a": 1}, True, b'{"a":1,"d":{"2024-01-01":null}}'),
+    ],
+    ids=[
+        "date-key",
+        "uuid-key",
+        "mixed-keys-sorted",
+        "scalar-keys",
+        "big-int",
+        "non-finite",
+        "nested",
+    ],
+)
+def test_codec_normalizes_keys_and_numbers_consistently(
+    codec: JsonCodec, payload: dict[object, object], sort_keys: bool, expected: bytes
+) -> None:
+    assert codec.dumps(payload, sort_keys=sort_keys) == expected
+
+
+@pytest.mark.parametrize("codec", _codecs(), ids=lambda c: c.name)
+@pytest.mark.parametrize("payload", [{"x": object()}, {object(): 1}, {"n": 2**70, "x": object()}])
+def test_codec_rejects_unsupported_types(codec: JsonCodec, payload: dict[object, object]) -> None:
+    with pytest.raises(TypeError):
+        codec.dumps(payload)
+
+
+def test_configure_json_codec_selects_backend() -> None:
+    assert configure_json_codec("stdlib").name == "stdlib"
+    assert get_json_codec().name == "stdlib"
+
+    expected = "orjson" if json_codec._orjson is not None else "stdlib"
+    assert configure_json_codec("auto").name == expected
+
+    if json_codec._orjson is None:
+        with pytest.raises(RuntimeError, match="fastjson"):
+            configure_json_codec("orjson")
+
+
+def test_fast_json_response_renders_models_like_json_response() -> None:
+    point = FundamentalsTimeSeriesPointHTTP(
+        cik="0000320193",
+        statement_type="INCOME_STATEMENT",
+        accounting_standard="US_GAAP",
+        statement_date=date(2024, 9, 28),
+        fiscal_year=2024,
+        fiscal_period="FY",
+        currency="USD",
+        metrics={"REVENUE": "391035000000.00"},
+        normalized_payload_version_sequence=1,
+    )
+    envelope = SuccessEnvelope[FundamentalsTimeSeriesPointHTTP](data=point)
+
+    fast = FastJSONResponse(content=envelope)
+    legacy = JSONResponse(content=envelope.model_dump_http())
+
+    assert fast.body == legacy.body
+    assert FastJSONResponse(content={"x": [1, "é"]}).body == b'{"x":[1,"\xc3\xa9"]}'
@@ -96,3 +96,140 @@ def test_json_formatter_includes_exception_info(caplog: pytest.LogCaptureFixture
     assert payload["level"] == "ERROR"
     assert payload["exc_type"] == "ValueError"
     assert "boom" in payload["exc_message"]
+
+
+def test_json_formatter_emits_flat_extras_with_size_caps() -> None:
+    """Flat ``extra=`` fields are emitted; long lists and strings are truncated."""
+    fmt = _JsonFormatter(max_items=3, max_chars=5)
+    record = logging.getLogger("test.logger.caps").makeRecord(
+        "test.logger.caps",
+        logging.INFO,
+        "test_logger",
+        1,
+        "caps",
+        (),
+        None,
+        extra={"ciks": list(range(10)), "note": "abcdefgh", "n": 7},
+    )
+    payload = json.loads(fmt.format(record))
+
+    assert payload["ciks"] == [0, 1, 2, "...(+7 more)"]
+    assert payload["note"] == "abcde...(+3 chars)"
+    assert payload["n"] == 7
+    assert payload["message"] == "caps"
+
+
+def test_async_logging_writes_batches_with_request_context(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Async mode captures contextvars at enqueue time and writes on a worker thread."""
+    import io
+
+    from arche_api.infrastructure.logging import logger as logger_mod
+
+    monkeypatch.delenv("REQUEST_ID", raising=False)
+    root = logging.getLogger()
+    saved = root.handlers[:]
+    root.handlers.clear()
+    try:
+        logger_mod.configure_root_logging("INFO", async_mode=True, queue_size=100)
+        (queue_handler,) = root.handlers
+        stream = io.StringIO()
+        logger_mod._listener._handler.stream = stream  # type: ignore[union-attr]
+
+        logger_mod.set_request_context(request_id="rid-async")
+        logging.getLogger("test.async").info("one", extra={"k": [1, 2]})
+        logging.getLogger("test.async").info("two")
+        logger_mod.shutdown_logging()
+    finally:
+        root.handlers[:] = saved
+        logger_mod._REQUEST_ID_CTX.set(None)
+
+    assert isinstance(queue_handler, logger_mod._ContextQueueHandler)
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [line["message"] for line in lines] == ["one", "two"]
+    assert all(line["request_id"] == "rid-async" for line in lines)
+    assert lines[0]["k"] == [1, 2]
+
+
+def test_force_reconfigures_own_handler_from_explicit_options() -> None:
+    """``force=True`` swaps the handler installed earlier; explicit options win over env."""
+    from arche_api.infrastructure.logging import logger as logger_mod
+
+    root = logging.getLogger()
+    saved = root.handlers[:]
+    root.handlers.clear()
+    try:
+        logger_mod.configure_root_logging("INFO")
+        (first,) = root.handlers
+
+        logger_mod.configure_root_logging("WARNING", max_items=2, max_chars=20)
+        assert root.handlers == [first]  # idempotent without force
+
+        logger_mod.configure_root_logging(
+            "WARNING",
+            max_items=2,
+            max_chars=20,
+            sample_rates={"/v1/quotes": 0.0},
+            force=True,
+        )
+        (second,) = root.handlers
+        assert second is not first
+        assert root.level == logging.WARNING
+        assert isinstance(second.formatter, logger_mod._JsonFormatter)
+        assert second.formatter._max_items == 2
+        assert second.formatter._max_chars == 20
+        assert any(isinstance(f, logger_mod._SuccessSampler) for f in second.filters)
+    finally:
+        logger_mod.shutdown_logging()
+        logger_mod._handler = None
+        root.handlers[:] = saved
+
+
+def test_queue_full_drops_instead_of_blocking() -> None:
+    """With a full queue, INFO records are dropped and counted rather than blocking."""
+    import queue
+
+    import prometheus_client as prom
+
+    from arche_api.infrastructure.logging import logger as logger_mod
+
+    def dropped() -> float:
+        value = prom.REGISTRY.get_sample_value(
+            "arche_log_records_dropped_total", {"reason": "queue_full"}
+        )
+        return value or 0.0
+
+    before = dropped()
+    handler = logger_mod._ContextQueueHandler(queue.Queue(maxsize=1))
+    log = logging.getLogger("test.drop")
+    for msg in ("kept", "dropped-1", "dropped-2"):
+        handler.handle(log.makeRecord("test.drop", logging.INFO, "f", 1, msg, (), None))
+
+    assert handler.queue.qsize() == 1
+    assert dropped() - before == 2
+
+
+def test_success_sampler_keeps_errors_and_samples_success_by_prefix() -> None:
+    """Only sub-400 access logs on sampled prefixes are thinned out."""
+    from arche_api.infrastructure.logging.logger import _SuccessSampler
+
+    sampler = _SuccessSampler({"/v1/quotes": 0.0, "*": 1.0}, rng=lambda: 0.5)
+    log = logging.getLogger("test.sample")
+
+    def record(path: str, status: int, level: int = logging.INFO) -> logging.LogRecord:
+        return log.makeRecord(
+            "test.sample",
+            level,
+            "f",
+            1,
+            "access_log",
+            (),
+            None,
+            extra={"path": path, "status": status},
+        )
+
+    assert sampler.filter(record("/v1/quotes/AAPL", 200)) is False
+    assert sampler.filter(record("/v1/quotes/AAPL", 503)) is True
+    assert sampler.filter(record("/v1/quotes/AAPL", 200, logging.WARNING)) is True
+    assert sampler.filter(record("/v1/filings", 200)) is True
@@ -16,6 +16,13 @@ class _FakeSettings:
     def __init__(self, *, enabled: bool, endpoint: str | None) -> None:
         self.otel_enabled = enabled
         self.otel_exporter_otlp_endpoint = endpoint
+        self.otel_traces_sample_ratio = 1.0
+        self.otel_traces_route_sample_ratios = {"/health": 0.0}
+        self.otel_traces_keep_errors = True
+        self.otel_traces_slow_threshold_ms = 1000.0
+        self.otel_bsp_max_queue_size = 2048
+        self.otel_bsp_max_export_batch_size = 512
+        self.otel_bsp_schedule_delay_ms = 5000
         # These fields are unused by init_otel but present on real Settings.
         self.environment = None  # pragma: no cover
 
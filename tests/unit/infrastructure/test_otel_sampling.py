@@ -0,0 +1,149 @@
+# tests/unit/infrastructure/test_otel_sampling.py
+from __future__ import annotations
+
+import time
+from typing import Any
+
+import pytest
+
+pytest.importorskip("opentelemetry.sdk")
+
+import prometheus_client as prom
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.trace import NonRecordingSpan, SpanContext, SpanKind, StatusCode, TraceFlags
+
+from arche_api.infrastructure.observability.sampling import (
+    PROMOTED_ATTRIBUTE,
+    TailSamplingSpanProcessor,
+    build_sampler,
+)
+
+
+def _provider(
+    ratio: float,
+    *,
+    routes: dict[str, float] | None = None,
+    slow_ms: float | None = 1000.0,
+    max_pending: int = 2048,
+) -> tuple[Any, InMemorySpanExporter]:
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider(sampler=build_sampler(ratio, routes, tail_enabled=True))
+    provider.add_span_processor(
+        TailSamplingSpanProcessor(
+            SimpleSpanProcessor(exporter),
+            max_queue_size=10,
+            slow_threshold_ms=slow_ms,
+            max_pending_traces=max_pending,
+        )
+    )
+    return provider.get_tracer("test"), exporter
+
+
+def _metric(name: str, **labels: str) -> float:
+    return prom.REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def _request(tracer: Any, path: str, *, error: bool = False, duration_s: float = 0.0) -> None:
+    started = time.time_ns()
+    root = tracer.start_span(
+        "GET", kind=SpanKind.SERVER, attributes={"url.path": path}, start_time=started
+    )
+    with (
+        trace.use_span(root, end_on_exit=False),
+        tracer.start_as_current_span("db.query") as child,
+    ):
+        if error:
+            child.set_status(StatusCode.ERROR)
+    root.end(end_time=started + int(duration_s * 1e9))
+
+
+def test_route_override_drops_health_and_default_ratio_samples_the_rest() -> None:
+    tracer, exporter = _provider(1.0, routes={"/health": 0.0})
+
+    _request(tracer, "/health/z", error=True)
+    _request(tracer, "/v2/quotes")
+
+    names = sorted(s.attributes.get("url.path", s.name) for s in exporter.get_finished_spans())
+    assert names == ["/v2/quotes", "db.query"]
+
+
+def test_unsampled_error_trace_is_promoted_with_children() -> None:
+    tracer, exporter = _provider(0.0)
+    before = _metric("arche_otel_trace_sampling_total", decision="error")
+
+    _request(tracer, "/v2/quotes", error=True)
+
+    spans = exporter.get_finished_spans()
+    assert len(spans) == 2
+    assert all(s.context.trace_flags.sampled for s in spans)
+    assert {s.attributes[PROMOTED_ATTRIBUTE] for s in spans} == {"error"}
+    assert _metric("arche_otel_trace_sampling_total", decision="error") == before + 1
+
+
+def test_unsampled_slow_trace_is_promoted_and_fast_trace_discarded() -> None:
+    tracer, exporter = _provider(0.0, slow_ms=500)
+
+    _request(tracer, "/v2/quotes", duration_s=0.0)
+    assert exporter.get_finished_spans() == ()
+
+    _request(tracer, "/v2/quotes", duration_s=0.6)
+    spans = exporter.get_finished_spans()
+    assert {s.attributes[PROMOTED_ATTRIBUTE] for s in spans} == {"slow"}
+
+
+def test_upstream_unsampled_decision_is_respected() -> None:
+    tracer, exporter = _provider(1.0)
+    remote = SpanContext(trace_id=0x1234, span_id=0x5678, is_remote=True, trace_flags=TraceFlags(0))
+
+    with trace.use_span(NonRecordingSpan(remote)):
+        span = tracer.start_span("GET", kind=SpanKind.SERVER, attributes={"url.path": "/v2"})
+        span.set_status(StatusCode.ERROR)
+        span.end()
+
+    assert not span.is_recording()
+    assert exporter.get_finished_spans() == ()
+
+
+def test_tail_buffer_eviction_is_counted() -> None:
+    tracer, exporter = _provider(0.0, max_pending=1)
+    before = _metric("arche_otel_spans_dropped_total", reason="tail_buffer_full")
+
+    roots = [tracer.start_span("GET", attributes={"url.path": "/v2"}) for _ in range(2)]
+    for root in roots:
+        with trace.use_span(root, end_on_exit=False):
+            tracer.start_span("child").end()
+
+    assert _metric("arche_otel_spans_dropped_total", reason="tail_buffer_full") == before + 1
+
+
+def test_full_export_queue_is_counted() -> None:
+    class _Batch:
+        """BatchSpanProcessor stand-in exposing a full SDK-shaped queue."""
+
+        def __init__(self) -> None:
+            self._batch_processor = type("BP", (), {"_queue": [object()] * 10})()
+            self.ended = 0
+
+        def on_start(self, span: Any, parent_context: Any = None) -> None:
+            return None
+
+        def on_end(self, span: Any) -> None:
+            self.ended += 1
+
+        def shutdown(self) -> None:
+            return None
+
+    delegate = _Batch()
+    provider = TracerProvider(sampler=build_sampler(1.0, tail_enabled=False))
+    provider.add_span_processor(
+        TailSamplingSpanProcessor(delegate, max_queue_size=10)  # type: ignore[arg-type]
+    )
+    before = _metric("arche_otel_spans_dropped_total", reason="queue_full")
+
+    provider.get_tracer("test").start_span("GET").end()
+
+    assert delegate.ended == 1
+    assert _metric("arche_otel_spans_dropped_total", reason="queue_full") == before + 1
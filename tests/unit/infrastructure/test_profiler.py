@@ -0,0 +1,47 @@
+# tests/unit/infrastructure/test_profiler.py
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from arche_api.infrastructure.observability import profiler
+from arche_api.infrastructure.observability.profiler import ProfilerBusy, sample_stacks
+
+
+def _spin_until(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(range(1000))
+
+
+def test_sample_stacks_attributes_busy_thread_and_skips_idle_ones() -> None:
+    stop = threading.Event()
+    busy = threading.Thread(target=_spin_until, args=(stop,), name="busy-worker")
+    idle = threading.Thread(target=stop.wait, name="idle-worker")
+    busy.start()
+    idle.start()
+    try:
+        profile = sample_stacks(0.2, interval_s=0.005)
+    finally:
+        stop.set()
+        busy.join()
+        idle.join()
+
+    assert profile.samples > 0
+    busy_stacks = [s for s in profile.stacks if s.startswith("thread:busy-worker;")]
+    assert busy_stacks
+    assert all("_spin_until (" in s for s in busy_stacks)
+    assert not any(s.startswith("thread:idle-worker;") for s in profile.stacks)
+
+    line = profile.collapsed().splitlines()[0]
+    stack, count = line.rsplit(" ", 1)
+    assert ";" in stack and int(count) >= 1
+
+
+def test_only_one_profile_runs_at_a_time() -> None:
+    assert profiler._lock.acquire(blocking=False)
+    try:
+        with pytest.raises(ProfilerBusy):
+            sample_stacks(0.01)
+    finally:
+        profiler._lock.release()
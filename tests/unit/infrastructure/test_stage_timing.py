@@ -0,0 +1,147 @@
+# tests/unit/infrastructure/test_stage_timing.py
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+from typing import Any
+
+import prometheus_client as prom
+import pytest
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from arche_api.application.interfaces.stage_timing import (
+    get_stage_observer,
+    set_stage_observer,
+    staged,
+    timed_stage,
+)
+from arche_api.infrastructure.middleware.server_timing import (
+    ServerTimingMiddleware,
+    format_server_timing,
+)
+from arche_api.infrastructure.observability.stages import (
+    StageTimer,
+    begin_request_stages,
+    end_request_stages,
+    install_stage_timing,
+)
+
+
+@pytest.fixture(autouse=True)
+def _restore_observer() -> Iterator[None]:
+    previous = get_stage_observer()
+    yield
+    set_stage_observer(previous)
+
+
+def _count(stage: str, outcome: str) -> float:
+    labels = {"stage": stage, "outcome": outcome}
+    return prom.REGISTRY.get_sample_value("arche_stage_duration_seconds_count", labels) or 0.0
+
+
+def test_disabled_stage_timing_returns_shared_noop() -> None:
+    install_stage_timing(enabled=False)
+
+    assert get_stage_observer() is None
+    assert timed_stage("a.one") is timed_stage("a.two")
+    with timed_stage("a.one"):
+        pass
+    assert _count("a.one", "success") == 0.0
+
+
+def test_stage_records_histogram_outcome_and_request_breakdown() -> None:
+    set_stage_observer(StageTimer())
+    stages, token = begin_request_stages()
+    ok_before = _count("test.ok", "success")
+    err_before = _count("test.fail", "error")
+
+    try:
+        with timed_stage("test.ok"):
+            pass
+        with pytest.raises(ValueError), timed_stage("test.fail"):
+            raise ValueError("boom")
+    finally:
+        end_request_stages(token)
+
+    assert [name for name, _ in stages] == ["test.ok", "test.fail"]
+    assert _count("test.ok", "success") == ok_before + 1
+    assert _count("test.fail", "error") == err_before + 1
+
+
+def test_staged_decorator_times_sync_and_async_callables() -> None:
+    set_stage_observer(StageTimer())
+
+    @staged("test.sync")
+    def double(x: int) -> int:
+        return x * 2
+
+    @staged("test.async")
+    async def triple(x: int) -> int:
+        return x * 3
+
+    stages, token = begin_request_stages()
+    try:
+        assert double(2) == 4
+        assert asyncio.run(triple(2)) == 6
+    finally:
+        end_request_stages(token)
+
+    assert [name for name, _ in stages] == ["test.sync", "test.async"]
+
+
+def test_stage_spans_nest_under_current_span_and_record_errors() -> None:
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+    from opentelemetry.trace import StatusCode
+
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    tracer = provider.get_tracer("test")
+    set_stage_observer(StageTimer(tracer=tracer))
+
+    with tracer.start_as_current_span("request"):
+        with timed_stage("test.hydrate"):
+            pass
+        with pytest.raises(RuntimeError), timed_stage("test.persist"):
+            raise RuntimeError("db down")
+
+    spans = {s.name: s for s in exporter.get_finished_spans()}
+    root = spans["request"].context
+    assert spans["test.hydrate"].parent.span_id == root.span_id  # type: ignore[union-attr]
+    assert spans["test.persist"].status.status_code is StatusCode.ERROR
+
+
+def test_format_server_timing_sums_repeated_stages_in_first_seen_order() -> None:
+    value = format_server_timing(
+        [("t.hydrate", 0.010), ("t.compute", 0.002), ("t.hydrate", 0.005)],
+        0.020,
+    )
+
+    assert value == "t.hydrate;dur=15.0, t.compute;dur=2.0, total;dur=20.0"
+
+
+def test_server_timing_middleware_reports_request_stages() -> None:
+    set_stage_observer(StageTimer())
+
+    async def endpoint(request: Request) -> Any:
+        with timed_stage("t.hydrate"):
+            pass
+        with timed_stage("t.compute"):
+            pass
+        return PlainTextResponse("ok")
+
+    app = Starlette(routes=[Route("/", endpoint)])
+    app.add_middleware(ServerTimingMiddleware)
+
+    with TestClient(app) as client:
+        header = client.get("/").headers["server-timing"]
+
+    names = [entry.split(";", 1)[0] for entry in header.split(", ")]
+    assert names == ["t.hydrate", "t.compute", "total"]